@@ -0,0 +1,109 @@
+# indent.py
+# NEWLINE, INDENT and DEDENT tokens for the mini-Python grammar.
+#
+# The lexer only reports line breaks (one NEWLINE per run of them) and
+# drops blanks and comments. IndentLexer sits between it and the parser and
+# turns that into Python's logical lines in one pass over the tokens: the
+# first token of a line gives the line's indentation (its offset from the
+# start of the line; a tab counts as one column), which is compared with a
+# stack of the enclosing block indentations. A deeper line pushes one level
+# and is preceded by INDENT; a shallower one pops every level deeper than
+# it, one DEDENT each. Each token is looked at once and each level is
+# pushed and popped once, so the whole pass is linear however deeply blocks
+# nest.
+#
+# Every logical line ends with exactly one NEWLINE: blank and comment-only
+# lines produce none, line breaks inside parentheses are joined, and the
+# last line gets one at the end of the input, followed by a DEDENT for each
+# block still open. A line dedented to a column no enclosing block started
+# at is read as a new, unexpected INDENT, which the parser reports. The
+# value of an INDENT or DEDENT is the indentation of the line it starts.
+from functools import partial
+
+from ply.lex import LexToken
+
+
+def _token(type, value, lineno, lexpos):
+    tok = LexToken()
+    tok.type = type
+    tok.value = value
+    tok.lineno = lineno
+    tok.lexpos = lexpos
+    return tok
+
+
+class IndentLexer:
+    # Wraps a PLY lexer or a stream.StreamLexer; the parser reads tokens
+    # from here, and diagnostics the position attributes of the wrapped one
+    def __init__(self, lexobj):
+        self.lexer = lexobj
+        self.token = partial(next, self._filter(), None)
+
+    def input(self, data):
+        self.lexer.input(data)
+        self.token = partial(next, self._filter(), None)
+
+    @property
+    def diagnostics(self):
+        return self.lexer.diagnostics
+
+    @property
+    def lexdata(self):
+        return self.lexer.lexdata
+
+    @property
+    def lexpos(self):
+        return self.lexer.lexpos
+
+    @property
+    def lexoffset(self):
+        return getattr(self.lexer, 'lexoffset', 0)
+
+    @property
+    def lineno(self):
+        return self.lexer.lineno
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    def _filter(self):
+        levels = [0]
+        depth = 0               # open parentheses
+        line_start = 0          # offset of the current physical line
+        newline = None          # the NEWLINE ending the last logical line
+        at_start = True         # no token of the current logical line yet
+        for tok in iter(self.lexer.token, None):
+            kind = tok.type
+            if kind == 'NEWLINE':
+                line_start = tok.lexpos + len(tok.value)
+                if not depth and not at_start:
+                    newline = tok
+                    at_start = True
+                    yield tok
+                continue
+            if at_start:
+                at_start = False
+                column = tok.lexpos - line_start
+                if column != levels[-1]:
+                    offset = self.lexoffset
+                    blanks = self.lexdata[line_start - offset:tok.lexpos - offset]
+                    while column < levels[-1]:
+                        levels.pop()
+                        yield _token('DEDENT', blanks, tok.lineno, tok.lexpos)
+                    if column > levels[-1]:
+                        levels.append(column)
+                        yield _token('INDENT', blanks, tok.lineno, tok.lexpos)
+            if kind == 'LPAREN':
+                depth += 1
+            elif kind == 'RPAREN' and depth:
+                depth -= 1
+            yield tok
+
+        end = self.lexoffset + len(self.lexdata or '')
+        lineno = self.lineno
+        if not at_start:
+            yield _token('NEWLINE', '\n', lineno, end)
+        elif newline is not None:
+            lineno = newline.lineno
+        for _ in levels[1:]:
+            yield _token('DEDENT', '', lineno, end)
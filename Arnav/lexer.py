@@ -1,4 +1,7 @@
-import ply.lex as lex
+import sys
+
+from lexyacc import frozen
+from lexyacc.diagnostics import Diagnostics
 
 reserved = {
     'if'    : 'IF',
@@ -18,6 +21,9 @@ tokens = [
     'RPAREN',
     'COLON',
     'COMMA',
+    'NEWLINE',
+    'INDENT',
+    'DEDENT',
 ] + list(reserved.values())
 
 t_PLUS   = r'\+'
@@ -40,14 +46,19 @@ def t_ID(t):
     t.type = reserved.get(t.value, 'ID')
     return t
 
-def t_newline(t):
+# Line breaks are tokens; indent.py turns them, and the indentation of the
+# lines after them, into NEWLINE, INDENT and DEDENT for the parser
+def t_NEWLINE(t):
     r'\n+'
     t.lexer.lineno += len(t.value)
+    return t
 
 t_ignore = ' \t'
+t_ignore_COMMENT = r'\#.*'
 
 def t_error(t):
-    print(f"Illegal character '{t.value[0]}'")
+    t.lexer.diagnostics.illegal(t.lexer, t.value[0])
     t.lexer.skip(1)
 
-lexer = lex.lex()
+lexer = frozen.lexer(sys.modules[__name__])
+lexer.diagnostics = Diagnostics()
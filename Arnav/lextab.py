@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('COLON', 'COMMA', 'DEDENT', 'DEF', 'DIVIDE', 'EQUALS', 'ID', 'IF', 'INDENT', 'LPAREN', 'MINUS', 'NEWLINE', 'NUMBER', 'PLUS', 'RPAREN', 'TIMES', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NUMBER>\\d+)|(?P<t_ID>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_NEWLINE>\\n+)|(?P<t_ignore_COMMENT>\\#.*)|(?P<t_LPAREN>\\()|(?P<t_PLUS>\\+)|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_EQUALS>=)|(?P<t_MINUS>-)', [None, ('t_NUMBER', 'NUMBER'), ('t_ID', 'ID'), ('t_NEWLINE', 'NEWLINE'), (None, None), (None, 'LPAREN'), (None, 'PLUS'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'EQUALS'), (None, 'MINUS')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_lexsignature = "(['COLON', 'COMMA', 'DEDENT', 'DEF', 'DIVIDE', 'EQUALS', 'ID', 'IF', 'INDENT', 'LPAREN', 'MINUS', 'NEWLINE', 'NUMBER', 'PLUS', 'RPAREN', 'TIMES', 'WHILE'], (), '', [('t_COLON', ':'), ('t_COMMA', ','), ('t_DIVIDE', '/'), ('t_EQUALS', '='), ('t_LPAREN', '\\\\('), ('t_MINUS', '-'), ('t_PLUS', '\\\\+'), ('t_RPAREN', '\\\\)'), ('t_TIMES', '\\\\*'), ('t_ignore', ' \\t'), ('t_ignore_COMMENT', '\\\\#.*')], [('t_NUMBER', '\\\\d+'), ('t_ID', '[a-zA-Z_][a-zA-Z_0-9]*'), ('t_NEWLINE', '\\\\n+'), ('t_error', None)])"
@@ -1,5 +1,29 @@
-from lexer import lexer
-from parser import parser
+import os
+import sys
+
+# The shared modules are in the lexyacc package at the repository root,
+# which is not on sys.path when this runs as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexyacc.diagnostics import Diagnostics
+from parser import Parser
+
+# Assignments are evaluated, and their values kept from line to line
+session = Parser(env={})
+
+def print_event(kind, value):
+    if kind == 'program':
+        print("--- PARSE SUCCESSFUL ---")
+    elif kind == 'assignment':
+        print(f"Valid Assignment: {value} = {session.env.get(value, '...')}")
+    elif kind == 'expression':
+        print("Valid Expression")
+    elif kind == 'if':
+        print("Valid IF statement")
+    elif kind == 'while':
+        print("Valid WHILE statement")
+    elif kind == 'function':
+        print(f"Valid Function Definition: def {value}(...):")
 
 print("--- Mini-Python Parser (5 Constructs) ---")
 print("Enter Python code. Enter 'exit' or press Ctrl+C to quit.")
@@ -11,8 +35,20 @@ while True:
             break
         if not data.strip():
             continue
+        # A header opens a block that goes on until an empty line, as at
+        # Python's own prompt
+        if data.rstrip().endswith(':'):
+            lines = [data]
+            while True:
+                line = input('... ')
+                if not line.strip():
+                    break
+                lines.append(line)
+            data = '\n'.join(lines)
 
-        result = parser.parse(data, lexer=lexer)
+        diagnostics = session.parse(data, Diagnostics(on_event=print_event))
+        for d in diagnostics:
+            print(d.message)
 
     except EOFError:
         break
@@ -1,9 +1,39 @@
-import ply.yacc as yacc
-from lexer import tokens
+import copy
+import sys
+
+import indent
+from lexyacc import arith, frozen, stream, tokenstream
+from lexyacc.diagnostics import Diagnostics, TooManyErrors
+from lexer import tokens, lexer
+
+# Blocks: the parser reads indent.py's logical lines, so every simple
+# statement ends with a NEWLINE and an indented block is NEWLINE INDENT
+# statements DEDENT, as in Python. The body of an if, while or def may also
+# be a single statement on the header's own line, which may itself be an
+# if, while or def (if x: while y: z = 1), a liberty Python doesn't allow.
+#
+# Error recovery: a line with a syntax error is skipped up to its NEWLINE
+# (or, in an if/while/def header, up to its colon) and parsing goes on, so
+# one pass reports every error. Both rules end with a token, so each
+# recovery moves on through the input. A block indented where none may
+# start is reported at its INDENT and otherwise parsed like any other.
+#
+# Evaluation: a Parser given an env builds a value for every expression,
+# folding constants as it reduces (a number, a name or an (op, left, right)
+# tuple), and stores the value of each top-level assignment in env as it is
+# reduced, with Python's arithmetic. Without one the expression rules build
+# nothing. See arith.py. Evaluating is only a best effort and never an
+# error: an assignment that reads a name env has no value for, or divides
+# by zero, leaves its target without one. Assignments in a def body are
+# local and don't touch env; one in an if or while body may run any number
+# of times, so its target has no known value after it.
 
 def p_program(p):
-    '''program : statements'''
-    print("--- PARSE SUCCESSFUL ---")
+    '''program : statements
+               | '''
+    # Empty, or only comments and blank lines, as an empty __init__.py
+    if not p.lexer.diagnostics.errors:
+        p.lexer.diagnostics.emit('program', None)
 
 def p_statements(p):
     '''statements : statement
@@ -11,59 +41,90 @@ def p_statements(p):
     pass
 
 def p_statement(p):
-    '''statement : assignment_statement
-                 | expression_statement
+    '''statement : simple_statement NEWLINE
                  | if_statement
                  | while_statement
                  | function_definition'''
     pass
 
+def p_simple_statement(p):
+    '''simple_statement : assignment_statement
+                        | expression_statement'''
+    pass
+
+def p_suite(p):
+    '''suite : statement
+             | NEWLINE INDENT statements DEDENT'''
+    pass
+
 def p_assignment_statement(p):
     '''assignment_statement : ID EQUALS expression'''
-    print(f"Valid Assignment: {p[1]} = ...")
+    env = p.parser.env
+    if env is not None:
+        # p.stack holds what is still open below this statement: a COLON
+        # there means it is in a body, a DEF that the body is a function's
+        body = {sym.type for sym in p.stack} & {'COLON', 'DEF'}
+        if 'DEF' in body:
+            pass
+        elif body:
+            env.pop(p[1], None)
+        else:
+            try:
+                env[p[1]] = arith.evaluate(p[3], env, arith.PYTHON, unset=None)
+            except arith.ArithError:
+                env.pop(p[1], None)
+    p.lexer.diagnostics.emit('assignment', p[1])
 
 def p_expression_statement(p):
     '''expression_statement : expression'''
-    print("Valid Expression")
+    p.lexer.diagnostics.emit('expression', None)
 
 def p_expression_binop(p):
     '''expression : expression PLUS term
                   | expression MINUS term'''
-    pass
+    if p.parser.env is not None:
+        p[0] = _binop(p)
 
 def p_expression_term(p):
     '''expression : term'''
-    pass
+    p[0] = p[1]
 
 def p_term_binop(p):
     '''term : term TIMES factor
             | term DIVIDE factor'''
-    pass
+    if p.parser.env is not None:
+        p[0] = _binop(p)
+
+def _binop(p):
+    value = arith.fold(p[2], p[1], p[3], arith.PYTHON)
+    if value is None:
+        return (p[2], p[1], p[3])
+    return value
 
 def p_term_factor(p):
     '''term : factor'''
-    pass
+    p[0] = p[1]
 
 def p_factor(p):
     '''factor : NUMBER
               | ID'''
-    pass
+    p[0] = p[1]
 
 def p_factor_group(p):
     '''factor : LPAREN expression RPAREN'''
-    pass
+    p[0] = p[2]
 
 def p_if_statement(p):
-    '''if_statement : IF expression COLON statement'''
-    print("Valid IF statement")
+    '''if_statement : IF expression COLON suite'''
+    p.lexer.diagnostics.emit('if', None)
 
 def p_while_statement(p):
-    '''while_statement : WHILE expression COLON statement'''
-    print("Valid WHILE statement")
+    '''while_statement : WHILE expression COLON suite'''
+    p.lexer.diagnostics.emit('while', None)
 
 def p_function_definition(p):
-    '''function_definition : DEF ID LPAREN arg_list RPAREN COLON statement'''
-    print(f"Valid Function Definition: def {p[2]}(...):")
+    '''function_definition : DEF ID LPAREN arg_list RPAREN COLON suite'''
+    p.lexer.diagnostics.emit('function', p[2])
 
 def p_arg_list(p):
     '''arg_list :
@@ -75,10 +136,97 @@ def p_parameters(p):
                   | parameters COMMA ID'''
     pass
 
-def p_error(p):
-    if p:
-        print(f"Syntax error at token {p.type} ('{p.value}')")
-    else:
-        print("Syntax error at end of input")
+def p_statement_error(p):
+    '''statement : error NEWLINE
+       if_statement : IF error COLON suite
+       while_statement : WHILE error COLON suite
+       function_definition : DEF error COLON suite'''
+    pass
 
-parser = yacc.yacc()
+def p_statement_indented(p):
+    '''statement : INDENT unexpected_indent statements DEDENT'''
+    pass
+
+def p_unexpected_indent(p):
+    '''unexpected_indent :'''
+    # Reported here, just after the INDENT, while a streamed input is still
+    # on the chunk it is in
+    p.lexer.diagnostics.syntax(p.stack[-1], p.lexer)
+
+def p_error(p):
+    # Only used by the module-level parser; p is None at end of input,
+    # where PLY gives us no lexer
+    lexobj = p.lexer if p else lexer
+    lexobj.diagnostics.syntax(p, lexobj)
+
+parser = frozen.parser(sys.modules[__name__])
+parser.env = None
+
+class Parser:
+    # A reentrant parser: its own lexer and LR stacks over the shared tables.
+    # Use one instance per thread; every parse() starts from a clean lexer.
+    # With an instrument.Profile the parse loop reports what it does there.
+    # With an env (a dict) it evaluates assignments into env, which carries
+    # over from parse to parse.
+    # With a limits.Limits a parse stops at the first limit it passes.
+    def __init__(self, profile=None, env=None, limits=None):
+        self.lexer = lexer.clone()
+        self.profile = profile
+        self.limits = limits
+        if profile is None:
+            self._parser = copy.copy(parser)
+            self._parser.errorfunc = self._error
+        else:
+            self._parser = profile.instrument(parser)
+            self._parser.errorfunc = profile.errorfunc(self._error)
+        self._parser.env = env
+
+    @property
+    def env(self):
+        return self._parser.env
+
+    def _error(self, tok):
+        self.lexer.diagnostics.syntax(tok, self._source)
+
+    def parse(self, data, diagnostics=None):
+        # Returns the Diagnostics for data; set on_event on it to see each construct
+        return self._run(data, self.lexer, diagnostics)
+
+    def parse_file(self, f, diagnostics=None, chunk_size=stream.CHUNK_SIZE):
+        # Like parse for the text read from file object f, which is lexed a
+        # chunk at a time (see stream.py) and so never held whole
+        return self._run(None, stream.StreamLexer(self.lexer, f, chunk_size), diagnostics)
+
+    def scan(self, data):
+        # data lexed once into a tokenstream.TokenStream, which parse_tokens
+        # (of this or any Parser of the grammar) can parse again and again
+        return tokenstream.scan(self.lexer, data, tokens)
+
+    def parse_tokens(self, scanned, diagnostics=None):
+        # Like parse for the text scanned was read from, without lexing it
+        return self._run(None, tokenstream.TokenLexer(self.lexer, scanned), diagnostics)
+
+    def _run(self, data, source, diagnostics):
+        if diagnostics is None:
+            diagnostics = Diagnostics()
+        self.lexer.diagnostics = diagnostics
+        self.lexer.lineno = 1
+        source = indent.IndentLexer(source)
+        self._source = source
+        tokenfunc = None
+        if self.profile is not None:
+            tokenfunc = self.profile.tokenfunc(source)
+        if self.limits:
+            tokenfunc = self.limits.tokenfunc(self._parser, source, tokenfunc)
+        try:
+            if self.profile is None:
+                self._parser.parse(data, lexer=source, tokenfunc=tokenfunc)
+            else:
+                self.profile.timed(self._parser.parse, data, lexer=source,
+                                   tokenfunc=tokenfunc)
+        except TooManyErrors:
+            pass
+        return diagnostics
+
+def parse(data, diagnostics=None):
+    return Parser().parse(data, diagnostics)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'COLON COMMA DEF DIVIDE EQUALS ID IF LPAREN MINUS NUMBER PLUS RPAREN TIMES WHILEprogram : statementsstatements : statement\n| statements statementstatement : assignment_statement\n| expression_statement\n| if_statement\n| while_statement\n| function_definitionassignment_statement : ID EQUALS expressionexpression_statement : expressionexpression : expression PLUS term\n| expression MINUS termexpression : termterm : term TIMES factor\n| term DIVIDE factorterm : factorfactor : NUMBER\n| IDfactor : LPAREN expression RPARENif_statement : IF expression COLON statementwhile_statement : WHILE expression COLON statementfunction_definition : DEF ID LPAREN arg_list RPAREN COLON statementarg_list :\n| parametersparameters : ID\n| parameters COMMA ID'
+_lr_signature = 'COLON COMMA DEDENT DEF DIVIDE EQUALS ID IF INDENT LPAREN MINUS NEWLINE NUMBER PLUS RPAREN TIMES WHILEprogram : statements\n               | statements : statement\n                  | statements statementstatement : simple_statement NEWLINE\n                 | if_statement\n                 | while_statement\n                 | function_definitionsimple_statement : assignment_statement\n                        | expression_statementsuite : statement\n             | NEWLINE INDENT statements DEDENTassignment_statement : ID EQUALS expressionexpression_statement : expressionexpression : expression PLUS term\n                  | expression MINUS termexpression : termterm : term TIMES factor\n            | term DIVIDE factorterm : factorfactor : NUMBER\n              | IDfactor : LPAREN expression RPARENif_statement : IF expression COLON suitewhile_statement : WHILE expression COLON suitefunction_definition : DEF ID LPAREN arg_list RPAREN COLON suitearg_list :\n                | parametersparameters : ID\n                  | parameters COMMA IDstatement : error NEWLINE\n       if_statement : IF error COLON suite\n       while_statement : WHILE error COLON suite\n       function_definition : DEF error COLON suitestatement : INDENT unexpected_indent statements DEDENTunexpected_indent :'
     
-_lr_action_items = {'ID':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,27,28,29,30,31,32,33,34,35,36,37,38,39,44,45,47,],[9,9,-2,-4,-5,-6,-7,-8,-18,-10,23,23,25,23,-13,-16,-17,-3,23,23,23,-18,23,23,-9,-11,-12,9,9,40,-19,-14,-15,-20,-21,46,9,-22,]),'IF':([0,2,3,4,5,6,7,8,9,10,15,16,17,18,23,29,30,31,32,33,35,36,37,38,39,45,47,],[11,11,-2,-4,-5,-6,-7,-8,-18,-10,-13,-16,-17,-3,-18,-9,-11,-12,11,11,-19,-14,-15,-20,-21,11,-22,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,15,16,17,18,23,29,30,31,32,33,35,36,37,38,39,45,47,],[12,12,-2,-4,-5,-6,-7,-8,-18,-10,-13,-16,-17,-3,-18,-9,-11,-12,12,12,-19,-14,-15,-20,-21,12,-22,]),'DEF':([0,2,3,4,5,6,7,8,9,10,15,16,17,18,23,29,30,31,32,33,35,36,37,38,39,45,47,],[13,13,-2,-4,-5,-6,-7,-8,-18,-10,-13,-16,-17,-3,-18,-9,-11,-12,13,13,-19,-14,-15,-20,-21,13,-22,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,23,27,28,29,30,31,32,33,35,36,37,38,39,45,47,],[17,17,-2,-4,-5,-6,-7,-8,-18,-10,17,17,17,-13,-16,-17,-3,17,17,17,-18,17,17,-9,-11,-12,17,17,-19,-14,-15,-20,-21,17,-22,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,23,25,27,28,29,30,31,32,33,35,36,37,38,39,45,47,],[14,14,-2,-4,-5,-6,-7,-8,-18,-10,14,14,14,-13,-16,-17,-3,14,14,14,-18,34,14,14,-9,-11,-12,14,14,-19,-14,-15,-20,-21,14,-22,]),'$end':([1,2,3,4,5,6,7,8,9,10,15,16,17,18,23,29,30,31,35,36,37,38,39,47,],[0,-1,-2,-4,-5,-6,-7,-8,-18,-10,-13,-16,-17,-3,-18,-9,-11,-12,-19,-14,-15,-20,-21,-22,]),'EQUALS':([9,],[19,]),'TIMES':([9,15,16,17,23,30,31,35,36,37,],[-18,27,-16,-17,-18,27,27,-19,-14,-15,]),'DIVIDE':([9,15,16,17,23,30,31,35,36,37,],[-18,28,-16,-17,-18,28,28,-19,-14,-15,]),'PLUS':([9,10,15,16,17,22,23,24,26,29,30,31,35,36,37,],[-18,20,-13,-16,-17,20,-18,20,20,20,-11,-12,-19,-14,-15,]),'MINUS':([9,10,15,16,17,22,23,24,26,29,30,31,35,36,37,],[-18,21,-13,-16,-17,21,-18,21,21,21,-11,-12,-19,-14,-15,]),'COLON':([15,16,17,22,23,24,30,31,35,36,37,43,],[-13,-16,-17,32,-18,33,-11,-12,-19,-14,-15,45,]),'RPAREN':([15,16,17,23,26,30,31,34,35,36,37,40,41,42,46,],[-13,-16,-17,-18,35,-11,-12,-23,-19,-14,-15,-25,43,-24,-26,]),'COMMA':([40,42,46,],[-25,44,-26,]),}
+_lr_action_items = {'$end':([0,1,2,3,5,6,7,21,22,23,51,52,53,55,56,57,61,68,69,],[-2,0,-1,-3,-6,-7,-8,-4,-5,-31,-35,-24,-11,-32,-25,-33,-34,-12,-26,]),'error':([0,2,3,5,6,7,9,12,14,15,21,22,23,24,38,39,40,43,44,46,51,52,53,55,56,57,61,62,65,66,68,69,],[8,8,-3,-6,-7,-8,-36,26,31,33,-4,-5,-31,8,8,8,8,8,8,8,-35,-24,-11,-32,-25,-33,-34,8,8,8,-12,-26,]),'INDENT':([0,2,3,5,6,7,9,21,22,23,24,38,39,40,43,44,46,51,52,53,54,55,56,57,61,62,65,66,68,69,],[9,9,-3,-6,-7,-8,-36,-4,-5,-31,9,9,9,9,9,9,9,-35,-24,-11,62,-32,-25,-33,-34,9,9,9,-12,-26,]),'IF':([0,2,3,5,6,7,9,21,22,23,24,38,39,40,43,44,46,51,52,53,55,56,57,61,62,65,66,68,69,],[12,12,-3,-6,-7,-8,-36,-4,-5,-31,12,12,12,12,12,12,12,-35,-24,-11,-32,-25,-33,-34,12,12,12,-12,-26,]),'WHILE':([0,2,3,5,6,7,9,21,22,23,24,38,39,40,43,44,46,51,52,53,55,56,57,61,62,65,66,68,69,],[14,14,-3,-6,-7,-8,-36,-4,-5,-31,14,14,14,14,14,14,14,-35,-24,-11,-32,-25,-33,-34,14,14,14,-12,-26,]),'DEF':([0,2,3,5,6,7,9,21,22,23,24,38,39,40,43,44,46,51,52,53,55,56,57,61,62,65,66,68,69,],[15,15,-3,-6,-7,-8,-36,-4,-5,-31,15,15,15,15,15,15,15,-35,-24,-11,-32,-25,-33,-34,15,15,15,-12,-26,]),'ID':([0,2,3,5,6,7,9,12,14,15,17,21,22,23,24,28,29,34,36,37,38,39,40,43,44,45,46,51,52,53,55,56,57,61,62,64,65,66,68,69,],[16,16,-3,-6,-7,-8,-36,27,27,32,27,-4,-5,-31,16,27,27,27,27,27,16,16,16,16,16,58,16,-35,-24,-11,-32,-25,-33,-34,16,67,16,16,-12,-26,]),'NUMBER':([0,2,3,5,6,7,9,12,14,17,21,22,23,24,28,29,34,36,37,38,39,40,43,44,46,51,52,53,55,56,57,61,62,65,66,68,69,],[20,20,-3,-6,-7,-8,-36,20,20,20,-4,-5,-31,20,20,20,20,20,20,20,20,20,20,20,20,-35,-24,-11,-32,-25,-33,-34,20,20,20,-12,-26,]),'LPAREN':([0,2,3,5,6,7,9,12,14,17,21,22,23,24,28,29,32,34,36,37,38,39,40,43,44,46,51,52,53,55,56,57,61,62,65,66,68,69,],[17,17,-3,-6,-7,-8,-36,17,17,17,-4,-5,-31,17,17,17,45,17,17,17,17,17,17,17,17,17,-35,-24,-11,-32,-25,-33,-34,17,17,17,-12,-26,]),'DEDENT':([3,5,6,7,21,22,23,38,51,52,53,55,56,57,61,65,68,69,],[-3,-6,-7,-8,-4,-5,-31,51,-35,-24,-11,-32,-25,-33,-34,68,-12,-26,]),'NEWLINE':([4,8,10,11,13,16,18,19,20,27,39,40,41,42,43,44,46,47,48,49,50,66,],[22,23,-9,-10,-14,-22,-17,-20,-21,-22,54,54,-15,-16,54,54,54,-13,-23,-18,-19,54,]),'PLUS':([13,16,18,19,20,25,27,30,35,41,42,47,48,49,50,],[28,-22,-17,-20,-21,28,-22,28,28,-15,-16,28,-23,-18,-19,]),'MINUS':([13,16,18,19,20,25,27,30,35,41,42,47,48,49,50,],[29,-22,-17,-20,-21,29,-22,29,29,-15,-16,29,-23,-18,-19,]),'EQUALS':([16,],[34,]),'TIMES':([16,18,19,20,27,41,42,48,49,50,],[-22,36,-20,-21,-22,36,36,-23,-18,-19,]),'DIVIDE':([16,18,19,20,27,41,42,48,49,50,],[-22,37,-20,-21,-22,37,37,-23,-18,-19,]),'COLON':([18,19,20,25,26,27,30,31,33,41,42,48,49,50,63,],[-17,-20,-21,39,40,-22,43,44,46,-15,-16,-23,-18,-19,66,]),'RPAREN':([18,19,20,27,35,41,42,45,48,49,50,58,59,60,67,],[-17,-20,-21,-22,48,-15,-16,-27,-23,-18,-19,-29,63,-28,-30,]),'COMMA':([58,60,67,],[-29,64,-30,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statements':([0,],[2,]),'statement':([0,2,32,33,45,],[3,18,38,39,47,]),'assignment_statement':([0,2,32,33,45,],[4,4,4,4,4,]),'expression_statement':([0,2,32,33,45,],[5,5,5,5,5,]),'if_statement':([0,2,32,33,45,],[6,6,6,6,6,]),'while_statement':([0,2,32,33,45,],[7,7,7,7,7,]),'function_definition':([0,2,32,33,45,],[8,8,8,8,8,]),'expression':([0,2,11,12,14,19,32,33,45,],[10,10,22,24,26,29,10,10,10,]),'term':([0,2,11,12,14,19,20,21,32,33,45,],[15,15,15,15,15,15,30,31,15,15,15,]),'factor':([0,2,11,12,14,19,20,21,27,28,32,33,45,],[16,16,16,16,16,16,16,16,36,37,16,16,16,]),'arg_list':([34,],[41,]),'parameters':([34,],[42,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statements':([0,24,62,],[2,38,65,]),'statement':([0,2,24,38,39,40,43,44,46,62,65,66,],[3,21,3,21,53,53,53,53,53,3,21,53,]),'simple_statement':([0,2,24,38,39,40,43,44,46,62,65,66,],[4,4,4,4,4,4,4,4,4,4,4,4,]),'if_statement':([0,2,24,38,39,40,43,44,46,62,65,66,],[5,5,5,5,5,5,5,5,5,5,5,5,]),'while_statement':([0,2,24,38,39,40,43,44,46,62,65,66,],[6,6,6,6,6,6,6,6,6,6,6,6,]),'function_definition':([0,2,24,38,39,40,43,44,46,62,65,66,],[7,7,7,7,7,7,7,7,7,7,7,7,]),'assignment_statement':([0,2,24,38,39,40,43,44,46,62,65,66,],[10,10,10,10,10,10,10,10,10,10,10,10,]),'expression_statement':([0,2,24,38,39,40,43,44,46,62,65,66,],[11,11,11,11,11,11,11,11,11,11,11,11,]),'expression':([0,2,12,14,17,24,34,38,39,40,43,44,46,62,65,66,],[13,13,25,30,35,13,47,13,13,13,13,13,13,13,13,13,]),'term':([0,2,12,14,17,24,28,29,34,38,39,40,43,44,46,62,65,66,],[18,18,18,18,18,18,41,42,18,18,18,18,18,18,18,18,18,18,]),'factor':([0,2,12,14,17,24,28,29,34,36,37,38,39,40,43,44,46,62,65,66,],[19,19,19,19,19,19,19,19,19,49,50,19,19,19,19,19,19,19,19,19,]),'unexpected_indent':([9,],[24,]),'suite':([39,40,43,44,46,66,],[52,55,56,57,61,69,]),'arg_list':([45,],[59,]),'parameters':([45,],[60,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,30 +27,40 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statements','program',1,'p_program','parser.py',5),
-  ('statements -> statement','statements',1,'p_statements','parser.py',9),
-  ('statements -> statements statement','statements',2,'p_statements','parser.py',10),
-  ('statement -> assignment_statement','statement',1,'p_statement','parser.py',14),
-  ('statement -> expression_statement','statement',1,'p_statement','parser.py',15),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',16),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',17),
-  ('statement -> function_definition','statement',1,'p_statement','parser.py',18),
-  ('assignment_statement -> ID EQUALS expression','assignment_statement',3,'p_assignment_statement','parser.py',22),
-  ('expression_statement -> expression','expression_statement',1,'p_expression_statement','parser.py',26),
-  ('expression -> expression PLUS term','expression',3,'p_expression_binop','parser.py',30),
-  ('expression -> expression MINUS term','expression',3,'p_expression_binop','parser.py',31),
-  ('expression -> term','expression',1,'p_expression_term','parser.py',35),
-  ('term -> term TIMES factor','term',3,'p_term_binop','parser.py',39),
-  ('term -> term DIVIDE factor','term',3,'p_term_binop','parser.py',40),
-  ('term -> factor','term',1,'p_term_factor','parser.py',44),
-  ('factor -> NUMBER','factor',1,'p_factor','parser.py',48),
-  ('factor -> ID','factor',1,'p_factor','parser.py',49),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor_group','parser.py',53),
-  ('if_statement -> IF expression COLON statement','if_statement',4,'p_if_statement','parser.py',57),
-  ('while_statement -> WHILE expression COLON statement','while_statement',4,'p_while_statement','parser.py',61),
-  ('function_definition -> DEF ID LPAREN arg_list RPAREN COLON statement','function_definition',7,'p_function_definition','parser.py',65),
-  ('arg_list -> <empty>','arg_list',0,'p_arg_list','parser.py',69),
-  ('arg_list -> parameters','arg_list',1,'p_arg_list','parser.py',70),
-  ('parameters -> ID','parameters',1,'p_parameters','parser.py',74),
-  ('parameters -> parameters COMMA ID','parameters',3,'p_parameters','parser.py',75),
+  ('program -> statements','program',1,'p_program','parser.py',32),
+  ('program -> <empty>','program',0,'p_program','parser.py',33),
+  ('statements -> statement','statements',1,'p_statements','parser.py',39),
+  ('statements -> statements statement','statements',2,'p_statements','parser.py',40),
+  ('statement -> simple_statement NEWLINE','statement',2,'p_statement','parser.py',44),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',45),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',46),
+  ('statement -> function_definition','statement',1,'p_statement','parser.py',47),
+  ('simple_statement -> assignment_statement','simple_statement',1,'p_simple_statement','parser.py',51),
+  ('simple_statement -> expression_statement','simple_statement',1,'p_simple_statement','parser.py',52),
+  ('suite -> statement','suite',1,'p_suite','parser.py',56),
+  ('suite -> NEWLINE INDENT statements DEDENT','suite',4,'p_suite','parser.py',57),
+  ('assignment_statement -> ID EQUALS expression','assignment_statement',3,'p_assignment_statement','parser.py',61),
+  ('expression_statement -> expression','expression_statement',1,'p_expression_statement','parser.py',79),
+  ('expression -> expression PLUS term','expression',3,'p_expression_binop','parser.py',83),
+  ('expression -> expression MINUS term','expression',3,'p_expression_binop','parser.py',84),
+  ('expression -> term','expression',1,'p_expression_term','parser.py',89),
+  ('term -> term TIMES factor','term',3,'p_term_binop','parser.py',93),
+  ('term -> term DIVIDE factor','term',3,'p_term_binop','parser.py',94),
+  ('term -> factor','term',1,'p_term_factor','parser.py',105),
+  ('factor -> NUMBER','factor',1,'p_factor','parser.py',109),
+  ('factor -> ID','factor',1,'p_factor','parser.py',110),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor_group','parser.py',114),
+  ('if_statement -> IF expression COLON suite','if_statement',4,'p_if_statement','parser.py',118),
+  ('while_statement -> WHILE expression COLON suite','while_statement',4,'p_while_statement','parser.py',122),
+  ('function_definition -> DEF ID LPAREN arg_list RPAREN COLON suite','function_definition',7,'p_function_definition','parser.py',126),
+  ('arg_list -> <empty>','arg_list',0,'p_arg_list','parser.py',130),
+  ('arg_list -> parameters','arg_list',1,'p_arg_list','parser.py',131),
+  ('parameters -> ID','parameters',1,'p_parameters','parser.py',135),
+  ('parameters -> parameters COMMA ID','parameters',3,'p_parameters','parser.py',136),
+  ('statement -> error NEWLINE','statement',2,'p_statement_error','parser.py',140),
+  ('if_statement -> IF error COLON suite','if_statement',4,'p_statement_error','parser.py',141),
+  ('while_statement -> WHILE error COLON suite','while_statement',4,'p_statement_error','parser.py',142),
+  ('function_definition -> DEF error COLON suite','function_definition',4,'p_statement_error','parser.py',143),
+  ('statement -> INDENT unexpected_indent statements DEDENT','statement',4,'p_statement_indented','parser.py',147),
+  ('unexpected_indent -> <empty>','unexpected_indent',0,'p_unexpected_indent','parser.py',151),
 ]
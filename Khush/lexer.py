@@ -1,5 +1,34 @@
 # lexer.py
-import ply.lex as lex
+import os
+import re
+import sys
+
+if __name__ == "__main__":
+    # Run as a script: the shared modules are in the lexyacc package at the
+    # repository root
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexyacc import frozen, stream
+from lexyacc.diagnostics import Diagnostics
+
+# Reserved words. Only what a declaration is made of gets a token of its
+# own; the other keywords are KEYWORD, or JUMP for those whose statement
+# always ends at the next semicolon, so the parser can skip a statement
+# without knowing its syntax. this and super lex as ID, as in this.x = 1;
+# so does record except where it declares one (see t_ID).
+reserved = {word: 'DATATYPE' for word in (
+    'int', 'long', 'short', 'byte', 'float', 'double', 'boolean', 'char', 'String', 'void')}
+reserved.update({word: 'MODIFIER' for word in (
+    'public', 'protected', 'private', 'static', 'final', 'abstract',
+    'transient', 'volatile', 'synchronized', 'native', 'strictfp', 'default')})
+reserved.update({word: 'KEYWORD' for word in (
+    'if', 'else', 'while', 'do', 'try', 'catch', 'finally', 'switch', 'case',
+    'instanceof', 'extends', 'implements', 'throws')})
+reserved.update({word: 'JUMP' for word in (
+    'return', 'throw', 'break', 'continue', 'assert', 'yield')})
+reserved.update({word: 'LITERAL' for word in ('true', 'false', 'null')})
+reserved.update({'class': 'CLASS', 'interface': 'CLASS', 'enum': 'ENUM', 'for': 'FOR',
+                 'new': 'NEW', 'package': 'PACKAGE', 'import': 'IMPORT'})
 
 tokens = (
     'DATATYPE',
@@ -8,7 +37,34 @@ tokens = (
     'RPAREN',
     'LBRACE',
     'RBRACE',
+    'LBRACKET',
+    'RBRACKET',
     'SEMICOLON',
+    'COMMA',
+    'DOT',
+    'ELLIPSIS',
+    'AT',
+    'ASSIGN',
+    'OPERATOR',
+    'TYPEARGS',
+    'LITERAL',
+    'MODIFIER',
+    'CLASS',
+    'ENUM',
+    'RECORD',
+    'FOR',
+    'PACKAGE',
+    'IMPORT',
+    'KEYWORD',
+    'JUMP',
+    'NEW',
+)
+
+# Inside /* */ comments; a state rather than one regex so a comment can run
+# across the chunks of a streamed file (the lexer keeps its state from one
+# input() to the next)
+states = (
+    ('comment', 'exclusive'),
 )
 
 # Single-character tokens
@@ -16,34 +72,101 @@ t_LPAREN    = r'\('
 t_RPAREN    = r'\)'
 t_LBRACE    = r'\{'
 t_RBRACE    = r'\}'
+t_LBRACKET  = r'\['
+t_RBRACKET  = r'\]'
 t_SEMICOLON = r';'
+t_COMMA     = r','
+t_DOT       = r'\.'
+t_ELLIPSIS  = r'\.\.\.'
+t_AT        = r'@'
+t_ASSIGN    = r'='
 
-# Use functions so we can add regex flags and control precedence.
-# DATATYPE must be matched BEFORE ID — functions are checked before simple tokens,
-# but to be safe we use an explicit regex with word-boundaries.
+# Function rules are tried in the order they are defined, before the string
+# rules above: comments before the operators they start with, type
+# arguments before the < they start with, and every operator, == and +=
+# included, before ASSIGN
 
-def t_DATATYPE(t):
-    r'\b(int|float|double|boolean|char|String|void)\b'
+def t_line_comment(t):
+    r'//.*'
+    pass
+
+def t_begin_comment(t):
+    r'/\*'
+    t.lexer.begin('comment')
+
+def t_TYPEARGS(t):
+    r'<(?:[\w\s.,?\[\]&]|<(?:[\w\s.,?\[\]&]|<[\w\s.,?\[\]&]*>)*>)*>'
+    # The <...> of a generic type, nested up to three deep, as one token so
+    # its commas never separate declarators. An expression can lex as one
+    # too (a < b && c > d); in the statements and initializers the parser
+    # skips, that makes no difference.
+    t.lexer.lineno += t.value.count('\n')
+    t.value = ' '.join(t.value.split()).replace('< ', '<').replace(' >', '>')
+    return t
+
+def t_LITERAL(t):
+    r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|0[xXbB][0-9a-fA-F_]+[lL]?|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?[fFdDlL]?'
+    return t
+
+def t_OPERATOR(t):
+    r'>>>=|<<=|>>=|->|::|\+\+|--|&&|\|\||[=!<>+\-*/%&|^]=|[+\-*/%&|^!~?:<>]'
     return t
 
 def t_ID(t):
-    r'[a-zA-Z_][a-zA-Z_0-9]*'
-    # If identifier equals a datatype (shouldn't happen because DATATYPE matched first),
-    # we would handle it, but DATATYPE regex above has word boundaries so it's safe.
+    r'[a-zA-Z_$][a-zA-Z_0-9$]*'
+    t.type = reserved.get(t.value, 'ID')
+    if t.value == 'record' and _RECORD.match(t.lexer.lexdata, t.lexer.lexpos):
+        # Not a type name since Java 16, so record Name( or record Name< can
+        # only declare one; elsewhere it is an ordinary name
+        t.type = 'RECORD'
     return t
 
+_RECORD = re.compile(r'\s+[a-zA-Z_$][a-zA-Z_0-9$]*\s*[(<]')
+
 # ignore spaces and tabs
-t_ignore = ' \t'
+t_ignore = ' \t\r\f'
+
+def t_comment_end(t):
+    r'\*/'
+    t.lexer.begin('INITIAL')
+
+def t_comment_newline(t):
+    r'\n+'
+    t.lexer.lineno += len(t.value)
+
+def t_comment_text(t):
+    r'[^*\n]+|\*'
+    pass
+
+t_comment_ignore = ''
+
+def t_comment_error(t):
+    t.lexer.skip(1)
 
 def t_newline(t):
     r'\n+'
     t.lexer.lineno += t.value.count("\n")
 
+def safe_cut(data):
+    # Where a streamed file may be cut (see stream.py): stream.safe_cut's
+    # cut, moved back to the end of a line ending in ; { or }. A TYPEARGS
+    # token can span lines but never holds one of those, so no cut there
+    # splits it; 0 if there is no such line yet.
+    cut = stream.safe_cut(data)
+    while cut:
+        start = data.rfind('\n', 0, cut - 1) + 1
+        line = data[start:cut].rstrip()
+        if line and line[-1] in ';{}':
+            return cut
+        cut = start
+    return 0
+
 def t_error(t):
-    print(f"Illegal character '{t.value[0]}' at line {t.lineno}")
+    t.lexer.diagnostics.illegal(t.lexer, t.value[0])
     t.lexer.skip(1)
 
-lexer = lex.lex()
+lexer = frozen.lexer(sys.modules[__name__])
+lexer.diagnostics = Diagnostics()
 
 # small test harness (optional)
 if __name__ == "__main__":
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASSIGN', 'AT', 'CLASS', 'COMMA', 'DATATYPE', 'DOT', 'ELLIPSIS', 'ENUM', 'FOR', 'ID', 'IMPORT', 'JUMP', 'KEYWORD', 'LBRACE', 'LBRACKET', 'LITERAL', 'LPAREN', 'MODIFIER', 'NEW', 'OPERATOR', 'PACKAGE', 'RBRACE', 'RBRACKET', 'RECORD', 'RPAREN', 'SEMICOLON', 'TYPEARGS'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'comment': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_line_comment>//.*)|(?P<t_begin_comment>/\\*)|(?P<t_TYPEARGS><(?:[\\w\\s.,?\\[\\]&]|<(?:[\\w\\s.,?\\[\\]&]|<[\\w\\s.,?\\[\\]&]*>)*>)*>)|(?P<t_LITERAL>"(?:[^"\\\\\\n]|\\\\.)*"|\\\'(?:[^\\\'\\\\\\n]|\\\\.)*\\\'|0[xXbB][0-9a-fA-F_]+[lL]?|(?:\\d[\\d_]*(?:\\.[\\d_]*)?|\\.\\d[\\d_]*)(?:[eE][+-]?\\d+)?[fFdDlL]?)|(?P<t_OPERATOR>>>>=|<<=|>>=|->|::|\\+\\+|--|&&|\\|\\||[=!<>+\\-*/%&|^]=|[+\\-*/%&|^!~?:<>])|(?P<t_ID>[a-zA-Z_$][a-zA-Z_0-9$]*)|(?P<t_newline>\\n+)|(?P<t_ELLIPSIS>\\.\\.\\.)|(?P<t_DOT>\\.)|(?P<t_LBRACE>\\{)|(?P<t_LBRACKET>\\[)|(?P<t_LPAREN>\\()|(?P<t_RBRACE>\\})|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_ASSIGN>=)|(?P<t_AT>@)|(?P<t_COMMA>,)|(?P<t_SEMICOLON>;)', [None, ('t_line_comment', 'line_comment'), ('t_begin_comment', 'begin_comment'), ('t_TYPEARGS', 'TYPEARGS'), ('t_LITERAL', 'LITERAL'), ('t_OPERATOR', 'OPERATOR'), ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'ELLIPSIS'), (None, 'DOT'), (None, 'LBRACE'), (None, 'LBRACKET'), (None, 'LPAREN'), (None, 'RBRACE'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'ASSIGN'), (None, 'AT'), (None, 'COMMA'), (None, 'SEMICOLON')])], 'comment': [('(?P<t_comment_end>\\*/)|(?P<t_comment_newline>\\n+)|(?P<t_comment_text>[^*\\n]+|\\*)', [None, ('t_comment_end', 'end'), ('t_comment_newline', 'newline'), ('t_comment_text', 'text')])]}
+_lexstateignore = {'comment': '', 'INITIAL': ' \t\r\x0c'}
+_lexstateerrorf = {'comment': 't_comment_error', 'INITIAL': 't_error'}
+_lexstateeoff = {}
+_lexsignature = '([\'ASSIGN\', \'AT\', \'CLASS\', \'COMMA\', \'DATATYPE\', \'DOT\', \'ELLIPSIS\', \'ENUM\', \'FOR\', \'ID\', \'IMPORT\', \'JUMP\', \'KEYWORD\', \'LBRACE\', \'LBRACKET\', \'LITERAL\', \'LPAREN\', \'MODIFIER\', \'NEW\', \'OPERATOR\', \'PACKAGE\', \'RBRACE\', \'RBRACKET\', \'RECORD\', \'RPAREN\', \'SEMICOLON\', \'TYPEARGS\'], ((\'comment\', \'exclusive\'),), \'\', [(\'t_ASSIGN\', \'=\'), (\'t_AT\', \'@\'), (\'t_COMMA\', \',\'), (\'t_DOT\', \'\\\\.\'), (\'t_ELLIPSIS\', \'\\\\.\\\\.\\\\.\'), (\'t_LBRACE\', \'\\\\{\'), (\'t_LBRACKET\', \'\\\\[\'), (\'t_LPAREN\', \'\\\\(\'), (\'t_RBRACE\', \'\\\\}\'), (\'t_RBRACKET\', \'\\\\]\'), (\'t_RPAREN\', \'\\\\)\'), (\'t_SEMICOLON\', \';\'), (\'t_comment_ignore\', \'\'), (\'t_ignore\', \' \\t\\r\\x0c\')], [(\'t_line_comment\', \'//.*\'), (\'t_begin_comment\', \'/\\\\*\'), (\'t_TYPEARGS\', \'<(?:[\\\\w\\\\s.,?\\\\[\\\\]&]|<(?:[\\\\w\\\\s.,?\\\\[\\\\]&]|<[\\\\w\\\\s.,?\\\\[\\\\]&]*>)*>)*>\'), (\'t_LITERAL\', \'"(?:[^"\\\\\\\\\\\\n]|\\\\\\\\.)*"|\\\\\\\'(?:[^\\\\\\\'\\\\\\\\\\\\n]|\\\\\\\\.)*\\\\\\\'|0[xXbB][0-9a-fA-F_]+[lL]?|(?:\\\\d[\\\\d_]*(?:\\\\.[\\\\d_]*)?|\\\\.\\\\d[\\\\d_]*)(?:[eE][+-]?\\\\d+)?[fFdDlL]?\'), (\'t_OPERATOR\', \'>>>=|<<=|>>=|->|::|\\\\+\\\\+|--|&&|\\\\|\\\\||[=!<>+\\\\-*/%&|^]=|[+\\\\-*/%&|^!~?:<>]\'), (\'t_ID\', \'[a-zA-Z_$][a-zA-Z_0-9$]*\'), (\'t_comment_end\', \'\\\\*/\'), (\'t_comment_newline\', \'\\\\n+\'), (\'t_comment_text\', \'[^*\\\\n]+|\\\\*\'), (\'t_comment_error\', None), (\'t_newline\', \'\\\\n+\'), (\'t_error\', None)])'
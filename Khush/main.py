@@ -1,8 +1,31 @@
 # main.py
+import argparse
+import json
+import os
+import sys
 
-from parser import parser, lexer   # parser.py already imports tokens & builds parser
+# The shared modules are in the lexyacc package at the repository root,
+# which is not on sys.path when this runs as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-if __name__ == "__main__":
+from lexyacc.diagnostics import Diagnostics
+from parser import Parser, parse   # parser.py already imports tokens & builds parser
+from symbols import SymbolIndex
+
+MESSAGES = {
+    'declaration': "✅ Valid simple data-type declaration",
+    'function_declaration': "✅ Valid function declaration",
+    'function_definition': "✅ Valid function definition",
+    'class': "✅ Valid class declaration",
+    'constant': "✅ Valid enum constant",
+    'package': "✅ Valid package declaration",
+    'import': "✅ Valid import",
+}
+
+def print_event(kind, name):
+    print(MESSAGES[kind])
+
+def repl():
     print("Enter Java statement (Ctrl+D to exit). Examples:")
     print("  int x;")
     print("  void f();")
@@ -14,11 +37,73 @@ if __name__ == "__main__":
             if not s:
                 continue
 
-            # Reset lexer input for each new statement
-            lexer.input(s)
-
-            # Parse the statement
-            parser.parse(s, lexer=lexer)
+            # Parse the statement; errors are collected rather than printed
+            diagnostics = parse(s, Diagnostics(on_event=print_event))
+            for d in diagnostics:
+                print(f"❌ {d.message}")
 
     except EOFError:
-        print("\nExiting.")
\ No newline at end of file
+        print("\nExiting.")
+
+def iter_inputs(paths):
+    # Directories are walked (sorted, so output order is stable) for .java files
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith('.java'):
+                    yield os.path.join(root, name)
+
+def scan(paths, find=None, out=sys.stdout):
+    # One JSON line per file with its errors and declarations (only those
+    # named in find, if given), then a summary. Each file is one streamed
+    # parse into a symbol index of its own; complete is false when the parse
+    # gave up early, so declarations after that point are not listed.
+    files = failed = unreadable = incomplete = symbols = 0
+    for path in iter_inputs(paths):
+        files += 1
+        index = SymbolIndex()
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                diagnostics = Parser(symbols=index).parse_file(f)
+        except OSError as e:
+            unreadable += 1
+            out.write(json.dumps({'file': path, 'ok': False, 'error': str(e)}) + '\n')
+            continue
+        if find is None:
+            found = list(index)
+        else:
+            found = [s for name in find for s in index.lookup(name)]
+        errors = [d.as_dict() for d in diagnostics]
+        failed += bool(errors)
+        incomplete += not index.complete
+        symbols += len(found)
+        out.write(json.dumps({'file': path, 'ok': not errors, 'errors': errors,
+                              'complete': index.complete,
+                              'symbols': [s.as_dict() for s in found]}) + '\n')
+    out.write(json.dumps({'summary': {'files': files, 'ok': files - failed - unreadable,
+                                      'failed': failed, 'unreadable': unreadable,
+                                      'incomplete': incomplete, 'symbols': symbols}}) + '\n')
+    if unreadable:
+        return 2
+    return 1 if failed else 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(
+        description="Java declaration parser. With no paths, starts the interactive prompt.")
+    ap.add_argument('paths', nargs='*',
+                    help="Java files, or directories to search for .java files")
+    ap.add_argument('--find', metavar='NAME', action='append',
+                    help="only list the declarations of NAME (may be repeated)")
+    args = ap.parse_args(argv)
+
+    if not args.paths:
+        repl()
+        return 0
+    return scan(args.paths, args.find)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,45 +1,510 @@
 # parser.py
-import ply.yacc as yacc
-from lexer import tokens, lexer
+import copy
+import os
+import sys
 
-# Grammar rules
+if __name__ == "__main__":
+    # Run as a script: the shared modules are in the lexyacc package at the
+    # repository root
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def p_statement(p):
-    '''statement : declaration
-                 | function_declaration
-                 | function_definition'''
-    # the action is in the specific rules below
+from lexyacc import frozen, stream, tokenstream
+from lexyacc.diagnostics import Diagnostics, TooManyErrors
+from lexer import tokens, lexer, safe_cut
+
+# Grammar rules - a whole compilation unit: package and imports,
+# declarations, functions and constructors with their parameter lists and
+# bodies, and classes, interfaces, enums and records, which nest to any
+# depth. Types can be qualified, generic and arrays.
+#
+# Only declarations are parsed. A statement in a body, or a variable's
+# initializer, is skipped as a run of tokens: up to the next semicolon with
+# ( ), [ ] and { } nested (expression), or, for a statement starting with a
+# keyword, up to its semicolon or its { } block, which is parsed as a block
+# so the declarations in it are found (clause). A for statement is parsed
+# as far as the variables it declares. Nothing in a run is an error, so
+# valid code gives none.
+#
+# Symbols: a Parser given a symbols.SymbolIndex records every declaration
+# in it as it is reduced (see symbols.py); a class or function header opens
+# its scope as it is reduced, before its body is read, and the end of the
+# class or function closes it.
+#
+# Error recovery: a member or a block item with a syntax error is skipped
+# up to the next semicolon, or up to and including the next { } block
+# (parsed as a block, so braces in it still nest), and parsing goes on;
+# every such statement gets its own error.
+
+def p_compilation_unit(p):
+    'compilation_unit : members'
+    pass
+
+def p_members(p):
+    '''members : members member
+               | empty'''
+    pass
+
+def p_member(p):
+    '''member : declaration
+              | function_declaration
+              | function_definition
+              | class_declaration
+              | package_declaration
+              | import_declaration
+              | modifiers block
+              | SEMICOLON'''
+    # the action is in the specific rules below; modifiers block is an
+    # initializer, static or not
+
+def p_package_declaration(p):
+    'package_declaration : PACKAGE name SEMICOLON'
+    if p.parser.symbols is not None:
+        p.parser.symbols.add(p[2], 'package', p[2], p.lineno(1))
+    p.lexer.diagnostics.emit('package', p[2])
+
+def p_import_declaration(p):
+    '''import_declaration : IMPORT name SEMICOLON
+                          | IMPORT name DOT OPERATOR SEMICOLON
+                          | IMPORT MODIFIER name SEMICOLON
+                          | IMPORT MODIFIER name DOT OPERATOR SEMICOLON'''
+    # Indexed under the name it makes visible, '*' for a whole package
+    if p[len(p) - 3] == '.':
+        name = p[len(p) - 2]
+        full = p[len(p) - 4] + '.' + name
+    else:
+        full = p[len(p) - 2]
+        name = full.rsplit('.', 1)[-1]
+    if p.parser.symbols is not None:
+        p.parser.symbols.add(name, 'import', full, p.lineno(1))
+    p.lexer.diagnostics.emit('import', full)
 
 def p_declaration(p):
-    'declaration : DATATYPE ID SEMICOLON'
-    print("✅ Valid simple data-type declaration")
+    '''declaration : modifiers type declarators SEMICOLON
+       local_declaration : type declarators SEMICOLON
+                         | modifier_list type declarators SEMICOLON'''
+    # A local declaration can't start with an empty modifiers: in a block,
+    # an ID could as well start a statement
+    symbols = p.parser.symbols
+    type = p[len(p) - 3]
+    for name, dims, line in p[len(p) - 2]:
+        if symbols is not None:
+            symbols.add(name, 'variable', type + dims, line)
+        p.lexer.diagnostics.emit('declaration', name)
+
+def p_declarators(p):
+    '''declarators : declarator
+                   | declarators COMMA declarator'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[0] = p[1]
+        p[0].append(p[3])
+
+def p_declarator(p):
+    '''declarator : ID
+                  | ID dims
+                  | ID ASSIGN expression
+                  | ID dims ASSIGN expression'''
+    # (name, the [] after it, line); the initializer is skipped
+    dims = p[2] if len(p) in (3, 5) else ''
+    p[0] = (p[1], dims, p.lineno(1))
+
+def p_type(p):
+    '''type : DATATYPE
+            | DATATYPE dims
+            | name
+            | name dims
+            | name TYPEARGS
+            | name TYPEARGS dims'''
+    p[0] = ''.join(p[1:])
+
+def p_dims(p):
+    '''dims : LBRACKET RBRACKET
+            | dims LBRACKET RBRACKET'''
+    p[0] = '[]' if len(p) == 3 else p[1] + '[]'
+
+def p_name(p):
+    '''name : ID
+            | name DOT ID'''
+    p[0] = p[1] if len(p) == 2 else p[1] + '.' + p[3]
+
+def p_modifiers(p):
+    '''modifiers : modifier_list
+                 | empty'''
+    pass
+
+def p_modifier_list(p):
+    '''modifier_list : modifier
+                     | modifier_list modifier'''
+    pass
+
+def p_modifier(p):
+    '''modifier : MODIFIER
+                | TYPEARGS
+                | AT name
+                | AT name LPAREN RPAREN
+                | AT name LPAREN inner RPAREN'''
+    # The type parameters of a generic method, and annotations, go with
+    # the modifiers
+    pass
+
+def p_function_header(p):
+    '''function_header : modifiers type ID LPAREN parameter_list RPAREN throws
+                       | modifiers ID LPAREN parameter_list RPAREN throws'''
+    # The second is a constructor, whose type is its class
+    name = p[len(p) - 5]
+    p[0] = name
+    symbols = p.parser.symbols
+    if symbols is not None:
+        symbols.add(name, 'function', p[2], p.lineno(len(p) - 5))
+        symbols.enter(name)
+        for type, parameter, line in p[len(p) - 3]:
+            symbols.add(parameter, 'parameter', type, line)
+
+def p_compact_constructor_header(p):
+    'function_header : modifiers ID'
+    # The compact canonical constructor of a record, R { ... }, which takes
+    # the record's components
+    p[0] = p[2]
+    symbols = p.parser.symbols
+    if symbols is not None:
+        symbols.add(p[2], 'function', p[2], p.lineno(2))
+        symbols.enter(p[2])
+
+def p_throws(p):
+    '''throws : KEYWORD clause
+              | empty'''
+    # throws A, B; or the default value of an annotation element
+    pass
+
+def p_parameter_list(p):
+    '''parameter_list : parameters
+                      | empty'''
+    p[0] = p[1] or []
+
+def p_parameters(p):
+    '''parameters : parameter
+                  | parameters COMMA parameter'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[0] = p[1]
+        p[0].append(p[3])
+
+def p_parameter(p):
+    '''parameter : type ID
+                 | type ELLIPSIS ID
+                 | modifier_list type ID
+                 | modifier_list type ELLIPSIS ID'''
+    # (type, name, line); a varargs parameter's type ends in ...
+    if p[len(p) - 2] == '...':
+        type = p[len(p) - 3] + '...'
+    else:
+        type = p[len(p) - 2]
+    p[0] = (type, p[len(p) - 1], p.lineno(len(p) - 1))
 
 def p_function_declaration(p):
-    'function_declaration : DATATYPE ID LPAREN RPAREN SEMICOLON'
-    print("✅ Valid function declaration")
+    'function_declaration : function_header SEMICOLON'
+    _leave(p)
+    p.lexer.diagnostics.emit('function_declaration', p[1])
 
 def p_function_definition(p):
-    'function_definition : DATATYPE ID LPAREN RPAREN LBRACE RBRACE'
-    print("✅ Valid function definition")
+    'function_definition : function_header block'
+    _leave(p)
+    p.lexer.diagnostics.emit('function_definition', p[1])
+
+def p_block(p):
+    'block : LBRACE block_items RBRACE'
+    pass
+
+def p_block_items(p):
+    '''block_items : block_items block_item
+                   | empty'''
+    pass
+
+def p_block_item(p):
+    '''block_item : local_declaration
+                  | class_declaration
+                  | block
+                  | statement'''
+    pass
+
+def p_statement(p):
+    '''statement : SEMICOLON
+                 | name SEMICOLON
+                 | name continuation SEMICOLON
+                 | name continuation expression SEMICOLON
+                 | expression_start SEMICOLON
+                 | expression_start expression SEMICOLON
+                 | JUMP SEMICOLON
+                 | JUMP expression SEMICOLON
+                 | KEYWORD block
+                 | KEYWORD clause block
+                 | KEYWORD clause SEMICOLON
+                 | MODIFIER continuation block
+                 | MODIFIER continuation clause block
+                 | MODIFIER continuation SEMICOLON
+                 | MODIFIER continuation clause SEMICOLON
+                 | FOR LPAREN for_control RPAREN block_item'''
+    # Skipped. A statement starting with a name goes on with something no
+    # type could (x = 1, f(), a[i]++), so name ID starts a declaration. The
+    # MODIFIER ones are synchronized (lock) { } and a switch's default:,
+    # default being a modifier of interface methods too.
+    pass
+
+def p_for_control(p):
+    '''for_control : for_variable OPERATOR inner
+                   | local_declaration
+                   | local_declaration inner
+                   | SEMICOLON
+                   | SEMICOLON inner
+                   | name SEMICOLON
+                   | name SEMICOLON inner
+                   | name continuation inner
+                   | expression_start inner'''
+    # What is between the parentheses of a for: for (T x : xs), whose
+    # OPERATOR is the colon, for (T i = 0, j = 0; ...), whose variables are
+    # declared like any others, or for (i = 0; ...), skipped
+    pass
+
+def p_for_variable(p):
+    '''for_variable : type ID
+                    | modifier_list type ID'''
+    if p.parser.symbols is not None:
+        p.parser.symbols.add(p[len(p) - 1], 'variable', p[len(p) - 2], p.lineno(len(p) - 1))
+    p.lexer.diagnostics.emit('declaration', p[len(p) - 1])
+
+def p_continuation(p):
+    '''continuation : ASSIGN
+                    | OPERATOR
+                    | LPAREN RPAREN
+                    | LPAREN inner RPAREN
+                    | LBRACKET inner RBRACKET'''
+    pass
+
+def p_expression_start(p):
+    '''expression_start : NEW
+                        | LITERAL
+                        | OPERATOR
+                        | LPAREN RPAREN
+                        | LPAREN inner RPAREN'''
+    pass
+
+def p_expression(p):
+    '''expression : expression_item
+                  | expression expression_item
+       expression_item : item
+                       | LBRACE RBRACE
+                       | LBRACE inner RBRACE
+       clause : clause_item
+              | clause clause_item
+       clause_item : item
+                   | COMMA
+       inner : inner_item
+             | inner inner_item
+       inner_item : expression_item
+                  | COMMA
+                  | SEMICOLON'''
+    # Runs of skipped tokens. An expression stops at a comma or semicolon
+    # outside brackets; a clause (if (c), extends A, B, throws E) at a
+    # semicolon or a { } block; inner is what is between brackets.
+    pass
+
+def p_item(p):
+    '''item : ID
+            | DATATYPE
+            | LITERAL
+            | MODIFIER
+            | CLASS
+            | ENUM
+            | RECORD
+            | FOR
+            | KEYWORD
+            | JUMP
+            | NEW
+            | TYPEARGS
+            | OPERATOR
+            | ASSIGN
+            | AT
+            | DOT
+            | ELLIPSIS
+            | LPAREN RPAREN
+            | LPAREN inner RPAREN
+            | LBRACKET RBRACKET
+            | LBRACKET inner RBRACKET'''
+    pass
+
+def p_class_header(p):
+    '''class_header : modifiers CLASS ID
+                    | modifiers CLASS ID clause
+       enum_header : modifiers ENUM ID
+                   | modifiers ENUM ID clause'''
+    # The clause is the type parameters, extends and implements
+    p[0] = p[3]
+    symbols = p.parser.symbols
+    if symbols is not None:
+        symbols.add(p[3], 'class', p[3], p.lineno(3))
+        symbols.enter(p[3])
+
+def p_record_header(p):
+    '''class_header : modifiers RECORD ID LPAREN parameter_list RPAREN
+                    | modifiers RECORD ID LPAREN parameter_list RPAREN clause
+                    | modifiers RECORD ID TYPEARGS LPAREN parameter_list RPAREN
+                    | modifiers RECORD ID TYPEARGS LPAREN parameter_list RPAREN clause'''
+    # A record is a class whose components are its fields
+    p[0] = p[3]
+    symbols = p.parser.symbols
+    if symbols is not None:
+        symbols.add(p[3], 'class', p[3], p.lineno(3))
+        symbols.enter(p[3])
+        for type, component, line in p[5] if p[4] == '(' else p[6]:
+            symbols.add(component, 'variable', type, line)
+
+def p_class_declaration(p):
+    '''class_declaration : class_header LBRACE members RBRACE
+                         | enum_header LBRACE enum_body RBRACE'''
+    _leave(p)
+    p.lexer.diagnostics.emit('class', p[1])
+
+def p_enum_body(p):
+    '''enum_body : enum_constants
+                 | enum_constants SEMICOLON members
+       enum_constants : constant_list
+                      | constant_list COMMA
+                      | empty
+       constant_list : enum_constant
+                     | constant_list COMMA enum_constant'''
+    # The constants, then, after a semicolon, the members of any class
+    pass
+
+def p_enum_constant(p):
+    '''enum_constant : constant_header
+                     | constant_header LBRACE members RBRACE'''
+    # A constant with a body is a class of its own, scoped under the constant
+    _leave(p)
+
+def p_constant_header(p):
+    '''constant_header : ID arguments
+                       | modifier_list ID arguments'''
+    name = p[len(p) - 2]
+    symbols = p.parser.symbols
+    if symbols is not None:
+        symbols.add(name, 'constant', symbols.scope, p.lineno(len(p) - 2))
+        symbols.enter(name)
+    p.lexer.diagnostics.emit('constant', name)
+
+def p_arguments(p):
+    '''arguments : LPAREN RPAREN
+                 | LPAREN inner RPAREN
+                 | empty'''
+    pass
+
+def _leave(p):
+    if p.parser.symbols is not None:
+        p.parser.symbols.leave()
+
+def p_empty(p):
+    'empty :'
+    pass
+
+def p_statement_error(p):
+    '''member : error SEMICOLON
+              | error block
+       block_item : error SEMICOLON
+                  | error block'''
+    # Error recovery: skip to the end of the declaration or past the braces.
+    # errok ends PLY's quiet window here, so an error in the next statement
+    # is reported too rather than three tokens on
+    p.parser.errok()
 
 def p_error(p):
-    if p:
-        print(f"❌ Syntax error at token {p.type} ('{p.value}') line {p.lineno}")
-    else:
-        print("❌ Syntax error at EOF")
+    # Only used by the module-level parser; p is None at EOF, where PLY
+    # gives us no lexer
+    lexobj = p.lexer if p else lexer
+    lexobj.diagnostics.syntax(p, lexobj)
+
+parser = frozen.parser(sys.modules[__name__])
+parser.symbols = None
+
+class Parser:
+    # A reentrant parser: its own lexer and LR stacks over the shared tables.
+    # Use one instance per thread; every parse() starts from a clean lexer.
+    # With an instrument.Profile the parse loop reports what it does there.
+    # With a symbols.SymbolIndex it records each declaration there; parses
+    # of more than one unit can share one index.
+    # With a limits.Limits a parse stops at the first limit it passes.
+    def __init__(self, profile=None, symbols=None, limits=None):
+        self.lexer = lexer.clone()
+        self.profile = profile
+        self.limits = limits
+        if profile is None:
+            self._parser = copy.copy(parser)
+            self._parser.errorfunc = self._error
+        else:
+            self._parser = profile.instrument(parser)
+            self._parser.errorfunc = profile.errorfunc(self._error)
+        self._parser.symbols = symbols
+
+    @property
+    def symbols(self):
+        return self._parser.symbols
+
+    def _error(self, tok):
+        self.lexer.diagnostics.syntax(tok, self._source)
+        if tok is None and self._parser.symbols is not None:
+            # A syntax error at the end: recovery may have skipped everything
+            # from an earlier error on, and the index lacks it
+            self._parser.symbols.complete = False
+
+    def parse(self, s, diagnostics=None):
+        # Returns the Diagnostics for s; set on_event on it to see each construct
+        return self._run(s, self.lexer, diagnostics)
+
+    def parse_file(self, f, diagnostics=None, chunk_size=stream.CHUNK_SIZE):
+        # Like parse for the text read from file object f, which is lexed a
+        # chunk at a time (see stream.py) and so never held whole
+        source = stream.StreamLexer(self.lexer, f, chunk_size, safe_cut)
+        return self._run(None, source, diagnostics)
+
+    def scan(self, data):
+        # data lexed once into a tokenstream.TokenStream, which parse_tokens
+        # (of this or any Parser of the grammar) can parse again and again
+        self.lexer.begin('INITIAL')
+        return tokenstream.scan(self.lexer, data, tokens)
+
+    def parse_tokens(self, scanned, diagnostics=None):
+        # Like parse for the text scanned was read from, without lexing it
+        return self._run(None, tokenstream.TokenLexer(self.lexer, scanned), diagnostics)
+
+    def _run(self, s, source, diagnostics):
+        if diagnostics is None:
+            diagnostics = Diagnostics()
+        self.lexer.diagnostics = diagnostics
+        self.lexer.lineno = 1
+        self.lexer.begin('INITIAL')     # a comment left open by the last input
+        if self._parser.symbols is not None:
+            self._parser.symbols.reset_scopes()
+        self._source = source
+        tokenfunc = None
+        if self.profile is not None:
+            tokenfunc = self.profile.tokenfunc(source)
+        if self.limits:
+            tokenfunc = self.limits.tokenfunc(self._parser, source, tokenfunc)
+        try:
+            if self.profile is None:
+                self._parser.parse(s, lexer=source, tokenfunc=tokenfunc)
+            else:
+                self.profile.timed(self._parser.parse, s, lexer=source,
+                                   tokenfunc=tokenfunc)
+        except TooManyErrors:
+            # Stopped early: whatever the index was given, it lacks the rest
+            if self._parser.symbols is not None:
+                self._parser.symbols.complete = False
+        return diagnostics
 
-parser = yacc.yacc()
+def parse(s, diagnostics=None):
+    return Parser().parse(s, diagnostics)
 
 if __name__ == "__main__":
-    print("Enter Java statement (Ctrl+D to exit). Examples:  int x;   void f();   int add() {}")
-    try:
-        while True:
-            s = input("Input: ").strip()
-            if not s:
-                continue
-            # feed the same input to the lexer used by parser
-            # (reset lexer input)
-            lexer.input(s)
-            parser.parse(s, lexer=lexer)
-    except EOFError:
-        print("\nExiting.")
\ No newline at end of file
+    from main import repl
+    repl()
\ No newline at end of file
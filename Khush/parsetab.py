@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'DATATYPE ID LBRACE LPAREN RBRACE RPAREN SEMICOLONstatement : declaration\n| function_declaration\n| function_definitiondeclaration : DATATYPE ID SEMICOLONfunction_declaration : DATATYPE ID LPAREN RPAREN SEMICOLONfunction_definition : DATATYPE ID LPAREN RPAREN LBRACE RBRACE'
+_lr_signature = 'ASSIGN AT CLASS COMMA DATATYPE DOT ELLIPSIS ENUM FOR ID IMPORT JUMP KEYWORD LBRACE LBRACKET LITERAL LPAREN MODIFIER NEW OPERATOR PACKAGE RBRACE RBRACKET RECORD RPAREN SEMICOLON TYPEARGScompilation_unit : membersmembers : members member\n               | emptymember : declaration\n              | function_declaration\n              | function_definition\n              | class_declaration\n              | package_declaration\n              | import_declaration\n              | modifiers block\n              | SEMICOLONpackage_declaration : PACKAGE name SEMICOLONimport_declaration : IMPORT name SEMICOLON\n                          | IMPORT name DOT OPERATOR SEMICOLON\n                          | IMPORT MODIFIER name SEMICOLON\n                          | IMPORT MODIFIER name DOT OPERATOR SEMICOLONdeclaration : modifiers type declarators SEMICOLON\n       local_declaration : type declarators SEMICOLON\n                         | modifier_list type declarators SEMICOLONdeclarators : declarator\n                   | declarators COMMA declaratordeclarator : ID\n                  | ID dims\n                  | ID ASSIGN expression\n                  | ID dims ASSIGN expressiontype : DATATYPE\n            | DATATYPE dims\n            | name\n            | name dims\n            | name TYPEARGS\n            | name TYPEARGS dimsdims : LBRACKET RBRACKET\n            | dims LBRACKET RBRACKETname : ID\n            | name DOT IDmodifiers : modifier_list\n                 | emptymodifier_list : modifier\n                     | modifier_list modifiermodifier : MODIFIER\n                | TYPEARGS\n                | AT name\n                | AT name LPAREN RPAREN\n                | AT name LPAREN inner RPARENfunction_header : modifiers type ID LPAREN parameter_list RPAREN throws\n                       | modifiers ID LPAREN parameter_list RPAREN throwsfunction_header : modifiers IDthrows : KEYWORD clause\n              | emptyparameter_list : parameters\n                      | emptyparameters : parameter\n                  | parameters COMMA parameterparameter : type ID\n                 | type ELLIPSIS ID\n                 | modifier_list type ID\n                 | modifier_list type ELLIPSIS IDfunction_declaration : function_header SEMICOLONfunction_definition : function_header blockblock : LBRACE block_items RBRACEblock_items : block_items block_item\n                   | emptyblock_item : local_declaration\n                  | class_declaration\n                  | block\n                  | statementstatement : SEMICOLON\n                 | name SEMICOLON\n                 | name continuation SEMICOLON\n                 | name continuation expression SEMICOLON\n                 | expression_start SEMICOLON\n                 | expression_start expression SEMICOLON\n                 | JUMP SEMICOLON\n                 | JUMP expression SEMICOLON\n                 | KEYWORD block\n                 | KEYWORD clause block\n                 | KEYWORD clause SEMICOLON\n                 | MODIFIER continuation block\n                 | MODIFIER continuation clause block\n                 | MODIFIER continuation SEMICOLON\n                 | MODIFIER continuation clause SEMICOLON\n                 | FOR LPAREN for_control RPAREN block_itemfor_control : for_variable OPERATOR inner\n                   | local_declaration\n                   | local_declaration inner\n                   | SEMICOLON\n                   | SEMICOLON inner\n                   | name SEMICOLON\n                   | name SEMICOLON inner\n                   | name continuation inner\n                   | expression_start innerfor_variable : type ID\n                    | modifier_list type IDcontinuation : ASSIGN\n                    | OPERATOR\n                    | LPAREN RPAREN\n                    | LPAREN inner RPAREN\n                    | LBRACKET inner RBRACKETexpression_start : NEW\n                        | LITERAL\n                        | OPERATOR\n                        | LPAREN RPAREN\n                        | LPAREN inner RPARENexpression : expression_item\n                  | expression expression_item\n       expression_item : item\n                       | LBRACE RBRACE\n                       | LBRACE inner RBRACE\n       clause : clause_item\n              | clause clause_item\n       clause_item : item\n                   | COMMA\n       inner : inner_item\n             | inner inner_item\n       inner_item : expression_item\n                  | COMMA\n                  | SEMICOLONitem : ID\n            | DATATYPE\n            | LITERAL\n            | MODIFIER\n            | CLASS\n            | ENUM\n            | RECORD\n            | FOR\n            | KEYWORD\n            | JUMP\n            | NEW\n            | TYPEARGS\n            | OPERATOR\n            | ASSIGN\n            | AT\n            | DOT\n            | ELLIPSIS\n            | LPAREN RPAREN\n            | LPAREN inner RPAREN\n            | LBRACKET RBRACKET\n            | LBRACKET inner RBRACKETclass_header : modifiers CLASS ID\n                    | modifiers CLASS ID clause\n       enum_header : modifiers ENUM ID\n                   | modifiers ENUM ID clauseclass_header : modifiers RECORD ID LPAREN parameter_list RPAREN\n                    | modifiers RECORD ID LPAREN parameter_list RPAREN clause\n                    | modifiers RECORD ID TYPEARGS LPAREN parameter_list RPAREN\n                    | modifiers RECORD ID TYPEARGS LPAREN parameter_list RPAREN clauseclass_declaration : class_header LBRACE members RBRACE\n                         | enum_header LBRACE enum_body RBRACEenum_body : enum_constants\n                 | enum_constants SEMICOLON members\n       enum_constants : constant_list\n                      | constant_list COMMA\n                      | empty\n       constant_list : enum_constant\n                     | constant_list COMMA enum_constantenum_constant : constant_header\n                     | constant_header LBRACE members RBRACEconstant_header : ID arguments\n                       | modifier_list ID argumentsarguments : LPAREN RPAREN\n                 | LPAREN inner RPAREN\n                 | emptyempty :member : error SEMICOLON\n              | error block\n       block_item : error SEMICOLON\n                  | error block'
     
-_lr_action_items = {'DATATYPE':([0,],[5,]),'$end':([1,2,3,4,7,10,12,],[0,-1,-2,-3,-4,-5,-6,]),'ID':([5,],[6,]),'SEMICOLON':([6,9,],[7,10,]),'LPAREN':([6,],[8,]),'RPAREN':([8,],[9,]),'LBRACE':([9,],[11,]),'RBRACE':([11,],[12,]),}
+_lr_action_items = {'SEMICOLON':([0,2,3,4,5,6,7,8,9,10,12,13,14,25,27,31,34,35,36,37,38,39,40,41,42,46,47,48,53,54,60,62,63,64,65,66,67,69,70,72,73,74,77,85,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,111,112,113,114,115,116,117,118,121,122,123,127,129,130,131,133,135,136,137,138,139,140,141,142,143,144,145,146,149,150,151,152,153,154,155,156,157,160,161,162,167,168,169,170,171,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,205,206,207,208,209,210,211,213,218,219,222,223,224,225,226,227,228,229,230,231,232,233,234,235,238,239,240,241,244,245,246,247,248,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,270,271,272,273,274,],[-163,12,-3,-2,-4,-5,-6,-7,-8,-9,-11,34,36,-10,-47,-163,-164,-165,-58,-59,-163,-163,69,-34,70,74,-22,-20,118,-62,12,138,-151,-153,-154,-156,-163,-12,-13,146,153,-17,-23,-122,-118,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,153,153,-60,-61,-63,-64,-65,-66,174,-67,178,184,186,153,-99,-100,-101,-32,-35,-147,-148,-163,-152,-163,-158,153,-162,-163,202,-15,153,-113,-115,-116,-117,-106,153,-21,-22,-24,-104,-163,-110,-135,153,-137,153,-166,-167,222,-68,224,-94,-95,153,153,-71,229,-73,230,-75,232,235,153,239,-102,153,-33,12,-155,12,-160,153,-159,-14,247,-114,-107,153,-163,-25,-105,-46,-49,-136,-138,-18,254,-69,255,-96,153,153,-72,-74,-76,-77,-78,259,-80,153,153,264,153,-103,-157,-161,-16,-108,-45,-48,-19,-70,-97,-98,-79,-81,118,153,153,153,153,153,153,-22,-82,153,153,153,-22,]),'error':([0,2,3,4,5,6,7,8,9,10,12,25,31,34,35,36,37,38,53,54,60,69,70,74,111,112,113,114,115,116,118,136,137,138,140,146,174,175,178,184,186,188,196,198,202,222,224,229,230,231,232,233,235,247,254,255,258,259,260,270,],[-163,13,-3,-2,-4,-5,-6,-7,-8,-9,-11,-10,-163,-164,-165,-58,-59,-163,117,-62,13,-12,-13,-17,-60,-61,-63,-64,-65,-66,-67,-147,-148,-163,-163,-15,-166,-167,-68,-71,-73,-75,13,13,-14,-18,-69,-72,-74,-76,-77,-78,-80,-16,-19,-70,-79,-81,117,-82,]),'PACKAGE':([0,2,3,4,5,6,7,8,9,10,12,25,34,35,36,37,38,60,69,70,74,111,136,137,138,140,146,196,198,202,247,],[-163,17,-3,-2,-4,-5,-6,-7,-8,-9,-11,-10,-164,-165,-58,-59,-163,17,-12,-13,-17,-60,-147,-148,-163,-163,-15,17,17,-14,-16,]),'IMPORT':([0,2,3,4,5,6,7,8,9,10,12,25,34,35,36,37,38,60,69,70,74,111,136,137,138,140,146,196,198,202,247,],[-163,18,-3,-2,-4,-5,-6,-7,-8,-9,-11,-10,-164,-165,-58,-59,-163,18,-12,-13,-17,-60,-147,-148,-163,-163,-15,18,18,-14,-16,]),'MODIFIER':([0,2,3,4,5,6,7,8,9,10,12,18,19,20,22,23,25,31,34,35,36,37,38,39,41,44,45,49,50,52,53,54,60,68,69,70,73,74,76,78,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,118,120,122,123,124,125,127,129,130,131,135,136,137,138,139,140,142,146,148,149,150,151,152,153,154,155,159,160,161,163,167,168,169,170,171,173,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,198,200,202,204,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,243,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,19,-3,-2,-4,-5,-6,-7,-8,-9,-11,43,-40,19,-41,-38,-10,-163,-164,-165,-58,-59,-163,19,-34,-39,-42,19,93,93,125,-62,19,19,-12,-13,93,-17,19,93,19,-122,-118,93,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,93,93,19,93,-60,-61,-63,-64,-65,-66,-67,19,93,93,93,-40,93,-99,-100,-101,-35,-147,-148,-163,19,-163,93,-15,-43,93,-113,-115,-116,-117,-106,93,93,93,-104,19,-110,-135,93,-137,93,19,-166,-167,-68,93,-94,-95,93,93,-71,93,-73,93,-75,93,93,93,19,-102,93,19,19,93,-14,-44,-114,-107,93,93,-105,93,-136,-138,93,-18,-69,93,-96,93,93,-72,-74,-76,-77,-78,93,-80,93,93,93,19,-103,-16,-108,93,93,93,-19,-70,-97,-98,-79,-81,125,93,93,93,93,93,93,93,-82,93,93,93,]),'TYPEARGS':([0,2,3,4,5,6,7,8,9,10,12,19,20,22,23,25,27,31,33,34,35,36,37,38,39,41,44,45,49,50,51,52,53,54,60,68,69,70,73,74,76,78,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,118,120,121,122,123,124,125,127,129,130,131,135,136,137,138,139,140,142,146,148,149,150,151,152,153,154,155,159,160,161,163,167,168,169,170,171,173,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,198,200,202,204,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,240,241,243,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,22,-3,-2,-4,-5,-6,-7,-8,-9,-11,-40,22,-41,-38,-10,-34,-163,58,-164,-165,-58,-59,-163,22,-34,-39,-42,22,100,109,100,22,-62,22,22,-12,-13,100,-17,22,100,22,-122,-118,100,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,100,100,22,100,-60,-61,-63,-64,-65,-66,-67,22,58,100,100,100,-40,100,-99,-100,-101,-35,-147,-148,-163,22,-163,100,-15,-43,100,-113,-115,-116,-117,-106,100,100,100,-104,22,-110,-135,100,-137,100,22,-166,-167,-68,100,-94,-95,100,100,-71,100,-73,100,-75,100,100,100,22,-102,100,22,22,100,-14,-44,-114,-107,100,100,-105,100,-136,-138,100,-18,-69,100,-96,100,100,-72,-74,-76,-77,-78,100,-80,100,100,58,100,22,-103,-16,-108,100,100,100,-19,-70,-97,-98,-79,-81,22,100,100,100,100,100,100,100,-82,100,100,100,]),'AT':([0,2,3,4,5,6,7,8,9,10,12,19,20,22,23,25,31,34,35,36,37,38,39,41,44,45,49,50,52,53,54,60,68,69,70,73,74,76,78,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,118,120,122,123,124,125,127,129,130,131,135,136,137,138,139,140,142,146,148,149,150,151,152,153,154,155,159,160,161,163,167,168,169,170,171,173,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,198,200,202,204,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,243,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,24,-3,-2,-4,-5,-6,-7,-8,-9,-11,-40,24,-41,-38,-10,-163,-164,-165,-58,-59,-163,24,-34,-39,-42,24,103,103,24,-62,24,24,-12,-13,103,-17,24,103,24,-122,-118,103,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,103,103,24,103,-60,-61,-63,-64,-65,-66,-67,24,103,103,103,-40,103,-99,-100,-101,-35,-147,-148,-163,24,-163,103,-15,-43,103,-113,-115,-116,-117,-106,103,103,103,-104,24,-110,-135,103,-137,103,24,-166,-167,-68,103,-94,-95,103,103,-71,103,-73,103,-75,103,103,103,24,-102,103,24,24,103,-14,-44,-114,-107,103,103,-105,103,-136,-138,103,-18,-69,103,-96,103,103,-72,-74,-76,-77,-78,103,-80,103,103,103,24,-103,-16,-108,103,103,103,-19,-70,-97,-98,-79,-81,24,103,103,103,103,103,103,103,-82,103,103,103,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,41,43,44,45,49,50,52,53,54,55,57,58,59,60,68,69,70,71,73,74,75,76,78,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,118,119,120,121,122,123,124,125,127,129,130,131,133,134,135,136,137,138,139,140,142,146,147,148,149,150,151,152,153,154,155,159,160,161,163,165,166,167,168,169,170,171,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,200,202,204,205,206,207,209,210,212,217,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,240,241,242,243,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,268,269,270,271,272,273,],[-163,-163,-3,-2,-4,-5,-6,-7,-8,-9,27,-11,41,41,-40,-36,-37,-41,-38,41,-10,47,-34,50,51,52,-163,-26,-28,-164,-165,-58,-59,-163,67,-34,41,-39,-42,41,86,86,41,-62,-27,-29,-30,135,-163,144,-12,-13,135,86,-17,157,41,86,164,41,-122,-118,86,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,86,86,41,86,-60,-61,-63,-64,-65,-66,-67,157,41,-28,86,86,86,-40,86,-99,-100,-101,-32,-31,-35,-147,-148,-163,67,-163,86,-15,135,-43,86,-113,-115,-116,-117,-106,86,86,86,-104,41,215,216,-110,-135,86,-137,86,41,-166,-167,157,-68,86,-94,-95,86,86,-71,86,-73,86,-75,86,86,86,41,-102,86,-33,-163,-163,86,-14,-44,-114,-107,86,86,-105,86,251,-136,-138,86,-18,-69,86,-96,86,86,-72,-74,-76,-77,-78,86,-80,86,86,-28,86,267,41,-103,-16,-108,86,86,86,-19,-70,-97,-98,-79,-81,41,86,86,86,86,86,86,274,86,-82,86,86,86,]),'CLASS':([0,2,3,4,5,6,7,8,9,10,11,12,19,20,21,22,23,25,31,34,35,36,37,38,41,44,45,50,52,53,54,60,69,70,73,74,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,120,122,123,124,125,127,128,129,130,131,135,136,137,138,140,142,146,148,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,193,194,196,198,200,202,204,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,-163,-3,-2,-4,-5,-6,-7,-8,-9,28,-11,-40,-36,-37,-41,-38,-10,-163,-164,-165,-58,-59,-163,-34,-39,-42,85,85,-163,-62,-163,-12,-13,85,-17,85,-122,-118,85,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,85,85,85,-60,-61,-63,-64,-65,-66,-67,-36,85,85,85,-40,85,28,-99,-100,-101,-35,-147,-148,-163,-163,85,-15,-43,85,-113,-115,-116,-117,-106,85,85,85,-104,-110,-135,85,-137,85,-166,-167,-68,85,-94,-95,85,85,-71,85,-73,85,-75,85,85,85,-102,85,-163,-163,85,-14,-44,-114,-107,85,85,-105,85,-136,-138,85,-18,-69,85,-96,85,85,-72,-74,-76,-77,-78,85,-80,85,85,85,-103,-16,-108,85,85,85,-19,-70,-97,-98,-79,-81,-163,85,85,85,85,85,85,85,-82,85,85,85,]),'RECORD':([0,2,3,4,5,6,7,8,9,10,11,12,19,20,21,22,23,25,31,34,35,36,37,38,41,44,45,50,52,53,54,60,69,70,73,74,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,120,122,123,124,125,127,128,129,130,131,135,136,137,138,140,142,146,148,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,193,194,196,198,200,202,204,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,-163,-3,-2,-4,-5,-6,-7,-8,-9,29,-11,-40,-36,-37,-41,-38,-10,-163,-164,-165,-58,-59,-163,-34,-39,-42,95,95,-163,-62,-163,-12,-13,95,-17,95,-122,-118,95,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,95,95,95,-60,-61,-63,-64,-65,-66,-67,-36,95,95,95,-40,95,29,-99,-100,-101,-35,-147,-148,-163,-163,95,-15,-43,95,-113,-115,-116,-117,-106,95,95,95,-104,-110,-135,95,-137,95,-166,-167,-68,95,-94,-95,95,95,-71,95,-73,95,-75,95,95,95,-102,95,-163,-163,95,-14,-44,-114,-107,95,95,-105,95,-136,-138,95,-18,-69,95,-96,95,95,-72,-74,-76,-77,-78,95,-80,95,95,95,-103,-16,-108,95,95,95,-19,-70,-97,-98,-79,-81,-163,95,95,95,95,95,95,95,-82,95,95,95,]),'ENUM':([0,2,3,4,5,6,7,8,9,10,11,12,19,20,21,22,23,25,31,34,35,36,37,38,41,44,45,50,52,53,54,60,69,70,73,74,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,120,122,123,124,125,127,128,129,130,131,135,136,137,138,140,142,146,148,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,193,194,196,198,200,202,204,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,-163,-3,-2,-4,-5,-6,-7,-8,-9,30,-11,-40,-36,-37,-41,-38,-10,-163,-164,-165,-58,-59,-163,-34,-39,-42,94,94,-163,-62,-163,-12,-13,94,-17,94,-122,-118,94,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,94,94,94,-60,-61,-63,-64,-65,-66,-67,-36,94,94,94,-40,94,30,-99,-100,-101,-35,-147,-148,-163,-163,94,-15,-43,94,-113,-115,-116,-117,-106,94,94,94,-104,-110,-135,94,-137,94,-166,-167,-68,94,-94,-95,94,94,-71,94,-73,94,-75,94,94,94,-102,94,-163,-163,94,-14,-44,-114,-107,94,94,-105,94,-136,-138,94,-18,-69,94,-96,94,94,-72,-74,-76,-77,-78,94,-80,94,94,94,-103,-16,-108,94,94,94,-19,-70,-97,-98,-79,-81,-163,94,94,94,94,94,94,94,-82,94,94,94,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,19,20,21,22,23,25,27,31,34,35,36,37,38,41,44,45,50,52,53,54,60,66,67,69,70,73,74,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,117,118,122,123,124,127,129,130,131,135,136,137,138,140,141,142,143,144,146,148,149,150,151,152,153,154,155,159,160,161,162,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,193,194,196,198,199,200,201,202,204,205,206,207,208,209,210,211,213,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,246,247,248,249,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,-163,-3,-2,-4,-5,-6,-7,-8,-9,31,-11,31,31,38,39,-40,-36,-37,-41,-38,-10,-47,-163,-164,-165,-58,-59,-163,-34,-39,-42,-139,-141,31,-62,-163,140,-163,-12,-13,155,-17,155,-122,-118,-140,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,155,155,-142,-60,-61,-63,-64,-65,-66,31,-67,155,155,31,155,-99,-100,-101,-35,-147,-148,-163,-163,-158,155,-162,-163,-15,-43,155,-113,-115,-116,-117,-106,155,155,155,-104,-163,-110,-135,155,-137,155,-166,-167,-68,155,-94,-95,155,155,-71,155,-73,155,-75,31,31,155,-102,155,-163,-163,-160,155,-159,-14,-44,-114,-107,155,-163,155,-105,-46,-49,-136,-138,-143,-18,-69,155,-96,155,155,-72,-74,-76,-77,-78,31,-80,155,155,155,-103,-161,-16,-108,-45,-48,-144,-145,-19,-70,-97,-98,-79,-81,31,155,155,155,155,155,155,-146,-82,155,155,155,]),'DATATYPE':([0,2,3,4,5,6,7,8,9,10,11,12,19,20,21,22,23,25,31,34,35,36,37,38,41,44,45,49,50,52,53,54,60,69,70,73,74,76,78,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,118,120,122,123,124,125,127,129,130,131,135,136,137,138,140,142,146,148,149,150,151,152,153,154,155,159,160,161,163,167,168,169,170,171,173,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,198,200,202,204,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,243,244,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,-163,-3,-2,-4,-5,-6,-7,-8,-9,32,-11,-40,-36,-37,-41,-38,-10,-163,-164,-165,-58,-59,-163,-34,-39,-42,32,91,91,32,-62,-163,-12,-13,91,-17,32,91,32,-122,-118,91,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,91,91,32,91,-60,-61,-63,-64,-65,-66,-67,32,91,91,91,-40,91,-99,-100,-101,-35,-147,-148,-163,-163,91,-15,-43,91,-113,-115,-116,-117,-106,91,91,91,-104,32,-110,-135,91,-137,91,32,-166,-167,-68,91,-94,-95,91,91,-71,91,-73,91,-75,91,91,91,32,-102,91,-163,-163,91,-14,-44,-114,-107,91,91,-105,91,-136,-138,91,-18,-69,91,-96,91,91,-72,-74,-76,-77,-78,91,-80,91,91,91,32,-103,-16,-108,91,91,91,-19,-70,-97,-98,-79,-81,32,91,91,91,91,91,91,91,-82,91,91,91,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,12,25,34,35,36,37,69,70,74,111,136,137,146,202,247,],[-163,0,-1,-3,-2,-4,-5,-6,-7,-8,-9,-11,-10,-164,-165,-58,-59,-12,-13,-17,-60,-147,-148,-15,-14,-16,]),'RBRACE':([3,4,5,6,7,8,9,10,12,25,31,34,35,36,37,38,39,53,54,60,61,62,63,64,65,66,67,69,70,74,85,86,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,111,112,113,114,115,116,118,136,137,138,139,140,141,143,144,146,150,151,152,153,154,155,168,170,174,175,178,184,186,188,196,197,198,199,201,202,205,206,207,218,219,222,224,229,230,231,232,233,235,245,246,247,248,254,255,258,259,270,],[-3,-2,-4,-5,-6,-7,-8,-9,-11,-10,-163,-164,-165,-58,-59,-163,-163,111,-62,136,137,-149,-151,-153,-154,-156,-163,-12,-13,-17,-122,-118,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-60,-61,-63,-64,-65,-66,-67,-147,-148,-163,-152,-163,-158,-162,-163,-15,-113,-115,-116,-117,-106,206,-135,-137,-166,-167,-68,-71,-73,-75,-150,-155,245,-160,-159,-14,-114,-107,248,-136,-138,-18,-69,-72,-74,-76,-77,-78,-80,-157,-161,-16,-108,-19,-70,-79,-81,-82,]),'LPAREN':([27,31,41,45,47,50,51,52,53,54,67,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,109,110,111,112,113,114,115,116,118,121,122,123,124,125,126,127,129,130,131,135,136,137,142,144,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,240,241,244,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[49,-163,-34,73,76,106,108,106,127,-62,142,106,106,-122,-118,106,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,106,106,173,106,-60,-61,-63,-64,-65,-66,-67,182,106,106,106,182,192,106,-99,-100,-101,-35,-147,-148,106,142,106,-113,-115,-116,-117,-106,106,106,106,-104,-110,-135,106,-137,106,-166,-167,-68,106,-94,-95,106,106,-71,106,-73,106,-75,106,106,106,127,-102,106,106,-114,-107,106,106,-105,106,-136,-138,106,-18,-69,106,-96,106,106,-72,-74,-76,-77,-78,106,-80,106,106,182,106,-103,-108,106,106,106,-19,-70,-97,-98,-79,-81,127,106,106,106,106,106,106,106,-82,106,106,106,]),'DOT':([27,33,40,41,42,45,50,52,72,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,121,122,123,124,127,129,130,131,135,142,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,179,180,181,182,183,185,187,189,190,191,193,194,200,205,206,207,209,210,212,218,219,220,222,225,226,227,228,234,238,239,240,241,244,248,250,252,253,254,256,257,261,262,263,264,265,266,269,271,272,273,],[-34,59,59,-34,71,59,104,104,147,104,104,-122,-118,104,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,104,104,104,59,104,104,104,104,-99,-100,-101,-35,104,104,-113,-115,-116,-117,-106,104,104,104,-104,-110,-135,104,-137,104,104,-94,-95,104,104,104,104,104,104,104,-102,104,104,-114,-107,104,104,-105,104,-136,-138,104,-18,104,-96,104,104,104,104,104,59,104,-103,-108,104,104,104,-19,-97,-98,104,104,104,104,104,104,104,104,104,104,]),'LBRACKET':([27,32,33,41,47,50,52,55,57,58,73,77,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,121,122,123,124,125,127,129,130,131,133,134,135,142,149,150,151,152,153,154,155,157,159,160,161,167,168,169,170,171,179,180,181,182,183,185,187,189,190,191,193,194,195,200,205,206,207,209,210,212,218,219,220,222,225,226,227,228,234,238,239,240,241,244,248,250,252,253,254,256,257,261,262,263,264,265,266,267,269,271,272,273,274,],[-34,56,56,-34,56,107,107,132,132,56,107,132,107,-122,-118,107,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,107,107,107,183,107,107,107,191,107,-99,-100,-101,-32,132,-35,107,107,-113,-115,-116,-117,-106,107,56,107,107,-104,-110,-135,107,-137,107,107,-94,-95,107,107,107,107,107,107,107,-102,107,-33,107,-114,-107,107,107,-105,107,-136,-138,107,-18,107,-96,107,107,107,107,107,183,107,-103,-108,107,107,107,-19,-97,-98,107,107,107,107,107,107,56,107,107,107,107,56,]),'JUMP':([31,50,52,53,54,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,122,123,124,127,129,130,131,136,137,142,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,193,194,200,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,98,98,123,-62,98,98,-122,-118,98,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,98,98,98,-60,-61,-63,-64,-65,-66,-67,98,98,98,98,-99,-100,-101,-147,-148,98,98,-113,-115,-116,-117,-106,98,98,98,-104,-110,-135,98,-137,98,-166,-167,-68,98,-94,-95,98,98,-71,98,-73,98,-75,98,98,98,-102,98,98,-114,-107,98,98,-105,98,-136,-138,98,-18,-69,98,-96,98,98,-72,-74,-76,-77,-78,98,-80,98,98,98,-103,-108,98,98,98,-19,-70,-97,-98,-79,-81,123,98,98,98,98,98,98,98,-82,98,98,98,]),'KEYWORD':([31,50,52,53,54,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,122,123,124,127,129,130,131,136,137,142,149,150,151,152,153,154,155,159,160,161,162,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,193,194,200,205,206,207,208,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,97,97,124,-62,97,97,-122,-118,97,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,97,97,97,-60,-61,-63,-64,-65,-66,-67,97,97,97,97,-99,-100,-101,-147,-148,97,97,-113,-115,-116,-117,-106,97,97,97,-104,212,-110,-135,97,-137,97,-166,-167,-68,97,-94,-95,97,97,-71,97,-73,97,-75,97,97,97,-102,97,97,-114,-107,97,212,97,-105,97,-136,-138,97,-18,-69,97,-96,97,97,-72,-74,-76,-77,-78,97,-80,97,97,97,-103,-108,97,97,97,-19,-70,-97,-98,-79,-81,124,97,97,97,97,97,97,97,-82,97,97,97,]),'FOR':([31,50,52,53,54,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,122,123,124,127,129,130,131,136,137,142,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,193,194,200,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,96,96,126,-62,96,96,-122,-118,96,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,96,96,96,-60,-61,-63,-64,-65,-66,-67,96,96,96,96,-99,-100,-101,-147,-148,96,96,-113,-115,-116,-117,-106,96,96,96,-104,-110,-135,96,-137,96,-166,-167,-68,96,-94,-95,96,96,-71,96,-73,96,-75,96,96,96,-102,96,96,-114,-107,96,96,-105,96,-136,-138,96,-18,-69,96,-96,96,96,-72,-74,-76,-77,-78,96,-80,96,96,96,-103,-108,96,96,96,-19,-70,-97,-98,-79,-81,126,96,96,96,96,96,96,96,-82,96,96,96,]),'NEW':([31,50,52,53,54,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,122,123,124,127,129,130,131,136,137,142,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,99,99,129,-62,99,99,-122,-118,99,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,99,99,99,-60,-61,-63,-64,-65,-66,-67,99,99,99,99,-99,-100,-101,-147,-148,99,99,-113,-115,-116,-117,-106,99,99,99,-104,-110,-135,99,-137,99,-166,-167,-68,99,-94,-95,99,99,-71,99,-73,99,-75,99,99,99,129,-102,99,99,-114,-107,99,99,-105,99,-136,-138,99,-18,-69,99,-96,99,99,-72,-74,-76,-77,-78,99,-80,99,99,99,-103,-108,99,99,99,-19,-70,-97,-98,-79,-81,129,99,99,99,99,99,99,99,-82,99,99,99,]),'LITERAL':([31,50,52,53,54,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,122,123,124,127,129,130,131,136,137,142,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,238,239,241,244,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,270,271,272,273,],[-163,92,92,130,-62,92,92,-122,-118,92,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,92,92,92,-60,-61,-63,-64,-65,-66,-67,92,92,92,92,-99,-100,-101,-147,-148,92,92,-113,-115,-116,-117,-106,92,92,92,-104,-110,-135,92,-137,92,-166,-167,-68,92,-94,-95,92,92,-71,92,-73,92,-75,92,92,92,130,-102,92,92,-114,-107,92,92,-105,92,-136,-138,92,-18,-69,92,-96,92,92,-72,-74,-76,-77,-78,92,-80,92,92,92,-103,-108,92,92,92,-19,-70,-97,-98,-79,-81,130,92,92,92,92,92,92,92,-82,92,92,92,]),'OPERATOR':([31,41,50,52,53,54,71,73,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,115,116,118,121,122,123,124,125,127,129,130,131,135,136,137,142,147,149,150,151,152,153,154,155,159,160,161,167,168,169,170,171,174,175,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,206,207,209,210,212,218,219,220,222,224,225,226,227,228,229,230,231,232,233,234,235,237,238,239,240,241,244,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,269,270,271,272,273,274,],[-163,-34,101,101,131,-62,145,101,101,-122,-118,101,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,101,101,101,-60,-61,-63,-64,-65,-66,-67,181,101,101,101,181,101,-99,-100,-101,-35,-147,-148,101,203,101,-113,-115,-116,-117,-106,101,101,101,-104,-110,-135,101,-137,101,-166,-167,-68,101,-94,-95,101,101,-71,101,-73,101,-75,101,101,101,131,-102,101,101,-114,-107,101,101,-105,101,-136,-138,101,-18,-69,101,-96,101,101,-72,-74,-76,-77,-78,101,-80,261,101,101,181,101,-103,-108,101,101,101,-19,-70,-97,-98,-79,-81,131,101,101,101,101,101,101,-92,101,-82,101,101,101,-93,]),'ELLIPSIS':([32,33,41,50,52,55,57,58,73,78,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,122,123,124,127,129,130,131,133,134,135,142,149,150,151,152,153,154,155,159,160,161,166,167,168,169,170,171,179,180,181,182,183,185,187,189,190,191,193,194,195,200,205,206,207,209,210,212,218,219,220,222,225,226,227,228,234,238,239,241,244,248,250,252,253,254,256,257,261,262,263,264,265,266,269,271,272,273,],[-26,-28,-34,105,105,-27,-29,-30,105,105,165,-122,-118,105,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,105,105,105,105,105,105,105,-99,-100,-101,-32,-31,-35,105,105,-113,-115,-116,-117,-106,105,105,105,-104,217,-110,-135,105,-137,105,105,-94,-95,105,105,105,105,105,105,105,-102,105,-33,105,-114,-107,105,105,-105,105,-136,-138,105,-18,105,-96,105,105,105,105,105,105,-103,-108,105,105,105,-19,-97,-98,105,105,105,105,105,105,105,105,105,105,]),'ASSIGN':([41,47,50,52,73,77,78,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,121,122,123,124,125,127,129,130,131,133,135,142,149,150,151,152,153,154,155,157,159,160,161,167,168,169,170,171,179,180,181,182,183,185,187,189,190,191,193,194,195,200,205,206,207,209,210,212,218,219,220,222,225,226,227,228,234,238,239,240,241,244,248,250,252,253,254,256,257,261,262,263,264,265,266,267,269,271,272,273,274,],[-34,78,102,102,102,159,102,-122,-118,102,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,102,102,102,180,102,102,102,180,102,-99,-100,-101,-32,-35,102,102,-113,-115,-116,-117,-106,102,78,102,102,-104,-110,-135,102,-137,102,102,-94,-95,102,102,102,102,102,102,102,-102,102,-33,102,-114,-107,102,102,-105,102,-136,-138,102,-18,102,-96,102,102,102,102,102,180,102,-103,-108,102,102,102,-19,-97,-98,102,102,102,102,102,102,78,102,102,102,102,78,]),'COMMA':([46,47,48,50,52,63,65,66,67,73,77,80,82,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,110,124,127,129,130,131,133,141,142,143,144,149,150,151,152,153,154,155,156,157,160,161,164,167,168,169,170,171,176,180,181,182,183,189,190,191,193,194,195,197,199,200,201,205,206,207,209,210,212,214,215,216,218,219,220,222,223,226,227,228,234,238,239,241,244,245,246,248,250,251,252,253,254,256,257,261,262,263,264,265,266,267,269,271,272,273,274,],[75,-22,-20,90,90,139,-154,-156,-163,152,-23,163,-52,-122,-118,90,-109,-111,-112,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,152,152,90,90,152,-99,-100,-101,-32,-158,152,-162,-163,152,-113,-115,-116,-117,-106,152,-21,-22,-24,-104,-54,-110,-135,152,-137,152,75,-94,-95,152,152,90,90,152,-102,152,-33,-155,-160,152,-159,-114,-107,152,-25,-105,90,-53,-55,-56,-136,-138,90,-18,75,-96,152,152,90,152,152,152,-103,-157,-161,-108,90,-57,90,90,-19,-97,-98,152,152,152,152,152,152,-22,90,152,152,152,-22,]),'RPAREN':([49,73,76,79,80,81,82,85,86,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,127,142,149,150,151,152,153,154,158,164,168,169,170,172,173,182,194,200,205,206,214,215,216,218,219,221,222,227,236,238,239,248,251,254,262,263,264,266,271,272,273,],[-163,148,-163,162,-50,-51,-52,-122,-118,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,168,-163,193,199,204,-113,-115,-116,-117,-106,208,-54,-135,218,-137,220,-163,226,244,246,-114,-107,-53,-55,-56,-136,-138,253,-18,256,260,-84,-86,-108,-57,-19,-85,-87,-88,-91,-83,-89,-90,]),'RBRACKET':([56,85,86,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,107,132,150,151,152,153,154,168,170,171,183,205,206,218,219,228,248,],[133,-122,-118,-119,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,170,195,-113,-115,-116,-117,-106,-135,-137,219,133,-114,-107,-136,-138,257,-108,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'statement':([0,],[1,]),'declaration':([0,],[2,]),'function_declaration':([0,],[3,]),'function_definition':([0,],[4,]),}
+_lr_goto_items = {'compilation_unit':([0,],[1,]),'members':([0,38,138,140,],[2,60,196,198,]),'empty':([0,2,31,38,39,49,53,60,67,76,108,138,140,144,162,173,196,198,208,260,],[3,21,54,3,64,81,21,21,143,81,81,3,3,143,213,81,21,21,213,21,]),'member':([2,60,196,198,],[4,4,4,4,]),'declaration':([2,60,196,198,],[5,5,5,5,]),'function_declaration':([2,60,196,198,],[6,6,6,6,]),'function_definition':([2,60,196,198,],[7,7,7,7,]),'class_declaration':([2,53,60,196,198,260,],[8,114,8,8,8,114,]),'package_declaration':([2,60,196,198,],[9,9,9,9,]),'import_declaration':([2,60,196,198,],[10,10,10,10,]),'modifiers':([2,53,60,196,198,260,],[11,128,11,11,11,128,]),'function_header':([2,60,196,198,],[14,14,14,14,]),'class_header':([2,53,60,196,198,260,],[15,15,15,15,15,15,]),'enum_header':([2,53,60,196,198,260,],[16,16,16,16,16,16,]),'modifier_list':([2,39,49,53,60,76,108,139,163,173,192,196,198,260,],[20,68,84,120,20,84,84,68,84,84,243,20,20,120,]),'modifier':([2,20,39,49,53,60,68,76,84,108,120,139,163,173,192,196,198,243,260,],[23,44,23,23,23,23,44,23,44,23,44,23,23,23,23,23,23,44,23,]),'block':([11,13,14,53,117,124,189,190,234,260,],[25,35,37,115,175,188,231,233,258,115,]),'type':([11,49,53,76,84,108,120,163,173,192,243,260,],[26,83,119,83,166,83,177,83,83,242,268,119,]),'name':([11,17,18,24,43,49,53,76,84,108,120,163,173,192,243,260,],[33,40,42,45,72,33,121,33,33,33,33,33,33,240,33,121,]),'declarators':([26,119,177,242,268,],[46,176,223,176,223,]),'declarator':([26,75,119,177,242,268,],[48,156,48,48,48,48,]),'block_items':([31,],[53,]),'dims':([32,33,47,58,121,157,240,267,274,],[55,57,77,134,57,77,57,77,77,]),'enum_body':([39,],[61,]),'enum_constants':([39,],[62,]),'constant_list':([39,],[63,]),'enum_constant':([39,139,],[65,197,]),'constant_header':([39,139,],[66,66,]),'parameter_list':([49,76,108,173,],[79,158,172,221,]),'parameters':([49,76,108,173,],[80,80,80,80,]),'parameter':([49,76,108,163,173,],[82,82,82,214,82,]),'clause':([50,52,124,190,212,220,253,],[87,110,189,234,250,252,269,]),'clause_item':([50,52,87,110,124,189,190,212,220,234,250,252,253,269,],[88,88,167,167,88,167,88,88,88,167,167,167,88,167,]),'item':([50,52,73,78,87,106,107,110,122,123,124,127,142,149,155,159,160,169,171,179,182,183,185,187,189,190,191,194,200,207,209,212,220,225,227,228,234,238,239,241,250,252,253,261,262,263,264,265,266,269,271,272,273,],[89,89,154,154,89,154,154,89,154,154,89,154,154,154,154,154,154,154,154,154,154,154,154,154,89,89,154,154,154,154,154,89,89,154,154,154,89,154,154,154,89,89,89,154,154,154,154,154,154,89,154,154,154,]),'block_item':([53,260,],[112,270,]),'local_declaration':([53,192,260,],[113,238,113,]),'statement':([53,260,],[116,116,]),'expression_start':([53,192,260,],[122,241,122,]),'arguments':([67,144,],[141,201,]),'inner':([73,106,107,127,142,155,182,183,191,238,239,241,261,264,265,],[149,169,171,194,200,207,227,228,228,262,263,266,271,272,273,]),'inner_item':([73,106,107,127,142,149,155,169,171,182,183,191,194,200,207,227,228,238,239,241,261,262,263,264,265,266,271,272,273,],[150,150,150,150,150,205,150,205,205,150,150,150,205,205,205,205,205,150,150,150,150,205,205,150,150,205,205,205,205,]),'expression_item':([73,78,106,107,122,123,127,142,149,155,159,160,169,171,179,182,183,185,187,191,194,200,207,209,225,227,228,238,239,241,261,262,263,264,265,266,271,272,273,],[151,161,151,151,161,161,151,151,151,151,161,210,151,151,161,151,151,210,210,151,151,151,151,210,210,151,151,151,151,151,151,151,151,151,151,151,151,151,151,]),'expression':([78,122,123,159,179,],[160,185,187,209,225,]),'continuation':([121,125,240,],[179,190,265,]),'throws':([162,208,],[211,249,]),'for_control':([192,],[236,]),'for_variable':([192,],[237,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -26,11 +26,172 @@ for _k, _v in _lr_goto_items.items():
        _lr_goto[_x][_k] = _y
 del _lr_goto_items
 _lr_productions = [
-  ("S' -> statement","S'",1,None,None,None),
-  ('statement -> declaration','statement',1,'p_statement','parser.py',8),
-  ('statement -> function_declaration','statement',1,'p_statement','parser.py',9),
-  ('statement -> function_definition','statement',1,'p_statement','parser.py',10),
-  ('declaration -> DATATYPE ID SEMICOLON','declaration',3,'p_declaration','parser.py',14),
-  ('function_declaration -> DATATYPE ID LPAREN RPAREN SEMICOLON','function_declaration',5,'p_function_declaration','parser.py',18),
-  ('function_definition -> DATATYPE ID LPAREN RPAREN LBRACE RBRACE','function_definition',6,'p_function_definition','parser.py',22),
+  ("S' -> compilation_unit","S'",1,None,None,None),
+  ('compilation_unit -> members','compilation_unit',1,'p_compilation_unit','parser.py',39),
+  ('members -> members member','members',2,'p_members','parser.py',43),
+  ('members -> empty','members',1,'p_members','parser.py',44),
+  ('member -> declaration','member',1,'p_member','parser.py',48),
+  ('member -> function_declaration','member',1,'p_member','parser.py',49),
+  ('member -> function_definition','member',1,'p_member','parser.py',50),
+  ('member -> class_declaration','member',1,'p_member','parser.py',51),
+  ('member -> package_declaration','member',1,'p_member','parser.py',52),
+  ('member -> import_declaration','member',1,'p_member','parser.py',53),
+  ('member -> modifiers block','member',2,'p_member','parser.py',54),
+  ('member -> SEMICOLON','member',1,'p_member','parser.py',55),
+  ('package_declaration -> PACKAGE name SEMICOLON','package_declaration',3,'p_package_declaration','parser.py',60),
+  ('import_declaration -> IMPORT name SEMICOLON','import_declaration',3,'p_import_declaration','parser.py',66),
+  ('import_declaration -> IMPORT name DOT OPERATOR SEMICOLON','import_declaration',5,'p_import_declaration','parser.py',67),
+  ('import_declaration -> IMPORT MODIFIER name SEMICOLON','import_declaration',4,'p_import_declaration','parser.py',68),
+  ('import_declaration -> IMPORT MODIFIER name DOT OPERATOR SEMICOLON','import_declaration',6,'p_import_declaration','parser.py',69),
+  ('declaration -> modifiers type declarators SEMICOLON','declaration',4,'p_declaration','parser.py',82),
+  ('local_declaration -> type declarators SEMICOLON','local_declaration',3,'p_declaration','parser.py',83),
+  ('local_declaration -> modifier_list type declarators SEMICOLON','local_declaration',4,'p_declaration','parser.py',84),
+  ('declarators -> declarator','declarators',1,'p_declarators','parser.py',95),
+  ('declarators -> declarators COMMA declarator','declarators',3,'p_declarators','parser.py',96),
+  ('declarator -> ID','declarator',1,'p_declarator','parser.py',104),
+  ('declarator -> ID dims','declarator',2,'p_declarator','parser.py',105),
+  ('declarator -> ID ASSIGN expression','declarator',3,'p_declarator','parser.py',106),
+  ('declarator -> ID dims ASSIGN expression','declarator',4,'p_declarator','parser.py',107),
+  ('type -> DATATYPE','type',1,'p_type','parser.py',113),
+  ('type -> DATATYPE dims','type',2,'p_type','parser.py',114),
+  ('type -> name','type',1,'p_type','parser.py',115),
+  ('type -> name dims','type',2,'p_type','parser.py',116),
+  ('type -> name TYPEARGS','type',2,'p_type','parser.py',117),
+  ('type -> name TYPEARGS dims','type',3,'p_type','parser.py',118),
+  ('dims -> LBRACKET RBRACKET','dims',2,'p_dims','parser.py',122),
+  ('dims -> dims LBRACKET RBRACKET','dims',3,'p_dims','parser.py',123),
+  ('name -> ID','name',1,'p_name','parser.py',127),
+  ('name -> name DOT ID','name',3,'p_name','parser.py',128),
+  ('modifiers -> modifier_list','modifiers',1,'p_modifiers','parser.py',132),
+  ('modifiers -> empty','modifiers',1,'p_modifiers','parser.py',133),
+  ('modifier_list -> modifier','modifier_list',1,'p_modifier_list','parser.py',137),
+  ('modifier_list -> modifier_list modifier','modifier_list',2,'p_modifier_list','parser.py',138),
+  ('modifier -> MODIFIER','modifier',1,'p_modifier','parser.py',142),
+  ('modifier -> TYPEARGS','modifier',1,'p_modifier','parser.py',143),
+  ('modifier -> AT name','modifier',2,'p_modifier','parser.py',144),
+  ('modifier -> AT name LPAREN RPAREN','modifier',4,'p_modifier','parser.py',145),
+  ('modifier -> AT name LPAREN inner RPAREN','modifier',5,'p_modifier','parser.py',146),
+  ('function_header -> modifiers type ID LPAREN parameter_list RPAREN throws','function_header',7,'p_function_header','parser.py',152),
+  ('function_header -> modifiers ID LPAREN parameter_list RPAREN throws','function_header',6,'p_function_header','parser.py',153),
+  ('function_header -> modifiers ID','function_header',2,'p_compact_constructor_header','parser.py',165),
+  ('throws -> KEYWORD clause','throws',2,'p_throws','parser.py',175),
+  ('throws -> empty','throws',1,'p_throws','parser.py',176),
+  ('parameter_list -> parameters','parameter_list',1,'p_parameter_list','parser.py',181),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','parser.py',182),
+  ('parameters -> parameter','parameters',1,'p_parameters','parser.py',186),
+  ('parameters -> parameters COMMA parameter','parameters',3,'p_parameters','parser.py',187),
+  ('parameter -> type ID','parameter',2,'p_parameter','parser.py',195),
+  ('parameter -> type ELLIPSIS ID','parameter',3,'p_parameter','parser.py',196),
+  ('parameter -> modifier_list type ID','parameter',3,'p_parameter','parser.py',197),
+  ('parameter -> modifier_list type ELLIPSIS ID','parameter',4,'p_parameter','parser.py',198),
+  ('function_declaration -> function_header SEMICOLON','function_declaration',2,'p_function_declaration','parser.py',207),
+  ('function_definition -> function_header block','function_definition',2,'p_function_definition','parser.py',212),
+  ('block -> LBRACE block_items RBRACE','block',3,'p_block','parser.py',217),
+  ('block_items -> block_items block_item','block_items',2,'p_block_items','parser.py',221),
+  ('block_items -> empty','block_items',1,'p_block_items','parser.py',222),
+  ('block_item -> local_declaration','block_item',1,'p_block_item','parser.py',226),
+  ('block_item -> class_declaration','block_item',1,'p_block_item','parser.py',227),
+  ('block_item -> block','block_item',1,'p_block_item','parser.py',228),
+  ('block_item -> statement','block_item',1,'p_block_item','parser.py',229),
+  ('statement -> SEMICOLON','statement',1,'p_statement','parser.py',233),
+  ('statement -> name SEMICOLON','statement',2,'p_statement','parser.py',234),
+  ('statement -> name continuation SEMICOLON','statement',3,'p_statement','parser.py',235),
+  ('statement -> name continuation expression SEMICOLON','statement',4,'p_statement','parser.py',236),
+  ('statement -> expression_start SEMICOLON','statement',2,'p_statement','parser.py',237),
+  ('statement -> expression_start expression SEMICOLON','statement',3,'p_statement','parser.py',238),
+  ('statement -> JUMP SEMICOLON','statement',2,'p_statement','parser.py',239),
+  ('statement -> JUMP expression SEMICOLON','statement',3,'p_statement','parser.py',240),
+  ('statement -> KEYWORD block','statement',2,'p_statement','parser.py',241),
+  ('statement -> KEYWORD clause block','statement',3,'p_statement','parser.py',242),
+  ('statement -> KEYWORD clause SEMICOLON','statement',3,'p_statement','parser.py',243),
+  ('statement -> MODIFIER continuation block','statement',3,'p_statement','parser.py',244),
+  ('statement -> MODIFIER continuation clause block','statement',4,'p_statement','parser.py',245),
+  ('statement -> MODIFIER continuation SEMICOLON','statement',3,'p_statement','parser.py',246),
+  ('statement -> MODIFIER continuation clause SEMICOLON','statement',4,'p_statement','parser.py',247),
+  ('statement -> FOR LPAREN for_control RPAREN block_item','statement',5,'p_statement','parser.py',248),
+  ('for_control -> for_variable OPERATOR inner','for_control',3,'p_for_control','parser.py',256),
+  ('for_control -> local_declaration','for_control',1,'p_for_control','parser.py',257),
+  ('for_control -> local_declaration inner','for_control',2,'p_for_control','parser.py',258),
+  ('for_control -> SEMICOLON','for_control',1,'p_for_control','parser.py',259),
+  ('for_control -> SEMICOLON inner','for_control',2,'p_for_control','parser.py',260),
+  ('for_control -> name SEMICOLON','for_control',2,'p_for_control','parser.py',261),
+  ('for_control -> name SEMICOLON inner','for_control',3,'p_for_control','parser.py',262),
+  ('for_control -> name continuation inner','for_control',3,'p_for_control','parser.py',263),
+  ('for_control -> expression_start inner','for_control',2,'p_for_control','parser.py',264),
+  ('for_variable -> type ID','for_variable',2,'p_for_variable','parser.py',271),
+  ('for_variable -> modifier_list type ID','for_variable',3,'p_for_variable','parser.py',272),
+  ('continuation -> ASSIGN','continuation',1,'p_continuation','parser.py',278),
+  ('continuation -> OPERATOR','continuation',1,'p_continuation','parser.py',279),
+  ('continuation -> LPAREN RPAREN','continuation',2,'p_continuation','parser.py',280),
+  ('continuation -> LPAREN inner RPAREN','continuation',3,'p_continuation','parser.py',281),
+  ('continuation -> LBRACKET inner RBRACKET','continuation',3,'p_continuation','parser.py',282),
+  ('expression_start -> NEW','expression_start',1,'p_expression_start','parser.py',286),
+  ('expression_start -> LITERAL','expression_start',1,'p_expression_start','parser.py',287),
+  ('expression_start -> OPERATOR','expression_start',1,'p_expression_start','parser.py',288),
+  ('expression_start -> LPAREN RPAREN','expression_start',2,'p_expression_start','parser.py',289),
+  ('expression_start -> LPAREN inner RPAREN','expression_start',3,'p_expression_start','parser.py',290),
+  ('expression -> expression_item','expression',1,'p_expression','parser.py',294),
+  ('expression -> expression expression_item','expression',2,'p_expression','parser.py',295),
+  ('expression_item -> item','expression_item',1,'p_expression','parser.py',296),
+  ('expression_item -> LBRACE RBRACE','expression_item',2,'p_expression','parser.py',297),
+  ('expression_item -> LBRACE inner RBRACE','expression_item',3,'p_expression','parser.py',298),
+  ('clause -> clause_item','clause',1,'p_expression','parser.py',299),
+  ('clause -> clause clause_item','clause',2,'p_expression','parser.py',300),
+  ('clause_item -> item','clause_item',1,'p_expression','parser.py',301),
+  ('clause_item -> COMMA','clause_item',1,'p_expression','parser.py',302),
+  ('inner -> inner_item','inner',1,'p_expression','parser.py',303),
+  ('inner -> inner inner_item','inner',2,'p_expression','parser.py',304),
+  ('inner_item -> expression_item','inner_item',1,'p_expression','parser.py',305),
+  ('inner_item -> COMMA','inner_item',1,'p_expression','parser.py',306),
+  ('inner_item -> SEMICOLON','inner_item',1,'p_expression','parser.py',307),
+  ('item -> ID','item',1,'p_item','parser.py',314),
+  ('item -> DATATYPE','item',1,'p_item','parser.py',315),
+  ('item -> LITERAL','item',1,'p_item','parser.py',316),
+  ('item -> MODIFIER','item',1,'p_item','parser.py',317),
+  ('item -> CLASS','item',1,'p_item','parser.py',318),
+  ('item -> ENUM','item',1,'p_item','parser.py',319),
+  ('item -> RECORD','item',1,'p_item','parser.py',320),
+  ('item -> FOR','item',1,'p_item','parser.py',321),
+  ('item -> KEYWORD','item',1,'p_item','parser.py',322),
+  ('item -> JUMP','item',1,'p_item','parser.py',323),
+  ('item -> NEW','item',1,'p_item','parser.py',324),
+  ('item -> TYPEARGS','item',1,'p_item','parser.py',325),
+  ('item -> OPERATOR','item',1,'p_item','parser.py',326),
+  ('item -> ASSIGN','item',1,'p_item','parser.py',327),
+  ('item -> AT','item',1,'p_item','parser.py',328),
+  ('item -> DOT','item',1,'p_item','parser.py',329),
+  ('item -> ELLIPSIS','item',1,'p_item','parser.py',330),
+  ('item -> LPAREN RPAREN','item',2,'p_item','parser.py',331),
+  ('item -> LPAREN inner RPAREN','item',3,'p_item','parser.py',332),
+  ('item -> LBRACKET RBRACKET','item',2,'p_item','parser.py',333),
+  ('item -> LBRACKET inner RBRACKET','item',3,'p_item','parser.py',334),
+  ('class_header -> modifiers CLASS ID','class_header',3,'p_class_header','parser.py',338),
+  ('class_header -> modifiers CLASS ID clause','class_header',4,'p_class_header','parser.py',339),
+  ('enum_header -> modifiers ENUM ID','enum_header',3,'p_class_header','parser.py',340),
+  ('enum_header -> modifiers ENUM ID clause','enum_header',4,'p_class_header','parser.py',341),
+  ('class_header -> modifiers RECORD ID LPAREN parameter_list RPAREN','class_header',6,'p_record_header','parser.py',350),
+  ('class_header -> modifiers RECORD ID LPAREN parameter_list RPAREN clause','class_header',7,'p_record_header','parser.py',351),
+  ('class_header -> modifiers RECORD ID TYPEARGS LPAREN parameter_list RPAREN','class_header',7,'p_record_header','parser.py',352),
+  ('class_header -> modifiers RECORD ID TYPEARGS LPAREN parameter_list RPAREN clause','class_header',8,'p_record_header','parser.py',353),
+  ('class_declaration -> class_header LBRACE members RBRACE','class_declaration',4,'p_class_declaration','parser.py',364),
+  ('class_declaration -> enum_header LBRACE enum_body RBRACE','class_declaration',4,'p_class_declaration','parser.py',365),
+  ('enum_body -> enum_constants','enum_body',1,'p_enum_body','parser.py',370),
+  ('enum_body -> enum_constants SEMICOLON members','enum_body',3,'p_enum_body','parser.py',371),
+  ('enum_constants -> constant_list','enum_constants',1,'p_enum_body','parser.py',372),
+  ('enum_constants -> constant_list COMMA','enum_constants',2,'p_enum_body','parser.py',373),
+  ('enum_constants -> empty','enum_constants',1,'p_enum_body','parser.py',374),
+  ('constant_list -> enum_constant','constant_list',1,'p_enum_body','parser.py',375),
+  ('constant_list -> constant_list COMMA enum_constant','constant_list',3,'p_enum_body','parser.py',376),
+  ('enum_constant -> constant_header','enum_constant',1,'p_enum_constant','parser.py',381),
+  ('enum_constant -> constant_header LBRACE members RBRACE','enum_constant',4,'p_enum_constant','parser.py',382),
+  ('constant_header -> ID arguments','constant_header',2,'p_constant_header','parser.py',387),
+  ('constant_header -> modifier_list ID arguments','constant_header',3,'p_constant_header','parser.py',388),
+  ('arguments -> LPAREN RPAREN','arguments',2,'p_arguments','parser.py',397),
+  ('arguments -> LPAREN inner RPAREN','arguments',3,'p_arguments','parser.py',398),
+  ('arguments -> empty','arguments',1,'p_arguments','parser.py',399),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',407),
+  ('member -> error SEMICOLON','member',2,'p_statement_error','parser.py',411),
+  ('member -> error block','member',2,'p_statement_error','parser.py',412),
+  ('block_item -> error SEMICOLON','block_item',2,'p_statement_error','parser.py',413),
+  ('block_item -> error block','block_item',2,'p_statement_error','parser.py',414),
 ]
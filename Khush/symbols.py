@@ -0,0 +1,92 @@
+# symbols.py
+# The declarations of a compilation unit, indexed by name.
+#
+# A Parser given a SymbolIndex (Parser(symbols=SymbolIndex())) adds a
+# Symbol to it as each declaration is reduced, so the index is complete
+# when the parse returns, with no second walk over anything. Names are
+# hashed: finding every declaration of a name is one dict lookup, however
+# large the unit. The same name may be declared more than once (overloads,
+# locals of different functions), so each maps to a list, in source order.
+#
+# scope is where the declaration is: the dotted names of the enclosing
+# classes and function, '' at the top level. The parser opens a scope when
+# it reduces a class or function header, before it reads the body. After a
+# syntax error the scopes of what follows in that unit may be off.
+#
+# complete is False once a parse into the index stopped before the end of
+# its unit (too many errors, or one of its limits.Limits), or reached the
+# end with a syntax error, which error recovery may have skipped to from an
+# earlier one: the declarations after that point are missing.
+
+
+class Symbol:
+    __slots__ = ('name', 'kind', 'type', 'line', 'scope')
+
+    def __init__(self, name, kind, type, line, scope):
+        self.name = name
+        self.kind = kind        # 'class', 'function', 'variable', 'parameter',
+                                # 'constant', 'package' or 'import'
+        self.type = type        # declared type; the return type of a function,
+                                # the enum of a constant, the full name of a
+                                # package or import
+        self.line = line
+        self.scope = scope
+
+    def as_dict(self):
+        return {'name': self.name, 'kind': self.kind, 'type': self.type,
+                'line': self.line, 'scope': self.scope}
+
+    def __repr__(self):
+        return (f'Symbol({self.name!r}, {self.kind!r}, {self.type!r}, '
+                f'line {self.line}, scope {self.scope!r})')
+
+
+class SymbolIndex:
+    def __init__(self):
+        self.symbols = []       # every Symbol, in the order declared
+        self.names = {}         # name -> [Symbol]
+        self.complete = True
+        self._scopes = []
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def lookup(self, name, kind=None):
+        # The declarations of name, of the given kind if one is given
+        symbols = self.names.get(name, ())
+        if kind is None:
+            return list(symbols)
+        return [s for s in symbols if s.kind == kind]
+
+    def add(self, name, kind, type, line):
+        scope = '.'.join(self._scopes)
+        symbol = Symbol(name, kind, type, line, scope)
+        self.symbols.append(symbol)
+        symbols = self.names.get(name)
+        if symbols is None:
+            self.names[name] = [symbol]
+        else:
+            symbols.append(symbol)
+        return symbol
+
+    @property
+    def scope(self):
+        # The innermost open scope, '' at the top level
+        return self._scopes[-1] if self._scopes else ''
+
+    def enter(self, name):
+        self._scopes.append(name)
+
+    def leave(self):
+        if self._scopes:
+            self._scopes.pop()
+
+    def reset_scopes(self):
+        # Called at the start of every parse
+        self._scopes.clear()
@@ -0,0 +1,158 @@
+# cache.py
+# Content-addressed cache of parse results.
+#
+# An entry is keyed by the SHA-256 of the input together with the grammar
+# version, a hash of every file whose change could change a result: the
+# tables, the lexers and parser, nodes.py, and the lexyacc modules the parse
+# runs through. Regenerating the tables, editing a grammar action or
+# changing how a token or error is reported therefore misses every old
+# entry, and the on-disk store drops the directories of other versions when
+# it opens.
+#
+# Values are the encoded tree (nodes.encode) and the diagnostics, marshalled
+# and zlib-compressed; the same bytes live in the in-memory LRU, which is
+# bounded by their total size, and in the optional directory.
+import hashlib
+import marshal
+import os
+import shutil
+import tempfile
+import zlib
+from collections import OrderedDict
+from time import perf_counter
+
+import lexyacc
+from lexyacc.diagnostics import Diagnostic, Diagnostics
+from nodes import decode, encode
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SHARED = os.path.dirname(os.path.abspath(lexyacc.__file__))
+VERSION_FILES = tuple(os.path.join(HERE, name) for name in (
+    'parsetab.py', 'lextab.py', 'parser.py', 'nodes.py', 'lexer.py', 'fastlex.py'))
+VERSION_FILES += tuple(os.path.join(SHARED, name) for name in (
+    'arith.py', 'diagnostics.py', 'frozen.py', 'limits.py', 'stream.py', 'tokenstream.py'))
+# Bump when the layout of a stored value changes
+FORMAT = b'1'
+
+
+def grammar_version():
+    h = hashlib.sha256(FORMAT)
+    for path in VERSION_FILES:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class CacheStats:
+    __slots__ = ('hits', 'misses', 'disk_hits', 'saved')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0      # hits served from the directory
+        self.saved = 0.0        # parse seconds avoided, less the cost of the hits
+
+    def add(self, other):
+        self.hits += other.hits
+        self.misses += other.misses
+        self.disk_hits += other.disk_hits
+        self.saved += other.saved
+
+    def as_dict(self):
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'disk_hits': self.disk_hits,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'saved_seconds': round(self.saved, 4)}
+
+
+class ParseCache:
+    def __init__(self, max_bytes=64 << 20, directory=None):
+        self.version = grammar_version()
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+        self.directory = None
+        if directory is not None:
+            self.directory = os.path.join(directory, self.version[:16])
+            os.makedirs(self.directory, exist_ok=True)
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if name != self.version[:16] and os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+
+    def key(self, data, lineno=1):
+        h = hashlib.sha256(self.version.encode())
+        h.update(b'%d:' % lineno)
+        h.update(data.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
+
+    def parse(self, parser, data, lineno=1, tree=True):
+        # parser.parse(data, lineno=lineno) through the cache. Returns
+        # (tree, diagnostics); tree is None when not asked for on a hit.
+        start = perf_counter()
+        key = self.key(data, lineno)
+        value = self._get(key)
+        if value is not None:
+            records, errors, seconds = marshal.loads(zlib.decompress(value))
+            result = decode(records) if tree else None
+            diagnostics = Diagnostics()
+            diagnostics.errors = [Diagnostic(*e) for e in errors]
+            self.stats.hits += 1
+            self.stats.saved += seconds - (perf_counter() - start)
+            return result, diagnostics
+
+        self.stats.misses += 1
+        started = perf_counter()
+        result, diagnostics = parser.parse(data, lineno=lineno)
+        seconds = perf_counter() - started
+        if any(d.kind == 'limit' for d in diagnostics):
+            # Stopped by the parser's limits.Limits: not a result of data alone
+            return result, diagnostics
+        errors = [(d.kind, d.type, d.value, d.line, d.column) for d in diagnostics]
+        records = encode(result) if result is not None else ()
+        self._put(key, zlib.compress(marshal.dumps((records, errors, seconds)), 1))
+        return result, diagnostics
+
+    def _get(self, key):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            return value
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                value = f.read()
+        except OSError:
+            return None
+        self.stats.disk_hits += 1
+        self._remember(key, value)
+        return value
+
+    def _put(self, key, value):
+        self._remember(key, value)
+        if self.directory is None:
+            return
+        # Write and rename, so concurrent runs never read half a file
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(value)
+        os.replace(tmp, path)
+
+    def _remember(self, key, value):
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key[2:])
@@ -0,0 +1,105 @@
+# fastlex.py
+# Hand-written single-pass lexer for the shell grammar.
+#
+# Produces exactly the tokens lexer.py does (same types, values, lineno and
+# lexpos) but from one compiled master regex: every position is matched by
+# exactly one named group, keywords come from the `reserved` dict and the
+# one-character operators from a table, so there is no per-rule function
+# call as in PLY. A catch-all group makes illegal characters part of the
+# same scan. Use it anywhere a PLY lexer is accepted.
+import re
+
+from ply.lex import LexToken
+
+from lexyacc.diagnostics import Diagnostics
+from lexer import reserved
+
+# Leading blanks are folded into every match so spaces never cost a match
+# of their own; blanks at the very end match nothing and are skipped. Order
+# matters where prefixes overlap: '$((' before the operators, '>>' before '>'.
+_MASTER = re.compile(r'''
+    [ \t]*
+    (?:
+        (?P<ID>[a-zA-Z_][a-zA-Z0-9_]*)
+      | (?P<NEWLINE>\n+)
+      | (?P<NUMBER>\d+)
+      | (?P<STRING>"[^"]*"|'[^']*')
+      | (?P<ARITH_OPEN>\$\(\()
+      | (?P<APPEND>>>)
+      | (?P<op>[|><=;()+\-*/])
+      | (?P<illegal>[^ \t])
+    )
+''', re.VERBOSE | re.DOTALL)
+
+_OPERATORS = {
+    '|': 'PIPE', '>': 'REDIRECT_OUT', '<': 'REDIRECT_IN', '=': 'EQUALS',
+    ';': 'SEMICOLON', '(': 'LPAREN', ')': 'RPAREN', '+': 'PLUS',
+    '-': 'MINUS', '*': 'MULTIPLY', '/': 'DIVIDE',
+}
+
+
+class FastLexer:
+    def __init__(self):
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self.diagnostics = Diagnostics()
+        self._tokens = iter(())
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self._tokens = self._scan(data)
+
+    def clone(self):
+        # Like PLY's clone: same input and position, independent scanning
+        c = FastLexer()
+        c.diagnostics = self.diagnostics
+        c.lineno = self.lineno
+        c.lexdata = self.lexdata
+        c.lexpos = self.lexpos
+        c._tokens = c._scan(self.lexdata, self.lexpos)
+        return c
+
+    def token(self):
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    def _scan(self, data, pos=0):
+        get_reserved = reserved.get
+        operators = _OPERATORS
+        lineno = self.lineno
+        for m in _MASTER.finditer(data, pos):
+            kind = m.lastgroup
+            value = m.group(kind)
+            start = m.end() - len(value)
+            if kind == 'ID':
+                kind = get_reserved(value, 'ID')
+            elif kind == 'op':
+                kind = operators[value]
+            elif kind == 'NUMBER':
+                value = int(value)
+            elif kind == 'NEWLINE' or kind == 'STRING':
+                tok = LexToken()
+                tok.type, tok.lineno, tok.lexpos = kind, lineno, start
+                tok.value = value[1:-1] if kind == 'STRING' else value
+                # lineno/lexpos are only written back when a line changes;
+                # the parser never reads them from the lexer
+                lineno += value.count('\n')
+                self.lineno = lineno
+                self.lexpos = m.end()
+                yield tok
+                continue
+            elif kind == 'illegal':
+                self.lexpos = start
+                self.diagnostics.illegal(self, value)
+                continue
+            tok = LexToken()
+            tok.type, tok.value, tok.lineno, tok.lexpos = kind, value, lineno, start
+            yield tok
+        self.lexpos = len(data)
+
+
+lexer = FastLexer()
@@ -0,0 +1,214 @@
+# incremental.py
+# Incremental reparsing for editors and linters that reparse the same
+# buffer after every change.
+#
+# The program is kept as a list of segments: runs of whole top-level
+# statements between two boundaries (see segments.py), each parsed on its
+# own. An edit re-lexes and reparses from the start of the segment it
+# touches up to the first boundary after it that lines up with an old
+# segment start; every other segment keeps its statements and diagnostics
+# and is only moved. A quote typed or deleted can also pair up with one an
+# earlier segment left open (see segments.open_quotes), and the reparse then
+# starts from that segment instead. Moving is lazy: a segment remembers
+# where its nodes were parsed and they are shifted the next time tree() is
+# asked for, so an edit followed by diagnostics() never walks an untouched
+# statement.
+#
+# Syntax errors are reported per segment, as if each segment were a file of
+# its own; see parallel.py for how that can differ from a whole-file parse.
+import bisect
+
+import fastlex
+import segments
+from lexyacc.diagnostics import Diagnostic, Diagnostics
+from nodes import Program, shift
+from parser import Parser
+
+# Segments are at least this many characters; smaller ones would cost more
+# in per-parse overhead than they save on an edit
+SEGMENT_SIZE = 512
+
+# Characters update() compares at a time
+_BLOCK = 4096
+
+
+class _Segment:
+    __slots__ = ('body', 'errors', 'start', 'line')
+
+    def __init__(self, body, errors, start, line):
+        self.body = body        # top-level statements
+        self.errors = errors    # Diagnostic list
+        self.start = start      # offset and line the nodes and errors carry
+        self.line = line
+
+
+class IncrementalParser:
+    def __init__(self, lexobj=fastlex.lexer, segment_size=SEGMENT_SIZE):
+        self._parser = Parser(lexobj)
+        self.segment_size = segment_size
+        self.data = ''
+        self.reparsed = 0       # characters parsed by the last parse or edit
+        self._starts = []       # current offset of every segment
+        self._lines = []        # current first line of every segment
+        self._segments = []
+
+    def parse(self, data):
+        # Parses data from scratch and returns its Diagnostics
+        self.data = data
+        self._starts, self._lines, self._segments = self._parse_region(data, 0, len(data), 1)
+        self.reparsed = len(data)
+        return self.diagnostics()
+
+    def edit(self, start, end, text):
+        # Replaces data[start:end] with text and returns the new Diagnostics
+        old = self.data
+        data = self.data = old[:start] + text + old[end:]
+        delta = len(text) - (end - start)
+        line_delta = text.count('\n') - old.count('\n', start, end)
+        starts, lines = self._starts, self._lines
+
+        i = max(bisect.bisect_right(starts, start) - 1, 0)
+        if starts:
+            i = self._open_segment(data, i, set(old[start:end] + text) & {'"', "'"})
+        region = starts[i] if starts else 0
+        # Reparse up to the first boundary past the edit where the rest of
+        # the text, and so every segment from there on, is unchanged
+        j, stop = len(starts), len(data)
+        edited = start + len(text)
+        for offset, _ in segments.boundaries(data, region):
+            if offset < edited:
+                continue
+            k = bisect.bisect_left(starts, offset - delta, i + 1)
+            if k < len(starts) and starts[k] == offset - delta and starts[k] >= end:
+                j, stop = k, offset
+                break
+
+        new_starts, new_lines, new_segments = self._parse_region(
+            data, region, stop, lines[i] if lines else 1)
+        starts[i:j] = new_starts
+        lines[i:j] = new_lines
+        self._segments[i:j] = new_segments
+        k = i + len(new_starts)
+        if delta:
+            starts[k:] = [s + delta for s in starts[k:]]
+        if line_delta:
+            lines[k:] = [n + line_delta for n in lines[k:]]
+        self.reparsed = stop - region
+        return self.diagnostics()
+
+    def update(self, data):
+        # Like edit, for callers that only have the new text: the changed
+        # region is everything between the common prefix and suffix
+        old = self.data
+        prefix = _common_prefix(old, data, min(len(old), len(data)))
+        suffix = _common_suffix(old, data, min(len(old), len(data)) - prefix)
+        return self.edit(prefix, len(old) - suffix, data[prefix:len(data) - suffix])
+
+    def diagnostics(self):
+        diagnostics = Diagnostics()
+        errors = diagnostics.errors
+        for segment, line in zip(self._segments, self._lines):
+            if not segment.errors:
+                continue
+            errors.extend(_moved(segment.errors, line - segment.line))
+        return diagnostics
+
+    def tree(self):
+        # The Program for the current text, as parser.parse would build it
+        body = []
+        for segment, start, line in zip(self._segments, self._starts, self._lines):
+            if segment.start != start or segment.line != line:
+                shift(segment.body, start - segment.start, line - segment.line)
+                segment.errors = _moved(segment.errors, line - segment.line)
+                segment.start, segment.line = start, line
+            body.extend(segment.body)
+        if body:
+            return Program(tuple(body), body[0].lineno, body[0].lexpos)
+        return Program(())
+
+    def _open_segment(self, data, i, quotes):
+        # The segment to reparse from for an edit in segment i that adds or
+        # removes quotes: an earlier one whose text has one of them open.
+        # Such a quote has no match after it in the whole text, so it is
+        # the last of its kind before segment i, and only its segment needs
+        # scanning.
+        starts = self._starts
+        for quote in quotes:
+            pos = data.rfind(quote, 0, starts[i])
+            if pos < 0:
+                continue
+            k = bisect.bisect_right(starts, pos) - 1
+            if quote in segments.open_quotes(data, starts[k], starts[k + 1]):
+                i = min(i, k)
+        return i
+
+    def _parse_region(self, data, start, stop, line):
+        # Parses data[start:stop] into segments; start must be a boundary
+        # and stop a boundary or the end of data
+        starts, lines, parsed = [], [], []
+
+        def add(begin, end, lineno):
+            tree, diagnostics = self._parser.parse(data[begin:end], lineno=lineno)
+            body = tree.body if tree is not None else ()
+            starts.append(begin)
+            lines.append(lineno)
+            # Offsets in body are still relative to begin; tree() moves them
+            parsed.append(_Segment(body, diagnostics.errors, 0, lineno))
+
+        begin, lineno = start, line
+        for offset, n in segments.boundaries(data, start):
+            if offset >= stop:
+                break
+            if offset - begin >= self.segment_size:
+                add(begin, offset, lineno)
+                begin, lineno = offset, line + n
+        add(begin, stop, lineno)
+        return starts, lines, parsed
+
+
+def _moved(errors, lines):
+    # errors as seen lines further down the file
+    if not lines:
+        return errors
+    return [Diagnostic(e.kind, e.type, e.value, None if e.line is None else e.line + lines,
+                       e.column) for e in errors]
+
+
+def _common_prefix(a, b, limit):
+    # Length of the common prefix, at most limit. b is compared in place
+    # (startswith at an offset) against a block of a at a time, and the
+    # first block that differs is bisected, so the comparing is done in C
+    # and no more than one block is ever copied.
+    pos = 0
+    while pos < limit:
+        end = min(pos + _BLOCK, limit)
+        if not b.startswith(a[pos:end], pos):
+            lo, hi = pos, end - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if b.startswith(a[pos:mid], pos):
+                    lo = mid
+                else:
+                    hi = mid - 1
+            return lo
+        pos = end
+    return limit
+
+
+def _common_suffix(a, b, limit):
+    # Length of the common suffix, at most limit, the same way from the end
+    # (endswith up to an offset)
+    n = 0
+    while n < limit:
+        m = min(n + _BLOCK, limit)
+        if not b.endswith(a[len(a) - m:len(a) - n], 0, len(b) - n):
+            lo, hi = n, m - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if b.endswith(a[len(a) - mid:len(a) - n], 0, len(b) - n):
+                    lo = mid
+                else:
+                    hi = mid - 1
+            return lo
+        n = m
+    return limit
@@ -1,14 +1,17 @@
-import ply.lex as lex
+import sys
+
+from lexyacc import frozen
+from lexyacc.diagnostics import Diagnostics
 
 # Token list
 tokens = [
     'IF', 'THEN', 'ELSE', 'FI', 'FOR', 'DO', 'DONE', 'WHILE', 'IN',
     'ID', 'NUMBER', 
     'PIPE', 'REDIRECT_IN', 'REDIRECT_OUT', 'APPEND',
-    'SEMICOLON',
+    'SEMICOLON', 'NEWLINE',
     'STRING',
     'EQUALS',
-    'LPAREN', 'RPAREN',
+    'LPAREN', 'RPAREN', 'ARITH_OPEN',
     'PLUS', 'MINUS', 'MULTIPLY', 'DIVIDE',
 ]
 
@@ -26,14 +29,17 @@ reserved = {
 }
 
 # Token rules
+# REDIRECT_OUT refuses a following '>' so '>>' is always APPEND, whatever
+# order PLY ends up trying the string rules in (it sorts them by regex length)
 t_PIPE         = r'\|'
-t_REDIRECT_OUT = r'>>'
+t_REDIRECT_OUT = r'>(?!>)'
 t_REDIRECT_IN  = r'<'
 t_APPEND       = r'>>'
 t_EQUALS       = r'='
 t_SEMICOLON    = r';'
 t_LPAREN       = r'\('
 t_RPAREN       = r'\)'
+t_ARITH_OPEN   = r'\$\(\('
 t_PLUS         = r'\+'
 t_MINUS        = r'-'
 t_MULTIPLY     = r'\*'
@@ -41,6 +47,7 @@ t_DIVIDE       = r'/'
 
 def t_STRING(t):
     r'\"[^"]*\"|\'[^\']*\''
+    t.lexer.lineno += t.value.count('\n')  # Strings may span lines
     t.value = t.value[1:-1]  # Remove quotes
     return t
 
@@ -57,12 +64,15 @@ def t_NUMBER(t):
 # Ignore spaces and tabs
 t_ignore = ' \t'
 
-def t_newline(t):
+# Newlines end statements, so unlike spaces they are real tokens
+def t_NEWLINE(t):
     r'\n+'
     t.lexer.lineno += len(t.value)
+    return t
 
 def t_error(t):
-    print(f"Illegal character: '{t.value[0]}'")
+    t.lexer.diagnostics.illegal(t.lexer, t.value[0])
     t.lexer.skip(1)
 
-lexer = lex.lex()
+lexer = frozen.lexer(sys.modules[__name__])
+lexer.diagnostics = Diagnostics()
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('APPEND', 'ARITH_OPEN', 'DIVIDE', 'DO', 'DONE', 'ELSE', 'EQUALS', 'FI', 'FOR', 'ID', 'IF', 'IN', 'LPAREN', 'MINUS', 'MULTIPLY', 'NEWLINE', 'NUMBER', 'PIPE', 'PLUS', 'REDIRECT_IN', 'REDIRECT_OUT', 'RPAREN', 'SEMICOLON', 'STRING', 'THEN', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_STRING>\\"[^"]*\\"|\\\'[^\\\']*\\\')|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_NUMBER>\\d+)|(?P<t_NEWLINE>\\n+)|(?P<t_ARITH_OPEN>\\$\\(\\()|(?P<t_REDIRECT_OUT>>(?!>))|(?P<t_APPEND>>>)|(?P<t_LPAREN>\\()|(?P<t_MULTIPLY>\\*)|(?P<t_PIPE>\\|)|(?P<t_PLUS>\\+)|(?P<t_RPAREN>\\))|(?P<t_DIVIDE>/)|(?P<t_EQUALS>=)|(?P<t_MINUS>-)|(?P<t_REDIRECT_IN><)|(?P<t_SEMICOLON>;)', [None, ('t_STRING', 'STRING'), ('t_ID', 'ID'), ('t_NUMBER', 'NUMBER'), ('t_NEWLINE', 'NEWLINE'), (None, 'ARITH_OPEN'), (None, 'REDIRECT_OUT'), (None, 'APPEND'), (None, 'LPAREN'), (None, 'MULTIPLY'), (None, 'PIPE'), (None, 'PLUS'), (None, 'RPAREN'), (None, 'DIVIDE'), (None, 'EQUALS'), (None, 'MINUS'), (None, 'REDIRECT_IN'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_lexsignature = '([\'APPEND\', \'ARITH_OPEN\', \'DIVIDE\', \'DO\', \'DONE\', \'ELSE\', \'EQUALS\', \'FI\', \'FOR\', \'ID\', \'IF\', \'IN\', \'LPAREN\', \'MINUS\', \'MULTIPLY\', \'NEWLINE\', \'NUMBER\', \'PIPE\', \'PLUS\', \'REDIRECT_IN\', \'REDIRECT_OUT\', \'RPAREN\', \'SEMICOLON\', \'STRING\', \'THEN\', \'WHILE\'], (), \'\', [(\'t_APPEND\', \'>>\'), (\'t_ARITH_OPEN\', \'\\\\$\\\\(\\\\(\'), (\'t_DIVIDE\', \'/\'), (\'t_EQUALS\', \'=\'), (\'t_LPAREN\', \'\\\\(\'), (\'t_MINUS\', \'-\'), (\'t_MULTIPLY\', \'\\\\*\'), (\'t_PIPE\', \'\\\\|\'), (\'t_PLUS\', \'\\\\+\'), (\'t_REDIRECT_IN\', \'<\'), (\'t_REDIRECT_OUT\', \'>(?!>)\'), (\'t_RPAREN\', \'\\\\)\'), (\'t_SEMICOLON\', \';\'), (\'t_ignore\', \' \\t\')], [(\'t_STRING\', \'\\\\"[^"]*\\\\"|\\\\\\\'[^\\\\\\\']*\\\\\\\'\'), (\'t_ID\', \'[a-zA-Z_][a-zA-Z0-9_]*\'), (\'t_NUMBER\', \'\\\\d+\'), (\'t_NEWLINE\', \'\\\\n+\'), (\'t_error\', None)])'
@@ -1,20 +1,325 @@
-from lexer import lexer
-from parser import parser
-
-print("Shell Parser (type Ctrl+D or Ctrl+C to exit)")
-print("=" * 50)
-
-while True:
-    try:
-        data = input('shell> ')
-    except (EOFError, KeyboardInterrupt):
-        print("\nExiting.")
-        break
-    
-    if not data:
-        continue
-    
-    try:
-        result = parser.parse(data, lexer=lexer)
-    except Exception as e:
-        print(f"Error: {e}")
+import argparse
+import collections
+import fnmatch
+import json
+import multiprocessing
+import os
+import sys
+
+# The shared modules are in the lexyacc package at the repository root,
+# which is not on sys.path when this runs as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexyacc import stream, tokenstream
+from lexyacc.diagnostics import Diagnostics
+from lexyacc.limits import Limits
+from parser import Parser
+import fastlex
+import parallel
+import pipelines
+from cache import CacheStats, ParseCache
+from nodes import to_json
+
+# --jobs splits files larger than this (in characters) between workers
+CHUNK_SIZE = 1 << 20
+# Saved token streams (tokenstream.py); inputs named so are parsed from them
+TOKENS_SUFFIX = '.tok'
+
+
+def print_event(kind, node, env):
+    if kind == 'program':
+        print("✓ Parse successful!")
+    elif kind == 'command':
+        print(f"Command recognized: {node.name}")
+    elif kind == 'assignment':
+        print(f"Assignment: {node.name} = {env.get(node.name, '...')}")
+    elif kind == 'if':
+        print("If statement recognized")
+    elif kind == 'for':
+        print("For loop recognized")
+
+
+def repl():
+    print("Shell Parser (type Ctrl+D or Ctrl+C to exit)")
+    print("=" * 50)
+
+    # Assignments are evaluated, and their values kept from line to line
+    session = Parser(env={})
+    on_event = lambda kind, node: print_event(kind, node, session.env)
+    while True:
+        try:
+            data = input('shell> ')
+        except (EOFError, KeyboardInterrupt):
+            print("\nExiting.")
+            break
+
+        if not data:
+            continue
+
+        try:
+            result, diagnostics = session.parse(data, Diagnostics(on_event=on_event))
+        except Exception as e:
+            print(f"Error: {e}")
+            continue
+        for d in diagnostics:
+            print(d.message)
+
+
+def iter_inputs(paths, pattern):
+    # Expand directories (sorted, so output order is stable) into matching files
+    for path in paths:
+        if path == '-' or not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if fnmatch.fnmatch(name, pattern):
+                    yield os.path.join(root, name)
+
+
+def read_input(path):
+    if path == '-':
+        return sys.stdin.read()
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def parse_text(data, parser, cache=None, with_ast=True):
+    # The whole file is parsed as one program
+    if cache is None:
+        tree, diagnostics = parser.parse(data)
+    else:
+        tree, diagnostics = cache.parse(parser, data, tree=with_ast)
+    return tree, [d.as_dict() for d in diagnostics]
+
+
+def parse_stream(path, parser):
+    # Lexes the file as it is read, so it is never held whole
+    if path == '-':
+        tree, diagnostics = parser.parse_file(sys.stdin)
+    else:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            tree, diagnostics = parser.parse_file(f)
+    return tree, [d.as_dict() for d in diagnostics]
+
+
+def parse_tokens(path, parser, save=False):
+    # From the token stream saved at path, or with save, lexed from the
+    # text at path and saved beside it for the next run
+    if path.endswith(TOKENS_SUFFIX):
+        scanned = tokenstream.TokenStream.load(path)
+    else:
+        scanned = parser.scan(read_input(path))
+        if save and path != '-':
+            scanned.save(path + TOKENS_SUFFIX)
+    tree, diagnostics = parser.parse_tokens(scanned)
+    return tree, [d.as_dict() for d in diagnostics]
+
+
+def check_files(paths, pattern, with_ast, lexobj, cache=None, save_tokens=False, limits=None):
+    # Yields (name, ast, errors, error) per input, one file at a time; ast
+    # is the tree as JSON text
+    parser = Parser(lexobj, limits=limits)
+    for path in iter_inputs(paths, pattern):
+        name = '<stdin>' if path == '-' else path
+        try:
+            if save_tokens or path.endswith(TOKENS_SUFFIX):
+                tree, errors = parse_tokens(path, parser, save_tokens)
+            # Large inputs are streamed, unless cached: the cache key needs
+            # all of the text
+            elif cache is None and (path == '-' or os.path.getsize(path) > stream.CHUNK_SIZE):
+                tree, errors = parse_stream(path, parser)
+            else:
+                tree, errors = parse_text(read_input(path), parser, cache, with_ast)
+        except (OSError, ValueError) as e:
+            # ValueError: a .tok file that is not a token stream
+            yield name, None, None, str(e)
+            continue
+        yield name, to_json(tree) if with_ast else None, errors, None
+
+
+def check_files_parallel(paths, pattern, with_ast, jobs, chunk_size, cache_options=None,
+                         cache_stats=None, limits=None):
+    # Same records as check_files, computed by a pool of jobs processes.
+    # Results come back in task order, so the output does not depend on jobs.
+    # Each worker has its own ParseCache(**cache_options), if given; their
+    # counts are added up in cache_stats.
+    chunks = collections.deque()
+
+    def all_tasks():
+        for path in iter_inputs(paths, pattern):
+            name = '<stdin>' if path == '-' else path
+            file_tasks = list(parallel.tasks(name, path, chunk_size))
+            chunks.append((name, len(file_tasks)))
+            yield from file_tasks
+
+    with multiprocessing.Pool(jobs, parallel.init_worker,
+                              (with_ast, cache_options, limits)) as pool:
+        results = pool.imap(parallel.parse_task, all_tasks(), chunksize=4)
+        for result in results:
+            name, count = chunks.popleft()
+            pieces = []
+            for piece, stats in [result] + [next(results) for _ in range(count - 1)]:
+                pieces.append(piece)
+                if stats is not None:
+                    cache_stats.add(stats)
+            ast, errors, error = parallel.merge(pieces)
+            yield name, ast, errors, error
+
+
+def run_batch(paths, pattern='*.sh', out=sys.stdout, with_ast=False, lexobj=fastlex.lexer,
+              jobs=1, chunk_size=CHUNK_SIZE, cache_options=None, save_tokens=False,
+              limits=None):
+    # cache_options, if not None, are the ParseCache arguments to cache
+    # results with. save_tokens writes each input's token stream beside it.
+    # limits (a limits.Limits) bound each parse; with --jobs, each chunk's.
+    cache_stats = None
+    if cache_options is not None:
+        cache_stats = CacheStats()
+    if jobs > 1:
+        records = check_files_parallel(paths, pattern, with_ast, jobs, chunk_size,
+                                       cache_options, cache_stats, limits)
+    else:
+        cache = None
+        if cache_options is not None:
+            cache = ParseCache(**cache_options)
+            cache.stats = cache_stats
+        records = check_files(paths, pattern, with_ast, lexobj, cache, save_tokens, limits)
+
+    files = failed = unreadable = 0
+    for name, ast, errors, error in records:
+        files += 1
+        if error is not None:
+            unreadable += 1
+            record = {'file': name, 'ok': False, 'error': error}
+        else:
+            if errors:
+                failed += 1
+            record = {'file': name, 'ok': not errors, 'errors': errors}
+        line = json.dumps(record)
+        if with_ast and error is None:
+            # Already JSON, from nodes.to_json (json.dumps would recurse as
+            # deep as the tree nests)
+            line = line[:-1] + ', "ast": ' + (ast or 'null') + '}'
+        out.write(line + '\n')
+        out.flush()
+
+    summary = {'files': files, 'ok': files - failed - unreadable,
+               'failed': failed, 'unreadable': unreadable}
+    if cache_stats is not None:
+        summary['cache'] = cache_stats.as_dict()
+    out.write(json.dumps({'summary': summary}) + '\n')
+
+    if unreadable:
+        return 2
+    return 1 if failed else 0
+
+
+def run_commands(paths, pattern='*.sh', out=sys.stdout, lexobj=fastlex.lexer, limits=None):
+    # A JSON line per command of each input (pipelines.py), with the file
+    # name first, and one per syntax error; inputs are read a chunk at a
+    # time, so no file is held whole
+    parser = Parser(lexobj, limits=limits)
+    files = failed = unreadable = 0
+    totals = collections.Counter()
+    for path in iter_inputs(paths, pattern):
+        files += 1
+        name = '<stdin>' if path == '-' else path
+        errors = []
+
+        def on_error(d):
+            errors.append(d)
+            out.write(json.dumps({'file': name, 'diagnostic': d.as_dict()}) + '\n')
+
+        def write_records(f):
+            for record in pipelines.commands(f, parser, on_error=on_error):
+                totals['commands'] += 1
+                totals['pipelines'] += record['stage'] == 1
+                totals['redirects'] += record['stdin'] not in (None, '|')
+                totals['redirects'] += record['stdout'] not in (None, '|')
+                totals['edges'] += len(record['after'])
+                totals['unsafe'] += record['unsafe']
+                out.write(json.dumps({'file': name, **record}) + '\n')
+        try:
+            if path == '-':
+                write_records(sys.stdin)
+            else:
+                with open(path, encoding='utf-8', errors='replace') as f:
+                    write_records(f)
+        except OSError as e:
+            unreadable += 1
+            out.write(json.dumps({'file': name, 'ok': False, 'error': str(e)}) + '\n')
+            continue
+        failed += bool(errors)
+
+    summary = {'files': files, 'ok': files - failed - unreadable,
+               'failed': failed, 'unreadable': unreadable}
+    summary.update((key, totals[key])
+                   for key in ('commands', 'pipelines', 'redirects', 'edges', 'unsafe'))
+    out.write(json.dumps({'summary': summary}) + '\n')
+
+    if unreadable:
+        return 2
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(
+        description="Shell grammar parser. With no paths, starts the interactive prompt.")
+    ap.add_argument('paths', nargs='*',
+                    help="files or directories to parse as whole programs ('-' for stdin)")
+    ap.add_argument('--pattern', default='*.sh',
+                    help="file name pattern used when walking directories (default: *.sh)")
+    ap.add_argument('--ast', action='store_true',
+                    help="include the syntax tree of each input in its record")
+    ap.add_argument('--ply-lexer', action='store_true',
+                    help="tokenize with the PLY lexer instead of the faster fastlex one")
+    ap.add_argument('-j', '--jobs', type=int, default=1,
+                    help="parse with this many worker processes (default: 1)")
+    ap.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                    help="with --jobs, split files larger than this many characters "
+                         "at statement boundaries (default: %(default)s)")
+    ap.add_argument('--cache', action='store_true',
+                    help="reuse the results of inputs already parsed in this run")
+    ap.add_argument('--cache-dir', metavar='DIR',
+                    help="also keep cached results in DIR across runs (implies --cache)")
+    ap.add_argument('--cache-size', type=int, default=64, metavar='MB',
+                    help="memory for cached results, per process (default: 64)")
+    ap.add_argument('--save-tokens', action='store_true',
+                    help=f"save the tokens of each input as FILE{TOKENS_SUFFIX}; "
+                         f"{TOKENS_SUFFIX} inputs are parsed from their tokens, unlexed")
+    ap.add_argument('--commands', action='store_true',
+                    help="write a record per command (argv, pipeline, redirects and the "
+                         "commands it depends on through files) instead of per file")
+    ap.add_argument('--max-depth', type=int, metavar='N',
+                    help="stop a parse whose parser stack gets deeper than N "
+                         "(a few entries per level of nesting)")
+    ap.add_argument('--max-tokens', type=int, metavar='N',
+                    help="stop a parse after N tokens")
+    ap.add_argument('--max-time', type=float, metavar='S',
+                    help="stop a parse after S seconds")
+    args = ap.parse_args(argv)
+    if args.save_tokens and (args.jobs > 1 or args.cache or args.cache_dir):
+        ap.error('--save-tokens cannot be used with --jobs or the cache')
+    if args.commands and (args.jobs > 1 or args.cache or args.cache_dir or args.ast
+                          or args.save_tokens):
+        ap.error('--commands cannot be used with --jobs, the cache, --ast or --save-tokens')
+
+    if not args.paths:
+        repl()
+        return 0
+    lexobj = None if args.ply_lexer else fastlex.lexer
+    limits = Limits(args.max_depth, args.max_tokens, args.max_time)
+    if args.commands:
+        return run_commands(args.paths, args.pattern, lexobj=lexobj, limits=limits)
+    cache_options = None
+    if args.cache or args.cache_dir:
+        cache_options = {'max_bytes': args.cache_size << 20, 'directory': args.cache_dir}
+    return run_batch(args.paths, args.pattern, with_ast=args.ast, lexobj=lexobj,
+                     jobs=args.jobs, chunk_size=args.chunk_size, cache_options=cache_options,
+                     save_tokens=args.save_tokens, limits=limits)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
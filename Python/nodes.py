@@ -0,0 +1,335 @@
+# nodes.py
+# AST node classes built by the grammar actions in parser.py.
+#
+# Every node uses __slots__ so instances carry no per-object __dict__; large
+# scripts produce hundreds of thousands of nodes and the dict overhead would
+# dominate memory. Child sequences are stored as tuples for the same reason.
+# lineno/lexpos give the source position of the node's first token.
+#
+# Trees nest as deeply as their input does (a pipeline of n commands is a
+# chain n deep, and so is an expression with n nested parentheses), so
+# nothing here recurses: every traversal keeps its own stack, and a tree of
+# any depth can be compared, printed, converted and walked.
+import json
+
+
+class Node:
+    __slots__ = ('lineno', 'lexpos')
+    _fields = ()
+
+    def __iter__(self):
+        # Yields (field, value) pairs, handy for generic walkers
+        for name in self._fields:
+            yield name, getattr(self, name)
+
+    def __eq__(self, other):
+        # Field by field, with a stack of the pairs still to compare
+        if type(self) is not type(other):
+            return NotImplemented
+        stack = [(self, other)]
+        while stack:
+            a, b = stack.pop()
+            if isinstance(a, Node):
+                if type(a) is not type(b):
+                    return False
+                stack.extend((getattr(a, f), getattr(b, f)) for f in a._fields)
+            elif type(a) is tuple and type(b) is tuple:
+                if len(a) != len(b):
+                    return False
+                stack.extend(zip(a, b))
+            elif a != b:
+                return False
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        # What the recursive Class(field=value, ...) form would give; the
+        # stack holds pieces of text (as _Text) and values still to write
+        pieces = []
+        stack = [self]
+        while stack:
+            value = stack.pop()
+            if type(value) is _Text:
+                pieces.append(value)
+                continue
+            if isinstance(value, Node):
+                parts = [_Text(type(value).__name__ + '(')]
+                for i, name in enumerate(value._fields):
+                    parts.append(_Text((', ' if i else '') + name + '='))
+                    parts.append(getattr(value, name))
+                parts.append(_Text(')'))
+            elif type(value) is tuple:
+                parts = [_Text('(')]
+                for i, item in enumerate(value):
+                    if i:
+                        parts.append(_Text(', '))
+                    parts.append(item)
+                parts.append(_Text(',)' if len(value) == 1 else ')'))
+            else:
+                pieces.append(repr(value))
+                continue
+            stack.extend(reversed(parts))
+        return ''.join(pieces)
+
+
+class _Text(str):
+    # Literal text in Node.__repr__'s stack, told apart from str fields
+    __slots__ = ()
+
+
+class Program(Node):
+    __slots__ = ('body',)
+    _fields = ('body',)
+
+    def __init__(self, body, lineno=1, lexpos=0):
+        self.body = body
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class Command(Node):
+    # input is the '<' Redirect, if any; redirect the '>' or '>>' one, or
+    # the '|' one to the next command of a pipeline
+    __slots__ = ('name', 'args', 'input', 'redirect')
+    _fields = ('name', 'args', 'input', 'redirect')
+
+    def __init__(self, name, args, input, redirect, lineno, lexpos):
+        self.name = name
+        self.args = args
+        self.input = input
+        self.redirect = redirect
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class Word(Node):
+    # A command argument; kind is the token type (ID, NUMBER or STRING)
+    __slots__ = ('kind', 'value')
+    _fields = ('kind', 'value')
+
+    def __init__(self, kind, value, lineno, lexpos):
+        self.kind = kind
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class Redirect(Node):
+    # op is '<', '>', '>>' or '|'; for '|' the target is the next Command
+    __slots__ = ('op', 'target')
+    _fields = ('op', 'target')
+
+    def __init__(self, op, target, lineno, lexpos):
+        self.op = op
+        self.target = target
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class Assignment(Node):
+    __slots__ = ('name', 'value')
+    _fields = ('name', 'value')
+
+    def __init__(self, name, value, lineno, lexpos):
+        self.name = name
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class BinOp(Node):
+    __slots__ = ('op', 'left', 'right')
+    _fields = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right, lineno, lexpos):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class Arith(Node):
+    # $(( expr )) used as a statement or an if condition
+    __slots__ = ('expr',)
+    _fields = ('expr',)
+
+    def __init__(self, expr, lineno, lexpos):
+        self.expr = expr
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class Num(Node):
+    __slots__ = ('value',)
+    _fields = ('value',)
+
+    def __init__(self, value, lineno, lexpos):
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class Var(Node):
+    __slots__ = ('name',)
+    _fields = ('name',)
+
+    def __init__(self, name, lineno, lexpos):
+        self.name = name
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class If(Node):
+    __slots__ = ('cond', 'body', 'orelse')
+    _fields = ('cond', 'body', 'orelse')
+
+    def __init__(self, cond, body, orelse, lineno, lexpos):
+        self.cond = cond
+        self.body = body
+        self.orelse = orelse
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class For(Node):
+    __slots__ = ('var', 'items', 'body')
+    _fields = ('var', 'items', 'body')
+
+    def __init__(self, var, items, body, lineno, lexpos):
+        self.var = var
+        self.items = items
+        self.body = body
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+def to_dict(node):
+    # Plain dict/list form of a tree (JSON output and the memory baseline).
+    # Built top down with an explicit stack of (value, container, key) still
+    # to convert; a dict gets its keys in field order before any child is
+    # filled in, so the result is what the obvious recursion would give.
+    root = [None]
+    stack = [(node, root, 0)]
+    while stack:
+        value, container, key = stack.pop()
+        if isinstance(value, Node):
+            d = {'type': type(value).__name__, 'lineno': value.lineno, 'lexpos': value.lexpos}
+            for name, child in value:
+                d[name] = None
+                stack.append((child, d, name))
+            value = d
+        elif isinstance(value, tuple):
+            items = [None] * len(value)
+            stack.extend((child, items, i) for i, child in enumerate(value))
+            value = items
+        container[key] = value
+    return root[0]
+
+
+def to_json(node):
+    # json.dumps(to_dict(node)), written out piece by piece: json.dumps
+    # itself recurses and fails on a tree more than about a thousand deep
+    dumps = json.dumps
+    pieces = []
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if type(value) is _Text:
+            pieces.append(value)
+            continue
+        if isinstance(value, Node):
+            parts = [_Text('{"type": %s, "lineno": %d, "lexpos": %d'
+                           % (dumps(type(value).__name__), value.lineno, value.lexpos))]
+            for name, child in value:
+                parts.append(_Text(', %s: ' % dumps(name)))
+                parts.append(child)
+            parts.append(_Text('}'))
+        elif isinstance(value, tuple):
+            parts = [_Text('[')]
+            for i, item in enumerate(value):
+                if i:
+                    parts.append(_Text(', '))
+                parts.append(item)
+            parts.append(_Text(']'))
+        else:
+            pieces.append(dumps(value))
+            continue
+        stack.extend(reversed(parts))
+    return ''.join(pieces)
+
+
+def walk(tree):
+    # Every node of tree, parents before children and children in field
+    # order (which is source order)
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Node):
+            yield node
+            stack.extend(reversed([value for _, value in node]))
+        elif isinstance(node, tuple):
+            stack.extend(reversed(node))
+
+
+def shift(tree, offset, lines=0):
+    # Moves every node of tree offset characters and lines lines further
+    # into the source, for trees parsed from a slice of it
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Node):
+            node.lexpos += offset
+            node.lineno += lines
+            stack.extend(value for _, value in node)
+        elif isinstance(node, tuple):
+            stack.extend(node)
+
+
+# Node classes by number for encode/decode; append new classes at the end
+CLASSES = (Program, Command, Word, Redirect, Assignment, BinOp, Arith, Num, Var, If, For)
+_NUMBERS = {cls: n for n, cls in enumerate(CLASSES)}
+
+
+def encode(tree):
+    # Flattens tree into a tuple of records that marshal can store:
+    # (class number, lineno, lexpos, *fields), where a child node is written
+    # as [its record number] and tuples of them stay tuples. Records are in
+    # breadth-first order, so every child comes after its parent, and no
+    # recursion is needed however deep the tree is.
+    numbers = _NUMBERS
+    queue = [tree]
+    records = []
+    for node in queue:
+        fields = []
+        for name in node._fields:
+            value = getattr(node, name)
+            if type(value) in numbers:
+                queue.append(value)
+                value = [len(queue) - 1]
+            elif type(value) is tuple:
+                items = []
+                for v in value:
+                    if type(v) in numbers:
+                        queue.append(v)
+                        v = [len(queue) - 1]
+                    items.append(v)
+                value = tuple(items)
+            fields.append(value)
+        records.append((numbers[type(node)], node.lineno, node.lexpos, *fields))
+    return tuple(records)
+
+
+def decode(records):
+    # Rebuilds the tree encode() flattened, children first
+    built = [None] * len(records)
+    for i in range(len(records) - 1, -1, -1):
+        number, lineno, lexpos, *fields = records[i]
+        for n, value in enumerate(fields):
+            if type(value) is list:
+                fields[n] = built[value[0]]
+            elif type(value) is tuple:
+                fields[n] = tuple([built[v[0]] if type(v) is list else v for v in value])
+        built[i] = CLASSES[number](*fields, lineno, lexpos)
+    return built[0] if built else None
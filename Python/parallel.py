@@ -0,0 +1,113 @@
+# parallel.py
+# Worker side of the multi-process batch mode (main.py --jobs N).
+#
+# The parent turns every input into one or more tasks and feeds them to a
+# multiprocessing pool in order; pool.imap hands the results back in that
+# same order, so records and diagnostics come out exactly as a sequential
+# run would write them. Workers import parser.py (and so load the frozen
+# tables) once and keep a single Parser for their whole life.
+#
+# Files larger than the chunk size are split at top-level statement
+# boundaries (see segments.py). Each chunk starts at the beginning of a
+# line, so it is parsed with its real starting line number and columns need
+# no adjustment; only node offsets are shifted back into file coordinates
+# before the chunks are merged.
+# With syntax errors the results can differ at a boundary: a chunk starts
+# with no error pending, where a whole-file parse may still be recovering
+# and keep quiet about an error just after it.
+import os
+import sys
+
+import fastlex
+import segments
+from cache import CacheStats, ParseCache
+from nodes import Program, decode, encode, shift, to_json
+from parser import Parser
+
+_worker = None
+
+
+def split(data, size):
+    # Yields (chunk, lineno, offset) with every chunk at least size
+    # characters long except the last
+    start = 0
+    lineno = 1
+    for offset, lines in segments.boundaries(data):
+        if offset - start >= size and offset < len(data):
+            yield data[start:offset], lineno, start
+            start, lineno = offset, 1 + lines
+    yield data[start:], lineno, start
+
+
+def tasks(name, path, size):
+    # Yields the tasks for one input: (name, path, data, lineno, offset).
+    # Inputs below the chunk size are read by the worker itself.
+    try:
+        if path != '-' and os.path.getsize(path) <= size:
+            yield name, path, None, 1, 0
+            return
+        if path == '-':
+            data = sys.stdin.read()
+        else:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                data = f.read()
+    except OSError:
+        # Let the worker run into the same error and report it
+        yield name, path, None, 1, 0
+        return
+    pieces = list(split(data, size))
+    # A blank tail would only add an empty program
+    if len(pieces) > 1 and not pieces[-1][0].strip():
+        chunk, lineno, offset = pieces.pop()
+        prev, plineno, poffset = pieces.pop()
+        pieces.append((prev + chunk, plineno, poffset))
+    for chunk, lineno, offset in pieces:
+        yield name, None, chunk, lineno, offset
+
+
+def init_worker(with_ast, cache_options=None, limits=None):
+    global _worker
+    cache = ParseCache(**cache_options) if cache_options is not None else None
+    _worker = (Parser(fastlex.lexer, limits=limits), with_ast, cache)
+
+
+def parse_task(task):
+    # Returns ((ast or None, errors, error), cache stats or None): error is
+    # set when the file could not be read. ast is the tree as
+    # nodes.encode records, which are flat and so pickle at any depth.
+    name, path, data, lineno, offset = task
+    parser, with_ast, cache = _worker
+    if data is None:
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                data = f.read()
+        except OSError as e:
+            return (None, None, str(e)), None
+    if cache is None:
+        tree, diagnostics = parser.parse(data, lineno=lineno)
+    else:
+        cache.stats = CacheStats()
+        tree, diagnostics = cache.parse(parser, data, lineno, tree=with_ast)
+    errors = [d.as_dict() for d in diagnostics]
+    ast = None
+    if with_ast and tree is not None:
+        if offset:
+            shift(tree, offset)
+        ast = encode(tree)
+    return (ast, errors, None), cache and cache.stats
+
+
+def merge(results):
+    # Joins the (ast, errors, error) results of one file's chunks into the
+    # whole file's, with the tree as JSON text
+    asts, errors = [], []
+    for ast, errs, error in results:
+        if error is not None:
+            return None, None, error
+        asts.append(ast)
+        errors.extend(errs)
+    if any(ast is None for ast in asts):
+        return None, errors, None
+    trees = [decode(ast) for ast in asts]
+    body = tuple(statement for tree in trees for statement in tree.body)
+    return to_json(Program(body, trees[0].lineno, trees[0].lexpos)), errors, None
@@ -1,17 +1,96 @@
-import ply.yacc as yacc
+import copy
+import sys
+
+from lexyacc import arith, frozen, stream, tokenstream
+from lexyacc.diagnostics import Diagnostics, TooManyErrors
 from lexer import tokens, lexer
+from nodes import (Program, Command, Word, Redirect, Assignment, Arith, BinOp,
+                   Num, Var, If, For)
 
-# Grammar rules - simplified and conflict-free
+# Grammar rules - conflict-free: every statement ends at a newline, a
+# semicolon or the keyword closing its block, and arithmetic only appears
+# inside an explicit $(( )) or on the right of an assignment.
+#
+# Error recovery: a syntax error drops the rest of its statement, up to the
+# next separator or the keyword closing the enclosing block, and parsing
+# goes on from there, so one pass reports every error and the tree keeps
+# all the good statements. PLY stays quiet until three tokens have been
+# shifted after an error, which keeps a single mistake from being reported
+# over and over; once the separator ending the bad statement is read, the
+# next statement is a fresh start, so its errors are reported however
+# short it is (see p_recovered). Every error rule either ends with a token or only
+# reduces on the tokens that may follow it in that one place (hence a body
+# nonterminal per closing keyword), so each recovery consumes input and
+# the whole parse stays linear. An error in an if or for header skips to
+# its fi or done. A block still open at the end of the input leaves PLY
+# nothing to resynchronise on: that is reported and the tree is None.
+#
+# Evaluation: a Parser given an env folds constant arithmetic as it reduces
+# (the tree gets Num(7) for "3 + 4") and stores the value of each
+# assignment in env as the assignment is reduced, that is in source order;
+# if and for bodies are not run, only read. See arith.py.
 
 def p_program(p):
-    '''program : statement_list
-               | empty'''
-    print("✓ Parse successful!")
-
-def p_statement_list(p):
-    '''statement_list : statement
-                      | statement_list SEMICOLON statement
-                      | statement_list statement'''
+    '''program : lines
+               | lines error'''
+    body = tuple(_statements(p))
+    if body:
+        p[0] = Program(body, body[0].lineno, body[0].lexpos)
+    else:
+        p[0] = Program(body)
+    if not p.lexer.diagnostics.errors:
+        p.lexer.diagnostics.emit('program', p[0])
+
+def p_body(p):
+    '''then_body : lines
+                 | lines error
+       else_body : lines
+                 | lines error
+       do_body : lines
+               | lines error'''
+    p[0] = _statements(p)
+
+def p_lines(p):
+    '''lines : line
+             | lines separator line
+             | lines recovered line'''
+    # Every line, None for blank ones; _statements drops those
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[0] = p[1]
+        if p.slice[2].type == 'recovered':
+            p[0][-1] = None
+        p[0].append(p[3])
+
+def p_recovered(p):
+    '''recovered : error separator'''
+    # Reduced as soon as the separator is shifted, before the next line is
+    # read: ends PLY's quiet window there rather than three tokens on
+    p.parser.errok()
+
+def _statements(p):
+    # The statements of p[1], a lines list. If an error follows it, its last
+    # line is the one the error is on: whatever PLY reduced of that line on
+    # the way to recovering is not a statement of the program.
+    lines = p[1]
+    if len(p) == 3:
+        lines[-1] = None
+    return [line for line in lines if line is not None]
+
+def p_line(p):
+    '''line : statement
+            | empty'''
+    p[0] = p[1]
+
+def p_separator(p):
+    '''separator : NEWLINE
+                 | SEMICOLON'''
+    pass
+
+def p_separators_opt(p):
+    '''separators_opt : empty
+                      | separators_opt separator'''
     pass
 
 def p_statement(p):
@@ -19,37 +98,130 @@ def p_statement(p):
                  | if_statement
                  | for_loop
                  | assignment
-                 | expression'''
-    pass
+                 | arith'''
+    p[0] = p[1]
 
 def p_command(p):
-    '''command : ID
-               | ID arg_list
-               | ID arg_list redirect
-               | ID redirect'''
-    print(f"Command recognized: {p[1]}")
+    '''command : simple_command
+               | pipeline PIPE simple_command'''
+    # A pipeline is read left to right into a flat list, so the parser
+    # stack stays shallow however long it is; the commands are then linked
+    # into the tree's chain, each with a '|' Redirect to the next, last
+    # first (the order the 'command' events have always come in)
+    if len(p) == 2:
+        p[0] = _command(p, p[1])
+        return
+    pipeline = p[1]
+    pipeline.append((p[2], p.lineno(2), p.lexpos(2), p[3]))
+    command = _command(p, pipeline[-1][3])
+    for i in range(len(pipeline) - 1, 0, -1):
+        op, lineno, lexpos = pipeline[i][:3]
+        command = _command(p, pipeline[i - 1][3], Redirect(op, command, lineno, lexpos))
+    p[0] = command
+
+def p_pipeline(p):
+    '''pipeline : first_command
+                | pipeline PIPE pipe_command'''
+    # [(pipe, lineno, lexpos, (name, args, input, redirect, lineno, lexpos))],
+    # pipe None for the first command
+    if len(p) == 2:
+        p[0] = [(None, 0, 0, p[1])]
+    else:
+        p[0] = p[1]
+        p[0].append((p[2], p.lineno(2), p.lexpos(2), p[3]))
+
+def p_simple_command(p):
+    '''simple_command : ID
+                      | ID arg_list
+                      | ID arg_list redirects
+                      | ID redirects
+       first_command : ID
+                     | ID arg_list
+                     | ID arg_list input
+                     | ID input
+       pipe_command : ID
+                    | ID arg_list'''
+    # The first command of a pipeline may read a file and the last write
+    # one; a command on its own may do both, in either order
+    args = ()
+    redirects = (None, None)
+    if len(p) == 4:
+        args, redirects = tuple(p[2]), p[3]
+    elif len(p) == 3:
+        if isinstance(p[2], list):
+            args = tuple(p[2])
+        else:
+            redirects = p[2]
+    if isinstance(redirects, Redirect):
+        redirects = (redirects, None)
+    p[0] = (p[1], args, *redirects, p.lineno(1), p.lexpos(1))
+
+def _command(p, parts, pipe=None):
+    name, args, input, redirect, lineno, lexpos = parts
+    command = Command(name, args, input, pipe or redirect, lineno, lexpos)
+    p.lexer.diagnostics.emit('command', command)
+    return command
 
 def p_arg_list(p):
     '''arg_list : argument
                 | arg_list argument'''
-    pass
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[0] = p[1]
+        p[0].append(p[2])
 
 def p_argument(p):
     '''argument : ID
                 | NUMBER
                 | STRING'''
-    pass
+    p[0] = Word(p.slice[1].type, p[1], p.lineno(1), p.lexpos(1))
+
+def p_redirects(p):
+    '''redirects : input
+                 | output
+                 | input output
+                 | output input'''
+    # (input, output)
+    if len(p) == 2:
+        p[0] = (p[1], None) if p[1].op == '<' else (None, p[1])
+    elif p[1].op == '<':
+        p[0] = (p[1], p[2])
+    else:
+        p[0] = (p[2], p[1])
 
 def p_redirect(p):
-    '''redirect : REDIRECT_OUT ID
-                | REDIRECT_IN ID
-                | PIPE command'''
-    pass
+    '''output : REDIRECT_OUT target
+              | APPEND target
+       input : REDIRECT_IN target'''
+    p[0] = Redirect(p[1], p[2], p.lineno(1), p.lexpos(1))
+
+def p_target(p):
+    '''target : ID
+              | IN
+              | NUMBER
+              | STRING'''
+    # A file name. in only means something in a for loop's header, so it can
+    # name a file; the block keywords can't, or segments.py would count them
+    p[0] = str(p[1])
 
 def p_assignment(p):
     '''assignment : ID EQUALS expression'''
-    # Demo assignments: "x = 42", "total = a + b * 3"
-    print(f"Assignment: {p[1]} = ...")
+    # Demo assignments: "x = 42", "total = a + b * 3", "y = $((x * 2))"
+    p[0] = Assignment(p[1], p[3], p.lineno(1), p.lexpos(1))
+    env = p.parser.env
+    if env is not None:
+        try:
+            env[p[1]] = arith.evaluate(p[3], env)
+        except arith.ArithError as e:
+            env.pop(p[1], None)
+            p.lexer.diagnostics.arith(str(e), p.lexer, p.lineno(1), p.lexpos(1))
+    p.lexer.diagnostics.emit('assignment', p[0])
+
+def p_arith(p):
+    '''arith : ARITH_OPEN expression RPAREN RPAREN'''
+    # Demo arithmetic statements: "$((1 + 2))", "$((a * (b - 1)))"
+    p[0] = Arith(p[2], p.lineno(1), p.lexpos(1))
 
 def p_expression(p):
     '''expression : expression PLUS term
@@ -60,7 +232,10 @@ def p_expression(p):
     # - Simple addition/subtraction: "1 + 2", "a - b"
     # - Mixed with multiplication:   "a + b * (c - 2)"
     # These exercise the 'expression' rule (left-recursive plus/minus).
-    pass
+    if len(p) == 2:
+        p[0] = p[1]
+    else:
+        p[0] = _binop(p)
 
 def p_term(p):
     '''term : term MULTIPLY factor
@@ -70,51 +245,160 @@ def p_term(p):
     # - Multiplication/division: "3 * 4", "x / y"
     # - Combined with factor:    "x * (y + 2)"
     # These exercise the 'term' rule (left-recursive multiply/divide).
-    pass
+    if len(p) == 2:
+        p[0] = p[1]
+    else:
+        p[0] = _binop(p)
+
+def _binop(p):
+    left, right = p[1], p[3]
+    if p.parser.env is not None and type(left) is Num and type(right) is Num:
+        value = arith.fold(p[2], left.value, right.value)
+        if value is not None:
+            return Num(value, left.lineno, left.lexpos)
+    return BinOp(p[2], left, right, left.lineno, left.lexpos)
 
 def p_factor(p):
     '''factor : NUMBER
               | ID
-              | LPAREN expression RPAREN'''
+              | LPAREN expression RPAREN
+              | arith'''
     # Demo factors to try:
     # - Number:    "123"
     # - Identifier:"varName"
     # - Parenthesized expression: "(1 + 2)"
+    # - Nested arithmetic:        "$((1 + 2))"
     # These are the base units for 'term' and 'expression'.
-    pass
+    if len(p) == 4:
+        p[0] = p[2]
+    elif isinstance(p[1], Arith):
+        p[0] = p[1].expr
+    elif p.slice[1].type == 'NUMBER':
+        p[0] = Num(p[1], p.lineno(1), p.lexpos(1))
+    else:
+        p[0] = Var(p[1], p.lineno(1), p.lexpos(1))
 
 def p_if_statement(p):
-    '''if_statement : IF condition THEN statement_list FI
-                    | IF condition THEN statement_list ELSE statement_list FI'''
-    # Demo if statements (use 'condition' which is an expression in this grammar):
+    '''if_statement : IF condition separators_opt THEN then_body FI
+                    | IF condition separators_opt THEN then_body ELSE else_body FI'''
+    # Demo if statements (the condition is a command or a $(( )) expression):
     # - Without else: "if x then y; fi"
-    # - With else:    "if x then a; else b; fi"
-    # - Using an expression condition: "if a + b then echo; fi"
+    # - With else:    "if x; then a; else b; fi"
+    # - Using an arithmetic condition: "if $((a + b)) then echo; fi"
     # - Multiple statements inside: "if x then a; b; fi"
-    # Note: statement_list items are separated by semicolons or new statements.
-    print("If statement recognized")
+    # Note: statements in a block are separated by semicolons or newlines.
+    orelse = tuple(p[7]) if len(p) == 9 else ()
+    p[0] = If(p[2], tuple(p[5]), orelse, p.lineno(1), p.lexpos(1))
+    p.lexer.diagnostics.emit('if', p[0])
 
 def p_condition(p):
-    '''condition : expression'''
-    # Demo conditions (this grammar treats a condition as an expression):
-    # - Simple identifier: "x"
-    # - Numeric literal:  "1"
-    # - Expression:        "a + b" or "(a - b) * 2"
-    # These examples exercise the 'condition' rule which delegates to 'expression'.
-    pass
+    '''condition : command
+                 | arith'''
+    # Demo conditions:
+    # - Command:    "x", "test a | grep b"
+    # - Arithmetic: "$((1))", "$((a + b))" or "$(((a - b) * 2))"
+    # A bare expression is not a condition: "x" alone would be ambiguous
+    # between running command x and evaluating variable x.
+    p[0] = p[1]
 
 def p_for_loop(p):
-    '''for_loop : FOR ID IN arg_list DO statement_list DONE'''
-    print("For loop recognized")
+    '''for_loop : FOR ID IN arg_list separators_opt DO do_body DONE'''
+    # Demo loops: "for i in a b c do echo i done", "for f in x y; do cat f; done"
+    p[0] = For(p[2], tuple(p[4]), tuple(p[7]), p.lineno(1), p.lexpos(1))
+    p.lexer.diagnostics.emit('for', p[0])
+
+def p_block_error(p):
+    '''if_statement : IF error FI
+       for_loop : FOR error DONE'''
+    pass
 
 def p_empty(p):
     '''empty :'''
     pass
 
 def p_error(p):
-    if p:
-        print(f"Syntax error at token '{p.value}'")
-    else:
-        print("Syntax error at EOF")
+    # Only used by the module-level parser; p is None at EOF, where PLY
+    # gives us no token to reach the lexer through
+    lexobj = p.lexer if p else lexer
+    lexobj.diagnostics.syntax(p, lexobj)
+
+parser = frozen.parser(sys.modules[__name__])
+parser.env = None
+
+class Parser:
+    # A reentrant parser. Each instance has its own lexer and LR stacks but
+    # shares the read-only tables and grammar actions with every other, so
+    # creating one is two shallow copies. Use one instance per thread;
+    # every parse() starts from a clean lexer (position, lineno, diagnostics).
+    # With an instrument.Profile the parse loop reports what it does there.
+    # With an env (a dict) it evaluates arithmetic into env, which carries
+    # over from parse to parse.
+    # With a limits.Limits a parse stops at the first limit it passes.
+    def __init__(self, lexobj=None, profile=None, env=None, limits=None):
+        self.lexer = (lexobj if lexobj is not None else lexer).clone()
+        self.profile = profile
+        self.limits = limits
+        if profile is None:
+            self._parser = copy.copy(parser)
+            self._parser.errorfunc = self._error
+        else:
+            self._parser = profile.instrument(parser)
+            self._parser.errorfunc = profile.errorfunc(self._error)
+        self._parser.env = env
+
+    @property
+    def env(self):
+        return self._parser.env
+
+    def _error(self, tok):
+        self.lexer.diagnostics.syntax(tok, self._source)
+
+    def parse(self, data, diagnostics=None, lineno=1):
+        # Parse a whole program. Returns (tree, diagnostics); pass a
+        # Diagnostics with on_event set to be told about each construct.
+        # lineno is the line data starts on when it is a slice of a file.
+        return self._run(data, self.lexer, diagnostics, lineno)
+
+    def parse_file(self, f, diagnostics=None, chunk_size=stream.CHUNK_SIZE):
+        # Like parse for the text read from file object f, which is lexed a
+        # chunk at a time (see stream.py) and so never held whole. That is
+        # no memory saving here: the tree returned holds every token and is
+        # many times the size of the text (bench/stream_memory.py), so the
+        # peak is much the same as parse's.
+        source = stream.StreamLexer(self.lexer, f, chunk_size)
+        return self._run(None, source, diagnostics, 1)
+
+    def scan(self, data):
+        # data lexed once into a tokenstream.TokenStream, which parse_tokens
+        # (of this or any Parser of the grammar) can parse again and again
+        return tokenstream.scan(self.lexer, data, tokens)
+
+    def parse_tokens(self, scanned, diagnostics=None):
+        # Like parse for the text scanned was read from, without lexing it
+        return self._run(None, tokenstream.TokenLexer(self.lexer, scanned), diagnostics, 1)
+
+    def _run(self, data, source, diagnostics, lineno):
+        if diagnostics is None:
+            diagnostics = Diagnostics()
+        self.lexer.diagnostics = diagnostics
+        self.lexer.lineno = lineno
+        self._source = source
+        tokenfunc = None
+        if self.profile is not None:
+            tokenfunc = self.profile.tokenfunc(source)
+        if self.limits:
+            tokenfunc = self.limits.tokenfunc(self._parser, source, tokenfunc)
+        try:
+            if self.profile is None:
+                tree = self._parser.parse(data, lexer=source, tokenfunc=tokenfunc)
+            else:
+                tree = self.profile.timed(self._parser.parse, data, lexer=source,
+                                          tokenfunc=tokenfunc)
+        except TooManyErrors:
+            tree = None
+        return tree, diagnostics
 
-parser = yacc.yacc()
+def parse(data, diagnostics=None, lexobj=None):
+    # One-off parse on a fresh Parser. lexobj defaults to the PLY lexer;
+    # fastlex.lexer yields the same tokens faster.
+    return Parser(lexobj).parse(data, diagnostics)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'APPEND DIVIDE DO DONE ELSE EQUALS FI FOR ID IF IN LPAREN MINUS MULTIPLY NUMBER PIPE PLUS REDIRECT_IN REDIRECT_OUT RPAREN SEMICOLON STRING THEN WHILEprogram : statement_list\n| emptystatement_list : statement\n| statement_list SEMICOLON statement\n| statement_list statementstatement : command\n| if_statement\n| for_loop\n| assignment\n| expressioncommand : ID\n| ID arg_list\n| ID arg_list redirect\n| ID redirectarg_list : argument\n| arg_list argumentargument : ID\n| NUMBER\n| STRINGredirect : REDIRECT_OUT ID\n| REDIRECT_IN ID\n| PIPE commandassignment : ID EQUALS expressionexpression : expression PLUS term\n| expression MINUS term\n| termterm : term MULTIPLY factor\n| term DIVIDE factor\n| factorfactor : NUMBER\n| ID\n| LPAREN expression RPARENif_statement : IF condition THEN statement_list FI\n| IF condition THEN statement_list ELSE statement_list FIcondition : expressionfor_loop : FOR ID IN arg_list DO statement_list DONEempty :'
+_lr_signature = 'APPEND ARITH_OPEN DIVIDE DO DONE ELSE EQUALS FI FOR ID IF IN LPAREN MINUS MULTIPLY NEWLINE NUMBER PIPE PLUS REDIRECT_IN REDIRECT_OUT RPAREN SEMICOLON STRING THEN WHILEprogram : lines\n               | lines errorthen_body : lines\n                 | lines error\n       else_body : lines\n                 | lines error\n       do_body : lines\n               | lines errorlines : line\n             | lines separator line\n             | lines recovered linerecovered : error separatorline : statement\n            | emptyseparator : NEWLINE\n                 | SEMICOLONseparators_opt : empty\n                      | separators_opt separatorstatement : command\n                 | if_statement\n                 | for_loop\n                 | assignment\n                 | arithcommand : simple_command\n               | pipeline PIPE simple_commandpipeline : first_command\n                | pipeline PIPE pipe_commandsimple_command : ID\n                      | ID arg_list\n                      | ID arg_list redirects\n                      | ID redirects\n       first_command : ID\n                     | ID arg_list\n                     | ID arg_list input\n                     | ID input\n       pipe_command : ID\n                    | ID arg_listarg_list : argument\n                | arg_list argumentargument : ID\n                | NUMBER\n                | STRINGredirects : input\n                 | output\n                 | input output\n                 | output inputoutput : REDIRECT_OUT target\n              | APPEND target\n       input : REDIRECT_IN targettarget : ID\n              | IN\n              | NUMBER\n              | STRINGassignment : ID EQUALS expressionarith : ARITH_OPEN expression RPAREN RPARENexpression : expression PLUS term\n                  | expression MINUS term\n                  | termterm : term MULTIPLY factor\n            | term DIVIDE factor\n            | factorfactor : NUMBER\n              | ID\n              | LPAREN expression RPAREN\n              | arithif_statement : IF condition separators_opt THEN then_body FI\n                    | IF condition separators_opt THEN then_body ELSE else_body FIcondition : command\n                 | arithfor_loop : FOR ID IN arg_list separators_opt DO do_body DONEif_statement : IF error FI\n       for_loop : FOR error DONEempty :'
     
-_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,13,14,15,18,21,22,23,25,29,30,33,38,39,40,41,42,43,44,45,46,47,50,51,52,55,60,61,],[-37,0,-1,-2,-3,-6,-7,-8,-9,-10,-11,-26,-29,-30,-5,-17,-12,-14,-15,-18,-19,-31,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,-27,-28,-32,-33,-34,-36,]),'ID':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,33,35,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,],[10,10,-3,-6,-7,-8,-9,-10,21,33,34,-26,-29,-30,33,10,-5,33,33,-17,21,-14,33,-15,44,45,47,-18,-19,-31,33,33,-4,-24,-25,-13,-16,-23,-20,-21,-22,21,10,21,-27,-28,-32,10,21,-33,10,10,10,10,-34,-36,]),'IF':([0,2,4,5,6,7,8,9,10,13,14,15,17,18,21,22,23,25,29,30,33,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,55,56,57,58,59,60,61,],[11,11,-3,-6,-7,-8,-9,-10,-11,-26,-29,-30,11,-5,-17,-12,-14,-15,-18,-19,-31,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,11,-27,-28,-32,11,-33,11,11,11,11,-34,-36,]),'FOR':([0,2,4,5,6,7,8,9,10,13,14,15,17,18,21,22,23,25,29,30,33,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,55,56,57,58,59,60,61,],[12,12,-3,-6,-7,-8,-9,-10,-11,-26,-29,-30,12,-5,-17,-12,-14,-15,-18,-19,-31,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,12,-27,-28,-32,12,-33,12,12,12,12,-34,-36,]),'NUMBER':([0,2,4,5,6,7,8,9,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,33,35,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,],[15,15,-3,-6,-7,-8,-9,-10,29,15,-26,-29,-30,15,15,-5,15,15,-17,29,-14,15,-15,-18,-19,-31,15,15,-4,-24,-25,-13,-16,-23,-20,-21,-22,29,15,29,-27,-28,-32,15,29,-33,15,15,15,15,-34,-36,]),'LPAREN':([0,2,4,5,6,7,8,9,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,33,35,36,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,55,56,57,58,59,60,61,],[16,16,-3,-6,-7,-8,-9,-10,-11,16,-26,-29,-30,16,16,-5,16,16,-17,-12,-14,16,-15,-18,-19,-31,16,16,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,16,-27,-28,-32,16,-33,16,16,16,16,-34,-36,]),'SEMICOLON':([2,4,5,6,7,8,9,10,13,14,15,18,21,22,23,25,29,30,33,38,39,40,41,42,43,44,45,46,47,50,51,52,53,55,58,59,60,61,],[17,-3,-6,-7,-8,-9,-10,-11,-26,-29,-30,-5,-17,-12,-14,-15,-18,-19,-31,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,-27,-28,-32,17,-33,17,17,-34,-36,]),'FI':([4,5,6,7,8,9,10,13,14,15,18,21,22,23,25,29,30,33,38,39,40,41,42,43,44,45,46,47,50,51,52,53,55,58,60,61,],[-3,-6,-7,-8,-9,-10,-11,-26,-29,-30,-5,-17,-12,-14,-15,-18,-19,-31,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,-27,-28,-32,55,-33,60,-34,-36,]),'ELSE':([4,5,6,7,8,9,10,13,14,15,18,21,22,23,25,29,30,33,38,39,40,41,42,43,44,45,46,47,50,51,52,53,55,60,61,],[-3,-6,-7,-8,-9,-10,-11,-26,-29,-30,-5,-17,-12,-14,-15,-18,-19,-31,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,-27,-28,-32,56,-33,-34,-36,]),'DONE':([4,5,6,7,8,9,10,13,14,15,18,21,22,23,25,29,30,33,38,39,40,41,42,43,44,45,46,47,50,51,52,55,59,60,61,],[-3,-6,-7,-8,-9,-10,-11,-26,-29,-30,-5,-17,-12,-14,-15,-18,-19,-31,-4,-24,-25,-13,-16,-23,-20,-21,-22,-11,-27,-28,-32,-33,61,-34,-36,]),'PLUS':([9,10,13,14,15,32,33,37,39,40,43,50,51,52,],[19,-31,-26,-29,-30,19,-31,19,-24,-25,19,-27,-28,-32,]),'MINUS':([9,10,13,14,15,32,33,37,39,40,43,50,51,52,],[20,-31,-26,-29,-30,20,-31,20,-24,-25,20,-27,-28,-32,]),'EQUALS':([10,],[24,]),'MULTIPLY':([10,13,14,15,33,39,40,50,51,52,],[-31,35,-29,-30,-31,35,35,-27,-28,-32,]),'DIVIDE':([10,13,14,15,33,39,40,50,51,52,],[-31,36,-29,-30,-31,36,36,-27,-28,-32,]),'REDIRECT_OUT':([10,21,22,25,29,30,42,47,],[26,-17,26,-15,-18,-19,-16,26,]),'REDIRECT_IN':([10,21,22,25,29,30,42,47,],[27,-17,27,-15,-18,-19,-16,27,]),'PIPE':([10,21,22,25,29,30,42,47,],[28,-17,28,-15,-18,-19,-16,28,]),'STRING':([10,21,22,25,29,30,42,47,49,54,],[30,-17,30,-15,-18,-19,-16,30,30,30,]),'THEN':([13,14,15,31,32,33,39,40,50,51,52,],[-26,-29,-30,48,-35,-31,-24,-25,-27,-28,-32,]),'RPAREN':([13,14,15,33,37,39,40,50,51,52,],[-26,-29,-30,-31,52,-24,-25,-27,-28,-32,]),'DO':([21,25,29,30,42,54,],[-17,-15,-18,-19,-16,57,]),'IN':([34,],[49,]),}
+_lr_action_items = {'error':([0,2,3,4,5,6,7,8,9,10,11,13,14,15,19,20,21,22,31,33,34,35,36,37,39,40,44,45,46,47,49,50,51,52,53,55,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,80,81,82,85,86,87,88,89,90,92,94,95,97,99,101,102,104,],[-73,18,-9,-13,-14,-19,-20,-21,-22,-23,-24,25,30,-28,-73,-73,-15,-16,-40,-29,-31,-43,-38,-44,-41,-42,-58,-61,-62,-63,-65,-12,-10,-11,-25,-28,-71,-72,-54,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-73,-55,-56,-57,-59,-60,-64,96,-66,-73,-73,103,105,-67,-70,]),'NEWLINE':([0,2,3,4,5,6,7,8,9,10,11,15,18,19,20,21,22,24,26,27,28,31,33,34,35,36,37,39,40,44,45,46,47,49,50,51,52,53,55,56,57,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,99,101,102,103,104,105,],[-73,21,-9,-13,-14,-19,-20,-21,-22,-23,-24,-28,21,-73,-73,-15,-16,-73,-68,-69,-28,-40,-29,-31,-43,-38,-44,-41,-42,-58,-61,-62,-63,-65,-12,-10,-11,-25,-28,21,-17,-71,-72,-54,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-73,-18,-73,-55,-56,-57,-59,-60,-64,21,21,-66,-73,21,-73,21,21,-67,21,-70,21,]),'SEMICOLON':([0,2,3,4,5,6,7,8,9,10,11,15,18,19,20,21,22,24,26,27,28,31,33,34,35,36,37,39,40,44,45,46,47,49,50,51,52,53,55,56,57,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,99,101,102,103,104,105,],[-73,22,-9,-13,-14,-19,-20,-21,-22,-23,-24,-28,22,-73,-73,-15,-16,-73,-68,-69,-28,-40,-29,-31,-43,-38,-44,-41,-42,-58,-61,-62,-63,-65,-12,-10,-11,-25,-28,22,-17,-71,-72,-54,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-73,-18,-73,-55,-56,-57,-59,-60,-64,22,22,-66,-73,22,-73,22,22,-67,22,-70,22,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,15,18,19,20,21,22,31,33,34,35,36,37,39,40,44,45,46,47,49,50,51,52,53,55,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,80,81,85,86,87,88,89,90,94,102,104,],[-73,0,-1,-9,-13,-14,-19,-20,-21,-22,-23,-24,-28,-2,-73,-73,-15,-16,-40,-29,-31,-43,-38,-44,-41,-42,-58,-61,-62,-63,-65,-12,-10,-11,-25,-28,-71,-72,-54,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-55,-56,-57,-59,-60,-64,-66,-67,-70,]),'IF':([0,19,20,21,22,50,82,95,97,],[13,13,13,-15,-16,-12,13,13,13,]),'FOR':([0,19,20,21,22,50,82,95,97,],[14,14,14,-15,-16,-12,14,14,14,]),'ID':([0,13,14,15,16,19,20,21,22,23,28,31,32,33,36,38,39,40,41,42,48,50,55,59,64,75,76,77,78,80,82,84,95,97,],[15,28,29,31,47,15,15,-15,-16,55,31,-40,47,31,-38,68,-41,-42,68,68,47,-12,31,31,-39,47,47,47,47,31,15,31,15,15,]),'ARITH_OPEN':([0,13,16,19,20,21,22,32,48,50,75,76,77,78,82,95,97,],[16,16,16,16,16,-15,-16,16,16,-12,16,16,16,16,16,16,16,]),'FI':([3,4,5,6,7,8,9,10,11,15,19,20,21,22,25,31,33,34,35,36,37,39,40,44,45,46,47,49,50,51,52,53,55,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,80,81,82,85,86,87,88,89,90,91,92,94,95,96,98,99,102,103,104,],[-9,-13,-14,-19,-20,-21,-22,-23,-24,-28,-73,-73,-15,-16,58,-40,-29,-31,-43,-38,-44,-41,-42,-58,-61,-62,-63,-65,-12,-10,-11,-25,-28,-71,-72,-54,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-73,-55,-56,-57,-59,-60,-64,94,-3,-66,-73,-4,102,-5,-67,-6,-70,]),'ELSE':([3,4,5,6,7,8,9,10,11,15,19,20,21,22,31,33,34,35,36,37,39,40,44,45,46,47,49,50,51,52,53,55,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,80,81,82,85,86,87,88,89,90,91,92,94,96,102,104,],[-9,-13,-14,-19,-20,-21,-22,-23,-24,-28,-73,-73,-15,-16,-40,-29,-31,-43,-38,-44,-41,-42,-58,-61,-62,-63,-65,-12,-10,-11,-25,-28,-71,-72,-54,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-73,-55,-56,-57,-59,-60,-64,95,-3,-66,-4,-67,-70,]),'DONE':([3,4,5,6,7,8,9,10,11,15,19,20,21,22,30,31,33,34,35,36,37,39,40,44,45,46,47,49,50,51,52,53,55,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,80,81,85,86,87,88,89,90,94,97,100,101,102,104,105,],[-9,-13,-14,-19,-20,-21,-22,-23,-24,-28,-73,-73,-15,-16,60,-40,-29,-31,-43,-38,-44,-41,-42,-58,-61,-62,-63,-65,-12,-10,-11,-25,-28,-71,-72,-54,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-55,-56,-57,-59,-60,-64,-66,-73,104,-7,-67,-70,-8,]),'THEN':([11,21,22,24,26,27,28,31,33,34,35,36,37,39,40,53,55,56,57,62,63,64,65,66,67,68,69,70,71,72,73,80,81,83,85,],[-24,-15,-16,-73,-68,-69,-28,-40,-29,-31,-43,-38,-44,-41,-42,-25,-28,82,-17,-30,-43,-39,-45,-46,-49,-50,-51,-52,-53,-47,-48,-29,-43,-18,-55,]),'PIPE':([12,15,17,28,31,33,35,36,39,40,54,55,63,64,67,68,69,70,71,80,],[23,-32,-26,-32,-40,-33,-35,-38,-41,-42,-27,-36,-34,-39,-49,-50,-51,-52,-53,-37,]),'EQUALS':([15,],[32,]),'REDIRECT_IN':([15,28,31,33,36,37,39,40,55,64,68,69,70,71,72,73,80,],[38,38,-40,38,-38,38,-41,-42,38,-39,-50,-51,-52,-53,-47,-48,38,]),'NUMBER':([15,16,28,31,32,33,36,38,39,40,41,42,48,55,59,64,75,76,77,78,80,84,],[39,46,39,-40,46,39,-38,70,-41,-42,70,70,46,39,39,-39,46,46,46,46,39,39,]),'STRING':([15,28,31,33,36,38,39,40,41,42,55,59,64,80,84,],[40,40,-40,40,-38,71,-41,-42,71,71,40,40,-39,40,40,]),'REDIRECT_OUT':([15,28,31,33,35,36,39,40,55,63,64,67,68,69,70,71,80,81,],[41,41,-40,41,41,-38,-41,-42,41,41,-39,-49,-50,-51,-52,-53,41,41,]),'APPEND':([15,28,31,33,35,36,39,40,55,63,64,67,68,69,70,71,80,81,],[42,42,-40,42,42,-38,-41,-42,42,42,-39,-49,-50,-51,-52,-53,42,42,]),'LPAREN':([16,32,48,75,76,77,78,],[48,48,48,48,48,48,48,]),'DO':([21,22,31,36,39,40,57,64,83,84,93,],[-15,-16,-40,-38,-41,-42,-17,-39,-18,-73,97,]),'IN':([29,38,41,42,],[59,69,69,69,]),'RPAREN':([43,44,45,46,47,49,74,79,85,86,87,88,89,90,],[74,-58,-61,-62,-63,-65,85,90,-55,-56,-57,-59,-60,-64,]),'PLUS':([43,44,45,46,47,49,61,79,85,86,87,88,89,90,],[75,-58,-61,-62,-63,-65,75,75,-55,-56,-57,-59,-60,-64,]),'MINUS':([43,44,45,46,47,49,61,79,85,86,87,88,89,90,],[76,-58,-61,-62,-63,-65,76,76,-55,-56,-57,-59,-60,-64,]),'MULTIPLY':([44,45,46,47,49,85,86,87,88,89,90,],[77,-61,-62,-63,-65,-55,77,77,-59,-60,-64,]),'DIVIDE':([44,45,46,47,49,85,86,87,88,89,90,],[78,-61,-62,-63,-65,-55,78,78,-59,-60,-64,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,48,56,57,],[2,53,58,59,]),'empty':([0,],[3,]),'statement':([0,2,17,48,53,56,57,58,59,],[4,18,38,4,18,4,4,18,18,]),'command':([0,2,17,28,48,53,56,57,58,59,],[5,5,5,46,5,5,5,5,5,5,]),'if_statement':([0,2,17,48,53,56,57,58,59,],[6,6,6,6,6,6,6,6,6,]),'for_loop':([0,2,17,48,53,56,57,58,59,],[7,7,7,7,7,7,7,7,7,]),'assignment':([0,2,17,48,53,56,57,58,59,],[8,8,8,8,8,8,8,8,8,]),'expression':([0,2,11,16,17,24,48,53,56,57,58,59,],[9,9,32,37,9,43,9,9,9,9,9,9,]),'term':([0,2,11,16,17,19,20,24,48,53,56,57,58,59,],[13,13,13,13,13,39,40,13,13,13,13,13,13,13,]),'factor':([0,2,11,16,17,19,20,24,35,36,48,53,56,57,58,59,],[14,14,14,14,14,14,14,14,50,51,14,14,14,14,14,14,]),'arg_list':([10,47,49,],[22,22,54,]),'redirect':([10,22,47,],[23,41,23,]),'argument':([10,22,47,49,54,],[25,42,25,25,42,]),'condition':([11,],[31,]),}
+_lr_goto_items = {'program':([0,],[1,]),'lines':([0,82,95,97,],[2,92,99,101,]),'line':([0,19,20,82,95,97,],[3,51,52,3,3,3,]),'statement':([0,19,20,82,95,97,],[4,4,4,4,4,4,]),'empty':([0,19,20,24,82,84,95,97,],[5,5,5,57,5,57,5,5,]),'command':([0,13,19,20,82,95,97,],[6,26,6,6,6,6,6,]),'if_statement':([0,19,20,82,95,97,],[7,7,7,7,7,7,]),'for_loop':([0,19,20,82,95,97,],[8,8,8,8,8,8,]),'assignment':([0,19,20,82,95,97,],[9,9,9,9,9,9,]),'arith':([0,13,16,19,20,32,48,75,76,77,78,82,95,97,],[10,27,49,10,10,49,49,49,49,49,49,10,10,10,]),'simple_command':([0,13,19,20,23,82,95,97,],[11,11,11,11,53,11,11,11,]),'pipeline':([0,13,19,20,82,95,97,],[12,12,12,12,12,12,12,]),'first_command':([0,13,19,20,82,95,97,],[17,17,17,17,17,17,17,]),'separator':([2,18,56,92,93,96,99,101,103,105,],[19,50,83,19,83,50,19,19,50,50,]),'recovered':([2,92,99,101,],[20,20,20,20,]),'condition':([13,],[24,]),'arg_list':([15,28,55,59,],[33,33,80,84,]),'redirects':([15,28,33,55,80,],[34,34,62,34,62,]),'input':([15,28,33,37,55,80,],[35,35,63,66,81,81,]),'argument':([15,28,33,55,59,80,84,],[36,36,64,36,36,64,64,]),'output':([15,28,33,35,55,63,80,81,],[37,37,37,65,37,65,37,65,]),'expression':([16,32,48,],[43,61,79,]),'term':([16,32,48,75,76,],[44,44,44,86,87,]),'factor':([16,32,48,75,76,77,78,],[45,45,45,45,45,88,89,]),'pipe_command':([23,],[54,]),'separators_opt':([24,84,],[56,93,]),'target':([38,41,42,],[67,72,73,]),'then_body':([82,],[91,]),'else_body':([95,],[98,]),'do_body':([97,],[100,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,41 +27,77 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','parser.py',7),
-  ('program -> empty','program',1,'p_program','parser.py',8),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',12),
-  ('statement_list -> statement_list SEMICOLON statement','statement_list',3,'p_statement_list','parser.py',13),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',14),
-  ('statement -> command','statement',1,'p_statement','parser.py',18),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',19),
-  ('statement -> for_loop','statement',1,'p_statement','parser.py',20),
-  ('statement -> assignment','statement',1,'p_statement','parser.py',21),
-  ('statement -> expression','statement',1,'p_statement','parser.py',22),
-  ('command -> ID','command',1,'p_command','parser.py',26),
-  ('command -> ID arg_list','command',2,'p_command','parser.py',27),
-  ('command -> ID arg_list redirect','command',3,'p_command','parser.py',28),
-  ('command -> ID redirect','command',2,'p_command','parser.py',29),
-  ('arg_list -> argument','arg_list',1,'p_arg_list','parser.py',33),
-  ('arg_list -> arg_list argument','arg_list',2,'p_arg_list','parser.py',34),
-  ('argument -> ID','argument',1,'p_argument','parser.py',38),
-  ('argument -> NUMBER','argument',1,'p_argument','parser.py',39),
-  ('argument -> STRING','argument',1,'p_argument','parser.py',40),
-  ('redirect -> REDIRECT_OUT ID','redirect',2,'p_redirect','parser.py',44),
-  ('redirect -> REDIRECT_IN ID','redirect',2,'p_redirect','parser.py',45),
-  ('redirect -> PIPE command','redirect',2,'p_redirect','parser.py',46),
-  ('assignment -> ID EQUALS expression','assignment',3,'p_assignment','parser.py',50),
-  ('expression -> expression PLUS term','expression',3,'p_expression','parser.py',54),
-  ('expression -> expression MINUS term','expression',3,'p_expression','parser.py',55),
-  ('expression -> term','expression',1,'p_expression','parser.py',56),
-  ('term -> term MULTIPLY factor','term',3,'p_term','parser.py',60),
-  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',61),
-  ('term -> factor','term',1,'p_term','parser.py',62),
-  ('factor -> NUMBER','factor',1,'p_factor','parser.py',66),
-  ('factor -> ID','factor',1,'p_factor','parser.py',67),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',68),
-  ('if_statement -> IF condition THEN statement_list FI','if_statement',5,'p_if_statement','parser.py',72),
-  ('if_statement -> IF condition THEN statement_list ELSE statement_list FI','if_statement',7,'p_if_statement','parser.py',73),
-  ('condition -> expression','condition',1,'p_condition','parser.py',77),
-  ('for_loop -> FOR ID IN arg_list DO statement_list DONE','for_loop',7,'p_for_loop','parser.py',81),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',85),
+  ('program -> lines','program',1,'p_program','parser.py',34),
+  ('program -> lines error','program',2,'p_program','parser.py',35),
+  ('then_body -> lines','then_body',1,'p_body','parser.py',45),
+  ('then_body -> lines error','then_body',2,'p_body','parser.py',46),
+  ('else_body -> lines','else_body',1,'p_body','parser.py',47),
+  ('else_body -> lines error','else_body',2,'p_body','parser.py',48),
+  ('do_body -> lines','do_body',1,'p_body','parser.py',49),
+  ('do_body -> lines error','do_body',2,'p_body','parser.py',50),
+  ('lines -> line','lines',1,'p_lines','parser.py',54),
+  ('lines -> lines separator line','lines',3,'p_lines','parser.py',55),
+  ('lines -> lines recovered line','lines',3,'p_lines','parser.py',56),
+  ('recovered -> error separator','recovered',2,'p_recovered','parser.py',67),
+  ('line -> statement','line',1,'p_line','parser.py',82),
+  ('line -> empty','line',1,'p_line','parser.py',83),
+  ('separator -> NEWLINE','separator',1,'p_separator','parser.py',87),
+  ('separator -> SEMICOLON','separator',1,'p_separator','parser.py',88),
+  ('separators_opt -> empty','separators_opt',1,'p_separators_opt','parser.py',92),
+  ('separators_opt -> separators_opt separator','separators_opt',2,'p_separators_opt','parser.py',93),
+  ('statement -> command','statement',1,'p_statement','parser.py',97),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',98),
+  ('statement -> for_loop','statement',1,'p_statement','parser.py',99),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',100),
+  ('statement -> arith','statement',1,'p_statement','parser.py',101),
+  ('command -> simple_command','command',1,'p_command','parser.py',105),
+  ('command -> pipeline PIPE simple_command','command',3,'p_command','parser.py',106),
+  ('pipeline -> first_command','pipeline',1,'p_pipeline','parser.py',123),
+  ('pipeline -> pipeline PIPE pipe_command','pipeline',3,'p_pipeline','parser.py',124),
+  ('simple_command -> ID','simple_command',1,'p_simple_command','parser.py',134),
+  ('simple_command -> ID arg_list','simple_command',2,'p_simple_command','parser.py',135),
+  ('simple_command -> ID arg_list redirects','simple_command',3,'p_simple_command','parser.py',136),
+  ('simple_command -> ID redirects','simple_command',2,'p_simple_command','parser.py',137),
+  ('first_command -> ID','first_command',1,'p_simple_command','parser.py',138),
+  ('first_command -> ID arg_list','first_command',2,'p_simple_command','parser.py',139),
+  ('first_command -> ID arg_list input','first_command',3,'p_simple_command','parser.py',140),
+  ('first_command -> ID input','first_command',2,'p_simple_command','parser.py',141),
+  ('pipe_command -> ID','pipe_command',1,'p_simple_command','parser.py',142),
+  ('pipe_command -> ID arg_list','pipe_command',2,'p_simple_command','parser.py',143),
+  ('arg_list -> argument','arg_list',1,'p_arg_list','parser.py',166),
+  ('arg_list -> arg_list argument','arg_list',2,'p_arg_list','parser.py',167),
+  ('argument -> ID','argument',1,'p_argument','parser.py',175),
+  ('argument -> NUMBER','argument',1,'p_argument','parser.py',176),
+  ('argument -> STRING','argument',1,'p_argument','parser.py',177),
+  ('redirects -> input','redirects',1,'p_redirects','parser.py',181),
+  ('redirects -> output','redirects',1,'p_redirects','parser.py',182),
+  ('redirects -> input output','redirects',2,'p_redirects','parser.py',183),
+  ('redirects -> output input','redirects',2,'p_redirects','parser.py',184),
+  ('output -> REDIRECT_OUT target','output',2,'p_redirect','parser.py',194),
+  ('output -> APPEND target','output',2,'p_redirect','parser.py',195),
+  ('input -> REDIRECT_IN target','input',2,'p_redirect','parser.py',196),
+  ('target -> ID','target',1,'p_target','parser.py',200),
+  ('target -> IN','target',1,'p_target','parser.py',201),
+  ('target -> NUMBER','target',1,'p_target','parser.py',202),
+  ('target -> STRING','target',1,'p_target','parser.py',203),
+  ('assignment -> ID EQUALS expression','assignment',3,'p_assignment','parser.py',209),
+  ('arith -> ARITH_OPEN expression RPAREN RPAREN','arith',4,'p_arith','parser.py',222),
+  ('expression -> expression PLUS term','expression',3,'p_expression','parser.py',227),
+  ('expression -> expression MINUS term','expression',3,'p_expression','parser.py',228),
+  ('expression -> term','expression',1,'p_expression','parser.py',229),
+  ('term -> term MULTIPLY factor','term',3,'p_term','parser.py',241),
+  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',242),
+  ('term -> factor','term',1,'p_term','parser.py',243),
+  ('factor -> NUMBER','factor',1,'p_factor','parser.py',262),
+  ('factor -> ID','factor',1,'p_factor','parser.py',263),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',264),
+  ('factor -> arith','factor',1,'p_factor','parser.py',265),
+  ('if_statement -> IF condition separators_opt THEN then_body FI','if_statement',6,'p_if_statement','parser.py',282),
+  ('if_statement -> IF condition separators_opt THEN then_body ELSE else_body FI','if_statement',8,'p_if_statement','parser.py',283),
+  ('condition -> command','condition',1,'p_condition','parser.py',295),
+  ('condition -> arith','condition',1,'p_condition','parser.py',296),
+  ('for_loop -> FOR ID IN arg_list separators_opt DO do_body DONE','for_loop',8,'p_for_loop','parser.py',305),
+  ('if_statement -> IF error FI','if_statement',3,'p_block_error','parser.py',311),
+  ('for_loop -> FOR error DONE','for_loop',3,'p_block_error','parser.py',312),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',316),
 ]
@@ -0,0 +1,156 @@
+# pipelines.py
+# A record per command of a shell script: what it runs, the pipeline it is
+# part of, where its input comes from and its output goes, and which
+# earlier commands it depends on through the files they share.
+#
+# commands(f) reads a script a chunk at a time and cuts it after whole
+# top-level statements (segments.py), never inside a string (see
+# stream.safe_cut), parses each piece on its own and yields its commands in
+# source order before reading on. Only one piece and its tree are held at a
+# time, about chunk_size characters or the longest if/for block if that is
+# longer, so memory does not grow with the file; what carries over from
+# piece to piece is one entry per file name redirected to or from. A tree
+# takes some 60 times the memory of its text, which is why pieces are much
+# smaller than stream.py's chunks.
+#
+# Each record is a dict that json.dumps as it is:
+#   index     the command's number in the script, from 0
+#   line, column
+#   argv      the command name and its arguments, as strings
+#   pipeline  the number of its pipeline in the script (from 0), None if
+#             it is not in one; stage is its position there, stages the
+#             pipeline's length (0 and 1 outside pipelines)
+#   stdin     the file it reads from (<), '|' from the pipeline, or None
+#   stdout    the file it writes to (> or >>), '|' to the pipeline, or None
+#   append    True when stdout is a >> target
+#   after     its dependency edges: {'command', 'file', 'kind'} with kind
+#             'read' (it reads the file that command wrote last), 'write'
+#             (it writes the file that command wrote last) or
+#             'write-after-read' (it writes the file that command read last,
+#             since the file was last written)
+#   unsafe    True when it truncates (>) a file an earlier command of the
+#             script wrote or read, or that it reads itself (sort < f > f
+#             has a write-after-read edge to itself: the file is empty
+#             before sort reads it)
+#
+# Edges only come from redirects: the grammar cannot tell which arguments
+# name files. Commands in if and for blocks count once, in source order,
+# whether or not they would run.
+import fastlex
+import segments
+from lexyacc import diagnostics, stream
+from nodes import Command, walk
+from parser import Parser
+
+PIECE_SIZE = 1 << 16
+
+
+def pieces(f, chunk_size=PIECE_SIZE):
+    # Yields (text, lineno) runs of whole top-level statements read
+    # from f, cut at the last boundary of each chunk read. With none in a
+    # chunk (a long block or string) it reads on, in ever larger pieces as
+    # stream.StreamLexer does, so that costs linear time.
+    pending = ''
+    lineno = 1
+    size = chunk_size
+    while True:
+        data = f.read(size)
+        text = pending + data
+        cut = lines = 0
+        if data:
+            # The last statement boundary before any quote still open
+            safe = stream.safe_cut(text)
+            for boundary, count in segments.boundaries(text[:safe]):
+                cut, lines = boundary, count
+        else:
+            cut = len(text)
+        if cut:
+            yield text[:cut], lineno
+            lineno += lines
+            text = text[cut:]
+            size = chunk_size
+        else:
+            size *= 2
+        if not data:
+            return
+        pending = text
+
+
+def _chain(command):
+    # The commands of the pipeline command starts, first to last
+    members = [command]
+    while command.redirect is not None and command.redirect.op == '|':
+        command = command.redirect.target
+        members.append(command)
+    return members
+
+
+def commands(f, parser=None, chunk_size=PIECE_SIZE, on_error=None):
+    # Yields a record per command of the script read from f; see above.
+    # Each piece is parsed with parser (a Parser over fastlex by default)
+    # and its syntax errors passed to on_error, if given, as Diagnostic
+    # objects. Commands of statements with errors are not recorded.
+    if parser is None:
+        parser = Parser(fastlex.lexer)
+    writer = {}         # file -> index of the command that wrote it last
+    reader = {}         # file -> index of the last to read it since then
+    index = 0
+    pipeline = 0
+    for text, lineno in pieces(f, chunk_size):
+        tree, errors = parser.parse(text, lineno=lineno)
+        if on_error is not None:
+            for d in errors:
+                on_error(d)
+        if tree is None:
+            continue
+        piped = set()       # ids of the commands after the first of a pipeline
+        for node in walk(tree):
+            if type(node) is not Command or id(node) in piped:
+                continue
+            members = _chain(node)
+            piped.update(id(c) for c in members[1:])
+            for stage, command in enumerate(members):
+                redirect = command.redirect
+                input = command.input
+                after = []
+                record = {
+                    'index': index,
+                    'line': command.lineno,
+                    'column': diagnostics.find_column(text, command.lexpos),
+                    'argv': [command.name] + [str(word.value) for word in command.args],
+                    'pipeline': pipeline if len(members) > 1 else None,
+                    'stage': stage,
+                    'stages': len(members),
+                    'stdin': input.target if input else '|' if stage else None,
+                    'stdout': None,
+                    'append': False,
+                    'after': after,
+                    'unsafe': False,
+                }
+                if input is not None:
+                    # Read before any output is opened, so a command
+                    # writing the file it reads depends on itself
+                    path = input.target
+                    if path in writer:
+                        after.append({'command': writer[path], 'file': path, 'kind': 'read'})
+                    reader[path] = index
+                if redirect is None:
+                    pass
+                elif redirect.op == '|':
+                    record['stdout'] = '|'
+                else:
+                    path = redirect.target
+                    record['stdout'] = path
+                    record['append'] = redirect.op == '>>'
+                    if path in writer:
+                        after.append({'command': writer[path], 'file': path, 'kind': 'write'})
+                    if path in reader:
+                        after.append({'command': reader.pop(path), 'file': path,
+                                      'kind': 'write-after-read'})
+                    record['unsafe'] = not record['append'] and any(
+                        edge['kind'] != 'read' for edge in after)
+                    writer[path] = index
+                index += 1
+                yield record
+            if len(members) > 1:
+                pipeline += 1
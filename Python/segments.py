@@ -0,0 +1,51 @@
+# segments.py
+# Top-level statement boundaries of a shell program, without parsing it.
+#
+# A boundary is the position just after a run of newlines that is outside
+# every if/fi and for/done block. Text between two boundaries is a run of
+# whole top-level statements that parses the same on its own as inside the
+# full program, which is what chunked (parallel.py) and incremental
+# (incremental.py) parsing rely on.
+import re
+
+# Only strings, words and newlines matter. Scanning left to right this
+# matches strings and identifiers at exactly the positions the lexer does,
+# so keywords are never seen inside either.
+_SCAN = re.compile(r'''"[^"]*"|'[^']*'|[a-zA-Z_][a-zA-Z0-9_]*|\n+''')
+_OPENERS = {'if', 'for'}
+_CLOSERS = {'fi', 'done'}
+
+# A string, or a quote that starts none
+_QUOTES = re.compile(r'''"[^"]*"|'[^']*'|["']''')
+
+
+def boundaries(data, pos=0):
+    # Yields (offset, lines) for every boundary after pos, where lines is
+    # the number of newlines between pos and offset. pos must itself be a
+    # boundary (or 0).
+    lines = 0
+    depth = 0
+    for m in _SCAN.finditer(data, pos):
+        word = m.group()
+        if word[0] == '\n':
+            lines += len(word)
+            if depth == 0:
+                yield m.end(), lines
+        elif word in _OPENERS:
+            depth += 1
+        elif word in _CLOSERS:
+            # A stray closer is a syntax error either way; don't let it
+            # hide the boundaries after it
+            depth = max(depth - 1, 0)
+        elif word[0] in '"\'':
+            lines += word.count('\n')
+
+
+def open_quotes(data, pos=0, end=None):
+    # The quote characters in data[pos:end] that start no string there. The
+    # lexer reports such a quote as illegal unless the same quote comes
+    # later in the text; boundaries() steps over it, so the statements
+    # after it are cut off from a string an edit further on would close.
+    if end is None:
+        end = len(data)
+    return {m.group() for m in _QUOTES.finditer(data, pos, end) if len(m.group()) == 1}
@@ -0,0 +1,68 @@
+"""Memory per AST node: __slots__ nodes versus the same tree as plain dicts.
+
+    python bench/ast_memory.py [--statements N]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+
+from parser import parse
+from nodes import Node, to_dict
+
+STATEMENTS = [
+    'echo hello world {i} "quoted text" >> log{i}',
+    'total{i} = a + b * (c - {i}) / 2',
+    'if x{i} then echo yes {i} else echo no fi',
+    'for f in a b c {i} do cat f | wc done',
+    'sort < input{i}',
+]
+
+
+def make_script(n):
+    return '; '.join(STATEMENTS[i % len(STATEMENTS)].format(i=i) for i in range(n))
+
+
+def count_nodes(tree):
+    total, stack = 0, [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Node):
+            total += 1
+            stack.extend(value for _, value in node)
+        elif isinstance(node, tuple):
+            stack.extend(node)
+    return total
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--statements', type=int, default=20000)
+    args = ap.parse_args()
+
+    data = make_script(args.statements)
+
+    tracemalloc.start()
+    tree, diagnostics = parse(data)
+    # The tree is the only thing still alive from the parse
+    slots_bytes = tracemalloc.get_traced_memory()[0]
+
+    before = tracemalloc.get_traced_memory()[0]
+    as_dicts = to_dict(tree)
+    dict_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    nodes = count_nodes(tree)
+    print(f"input:        {len(data):,} chars, {args.statements:,} statements")
+    print(f"nodes:        {nodes:,}")
+    print(f"slots nodes:  {slots_bytes:,} bytes ({slots_bytes / nodes:.1f} B/node)")
+    print(f"plain dicts:  {dict_bytes:,} bytes ({dict_bytes / nodes:.1f} B/node)")
+    print(f"ratio:        {dict_bytes / slots_bytes:.2f}x smaller with slots")
+    del as_dicts
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Checking a file of expressions with main.sh, line by line against --batch.
+
+    python bench/bash_batch.py [--root DIR] [--lines N] [--distinct D] [--jobs J ...]
+
+Writes a file of N expression lines that cycles through D distinct ones
+(some with a syntax error), then times `main.sh -f FILE -g expression -q`
+(process_file, one parse_input with its traces per line; run on at most
+1000 lines and scaled up) and `main.sh -b -f FILE -g expression -j J`.
+Batch mode parses each distinct line once, so D, not N, sets most of its
+cost; workers only help with more than one CPU.
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LINE_BY_LINE_MAX = 1000
+
+
+def expression(rng):
+    # A few terms, sometimes parenthesized; one line in ten has an error
+    terms = [str(rng.randint(0, 999)) for _ in range(rng.randint(2, 6))]
+    if rng.random() < 0.3:
+        terms[0] = f'({terms[0]} + {rng.randint(0, 9)})'
+    line = terms[0]
+    for term in terms[1:]:
+        line += f" {rng.choice('+-*/')} {term}"
+    if rng.random() < 0.1:
+        line += ' +'
+    return line
+
+
+def write(path, lines, distinct):
+    rng = random.Random(lines)
+    pool = [expression(rng) for _ in range(distinct)]
+    with open(path, 'w') as f:
+        for i in range(lines):
+            f.write(pool[i % distinct] + '\n')
+
+
+def timed(args, cwd):
+    start = time.perf_counter()
+    proc = subprocess.run(['bash', 'main.sh'] + args, cwd=cwd, capture_output=True, text=True)
+    return time.perf_counter() - start, proc
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--root', default=ROOT)
+    ap.add_argument('--lines', type=int, default=100000)
+    ap.add_argument('--distinct', type=int, default=1000)
+    ap.add_argument('--jobs', type=int, nargs='+', default=[1, 4])
+    args = ap.parse_args()
+
+    root = os.path.abspath(args.root)
+    distinct = min(args.distinct, args.lines)
+    print(f'lines: {args.lines}, distinct: {distinct}, cpus: {os.cpu_count()}')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'input.txt')
+        sample = min(args.lines, LINE_BY_LINE_MAX)
+        write(path, sample, min(distinct, sample))
+        seconds, _ = timed(['-f', path, '-g', 'expression', '-q'], root)
+        scaled = seconds * args.lines / sample
+        note = '' if sample == args.lines else f'  ({sample} lines, scaled)'
+        print(f'{"line by line":14} {scaled:9.2f} s{note}')
+
+        write(path, args.lines, distinct)
+        for jobs in args.jobs:
+            seconds, proc = timed(['-b', '-f', path, '-g', 'expression', '-j', str(jobs)], root)
+            total = proc.stdout.splitlines()[-1].replace('\t', ', ')
+            print(f'{f"batch -j {jobs}":14} {seconds:9.2f} s  {total}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
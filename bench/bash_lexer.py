@@ -0,0 +1,69 @@
+"""Tokenizing time of lexer.sh at growing input sizes.
+
+    python bench/bash_lexer.py [--root DIR] [--sizes N ...] [--repeat R]
+
+Sources lexer.sh in bash and times tokenize_input alone (bash's own clock,
+so start-up and sourcing are left out) on arithmetic of about N characters,
+with QUIET=true. The time per character should stay flat as N grows.
+--root points at another checkout to compare with.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+SCRIPT = '''
+source "$1/lexer.sh" >/dev/null 2>&1
+QUIET=true
+input=$(<"$2")
+start=$EPOCHREALTIME
+tokenize_input "$input" >/dev/null 2>&1
+status=$?
+end=$EPOCHREALTIME
+echo "$status ${#TOKENS[@]} $start $end"
+'''
+
+
+def expression(size):
+    # bash_expression cut at the last blank before size characters
+    data = gen.bash_expression(size // 3 + 10)
+    return data[:data.rindex(' ', 0, size)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--root', default=ROOT)
+    ap.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    ap.add_argument('--repeat', type=int, default=3)
+    args = ap.parse_args()
+
+    root = os.path.abspath(args.root)
+    print(f"lexer:  {os.path.join(root, 'lexer.sh')}")
+    print(f"{'chars':>8} {'tokens':>8} {'seconds':>9} {'us/char':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'input')
+        for size in args.sizes:
+            data = expression(size)
+            with open(path, 'w') as f:
+                f.write(data)
+            times = []
+            for _ in range(args.repeat):
+                out = subprocess.run(['bash', '-c', SCRIPT, 'bench', root, path],
+                                     capture_output=True, text=True, check=True).stdout
+                status, tokens, start, end = out.split()
+                times.append(float(end) - float(start))
+            seconds = statistics.median(times)
+            note = '' if status == '0' else '  (rejected)'
+            print(f"{len(data):>8} {int(tokens):>8} {seconds:>9.3f} "
+                  f"{seconds / len(data) * 1e6:>8.1f}{note}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
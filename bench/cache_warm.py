@@ -0,0 +1,76 @@
+"""Batch runs with a cold, a warm on-disk and a warm in-memory parse cache.
+
+    python bench/cache_warm.py [--files F] [--statements S]
+
+Parses the same synthetic corpus four times: without a cache, with an
+empty cache directory, with the directory filled by that run, and a second
+time in the same process so hits come from memory. Each run must write the
+same records as the uncached one.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+import main
+from cache import ParseCache
+
+import generators
+
+ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+ap.add_argument('--files', type=int, default=200)
+ap.add_argument('--statements', type=int, default=200)
+args = ap.parse_args()
+
+
+def run(paths, **kwargs):
+    out = io.StringIO()
+    start = time.perf_counter()
+    main.run_batch(paths, out=out, with_ast=True, **kwargs)
+    elapsed = time.perf_counter() - start
+    lines = out.getvalue().splitlines()
+    return lines[:-1], json.loads(lines[-1])['summary'].get('cache'), elapsed
+
+
+def bench():
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, 'corpus')
+        os.mkdir(corpus)
+        for n in range(args.files):
+            with open(os.path.join(corpus, f'script{n:05}.sh'), 'w') as f:
+                f.write(generators.shell_statements(args.statements + n))
+        options = {'directory': os.path.join(tmp, 'cache')}
+
+        expected, _, base = run([corpus])
+        print(f"corpus:       {args.files} files")
+        print(f"no cache:     {base:6.2f} s")
+        mismatches = 0
+        for label in ('cold disk', 'warm disk'):
+            records, stats, elapsed = run([corpus], cache_options=options)
+            mismatches += records != expected
+            print(f"{label + ':':13} {elapsed:6.2f} s  {base / elapsed:5.2f}x  "
+                  f"hit rate {stats['hit_rate']:.0%}, saved {stats['saved_seconds']:.2f} s")
+
+        # Same process, one cache: the second pass hits memory only
+        cache = ParseCache()
+        parser = main.Parser()
+        paths = sorted(os.path.join(corpus, name) for name in os.listdir(corpus))
+        for n in range(2):
+            start = time.perf_counter()
+            for path in paths:
+                with open(path) as f:
+                    cache.parse(parser, f.read())
+            elapsed = time.perf_counter() - start
+        print(f"warm memory:  {elapsed:6.2f} s  {base / elapsed:5.2f}x  "
+              f"({cache.size / 1e6:.1f} MB held)")
+        print(f"mismatches:   {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(bench())
@@ -0,0 +1,128 @@
+"""Per-command records (main.py --commands) against a whole-file parse.
+
+    python bench/command_records.py [--mb M ...] [--chunk-size C]
+
+For each size, writes an M-megabyte shell script of pipelines and commands
+redirecting to and from a shared pool of files (generators.shell_redirects)
+and runs, each in its own interpreter, `main.py FILE` (one parse into one
+tree, the lexer streaming the file) and `main.py --commands FILE`
+(pipelines.py: a piece at a time, records written as they are made). Reports
+the time, MB/s, the records written and the edges and unsafe writes found,
+and the peak RSS of the process, which for --commands should not grow with
+the file. It also checks that the records don't depend on how the file is
+cut into pieces: the smallest script is run through pipelines.commands with
+a chunk size of C and with one chunk holding it all. Last, it checks the
+records of a few commands with both an input and an output file. A file
+read and truncated by the same command (sort < f > f) must be flagged
+unsafe, and reading one file while writing another must not be. The exit
+status is 1 if a check fails.
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+MAIN = os.path.join(ROOT, 'Python', 'main.py')
+
+
+def write_script(path, mb):
+    # Writes an mb-megabyte script a unit at a time; returns its size in MB
+    unit = gen.shell_redirects(1000)
+    copies = max(1, int(mb * 1e6 / len(unit)))
+    with open(path, 'w') as f:
+        for _ in range(copies):
+            f.write(unit)
+    return copies * len(unit) / 1e6
+
+
+def run(args):
+    # (seconds, peak RSS in MB, lines written, last line) of main.py with
+    # args. The output is counted as it comes rather than kept: the child
+    # starts out sharing this process's memory, whose peak it inherits, so
+    # this process stays small. wait4 gives the child's own peak.
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, MAIN] + args, stdout=subprocess.PIPE,
+                            text=True)
+    count = 0
+    last = None
+    for last in proc.stdout:
+        count += 1
+    proc.stdout.close()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    seconds = time.perf_counter() - start
+    return seconds, usage.ru_maxrss / 1024, count, last
+
+
+# Commands with both redirects: (line, stdin, stdout, unsafe) of each record
+BOTH = (
+    ('gen > a', None, 'a', False),
+    ('sort < a > b', 'a', 'b', False),
+    ('sort < f > f', 'f', 'f', True),
+    ('cat < in | wc > out', 'in', '|', False),
+    (None, '|', 'out', False),
+    ('sort > c < a', 'a', 'c', False),
+)
+
+
+def same_pieces(data, chunk_size):
+    sys.path.insert(0, os.path.join(ROOT, 'Python'))
+    import pipelines
+    small = list(pipelines.commands(io.StringIO(data), chunk_size=chunk_size))
+    whole = list(pipelines.commands(io.StringIO(data), chunk_size=len(data) + 1))
+    return small == whole, len(small)
+
+
+def both_redirects():
+    # The lines of BOTH whose records are not as expected
+    sys.path.insert(0, os.path.join(ROOT, 'Python'))
+    import pipelines
+    data = ''.join(line + '\n' for line, *_ in BOTH if line)
+    records = list(pipelines.commands(io.StringIO(data)))
+    wrong = [line for (line, *expected), r in zip(BOTH, records)
+             if [r['stdin'], r['stdout'], r['unsafe']] != expected]
+    if len(records) != len(BOTH):
+        wrong.append(f'{len(records)} records for {len(BOTH)} commands')
+    return wrong
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--mb', type=float, nargs='+', default=[1, 4, 16])
+    ap.add_argument('--chunk-size', type=int, default=4096)
+    args = ap.parse_args()
+
+    print(f"{'MB':>6} {'mode':10} {'seconds':>8} {'MB/s':>6} {'records':>9} {'edges':>8}"
+          f" {'unsafe':>7} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mb in sorted(args.mb):
+            path = os.path.join(tmp, 'script.sh')
+            size = write_script(path, mb)
+            for mode, extra in (('parse', []), ('--commands', ['--commands'])):
+                seconds, peak, count, last = run(extra + [path])
+                summary = json.loads(last)['summary']
+                print(f"{size:6.1f} {mode:10} {seconds:8.2f} {size / seconds:6.2f}"
+                      f" {count - 1:9} {summary.get('edges', '-'):>8}"
+                      f" {summary.get('unsafe', '-'):>7} {peak:8.0f}")
+    unit = gen.shell_redirects(1000)
+    data = unit * max(1, int(min(args.mb) * 1e6 / len(unit)))
+    same, count = same_pieces(data, args.chunk_size)
+    print(f"records with {args.chunk_size}-character chunks "
+          f"{'equal' if same else 'DIFFER from'} those of one chunk ({count} records)")
+    wrong = both_redirects()
+    print(f"input and output on one command: {', '.join(map(str, wrong)) or 'as expected'}"
+          f" ({len(BOTH)} commands, sort < f > f unsafe)")
+    return 1 if wrong or not same else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Pathologically deep inputs: parse, tree walks and limits at up to 100k levels.
+
+    python bench/deep_nesting.py [--levels N ...] [--max-depth D] [--only NAME ...]
+
+For each grammar, in a fresh interpreter, parses inputs nested N levels
+deep (parentheses, blocks, and for the shell grammar a pipeline of N
+commands) and reports the parse time, the errors (there should be none),
+and the deepest the parser's symbol stack got. On the shell grammar's
+trees it also times the traversals that used to recurse: to_json (what
+main.py --ast writes), repr, ==, and walk. Then it parses each input again
+with Limits(max_depth=D) and reports how soon the parse stops and the
+diagnostic it stops with. A RecursionError anywhere is reported as such
+rather than ending the run.
+
+Every case is then checked. The parse must give no errors and nothing may
+raise RecursionError. A nesting input must leave the parser at least N
+deep, and the limited parse must stop exactly when that passes D. The
+pipeline nests nothing: its stack stays the same at every N, and Limits
+must let it through. Any case that fails is listed, and the exit status is
+1.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+# (input of N levels, whether it nests: a pipeline is read left-recursively,
+# so its stack does not grow with N)
+CASES = {
+    'Python': {
+        'parentheses': (lambda n: gen.nested_arithmetic(n), True),
+        'pipeline': (lambda n: gen.shell_pipelines(n), False),
+        'if blocks': (gen.nested_ifs, True),
+    },
+    'Arnav': {
+        'parentheses': (lambda n: gen.mini_python_arithmetic(n), True),
+        'blocks': (lambda n: gen.nested_blocks(n), True),
+    },
+    'Khush': {
+        'blocks': (gen.java_nested_blocks, True),
+    },
+}
+
+# The most a flat input may leave on the stack
+FLAT_STACK = 16
+
+
+class StackDepth:
+    # Stands in for a limits.Limits that only measures: the deepest the
+    # parser's symbol stack got, checked as each token is read
+    def __init__(self):
+        self.deepest = 0
+
+    def __bool__(self):
+        return True
+
+    def tokenfunc(self, lrparser, lexobj, token=None):
+        def measured():
+            self.deepest = max(self.deepest, len(lrparser.symstack))
+            return (token or lexobj.token)()
+        return measured
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except RecursionError:
+        return 'RecursionError', None
+    return time.perf_counter() - start, result
+
+
+def worker(grammar, case, levels, max_depth):
+    # Runs inside the grammar's own interpreter; prints one JSON object
+    sys.path.insert(0, os.path.join(ROOT, grammar))
+    import parser
+    from lexyacc.diagnostics import Diagnostics
+    from lexyacc.limits import Limits
+    data = CASES[grammar][case][0](levels)
+    out = {'chars': len(data)}
+
+    depth = StackDepth()
+    instance = parser.Parser(limits=depth)
+    out['parse'], result = timed(instance.parse, data, Diagnostics(max_errors=None))
+    diagnostics = result[1] if isinstance(result, tuple) else result
+    out['errors'] = len(diagnostics)
+    out['stack'] = depth.deepest
+
+    if grammar == 'Python':
+        import nodes
+        tree = result[0]
+        copy = nodes.decode(nodes.encode(tree))
+        out['to_json'], _ = timed(nodes.to_json, tree)
+        out['repr'], _ = timed(repr, tree)
+        out['equal'], same = timed(lambda: tree == copy)
+        assert same is not False
+        out['walk'], _ = timed(lambda: sum(1 for _ in nodes.walk(tree)))
+
+    limited = parser.Parser(limits=Limits(max_depth=max_depth))
+    out['limited'], result = timed(limited.parse, data)
+    diagnostics = result[1] if isinstance(result, tuple) else result
+    out['stopped'] = [d.message for d in diagnostics if d.kind == 'limit']
+    print(json.dumps(out))
+
+
+def run(grammar, case, levels, max_depth):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', grammar,
+                          case, str(levels), str(max_depth)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def problems(r, nests, levels, max_depth):
+    # What is wrong with one case's results, as a list of sentences
+    found = [f'{name}: RecursionError' for name in
+             ('parse', 'to_json', 'repr', 'equal', 'walk', 'limited')
+             if r.get(name) == 'RecursionError']
+    if r['errors']:
+        found.append(f"{r['errors']} errors")
+    stopped = bool(r['stopped'])
+    if nests:
+        if r['stack'] < levels:
+            found.append(f"stack {r['stack']} is less than the {levels} levels")
+        if stopped != (r['stack'] > max_depth):
+            found.append(f"stack {r['stack']} but the limited parse "
+                         f"{'stopped' if stopped else 'did not stop'}")
+    else:
+        if r['stack'] > FLAT_STACK:
+            found.append(f"stack {r['stack']} grew with the input")
+        if stopped:
+            found.append('the limited parse stopped')
+    return found
+
+
+def ms(value):
+    if isinstance(value, str):
+        return f'{value:>14}'
+    return f'{value * 1e3:11.1f} ms'
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--levels', type=int, nargs='+', default=[1000, 10000, 100000])
+    ap.add_argument('--max-depth', type=int, default=1000)
+    ap.add_argument('--only', nargs='+', choices=sorted(CASES))
+    ap.add_argument('--worker', nargs=4, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.worker:
+        grammar, case, levels, max_depth = args.worker
+        worker(grammar, case, int(levels), int(max_depth))
+        return 0
+
+    print(f"{'grammar':8} {'input':12} {'N':>7} {'parse':>14} {'errors':>6} {'stack':>7}"
+          f" {'to_json':>14} {'repr':>14} {'==':>14} {'walk':>14}"
+          f" {f'depth {args.max_depth}':>14}")
+    stops = set()
+    failed = []
+    for grammar in args.only or CASES:
+        for case, (_, nests) in CASES[grammar].items():
+            for levels in args.levels:
+                try:
+                    r = run(grammar, case, levels, args.max_depth)
+                except subprocess.CalledProcessError as e:
+                    failed.append(f'{grammar} {case} {levels}: worker exited {e.returncode}')
+                    continue
+                print(f"{grammar:8} {case:12} {levels:7} {ms(r['parse'])} {r['errors']:6}"
+                      f" {r['stack']:7} {ms(r.get('to_json', '-'))} {ms(r.get('repr', '-'))}"
+                      f" {ms(r.get('equal', '-'))} {ms(r.get('walk', '-'))}"
+                      f" {ms(r['limited'])}")
+                stops.update(r['stopped'])
+                failed.extend(f'{grammar} {case} {levels}: {problem}'
+                              for problem in problems(r, nests, levels, args.max_depth))
+    for message in sorted(stops):
+        print('stopped:', message)
+    for problem in failed:
+        print('FAILED', problem)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Edit latency of incremental reparsing against a full reparse.
+
+    python bench/edit_latency.py [--statements N] [--edits E] [--seed S]
+
+Applies random single-keystroke edits (typing inside a word, changing a
+digit, adding or deleting a line) to a generated script. It times
+IncrementalParser.edit plus diagnostics() for each edit against
+parser.parse of the whole buffer. Every tenth edit, the incremental tree and
+diagnostics are checked against a full parse. Three edits are measured on
+their own. Closing a string left open 200 lines up reparses from the line
+the string opens on, and is checked too. Opening a block near the top of the
+file changes how everything after it parses, so it reparses to the end of
+the file by design. update() with a one-character change in the middle has
+to find the change by comparing the old and new text first.
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+import fastlex
+from incremental import IncrementalParser
+from nodes import to_dict
+from parser import Parser
+
+import generators
+
+ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+ap.add_argument('--statements', type=int, default=5000)
+ap.add_argument('--edits', type=int, default=500)
+ap.add_argument('--seed', type=int, default=1)
+args = ap.parse_args()
+
+WORD = re.compile(r'\b(?:hello|world|total|input|quoted)\b')
+DIGIT = re.compile(r'\d')
+
+
+def random_edit(rng, data):
+    # Returns (start, end, text) keeping the program valid
+    kind = rng.randrange(4)
+    if kind == 0:
+        m = rng.choice(list(WORD.finditer(data, rng.randrange(len(data) // 2))) or [None])
+        if m:
+            pos = rng.randrange(m.start() + 1, m.end())
+            return pos, pos, rng.choice('abcxyz')
+    if kind == 1:
+        pos = rng.randrange(len(data) - 2000)
+        m = DIGIT.search(data, pos)
+        if m:
+            return m.start(), m.end(), str(rng.randrange(10))
+    line_start = data.find('\necho', rng.randrange(len(data))) + 1
+    if kind == 2 and line_start:
+        return line_start, line_start, 'echo typed line\n'
+    if line_start:
+        end = data.index('\n', line_start) + 1
+        return line_start, end, ''
+    return 0, 0, ''
+
+
+def full(parser, data):
+    start = time.perf_counter()
+    tree, diagnostics = parser.parse(data)
+    return time.perf_counter() - start, tree, diagnostics
+
+
+def same(parser, inc, diagnostics):
+    # Whether the incremental tree and diagnostics are a full parse's
+    _, tree, expected = full(parser, inc.data)
+    return (to_dict(inc.tree()) == to_dict(tree) and
+            [d.as_dict() for d in diagnostics] == [d.as_dict() for d in expected])
+
+
+def main():
+    rng = random.Random(args.seed)
+    data = generators.shell_statements(args.statements)
+    parser = Parser(fastlex.lexer)
+    inc = IncrementalParser()
+
+    start = time.perf_counter()
+    inc.parse(data)
+    initial = time.perf_counter() - start
+    full_times, edit_times, reparsed = [], [], []
+    mismatches = 0
+    for n in range(args.edits):
+        s, e, text = random_edit(rng, data)
+        data = data[:s] + text + data[e:]
+        t0 = time.perf_counter()
+        diagnostics = inc.edit(s, e, text)
+        edit_times.append(time.perf_counter() - t0)
+        reparsed.append(inc.reparsed)
+        if n % 10 == 0:
+            elapsed, tree, expected = full(parser, data)
+            full_times.append(elapsed)
+            if (to_dict(inc.tree()) != to_dict(tree) or
+                    [d.as_dict() for d in diagnostics] != [d.as_dict() for d in expected]):
+                mismatches += 1
+    checks = len(full_times)
+
+    # An echo whose string is never closed, then the closing quote typed at
+    # the end of the file: the string now spans 200 lines of statements
+    s = len(data)
+    inc.edit(s, s, 'echo "a\n' + 'ls x\n' * 200 + 'echo b\n')
+    s = len(inc.data) - 1
+    t0 = time.perf_counter()
+    diagnostics = inc.edit(s, s, '"')
+    string = time.perf_counter() - t0
+    string_reparsed = inc.reparsed
+    checks += 1
+    mismatches += not same(parser, inc, diagnostics)
+    data = inc.data
+
+    # Typing 'if x' + newline near the top leaves an open block to the end
+    s = data.index('\n', len(data) // 10) + 1
+    t0 = time.perf_counter()
+    inc.edit(s, s, 'if x\n')
+    block = time.perf_counter() - t0
+    block_reparsed = inc.reparsed
+    data = inc.data
+
+    middle = len(data) // 2
+    t0 = time.perf_counter()
+    inc.update(data[:middle] + 'x' + data[middle:])
+    update = time.perf_counter() - t0
+
+    ms = lambda seconds: f'{seconds * 1000:.2f} ms'
+    full_mean = statistics.mean(full_times)
+    print(f"script:         {args.statements:,} statements, {len(data):,} chars")
+    print(f"initial parse:  {ms(initial)} incremental, {ms(full_mean)} full (mean)")
+    print(f"edit latency:   mean {ms(statistics.mean(edit_times))}, "
+          f"p50 {ms(statistics.median(edit_times))}, "
+          f"p95 {ms(sorted(edit_times)[int(len(edit_times) * .95)])}, "
+          f"max {ms(max(edit_times))} over {len(edit_times)} edits")
+    print(f"reparsed:       {statistics.mean(reparsed):,.0f} chars per edit on average")
+    print(f"speedup:        {full_mean / statistics.mean(edit_times):.0f}x vs full reparse")
+    print(f"closed string:  {ms(string)} (reparses {string_reparsed:,} chars)")
+    print(f"open block:     {ms(block)} (reparses {block_reparsed:,} chars)")
+    print(f"update:         {ms(update)} (reparses {inc.reparsed:,} chars)")
+    print(f"mismatches:     {mismatches} of {checks} checks")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
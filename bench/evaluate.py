@@ -0,0 +1,136 @@
+"""Expression evaluation on deeply nested and very long arithmetic.
+
+    python bench/evaluate.py [--sizes N ...] [--repeat R]
+
+For each input, an assignment whose right side nests N parentheses deep
+(all constants, or a variable at every level) or is a flat run of N terms,
+times in a fresh interpreter per grammar: a plain parse, a parse that
+evaluates (Parser(env=...): folding while reducing, then arith.py's postfix
+code), and, on the shell grammar's unfolded tree, a recursive tree walk
+against compiling it to postfix code once and running that code. The walk
+fails with RecursionError past a few hundred levels; nothing in the parse
+or the postfix path recurses.
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+CASES = {
+    'nested constants': gen.nested_arithmetic,
+    'nested variables': gen.mini_python_arithmetic,
+    'long': gen.long_arithmetic,
+}
+
+
+def walk(expr, env):
+    # What evaluating the tree afterwards looks like without arith.py
+    if hasattr(expr, 'op'):
+        left, right = walk(expr.left, env), walk(expr.right, env)
+        if expr.op == '+':
+            return left + right
+        if expr.op == '-':
+            return left - right
+        if expr.op == '*':
+            return left * right
+        q = abs(left) // abs(right)
+        return -q if (left < 0) != (right < 0) else q
+    if hasattr(expr, 'value'):
+        return expr.value
+    return env.get(expr.name, 0)
+
+
+def timed(repeat, func, *args):
+    # Median seconds of repeat calls, and the last result
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def worker(grammar, case, size, repeat):
+    # Runs inside the grammar's own interpreter; prints one JSON object
+    sys.path.insert(0, os.path.join(ROOT, grammar))
+    import parser
+    from lexyacc import arith
+    data = CASES[case](size)
+    seed = {f'v{d}': d + 1 for d in range(size)}
+    gc.disable()
+    out = {'chars': len(data)}
+    if grammar == 'Python':
+        import fastlex
+        plain = parser.Parser(fastlex.lexer)
+        make = lambda: parser.Parser(fastlex.lexer, env=dict(seed))
+    else:
+        plain = parser.Parser()
+        make = lambda: parser.Parser(env=dict(seed))
+
+    out['parse'], result = timed(repeat, plain.parse, data)
+    evaluating = [make() for _ in range(repeat)]
+    out['evaluate'], _ = timed(repeat, lambda: evaluating.pop().parse(data))
+    session = make()
+    session.parse(data)
+    out['value'] = session.env.get('x0')
+
+    if grammar == 'Python':
+        expr = result[0].body[0].value
+        try:
+            out['walk'], value = timed(repeat, walk, expr, seed)
+            assert value == out['value']
+        except RecursionError:
+            out['walk'] = 'RecursionError'
+        out['compile'], code = timed(repeat, arith.compile, expr)
+        out['run'], value = timed(repeat, arith.run, code, seed)
+        assert value == out['value']
+    print(json.dumps(out, default=str))
+
+
+def run(grammar, case, size, repeat):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', grammar,
+                          case, str(size), str(repeat)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def ms(value):
+    if isinstance(value, str):
+        return f'{value:>14}'
+    return f'{value * 1e3:11.2f} ms'
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--worker', nargs=4, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.worker:
+        grammar, case, size, repeat = args.worker
+        worker(grammar, case, int(size), int(repeat))
+        return 0
+
+    print(f"{'grammar':8} {'input':17} {'N':>7} {'parse':>14} {'evaluate':>14}"
+          f" {'tree walk':>14} {'compile':>14} {'run':>14}")
+    for grammar in ('Python', 'Arnav'):
+        for case in CASES:
+            for size in args.sizes:
+                r = run(grammar, case, size, args.repeat)
+                print(f"{grammar:8} {case:17} {size:7} {ms(r['parse'])} {ms(r['evaluate'])}"
+                      f" {ms(r.get('walk', '-'))} {ms(r.get('compile', '-'))}"
+                      f" {ms(r.get('run', '-'))}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Synthetic inputs for the benchmarks, one family per grammar.
+
+Every generator is deterministic: the same arguments always give the same
+text, so timings taken on different revisions parse identical input.
+"""
+
+# ---- Python/: the shell grammar ----------------------------------------
+
+SHELL_STATEMENTS = [
+    'echo hello world {i} "quoted text"',
+    'total = a + b * (c - {i}) / 2',
+    'if x\nthen\n  echo yes {i}\nelse\n  echo no\nfi',
+    'for f in a b c {i}\ndo\n  cat f | wc\ndone',
+    'sort < input{i} ; echo ok >> log{i}',
+    'n = $(( {i} * 2 + 1 ))',
+]
+
+_OPS = '+-*/'
+
+
+def nested_arithmetic(depth, lines=1):
+    # Assignments whose right side nests depth parentheses deep, alternating
+    # the four operators so both p_expression and p_term do the work
+    # (built left to right rather than by wrapping, which is quadratic)
+    tail = ''.join(f' {_OPS[d % 4]} {d + 1})' for d in range(depth))
+    return ''.join(f'x{n} = {"(" * depth}{n}{tail}\n' for n in range(lines))
+
+
+def shell_statements(count):
+    # A long statement list mixing every kind of statement
+    return '\n'.join(SHELL_STATEMENTS[i % len(SHELL_STATEMENTS)].format(i=i)
+                     for i in range(count)) + '\n'
+
+
+def shell_arguments(width, lines=1):
+    # Commands with width arguments each
+    words = ('file', '42', '"some text"', 'opt')
+    args = ' '.join(words[i % len(words)] for i in range(width))
+    return '\n'.join(f'cmd{n} {args}' for n in range(lines)) + '\n'
+
+
+def shell_pipelines(length, lines=1):
+    # Pipelines of length commands: cmd0 a | cmd1 b | ...
+    return '\n'.join(' | '.join(f'cmd{i} arg{n}' for i in range(length))
+                     for n in range(lines)) + '\n'
+
+
+def nested_ifs(depth):
+    # if blocks nested depth deep, one per line, around one command
+    return ''.join(f'if c{d} then\n' for d in range(depth)) + 'echo x\n' + 'fi\n' * depth
+
+
+def shell_redirects(count, files=50):
+    # Pipelines and commands redirecting to and from a pool of files, some
+    # inside if and for blocks; each run of five statements writes, reads
+    # and rewrites one file and reads the next run's, so most redirects
+    # depend on an earlier one
+    lines = []
+    for i in range(count):
+        a, b = f'out{i // 5 % files}', f'out{(i // 5 + 1) % files}'
+        lines.append(('gen{i} n {i} | sort | uniq > {a}',
+                      'sort < {a}',
+                      'echo step {i} "done" >> log',
+                      'if test{i}\nthen\n  cat < {b} | wc > {a}\nfi',
+                      'for f in x y {i}\ndo\n  grep f < {b}\ndone')[i % 5].format(i=i, a=a, b=b))
+    return '\n'.join(lines) + '\n'
+
+
+# ---- Arnav/: mini-Python -----------------------------------------------
+
+def nested_blocks(depth, lines=1):
+    # def/while blocks nested depth deep around one assignment
+    out = []
+    for n in range(lines):
+        head = []
+        for d in range(depth):
+            if d % 2:
+                head.append(f'while a{d} - {n}:')
+            else:
+                head.append(f'def f{d}_{n}(a, b, c):')
+        out.append(' '.join(head) + f' x = a * (b + {n}) - c / 2')
+    return '\n'.join(out) + '\n'
+
+
+def indented_blocks(depth, blocks=1):
+    # The same def/while nesting as real multi-line Python: every level is
+    # an indented block with an assignment in it, so a block of depth d is
+    # 2 * d lines and ends with d dedents
+    out = []
+    for n in range(blocks):
+        for d in range(depth):
+            pad = '    ' * d
+            if d % 2:
+                out.append(f'{pad}while a{d} - {n}:')
+            else:
+                out.append(f'{pad}def f{d}_{n}(a, b, c):')
+            out.append(f'{pad}    x{d} = a * (b + {n}) - c / 2')
+    return '\n'.join(out) + '\n'
+
+
+def mini_python_arithmetic(depth, lines=1):
+    tail = ''.join(f' {_OPS[d % 4]} v{d})' for d in range(depth))
+    return ''.join(f'x{n} = {"(" * depth}{n}{tail}\n' for n in range(lines))
+
+
+def long_arithmetic(terms, lines=1):
+    # Assignments whose right side is one flat run of terms products,
+    # v0 * 1 + v1 * 2 - ...; valid in the shell grammar too
+    body = ' '.join(f'{"+-"[t % 2]} v{t} * {t + 1}' for t in range(terms))[2:]
+    return ''.join(f'x{n} = {body}\n' for n in range(lines))
+
+
+# ---- Khush/: Java declarations -----------------------------------------
+
+JAVA_DECLARATIONS = [
+    'int count{i};',
+    'double ratio{i};',
+    'void reset{i}();',
+    'String name{i}() {{}}',
+    'boolean ready{i};',
+    'char first{i}() {{}}',
+]
+
+
+def java_declarations(count):
+    # One declaration per line
+    return '\n'.join(JAVA_DECLARATIONS[i % len(JAVA_DECLARATIONS)].format(i=i)
+                     for i in range(count)) + '\n'
+
+
+def java_classes(count, members=20):
+    # Compilation units of classes with fields, methods with parameters,
+    # local declarations and nested blocks, and a nested class each
+    out = []
+    for c in range(count):
+        out.append(f'/* Class {c} */')
+        out.append(f'public class Shape{c} {{')
+        for m in range(members):
+            if m % 4 == 0:
+                out.append(f'    private static int count{m}, total{m};  // fields')
+            elif m % 4 == 1:
+                out.append(f'    public double area{m}(double w, double h, Shape{c} s) {{')
+                out.append(f'        double result{m};')
+                out.append('        {')
+                out.append(f'            int scratch{m};')
+                out.append('        }')
+                out.append('    }')
+            elif m % 4 == 2:
+                out.append(f'    abstract void reset{m}(int level);')
+            else:
+                out.append(f'    String name{m};')
+        out.append(f'    class Inner{c} {{')
+        out.append('        char c;')
+        out.append('        int get() { }')
+        out.append('    }')
+        out.append('}')
+    return '\n'.join(out) + '\n'
+
+
+def java_nested_blocks(depth):
+    # A method whose body is depth nested blocks around one declaration
+    return 'void f() {' + '{' * depth + ' int x; ' + '}' * depth + '}\n'
+
+
+# ---- parser.sh: the bash expression grammar -----------------------------
+
+def bash_expression(terms):
+    # terms numbers joined by operators, with a parenthesised group every
+    # fourth term
+    parts = []
+    for i in range(terms):
+        parts.append(f'({i} + 1)' if i % 4 == 3 else str(i))
+    return ' '.join(p + (f' {_OPS[i % 4]}' if i < terms - 1 else '')
+                    for i, p in enumerate(parts))
@@ -0,0 +1,50 @@
+"""LALR state count and parse throughput of the shell grammar.
+
+    python bench/grammar.py [--root DIR] [--statements N] [--repeat R]
+
+--root points at another checkout (e.g. a `git worktree` of an older
+revision) to compare grammars on the same input; conflicts are reported by
+tools/build_tables.py --check.
+"""
+import argparse
+import os
+import sys
+import time
+
+ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+ap.add_argument('--root', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+ap.add_argument('--statements', type=int, default=20000)
+ap.add_argument('--repeat', type=int, default=5)
+args = ap.parse_args()
+
+sys.path.insert(0, os.path.abspath(args.root))
+sys.path.insert(0, os.path.join(os.path.abspath(args.root), 'Python'))
+import parser
+
+# Statements accepted by the old juxtaposition grammar and the separated one
+STATEMENTS = [
+    'echo hello world {i} "quoted text"',
+    'total = a + b * (c - {i}) / 2',
+    'if x then echo yes {i} else echo no fi',
+    'for f in a b c {i} do cat f | wc done',
+    'sort < input{i}',
+]
+
+
+def main():
+    data = '; '.join(STATEMENTS[i % len(STATEMENTS)].format(i=i)
+                     for i in range(args.statements))
+    best = float('inf')
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        tree, diagnostics = parser.parse(data)
+        best = min(best, time.perf_counter() - start)
+    print(f"grammar:     {os.path.abspath(args.root)}")
+    print(f"states:      {len(parser.parser.action)}")
+    print(f"errors:      {len(diagnostics)}")
+    print(f"parse:       {best * 1000:.1f} ms for {len(data):,} chars "
+          f"({len(data) / best / 1e6:.2f} MB/s, best of {args.repeat})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Mixed-grammar parsing in one process through the lexyacc registry.
+
+    python bench/grammar_registry.py [--inputs N] [--runs R]
+
+Each sample is a fresh interpreter. Columns, in milliseconds:
+  import      `import lexyacc` alone (registers the grammars, loads none)
+  first       the first parse with each grammar, which loads it
+  load        what loading the grammar itself took (Grammar.load_time)
+  per input   mean time of N further small parses, round robin over all
+              three grammars
+and the modules left in sys.modules under the grammars' bare names, which
+should be none. For comparison, 'per process' is what a fresh interpreter
+per input costs (import the grammar's parser, parse one input).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLES = {'shell': 'echo hello | wc -l', 'minipython': 'x = 1 + 2', 'java': 'int x;'}
+DIRECTORIES = {'shell': 'Python', 'minipython': 'Arnav', 'java': 'Khush'}
+
+PROBE = '''
+import json, sys, time
+t0 = time.perf_counter()
+import lexyacc
+out = {'import': time.perf_counter() - t0, 'first': {}, 'load': {}}
+samples = %r
+for name, text in samples.items():
+    t0 = time.perf_counter()
+    lexyacc.parse(name, text)
+    out['first'][name] = time.perf_counter() - t0
+    out['load'][name] = lexyacc.get(name).load_time
+names = list(samples)
+t0 = time.perf_counter()
+for i in range(%d):
+    name = names[i %% 3]
+    lexyacc.parse(name, samples[name])
+out['per input'] = (time.perf_counter() - t0) / %d
+out['leaked'] = sorted(m for m in ('parser', 'lexer', 'nodes', 'indent', 'symbols') if m in sys.modules)
+print(json.dumps(out))
+'''
+
+SINGLE = '''
+import parser
+parser.parse(%r)
+'''
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--inputs', type=int, default=3000)
+    ap.add_argument('--runs', type=int, default=5)
+    args = ap.parse_args()
+
+    samples = []
+    code = PROBE % (SAMPLES, args.inputs, args.inputs)
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        samples.append(json.loads(out))
+
+    def median(get):
+        return statistics.median(get(s) for s in samples) * 1000
+
+    print(f"import lexyacc: {median(lambda s: s['import']):.2f} ms")
+    print(f"{'grammar':12} {'first':>9} {'load':>9} {'per process':>12}")
+    for name in SAMPLES:
+        times = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, '-c', SINGLE % SAMPLES[name]], check=True,
+                           cwd=os.path.join(ROOT, DIRECTORIES[name]), capture_output=True,
+                           env=dict(os.environ, PYTHONPATH=ROOT))
+            times.append(time.perf_counter() - t0)
+        print(f"{name:12} {median(lambda s: s['first'][name]):9.2f}"
+              f" {median(lambda s: s['load'][name]):9.2f}"
+              f" {statistics.median(times) * 1000:12.2f}")
+    print(f"per input, mixed, after loading: {median(lambda s: s['per input']):.3f} ms")
+    print(f"bare module names left in sys.modules: {samples[-1]['leaked'] or 'none'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Throughput of the mini-Python grammar on indented multi-line files.
+
+    python bench/indented_python.py [--lines N ...] [--depth D] [--repeat R]
+
+Parses files of about N lines of def/while blocks nested D deep (see
+generators.indented_blocks) and reports, per size, the time to lex them
+with the PLY lexer alone, to lex them through indent.IndentLexer (adding
+NEWLINE/INDENT/DEDENT), and to parse them, with lines per second for the
+parse. ast.parse, CPython's own parser in C, on the same text is the
+reference. Times are medians with the garbage collector off; the per line
+figures should stay flat as N grows.
+"""
+import argparse
+import ast
+import gc
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+sys.path.insert(0, os.path.join(ROOT, 'Arnav'))
+import indent
+from lexyacc.diagnostics import Diagnostics
+from parser import Parser
+
+
+def timed(repeat, func, *args):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def count_tokens(lexobj, data):
+    lexobj.input(data)
+    return sum(1 for _ in iter(lexobj.token, None))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--lines', type=int, nargs='+', default=[1000, 10000, 100000])
+    ap.add_argument('--depth', type=int, default=10)
+    ap.add_argument('--repeat', type=int, default=3)
+    args = ap.parse_args()
+
+    parser = Parser()
+    lexobj = parser.lexer
+    lexobj.diagnostics = Diagnostics()
+    gc.disable()
+    print(f"{'lines':>8} {'tokens':>8} {'lex ms':>9} {'+indent ms':>11} {'parse ms':>9}"
+          f" {'klines/s':>9} {'us/line':>8} {'ast.parse ms':>13}")
+    for lines in args.lines:
+        data = gen.indented_blocks(args.depth, max(1, lines // (2 * args.depth)))
+        count = data.count('\n')
+        lex_s, _ = timed(args.repeat, count_tokens, lexobj, data)
+        indent_s, tokens = timed(args.repeat, count_tokens, indent.IndentLexer(lexobj), data)
+        parse_s, diagnostics = timed(args.repeat, parser.parse, data)
+        if len(diagnostics):
+            print(f'{lines}: {diagnostics.errors[0].message}', file=sys.stderr)
+            return 1
+        ast_s, _ = timed(args.repeat, ast.parse, data)
+        print(f"{count:8} {tokens:8} {lex_s * 1e3:9.1f} {indent_s * 1e3:11.1f}"
+              f" {parse_s * 1e3:9.1f} {count / parse_s / 1e3:9.1f}"
+              f" {parse_s / count * 1e6:8.1f} {ast_s * 1e3:13.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Declaration scanning of Java sources: one parse per statement against one per file.
+
+    python bench/java_symbols.py [--declarations N ...] [--classes C] [--repeat R]
+
+On N one-line declarations (generators.java_declarations), times what the
+Java grammar used to require, a parse per statement with the results
+gathered by the caller from the events, against one parse of the whole
+file building a symbols.SymbolIndex, and the same file streamed with
+parse_file. Then, on C classes with fields, methods, parameters and nested
+blocks (generators.java_classes), the whole-file parse with and without the
+index, and the cost of looking every declared name up in it afterwards.
+Times are medians with the garbage collector off.
+"""
+import argparse
+import gc
+import io
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+sys.path.insert(0, os.path.join(ROOT, 'Khush'))
+from lexyacc.diagnostics import Diagnostics
+from parser import Parser
+from symbols import SymbolIndex
+
+
+def timed(repeat, func, *args):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def per_statement(data):
+    found = []
+    diagnostics = Diagnostics(on_event=lambda kind, name: found.append((kind, name)))
+    parser = Parser()
+    for line in data.splitlines():
+        parser.parse(line, diagnostics)
+    return len(found)
+
+
+def whole(data):
+    index = SymbolIndex()
+    Parser(symbols=index).parse(data)
+    return index
+
+
+def streamed(data):
+    index = SymbolIndex()
+    Parser(symbols=index).parse_file(io.StringIO(data))
+    return index
+
+
+def lookups(index):
+    return sum(len(index.lookup(symbol.name)) for symbol in index)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--declarations', type=int, nargs='+', default=[1000, 10000, 100000])
+    ap.add_argument('--classes', type=int, default=500)
+    ap.add_argument('--repeat', type=int, default=3)
+    args = ap.parse_args()
+    gc.disable()
+
+    print(f"{'decls':>8} {'per statement':>14} {'whole file':>11} {'streamed':>9}   (ms)")
+    for count in args.declarations:
+        data = gen.java_declarations(count)
+        line_s, found = timed(args.repeat, per_statement, data)
+        whole_s, index = timed(args.repeat, whole, data)
+        stream_s, _ = timed(args.repeat, streamed, data)
+        assert found == len(index) == count
+        print(f"{count:8} {line_s * 1e3:14.1f} {whole_s * 1e3:11.1f} {stream_s * 1e3:9.1f}")
+
+    data = gen.java_classes(args.classes)
+    plain_s, _ = timed(args.repeat, Parser().parse, data)
+    index_s, index = timed(args.repeat, whole, data)
+    lookup_s, _ = timed(args.repeat, lookups, index)
+    print(f"\n{args.classes} classes, {data.count(chr(10))} lines, {len(index)} declarations:")
+    print(f"  parse {plain_s * 1e3:.1f} ms, with the index {index_s * 1e3:.1f} ms;"
+          f" {len(index)} lookups {lookup_s * 1e3:.1f} ms"
+          f" ({lookup_s / len(index) * 1e6:.2f} us each)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
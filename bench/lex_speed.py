@@ -0,0 +1,85 @@
+"""Tokens per second: PLY lexer (lex.lex tables) versus fastlex.FastLexer.
+
+    python bench/lex_speed.py [--mb SIZE] [--repeat R]
+
+Both lexers must produce the same token stream; the run aborts if they differ.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+
+from lexer import lexer as ply_lexer
+from fastlex import FastLexer
+
+LINES = [
+    'echo hello world {i} "quoted text" >> log{i}',
+    'total{i} = a + b * (c - {i}) / 2',
+    'if grep x{i} < input; then echo yes {i}; else echo no; fi',
+    'for f in a b c {i}; do cat f | wc > count{i}; done',
+    "$((counter + {i}))",
+]
+
+
+def make_input(size):
+    out, total, i = [], 0, 0
+    while total < size:
+        line = LINES[i % len(LINES)].format(i=i)
+        out.append(line)
+        total += len(line) + 1
+        i += 1
+    return '\n'.join(out) + '\n'
+
+
+def run(lexobj, data):
+    lexobj.input(data)
+    lexobj.lineno = 1
+    token = lexobj.token
+    toks = []
+    append = toks.append
+    # Keep the cyclic GC out of the numbers: a million live tokens would
+    # otherwise trigger full collections that dwarf the lexing itself
+    gc.disable()
+    start = time.perf_counter()
+    while True:
+        tok = token()
+        if tok is None:
+            break
+        append(tok)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed, toks
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--mb', type=float, default=4.0)
+    ap.add_argument('--repeat', type=int, default=3)
+    args = ap.parse_args()
+
+    data = make_input(int(args.mb * 1024 * 1024))
+    results = {}
+    for name, lexobj in (('ply', ply_lexer), ('fastlex', FastLexer())):
+        best = float('inf')
+        for _ in range(args.repeat):
+            elapsed, toks = run(lexobj, data)
+            best = min(best, elapsed)
+        results[name] = (best, toks)
+
+    ply_toks, fast_toks = results['ply'][1], results['fastlex'][1]
+    key = lambda t: (t.type, t.value, t.lineno, t.lexpos)
+    if len(ply_toks) != len(fast_toks) or any(map(lambda a, b: key(a) != key(b), ply_toks, fast_toks)):
+        sys.exit("token streams differ")
+
+    print(f"input: {len(data) / 1e6:.1f} MB, {len(ply_toks):,} tokens (best of {args.repeat})")
+    for name, (best, toks) in results.items():
+        print(f"{name:8} {best:7.3f}s  {len(toks) / best / 1e6:6.2f} M tokens/s")
+    print(f"speedup: {results['ply'][0] / results['fastlex'][0]:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
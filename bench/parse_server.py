@@ -0,0 +1,154 @@
+"""Load generator for the lexyacc parse server.
+
+    python bench/parse_server.py [--socket PATH] [--requests N] [--connections C]
+                                 [--pipeline P] [--jobs J] [--spawn-baseline K]
+
+Starts `python -m lexyacc.server` on a temporary Unix socket (or uses the
+one at --socket), then sends N small requests, a mix of the three grammars
+drawn from generators.py, over C connections with up to P requests in
+flight on each. Reports the client-side throughput and latency percentiles
+(send to reply) and the server's own counters. --spawn-baseline K also times
+K checks done the old way, a fresh interpreter per check, for comparison.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+SPAWN = '''
+import sys
+import parser
+parser.parse(sys.argv[1])
+'''
+
+
+def workload(count):
+    # (grammar, text) requests, round robin over the grammars
+    shell = [text.format(i=i) for i, text in enumerate(gen.SHELL_STATEMENTS)]
+    mini = [gen.mini_python_arithmetic(5), gen.indented_blocks(3), 'x = 1\n']
+    java = gen.java_declarations(6).splitlines() + [gen.java_classes(1, 4)]
+    pools = [('shell', shell), ('minipython', mini), ('java', java)]
+    out = []
+    for i in range(count):
+        grammar, texts = pools[i % 3]
+        out.append((grammar, texts[(i // 3) % len(texts)]))
+    return out
+
+
+async def connection(path, requests, pipeline, latencies):
+    reader, writer = await asyncio.open_unix_connection(path, limit=1 << 24)
+    slots = asyncio.Semaphore(pipeline)
+    sent = {}
+    failures = 0
+
+    async def read_replies():
+        nonlocal failures
+        for _ in range(len(requests)):
+            reply = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent.pop(reply['id']))
+            if 'errors' not in reply:
+                failures += 1
+            slots.release()
+
+    replies = asyncio.ensure_future(read_replies())
+    for i, (grammar, text) in enumerate(requests):
+        await slots.acquire()
+        sent[i] = time.perf_counter()
+        writer.write(json.dumps({'id': i, 'grammar': grammar, 'text': text}).encode() + b'\n')
+        await writer.drain()
+    await replies
+    writer.close()
+    return failures
+
+
+async def server_stats(path):
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(b'{"id": 0, "op": "stats"}\n')
+    reply = json.loads(await reader.readline())
+    writer.close()
+    return reply['stats']
+
+
+async def load(path, requests, connections, pipeline):
+    latencies = []
+    shares = [requests[k::connections] for k in range(connections)]
+    start = time.perf_counter()
+    failures = await asyncio.gather(*(connection(path, share, pipeline, latencies)
+                                      for share in shares))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies), sum(failures), await server_stats(path)
+
+
+def percentile(values, q):
+    return values[(len(values) - 1) * q // 100] * 1000
+
+
+def spawn_baseline(count):
+    # A fresh interpreter per check, importing the grammar's parser
+    directories = {'shell': 'Python', 'minipython': 'Arnav', 'java': 'Khush'}
+    times = []
+    for grammar, text in workload(count):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', SPAWN, text], check=True, capture_output=True,
+                       cwd=os.path.join(ROOT, directories[grammar]),
+                       env=dict(os.environ, PYTHONPATH=ROOT))
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--socket', help="use a server already listening here")
+    ap.add_argument('--requests', type=int, default=20000)
+    ap.add_argument('--connections', type=int, default=8)
+    ap.add_argument('--pipeline', type=int, default=32)
+    ap.add_argument('--jobs', type=int, default=None, help="workers of the spawned server")
+    ap.add_argument('--spawn-baseline', type=int, default=0, metavar='K')
+    args = ap.parse_args()
+
+    requests = workload(args.requests)
+    with tempfile.TemporaryDirectory() as tmp:
+        server = None
+        path = args.socket
+        if path is None:
+            path = os.path.join(tmp, 'parse.sock')
+            cmd = [sys.executable, '-m', 'lexyacc.server', '--socket', path]
+            if args.jobs:
+                cmd += ['--jobs', str(args.jobs)]
+            server = subprocess.Popen(cmd, cwd=ROOT, stderr=subprocess.PIPE, text=True)
+            server.stderr.readline()    # 'listening on ...' once the workers are up
+        try:
+            elapsed, latencies, failures, stats = asyncio.run(
+                load(path, requests, args.connections, args.pipeline))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    print(f'{len(requests)} requests over {args.connections} connections, '
+          f'{args.pipeline} in flight each: {elapsed:.2f} s, '
+          f'{len(requests) / elapsed:.0f} requests/s, {failures} failed')
+    print(f'client latency ms: p50 {percentile(latencies, 50):.2f}  '
+          f'p90 {percentile(latencies, 90):.2f}  p99 {percentile(latencies, 99):.2f}  '
+          f'max {latencies[-1] * 1000:.2f}')
+    print(f"server: {stats['requests_per_s']} requests/s over its uptime, "
+          f"{stats['batches']} batches of {stats['mean_batch']} on average, "
+          f"latency ms {stats['latency_ms']}")
+    if args.spawn_baseline:
+        times = spawn_baseline(args.spawn_baseline)
+        print(f'a process per check: {statistics.median(times) * 1000:.1f} ms each '
+              f'(median of {len(times)}), {1 / statistics.median(times):.0f} checks/s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
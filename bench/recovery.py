@@ -0,0 +1,60 @@
+"""Syntax error recovery time on hostile shell inputs.
+
+    python bench/recovery.py [--size N]
+
+Parses inputs made mostly of errors (stray closers, broken statements,
+blocks that never close) at N and 4N characters with no limit on the
+number of errors, and prints the time for each size, the ratio between
+them, which should stay near 4 because recovery is linear, and the errors
+reported.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+import fastlex
+from lexyacc.diagnostics import Diagnostics
+from parser import Parser
+
+ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+ap.add_argument('--size', type=int, default=20000)
+args = ap.parse_args()
+
+INPUTS = {
+    'stray fi':       lambda n: 'fi ' * (n // 3),
+    'stray lines':    lambda n: 'done\n' * (n // 5),
+    'rparens':        lambda n: ')' * n,
+    'bad statements': lambda n: 'x = = 3\necho a >\necho ok\n' * (n // 24),
+    'bad headers':    lambda n: 'if ; then a; fi\nfor 1 in x; do b; done\n' * (n // 38),
+    'nested':         lambda n: 'if x; then ' * (n // 20) + 'a > ; ' + 'fi; ' * (n // 20),
+    'never closed':   lambda n: 'if x; then\n' * (n // 22) + 'echo )\n' * (n // 14),
+}
+
+
+def bench():
+    parser = Parser(fastlex.lexer)
+    gc.disable()
+    print(f"{'input':16} {'N':>10} {'4N':>10}  ratio  errors")
+    worst = 0.0
+    for name, make in INPUTS.items():
+        times, counts = [], []
+        for size in (args.size, 4 * args.size):
+            data = make(size)
+            start = time.perf_counter()
+            _, diagnostics = parser.parse(data, Diagnostics(max_errors=None))
+            times.append(time.perf_counter() - start)
+            counts.append(len(diagnostics))
+        ratio = times[1] / times[0]
+        worst = max(worst, ratio)
+        print(f"{name:16} {times[0] * 1e3:7.1f} ms {times[1] * 1e3:7.1f} ms  {ratio:5.1f}"
+              f"  {counts[0]} / {counts[1]}")
+    print(f"worst ratio:     {worst:.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(bench())
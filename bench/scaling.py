@@ -0,0 +1,84 @@
+"""Scaling of the multi-process batch mode (main.py --jobs) from 1 to N workers.
+
+    python bench/scaling.py [--files F] [--statements S] [--max-jobs N]
+
+Writes a synthetic corpus to a temporary directory, parses it with 1..N
+workers and checks every run writes byte-for-byte the output of the
+sequential one. A single large file is then parsed in chunks of several
+sizes, with trees, to check chunking changes nothing either.
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+import main
+
+ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+ap.add_argument('--files', type=int, default=400)
+ap.add_argument('--statements', type=int, default=200, help="statements per file")
+ap.add_argument('--max-jobs', type=int, default=os.cpu_count())
+args = ap.parse_args()
+
+STATEMENTS = [
+    'echo hello world {i} "quoted text"',
+    'total = a + b * (c - {i}) / 2',
+    'if x\nthen\n  echo yes {i}\nelse\n  echo no\nfi',
+    'for f in a b c {i}\ndo\n  cat f | wc\ndone',
+    'sort < input{i} ; echo "multi\nline {i}"',
+    'ls >',  # a syntax error now and then
+]
+
+
+def program(n, seed, statements=STATEMENTS):
+    return '\n'.join(statements[(i * 7 + seed) % len(statements)].format(i=i)
+                     for i in range(n)) + '\n'
+
+
+def run(paths, **kwargs):
+    out = io.StringIO()
+    start = time.perf_counter()
+    main.run_batch(paths, out=out, **kwargs)
+    return out.getvalue(), time.perf_counter() - start
+
+
+def bench():
+    with tempfile.TemporaryDirectory() as tmp:
+        size = 0
+        for n in range(args.files):
+            data = program(args.statements, n)
+            size += len(data)
+            with open(os.path.join(tmp, f'script{n:05}.sh'), 'w') as f:
+                f.write(data)
+        print(f"corpus: {args.files} files, {size / 1e6:.1f} MB, {os.cpu_count()} CPUs")
+
+        expected, base = run([tmp])
+        print(f"  jobs  1  {base:7.2f} s  1.00x")
+        mismatches = 0
+        for jobs in range(2, args.max_jobs + 1):
+            output, elapsed = run([tmp], jobs=jobs)
+            mismatches += output != expected
+            print(f"  jobs {jobs:2}  {elapsed:7.2f} s  {base / elapsed:.2f}x"
+                  f"{'' if output == expected else '  OUTPUT DIFFERS'}")
+
+        big = os.path.join(tmp, 'big.sh')
+        with open(big, 'w') as f:
+            # Error free: right after a syntax error a chunk boundary can
+            # change which of the errors that follow get reported
+            f.write(program(args.statements * 100, 3, STATEMENTS[:-1]))
+        expected, base = run([big], with_ast=True)
+        print(f"large file: {os.path.getsize(big) / 1e6:.1f} MB, whole {base:.2f} s")
+        for chunk in (1 << 20, 1 << 18, 1 << 16):
+            output, elapsed = run([big], with_ast=True, jobs=max(args.max_jobs, 2), chunk_size=chunk)
+            mismatches += output != expected
+            print(f"  chunks of {chunk >> 10:5} KB  {elapsed:7.2f} s"
+                  f"{'' if output == expected else '  OUTPUT DIFFERS'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(bench())
@@ -0,0 +1,69 @@
+"""Import-to-first-parse time for each grammar, frozen tables versus lex()/yacc().
+
+    python bench/startup.py [--runs N]
+
+Every sample is a fresh interpreter. Columns:
+  frozen      default startup: tables bound directly, no reflection, no writes
+  classic     lex.lex()/yacc.yacc() with up-to-date tables (validate + signature check)
+  regenerate  lex.lex()/yacc.yacc() with no usable tables, as happens whenever
+              parsetab.py is stale (this also rewrites parsetab.py/parser.out)
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLES = {'Python': 'echo hello', 'Arnav': 'x = 1', 'Khush': 'int x;'}
+
+PROBE = '''
+import time
+t0 = time.perf_counter()
+import parser
+parser.parse({sample!r})
+print(time.perf_counter() - t0)
+'''
+
+
+def sample(cwd, code, build):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop('LEXYACC_BUILD_TABLES', None)
+    if build:
+        env['LEXYACC_BUILD_TABLES'] = '1'
+    out = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return float(out.split()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--runs', type=int, default=15)
+    args = ap.parse_args()
+
+    print(f"{'grammar':8} {'frozen':>10} {'classic':>10} {'regenerate':>11}   (median ms, {args.runs} runs)")
+    for grammar, text in SAMPLES.items():
+        src = os.path.join(ROOT, grammar)
+        code = PROBE.format(sample=text)
+        with tempfile.TemporaryDirectory() as scratch:
+            # A copy without generated tables, so regeneration never touches the tree
+            bare = os.path.join(scratch, grammar)
+            shutil.copytree(src, bare, ignore=shutil.ignore_patterns(
+                'lextab.py', 'parsetab.py', 'parser.out', '__pycache__'))
+            row = []
+            for cwd, build in ((src, False), (src, True), (bare, True)):
+                times = []
+                for _ in range(args.runs):
+                    if cwd == bare:
+                        for name in ('parsetab.py', 'parser.out'):
+                            if os.path.exists(os.path.join(bare, name)):
+                                os.remove(os.path.join(bare, name))
+                    times.append(sample(cwd, code, build))
+                row.append(statistics.median(times) * 1000)
+        print(f"{grammar:8} {row[0]:10.2f} {row[1]:10.2f} {row[2]:11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""Peak memory and first-token latency of streamed against whole-file parsing.
+
+    python bench/stream_memory.py [--mb M] [--chunk-size C] [--only NAME ...]
+
+Writes an M-megabyte synthetic input per grammar and, in a fresh
+interpreter each time, reads it whole or a chunk at a time (stream.py):
+lexed to the end with nothing kept, then parsed with Parser.parse or with
+Parser.parse_file. Reports the peak RSS of the lexing and of the parse
+above the interpreter with the grammar loaded, the parse time, and how
+long the first token takes from opening the file.
+
+Streaming saves the input string and nothing else, and only on a file many
+times --chunk-size; its first token can come later, after a whole chunk is
+read and cut. The lex column is where the saving shows, for every grammar
+(try --mb 20). The mini-Python and Java parses keep little per statement,
+so their parse peaks follow the lex ones; the shell parse returns a tree
+holding every token, many times the size of the input, and streamed or not
+its peak is much the same: parse_file gains the shell grammar nothing in
+memory.
+"""
+import argparse
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+# Statements of the generators, repeated up to the requested size
+INPUTS = {
+    'Python': lambda: gen.shell_statements(2000),
+    'Arnav': lambda: gen.nested_blocks(10, 200) + gen.mini_python_arithmetic(20, 200),
+    'Khush': lambda: gen.java_declarations(2000),
+}
+
+
+def reset_peak():
+    # Start a new high-water mark at the current RSS, so the peak measured
+    # is the run's own and not the interpreter's start-up (Linux only; on
+    # other systems ru_maxrss, which cannot be reset, is the fallback)
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+    return peak_kb()
+
+
+def peak_kb():
+    try:
+        with open('/proc/self/status') as f:
+            return int(re.search(r'VmHWM:\s+(\d+)', f.read()).group(1))
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def worker(grammar, path, mode, phase, chunk_size):
+    # Runs inside the grammar's own interpreter; prints one JSON object.
+    # Phase 'first' times the first token only, 'lex' lexes the whole file
+    # with nothing kept, 'parse' is a whole parse.
+    sys.path.insert(0, os.path.join(ROOT, grammar))
+    import parser
+    from lexyacc.diagnostics import Diagnostics
+    from lexyacc.stream import StreamLexer
+    instance = parser.Parser()
+    base = reset_peak()
+
+    start = time.perf_counter()
+    with open(path, encoding='utf-8') as f:
+        if phase == 'first':
+            if mode == 'whole':
+                instance.lexer.input(f.read())
+                instance.lexer.token()
+            else:
+                StreamLexer(instance.lexer, f, chunk_size).token()
+        elif phase == 'lex':
+            if mode == 'whole':
+                source = instance.lexer
+                source.input(f.read())
+            else:
+                source = StreamLexer(instance.lexer, f, chunk_size)
+            while source.token():
+                pass
+        else:
+            # No limit on errors, so a parse is never cut short
+            diagnostics = Diagnostics(max_errors=None)
+            if mode == 'whole':
+                instance.parse(f.read(), diagnostics)
+            else:
+                instance.parse_file(f, diagnostics, chunk_size)
+    elapsed = time.perf_counter() - start
+    peak = peak_kb() - base
+    print(json.dumps({'peak_kb': peak, 'seconds': elapsed}))
+
+
+def run(grammar, path, mode, phase, chunk_size):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', grammar,
+                          path, mode, phase, str(chunk_size)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--mb', type=float, default=4)
+    ap.add_argument('--chunk-size', type=int, default=1 << 20)
+    ap.add_argument('--only', nargs='+', choices=sorted(INPUTS))
+    ap.add_argument('--worker', nargs=5, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.worker:
+        grammar, path, mode, phase, chunk_size = args.worker
+        worker(grammar, path, mode, phase, int(chunk_size))
+        return 0
+
+    print(f"{'grammar':8} {'mode':7} {'MB':>6} {'lex RSS':>10} {'parse RSS':>10}"
+          f" {'parse':>9} {'first token':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for grammar in args.only or INPUTS:
+            unit = INPUTS[grammar]()
+            path = os.path.join(tmp, grammar)
+            with open(path, 'w') as f:
+                f.write(unit * max(1, int(args.mb * 1e6 / len(unit))))
+            size = os.path.getsize(path) / 1e6
+            for mode in ('whole', 'stream'):
+                first = run(grammar, path, mode, 'first', args.chunk_size)
+                lexed = run(grammar, path, mode, 'lex', args.chunk_size)
+                r = run(grammar, path, mode, 'parse', args.chunk_size)
+                print(f"{grammar:8} {mode:7} {size:6.1f} {lexed['peak_kb'] / 1024:7.1f} MB"
+                      f" {r['peak_kb'] / 1024:7.1f} MB"
+                      f" {r['seconds']:7.2f} s {first['seconds'] * 1e3:9.2f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
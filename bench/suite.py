@@ -0,0 +1,225 @@
+"""Benchmark suite: every grammar, plus the bash implementation, on synthetic input.
+
+    python bench/suite.py [--scale S] [--repeat R] [--only NAME ...]
+                          [--save FILE] [--compare FILE [--tolerance T]]
+
+Each Python grammar runs in its own interpreter (their `lexer`/`parser`
+modules share names) and reports, per workload, the lexing and parsing
+throughput, the split between the lex and parse phases, and the peak
+traced memory of one parse. Timings are the best of --repeat runs with the
+garbage collector off. The bash parser is timed as a whole, one process
+per input, since it has no separate lexing phase worth measuring; its
+err column is 1 when the (valid) input was rejected.
+
+--save writes the results as JSON; --compare reads such a file and exits
+with status 1 if a workload got slower or used more memory than the
+baseline by more than --tolerance (default 0.10, i.e. 10%).
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+# (name, generator, unit): unit 'file' parses the whole text as one input,
+# 'line' parses every line on its own (one Java declaration per input, as
+# the grammar once required)
+WORKLOADS = {
+    'Python': [
+        ('statements', lambda s: gen.shell_statements(20000 * s), 'file'),
+        ('nested_arith', lambda s: gen.nested_arithmetic(200, 40 * s), 'file'),
+        ('arg_lists', lambda s: gen.shell_arguments(500, 40 * s), 'file'),
+        ('pipelines', lambda s: gen.shell_pipelines(200, 40 * s), 'file'),
+    ],
+    'Arnav': [
+        ('nested_blocks', lambda s: gen.nested_blocks(100, 100 * s), 'file'),
+        ('indented_blocks', lambda s: gen.indented_blocks(20, 200 * s), 'file'),
+        ('arithmetic', lambda s: gen.mini_python_arithmetic(200, 40 * s), 'file'),
+    ],
+    'Khush': [
+        ('declarations', lambda s: gen.java_declarations(20000 * s), 'line'),
+        ('classes', lambda s: gen.java_classes(200 * s), 'file'),
+    ],
+}
+BASH_TERMS = (8, 32)
+
+
+def timed(func, repeat):
+    best = float('inf')
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best, result
+
+
+def worker(grammar, scale, repeat, only):
+    # Runs inside the grammar's own interpreter; prints a JSON list
+    sys.path.insert(0, os.path.join(ROOT, grammar))
+    start = time.perf_counter()
+    import parser
+    from lexyacc.diagnostics import Diagnostics
+    load = time.perf_counter() - start
+    if grammar == 'Python':
+        import fastlex
+        instance = parser.Parser(fastlex.lexer)
+    else:
+        instance = parser.Parser()
+    lexobj = instance.lexer
+
+    def lex(units):
+        lexobj.diagnostics = Diagnostics()
+        count = 0
+        for unit in units:
+            lexobj.input(unit)
+            for _ in iter(lexobj.token, None):
+                count += 1
+        return count
+
+    def parse(units):
+        errors = 0
+        for unit in units:
+            result = instance.parse(unit)
+            diagnostics = result[1] if grammar == 'Python' else result
+            errors += len(diagnostics)
+        return errors
+
+    results = []
+    for name, make, unit in WORKLOADS[grammar]:
+        if only and name not in only and grammar not in only:
+            continue
+        data = make(scale)
+        units = data.splitlines() if unit == 'line' else [data]
+        lex_s, tokens = timed(lambda: lex(units), repeat)
+        total_s, errors = timed(lambda: parse(units), repeat)
+        tracemalloc.start()
+        parse(units)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({
+            'name': f'{grammar}/{name}', 'chars': len(data), 'tokens': tokens,
+            'errors': errors, 'load_s': load, 'lex_s': lex_s,
+            'parse_s': max(total_s - lex_s, 0.0), 'total_s': total_s, 'peak_bytes': peak,
+        })
+    print(json.dumps(results))
+
+
+def run_grammar(grammar, args):
+    cmd = [sys.executable, os.path.abspath(__file__), '--worker', grammar,
+           '--scale', str(args.scale), '--repeat', str(args.repeat)]
+    if args.only:
+        cmd += ['--only', *args.only]
+    proc = subprocess.run(cmd, cwd=os.path.join(ROOT, grammar), capture_output=True,
+                          text=True, env=dict(os.environ, PYTHONHASHSEED='0'))
+    if proc.returncode:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f'{grammar}: benchmark worker failed')
+    return json.loads(proc.stdout)
+
+
+def run_bash(args):
+    # parse_input of parser.sh, in a fresh bash per input
+    results = []
+    script = 'source "$1/parser.sh" >/dev/null 2>&1 && parse_input "$2" expression 2>/dev/null'
+    for terms in BASH_TERMS:
+        data = gen.bash_expression(terms * args.scale)
+        cmd = ['bash', '-c', script, 'bench', ROOT, data]
+        total_s, proc = timed(lambda: subprocess.run(cmd, capture_output=True), args.repeat)
+        results.append({
+            'name': f'bash/expression_{terms}', 'chars': len(data), 'tokens': None,
+            'errors': 0 if proc.returncode == 0 else 1, 'load_s': None, 'lex_s': None,
+            'parse_s': None, 'total_s': total_s, 'peak_bytes': None,
+        })
+    return results
+
+
+def fmt(value, spec, scale=1):
+    return '-' if value is None else format(value * scale, spec)
+
+
+def report(results):
+    print(f"{'workload':24} {'chars':>10} {'tokens':>9} {'err':>5} {'lex ms':>9} "
+          f"{'parse ms':>9} {'total ms':>9} {'MB/s':>6} {'ktok/s':>7} {'peak KB':>9}")
+    for r in results:
+        mbs = r['chars'] / r['total_s'] / 1e6
+        ktoks = r['tokens'] / r['total_s'] / 1e3 if r['tokens'] else None
+        print(f"{r['name']:24} {r['chars']:>10,} {fmt(r['tokens'], ',d'):>9} {r['errors']:>5} "
+              f"{fmt(r['lex_s'], '.1f', 1000):>9} {fmt(r['parse_s'], '.1f', 1000):>9} "
+              f"{r['total_s'] * 1000:>9.1f} {mbs:>6.2f} {fmt(ktoks, '.0f'):>7} "
+              f"{fmt(r['peak_bytes'], ',.0f', 1 / 1024):>9}")
+    loads = {r['name'].split('/')[0]: r['load_s'] for r in results if r['load_s'] is not None}
+    print('table load: ' + ', '.join(f'{g} {s * 1000:.1f} ms' for g, s in loads.items()))
+
+
+def compare(results, path, tolerance):
+    with open(path) as f:
+        baseline = {r['name']: r for r in json.load(f)['results']}
+    regressions = 0
+    print(f"\ncompared with {path} (tolerance {tolerance:.0%}):")
+    for r in results:
+        old = baseline.get(r['name'])
+        if old is None or old['chars'] != r['chars']:
+            print(f"  {r['name']:24} no comparable baseline")
+            continue
+        notes = []
+        for key, label in (('total_s', 'time'), ('peak_bytes', 'memory')):
+            if r[key] is None or not old[key]:
+                continue
+            ratio = r[key] / old[key]
+            flag = ratio > 1 + tolerance
+            regressions += flag
+            notes.append(f"{label} {ratio:.2f}x{' REGRESSION' if flag else ''}")
+        if r['errors'] != old['errors']:
+            notes.append(f"errors {old['errors']} -> {r['errors']}")
+        print(f"  {r['name']:24} {', '.join(notes)}")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--scale', type=int, default=1, help="multiplies every input size")
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--only', nargs='+', help="grammars or workload names to run")
+    ap.add_argument('--save', metavar='FILE', help="write the results to FILE as JSON")
+    ap.add_argument('--compare', metavar='FILE', help="compare against results saved earlier")
+    ap.add_argument('--tolerance', type=float, default=0.10)
+    ap.add_argument('--worker', help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.scale, args.repeat, args.only)
+        return 0
+
+    results = []
+    for grammar in WORKLOADS:
+        if not args.only or grammar in args.only or any(
+                name in args.only for name, _, _ in WORKLOADS[grammar]):
+            results.extend(run_grammar(grammar, args))
+    if not args.only or 'bash' in args.only:
+        results.extend(run_bash(args))
+    report(results)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(), 'scale': args.scale,
+                       'results': results}, f, indent=1)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.tolerance) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Parse many shell programs from a thread pool, one Parser per thread.
+
+    python bench/threads.py [--programs N] [--threads T]
+
+Every program is parsed once sequentially and once concurrently; the script
+fails if any tree, diagnostic or line number differs between the two runs.
+Threads do not make CPU-bound parsing faster under the GIL, so the timings
+only show what sharing the tables costs, not a speedup.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+import fastlex
+from parser import Parser
+
+ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+ap.add_argument('--programs', type=int, default=2000)
+ap.add_argument('--threads', type=int, default=8)
+args = ap.parse_args()
+
+# Some programs end in a syntax error on their last line, so the line
+# numbers in the diagnostics show whether lexer state leaked between parses
+TEMPLATES = [
+    'echo start {i}\nx = {i} * (y + 2)\nls -\n',
+    'for f in a b {i} do cat f | wc done\nif x then echo {i} fi',
+    'sort < in{i} ; echo "done {i}"\n\ntotal = $(( {i} + 1 ))',
+    'echo {i}\n\n\nif then fi',
+]
+
+local = threading.local()
+
+
+def parse(data):
+    if not hasattr(local, 'parser'):
+        local.parser = Parser(fastlex.lexer)
+    tree, diagnostics = local.parser.parse(data)
+    return tree, [d.as_dict() for d in diagnostics]
+
+
+def main():
+    programs = [TEMPLATES[i % len(TEMPLATES)].format(i=i) for i in range(args.programs)]
+
+    start = time.perf_counter()
+    expected = [parse(p) for p in programs]
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        results = list(pool.map(parse, programs, chunksize=16))
+    concurrent = time.perf_counter() - start
+
+    mismatches = sum(r != e for r, e in zip(results, expected))
+    print(f"programs:    {len(programs):,} ({sum(bool(e[1]) for e in expected):,} with errors)")
+    print(f"sequential:  {sequential * 1000:.1f} ms")
+    print(f"{args.threads} threads:   {concurrent * 1000:.1f} ms")
+    print(f"mismatches:  {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
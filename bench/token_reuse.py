@@ -0,0 +1,127 @@
+"""Parsing again from a saved token stream against lexing the text again.
+
+    python bench/token_reuse.py [--mb M] [--stages K] [--repeat R] [--only NAME ...]
+
+For an M-megabyte synthetic input per grammar, in a fresh interpreter per
+grammar (the shell grammar lexed by fastlex, the others by PLY), times the
+lexer alone, a parse of the text, Parser.scan (lexing into a
+tokenstream.TokenStream), writing the stream to bytes and reading it back,
+and Parser.parse_tokens. Sizes are the text, the stream's bytes, and for
+comparison the tokens pickled as (type, value, lineno, lexpos) tuples,
+which is what saving the lexer's output would otherwise look like. The
+last column is K stages that each parse the input: K parses of the text
+against one scan, one write and read, and K parses of the stream. Times
+are medians with the garbage collector off.
+"""
+import argparse
+import gc
+import json
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+import generators as gen
+
+INPUTS = {
+    'Python': lambda: gen.shell_statements(2000),
+    'Arnav': lambda: gen.indented_blocks(4, 50) + gen.mini_python_arithmetic(20, 200),
+    'Khush': lambda: gen.java_classes(50),
+}
+
+
+def timed(repeat, func, *args):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def worker(grammar, mb, repeat):
+    # Runs inside the grammar's own interpreter; prints one JSON object
+    sys.path.insert(0, os.path.join(ROOT, grammar))
+    import parser
+    from lexyacc.diagnostics import Diagnostics
+    from lexyacc.tokenstream import TokenStream
+    unit = INPUTS[grammar]()
+    data = unit * max(1, int(mb * 1e6 / len(unit)))
+    if grammar == 'Python':
+        import fastlex
+        instance = parser.Parser(fastlex.lexer)
+    else:
+        instance = parser.Parser()
+    gc.disable()
+
+    def lex():
+        lexobj = instance.lexer.clone()
+        lexobj.input(data)
+        return [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexobj.token, None)]
+
+    def errors(result):
+        diagnostics = result[1] if isinstance(result, tuple) else result
+        return len(diagnostics)
+
+    out = {'chars': len(data)}
+    out['lex'], tuples = timed(repeat, lex)
+    out['pickle_bytes'] = len(pickle.dumps(tuples, pickle.HIGHEST_PROTOCOL))
+    del tuples
+    # Each parse with its own Diagnostics; only the error counts are kept
+    out['parse'], count = timed(repeat, lambda: errors(
+        instance.parse(data, Diagnostics(max_errors=None))))
+    out['scan'], stream = timed(repeat, instance.scan, data)
+    out['to_bytes'], blob = timed(repeat, stream.to_bytes)
+    out['from_bytes'], loaded = timed(repeat, TokenStream.from_bytes, blob)
+    out['parse_tokens'], replayed = timed(repeat, lambda: errors(
+        instance.parse_tokens(loaded, Diagnostics(max_errors=None))))
+    assert count == replayed == 0
+    out['tokens'] = len(stream)
+    out['values'] = len(stream.values)
+    out['stream_bytes'] = len(blob) - len(data.encode())
+    print(json.dumps(out))
+
+
+def run(grammar, mb, repeat):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', grammar,
+                          str(mb), str(repeat)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--mb', type=float, default=2)
+    ap.add_argument('--stages', type=int, default=3)
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--only', nargs='+', choices=sorted(INPUTS))
+    ap.add_argument('--worker', nargs=3, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.worker:
+        grammar, mb, repeat = args.worker
+        worker(grammar, float(mb), int(repeat))
+        return 0
+
+    k = args.stages
+    print(f"{'grammar':8} {'tokens':>8} {'lex':>7} {'parse':>7} {'scan':>7} {'write':>6}"
+          f" {'read':>6} {'replay':>7} {'stream MB':>10} {'pickle MB':>10}"
+          f" {f'{k} stages (s)':>16}")
+    for grammar in args.only or INPUTS:
+        r = run(grammar, args.mb, args.repeat)
+        text = k * r['parse']
+        reused = r['scan'] + r['to_bytes'] + r['from_bytes'] + k * r['parse_tokens']
+        print(f"{grammar:8} {r['tokens']:8} {r['lex']:6.2f}s {r['parse']:6.2f}s"
+              f" {r['scan']:6.2f}s {r['to_bytes']:5.3f}s {r['from_bytes']:5.3f}s"
+              f" {r['parse_tokens']:6.2f}s {r['stream_bytes'] / 1e6:10.2f}"
+              f" {r['pickle_bytes'] / 1e6:10.2f} {text:7.2f} -> {reused:5.2f}")
+    print("stream MB is the stream's bytes less the text it carries; all times median")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,32 @@
 #!/bin/bash
 # lexer.sh - Shell-based Lexical Analyzer
 # Implements tokenization using bash regular expressions and pattern matching
+#
+# The scanner runs in the calling shell (no subshell per token) and never
+# re-slices the whole input: one regex combining every token pattern is
+# matched at the current position of a small buffer, which is refilled a
+# block at a time from the input as it is consumed, so each token costs
+# the same however long the input is. Debug traces and errors go to
+# stderr unless QUIET=true.
 
 # Global variables for token processing
 declare -a TOKENS=()
 declare -a TOKEN_VALUES=()
 INPUT_TEXT=""
+INPUT_LENGTH=0
 TOKEN_INDEX=0
+QUIET="${QUIET:-false}"
+
+# Scanner state: LEX_BUFFER holds the input from LEX_OFFSET - ${#LEX_BUFFER}
+# on, and LEX_POS is the position of the next token in it
+LEX_BUFFER=""
+LEX_POS=0
+LEX_OFFSET=0
+LEX_BLOCK=2048
 
 TOKEN_TYPES=(
     "NUMBER"
-    "PLUS" 
+    "PLUS"
     "MINUS"
     "TIMES"
     "DIVIDE"
@@ -26,27 +42,31 @@ TOKEN_TYPES=(
     "B"
 )
 
-declare -A TOKEN_PATTERNS=(
-    ["NUMBER"]="^[0-9]+(\.[0-9]+)?"
-    ["PLUS"]="^\+"
-    ["MINUS"]="^-"
-    ["TIMES"]="^\*"
-    ["DIVIDE"]="^/"
-    ["LPAREN"]="^\("
-    ["RPAREN"]="^\)"
-    ["EQUALS"]="^="
-    ["SEMICOLON"]="^;"
-    ["COMMA"]="^,"
-    ["NEWLINE"]="^[\n\r]+"
-    ["A"]="^a+"
-    ["B"]="^b+"
-    ["ID"]="^[a-zA-Z][a-zA-Z0-9]*"
-    ["TYPE"]="^(int|char|float|double)"
+# Blanks before a token, then one of: NUMBER, ID (or reserved word), an
+# operator, NEWLINE. The first character of the match tells them apart.
+LEX_BLANKS=$' \t\r\v\f'
+LEX_NEWLINES=$'\n\r'
+LEX_PATTERN="^[$LEX_BLANKS]*([0-9]+(\.[0-9]+)?|[a-zA-Z][a-zA-Z0-9]*|[-+*/()=;,]|[$LEX_NEWLINES]+)"
+
+# For the a^n b^n grammar every a and b is a token of its own (A, B); any
+# other word is still an ID
+LEX_SEQUENCE_PATTERN="^[$LEX_BLANKS]*([0-9]+(\.[0-9]+)?|[ab]|[c-zA-Z][a-zA-Z0-9]*|[-+*/()=;,]|[$LEX_NEWLINES]+)"
+
+declare -A OPERATOR_TYPES=(
+    ["+"]="PLUS"
+    ["-"]="MINUS"
+    ["*"]="TIMES"
+    ["/"]="DIVIDE"
+    ["("]="LPAREN"
+    [")"]="RPAREN"
+    ["="]="EQUALS"
+    [";"]="SEMICOLON"
+    [","]="COMMA"
 )
 
 declare -A RESERVED_WORDS=(
     ["int"]="TYPE"
-    ["char"]="TYPE" 
+    ["char"]="TYPE"
     ["float"]="TYPE"
     ["double"]="TYPE"
 )
@@ -54,94 +74,123 @@ declare -A RESERVED_WORDS=(
 initialize_lexer() {
     local input="$1"
     INPUT_TEXT="$input"
+    INPUT_LENGTH=${#input}
     TOKENS=()
     TOKEN_VALUES=()
     TOKEN_INDEX=0
-    echo "Lexer initialized with input: '$input'" >&2
+    LEX_BUFFER=""
+    LEX_POS=0
+    LEX_OFFSET=0
+    [[ $QUIET == true ]] || echo "Lexer initialized with input: '$input'" >&2
 }
 
-skip_whitespace() {
-    while [[ ${INPUT_TEXT:0:1} =~ [[:space:]] && ${INPUT_TEXT:0:1} != $'\n' ]]; do
-        INPUT_TEXT="${INPUT_TEXT:1}"
-    done
-}
+# Scans the next token into TOKENS/TOKEN_VALUES. Returns 1 at the end of
+# the input and 2 on an illegal character. $1 is the pattern to use.
+get_next_token() {
+    local pattern="${1:-$LEX_PATTERN}"
+    local match token token_type
 
-match_token() {
-    local token_type="$1"
-    local pattern="${TOKEN_PATTERNS[$token_type]}"
-    
-    if [[ -z "$pattern" ]]; then
-        return 1
-    fi
-    
-    if [[ "$INPUT_TEXT" =~ $pattern ]]; then
-        local match="${BASH_REMATCH[0]}"
-        )
-        if [[ "$token_type" == "ID" && -n "${RESERVED_WORDS[$match]}" ]]; then
-            token_type="${RESERVED_WORDS[$match]}"
+    while true; do
+        # Keep a block of input ahead of the scan position; copying out a
+        # block at a time keeps slicing off the whole input rare
+        if (( ${#LEX_BUFFER} - LEX_POS < LEX_BLOCK && LEX_OFFSET < INPUT_LENGTH )); then
+            LEX_BUFFER="${LEX_BUFFER:LEX_POS}${INPUT_TEXT:LEX_OFFSET:LEX_BLOCK}"
+            LEX_POS=0
+            LEX_OFFSET=$((LEX_OFFSET + LEX_BLOCK))
         fi
-        
+        if [[ ! ${LEX_BUFFER:LEX_POS} =~ $pattern ]]; then
+            if [[ ${LEX_BUFFER:LEX_POS} =~ ^[$LEX_BLANKS]*$ ]]; then
+                # Only blanks (a run longer than the buffer, or the end)
+                (( LEX_OFFSET < INPUT_LENGTH )) || return 1
+                LEX_POS=${#LEX_BUFFER}
+                continue
+            fi
+            break
+        fi
+        match="${BASH_REMATCH[0]}"
+        # A token that runs to the end of the buffer, or one character
+        # short of it (12. may be the start of 12.5), may go on past it:
+        # take in another block and match again
+        if (( LEX_POS + ${#match} + 1 >= ${#LEX_BUFFER} && LEX_OFFSET < INPUT_LENGTH )); then
+            LEX_BUFFER+="${INPUT_TEXT:LEX_OFFSET:LEX_BLOCK}"
+            LEX_OFFSET=$((LEX_OFFSET + LEX_BLOCK))
+            continue
+        fi
+
+        token="${BASH_REMATCH[1]}"
+        LEX_POS=$((LEX_POS + ${#match}))
+        case "$token" in
+            [0-9]*)
+                token_type="NUMBER"
+                ;;
+            a | b)
+                if [[ $pattern == "$LEX_SEQUENCE_PATTERN" ]]; then
+                    token_type="${token^^}"
+                else
+                    token_type="ID"
+                fi
+                ;;
+            [a-zA-Z]*)
+                token_type="${RESERVED_WORDS[$token]:-ID}"
+                ;;
+            [$LEX_NEWLINES]*)
+                token_type="NEWLINE"
+                ;;
+            *)
+                token_type="${OPERATOR_TYPES[$token]}"
+                ;;
+        esac
         TOKENS+=("$token_type")
-        TOKEN_VALUES+=("$match")
-        
-        INPUT_TEXT="${INPUT_TEXT:${#match}}"
-        
-        echo "Matched token: $token_type = '$match'" >&2
+        TOKEN_VALUES+=("$token")
+        [[ $QUIET == true ]] || echo "Matched token: $token_type = '$token'" >&2
         return 0
-    fi
-    
-    return 1
-}
-
-get_next_token() {
-    skip_whitespace
-    
-    if [[ -z "$INPUT_TEXT" ]]; then
-        echo "EOF"
-        return 1
-    fi
-    
-    for token_type in "${TOKEN_TYPES[@]}"; do
-        if match_token "$token_type"; then
-            echo "$token_type"
-            return 0
-        fi
     done
-    
-    # If no token matched, it's an error
-    echo "ERROR: Illegal character '${INPUT_TEXT:0:1}'" >&2
-    INPUT_TEXT="${INPUT_TEXT:1}"  
-    echo "ERROR"
-    return 1
+
+    # A character no pattern matches
+    [[ ${LEX_BUFFER:LEX_POS} =~ ^[$LEX_BLANKS]*(.) ]]
+    LEX_POS=$((LEX_POS + ${#BASH_REMATCH[0]}))
+    [[ $QUIET == true ]] || echo "ERROR: Illegal character '${BASH_REMATCH[1]}'" >&2
+    return 2
 }
 
-# Function to tokenize entire input
+# Function to tokenize entire input; $2 is the grammar the tokens are for
+# (the a^n b^n grammar lexes a and b on their own)
 tokenize_input() {
     local input="$1"
+    local grammar_type="$2"
+    # Byte semantics: offsets and lengths need no multibyte decoding, and
+    # every token is ASCII
+    local LC_ALL=C
+    local pattern="$LEX_PATTERN"
+    case "$grammar_type" in
+        sequence | anbn)
+            pattern="$LEX_SEQUENCE_PATTERN"
+            ;;
+    esac
     initialize_lexer "$input"
-    
-    echo "=== TOKENIZATION PROCESS ===" >&2
-    
-    while [[ -n "$INPUT_TEXT" ]]; do
-        local token
-        token=$(get_next_token)
-        
-        if [[ "$token" == "EOF" ]]; then
-            break
-        elif [[ "$token" == "ERROR" ]]; then
-            echo "Tokenization failed due to illegal character" >&2
-            return 1
-        fi
-    done
-    
-    echo "=== TOKENIZATION COMPLETE ===" >&2
-    echo "Tokens found: ${#TOKENS[@]}" >&2
-    
-    # Print all tokens
-    for ((i=0; i<${#TOKENS[@]}; i++)); do
-        echo "Token[$i]: ${TOKENS[i]} = '${TOKEN_VALUES[i]}'"
+
+    [[ $QUIET == true ]] || echo "=== TOKENIZATION PROCESS ===" >&2
+
+    local status=0
+    while (( status == 0 )); do
+        get_next_token "$pattern"
+        status=$?
     done
-    
+    if (( status == 2 )); then
+        [[ $QUIET == true ]] || echo "Tokenization failed due to illegal character" >&2
+        return 1
+    fi
+
+    if [[ $QUIET != true ]]; then
+        echo "=== TOKENIZATION COMPLETE ===" >&2
+        echo "Tokens found: ${#TOKENS[@]}" >&2
+
+        # Print all tokens
+        for ((i=0; i<${#TOKENS[@]}; i++)); do
+            echo "Token[$i]: ${TOKENS[i]} = '${TOKEN_VALUES[i]}'"
+        done
+    fi
+
     return 0
 }
 
@@ -0,0 +1,4 @@
+# The grammars of this repository behind one interface; see registry.py.
+# The modules the grammars share are here too (diagnostics, frozen, ...).
+from .registry import (Grammar, UnknownGrammar, for_path, get, names, parse,
+                       register)
@@ -0,0 +1,99 @@
+"""Parse files with any registered grammar, in one process.
+
+    python -m lexyacc [-g GRAMMAR] PATH ...     # JSON lines, one per file, then a summary
+    python -m lexyacc --list                    # the registered grammars
+
+Run from the repository root. Each file is parsed with the grammar given by
+-g or, without it, the one registered for its extension (.sh, .py, .java);
+directories are walked for files of any registered extension. Only the
+grammars actually needed are loaded, each once, the first time a file asks
+for it; the summary says which were loaded and how long that took.
+"""
+import argparse
+import json
+import os
+import sys
+
+from . import registry
+
+
+def iter_inputs(paths, grammar):
+    # Yields (path, grammar or None); directories are walked in sorted order
+    for path in paths:
+        if path == '-' or not os.path.isdir(path):
+            yield path, grammar or registry.for_path(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                found = grammar or registry.for_path(name)
+                if found is not None and (grammar is None or name.endswith(found.extensions)):
+                    yield os.path.join(root, name), found
+
+
+def read_input(path):
+    if path == '-':
+        return sys.stdin.read()
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def run(paths, grammar=None, out=sys.stdout):
+    files = failed = unreadable = 0
+    for path, found in iter_inputs(paths, grammar):
+        files += 1
+        name = '<stdin>' if path == '-' else path
+        record = {'file': name, 'grammar': found.name if found else None}
+        if found is None:
+            unreadable += 1
+            record.update(ok=False, error='no grammar for this file; use -g')
+        else:
+            try:
+                _, diagnostics = found.parse(read_input(path))
+            except OSError as e:
+                unreadable += 1
+                record.update(ok=False, error=str(e))
+            else:
+                errors = [d.as_dict() for d in diagnostics]
+                failed += bool(errors)
+                record.update(ok=not errors, errors=errors)
+        out.write(json.dumps(record) + '\n')
+
+    loaded = {name: round(registry.get(name).load_time * 1000, 2)
+              for name in registry.names() if registry.get(name).loaded}
+    out.write(json.dumps({'summary': {'files': files, 'ok': files - failed - unreadable,
+                                      'failed': failed, 'unreadable': unreadable,
+                                      'loaded_ms': loaded}}) + '\n')
+    if unreadable:
+        return 2
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog='python -m lexyacc',
+                                 description=__doc__.splitlines()[0])
+    ap.add_argument('paths', nargs='*', help="files or directories ('-' for stdin, with -g)")
+    ap.add_argument('-g', '--grammar', help="parse everything with this grammar")
+    ap.add_argument('--list', action='store_true', help="list the registered grammars")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for name in registry.names():
+            grammar = registry.get(name)
+            names = ', '.join((name,) + grammar.aliases)
+            print(f"{names:32} {' '.join(grammar.extensions):6} {grammar.description}")
+        return 0
+    if not args.paths:
+        ap.error('no input files')
+    grammar = None
+    if args.grammar is not None:
+        try:
+            grammar = registry.get(args.grammar)
+        except registry.UnknownGrammar:
+            ap.error(f"unknown grammar {args.grammar!r} "
+                     f"(choose from {', '.join(registry.names())})")
+    return run(args.paths, grammar)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
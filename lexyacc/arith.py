@@ -0,0 +1,115 @@
+# arith.py
+# Constant folding and a postfix evaluator for the arithmetic sub-grammar.
+#
+# A parser made with an environment (Parser(env={})) folds expressions as
+# it reduces them: an operator whose operands are both constants becomes a
+# constant, so when an expression is complete only the parts that read a
+# variable are left. compile() flattens what is left to postfix code, a
+# tuple of (opcode, argument) pairs, and run() executes it with a value
+# stack in a single loop. Neither recurses, so however deeply an
+# expression nests it costs memory, never Python stack.
+#
+# An expression is a number, a variable name (a str) or an (op, left,
+# right) tuple; the shell grammar's Num, Var and BinOp nodes are read the
+# same way. The operator table sets the semantics: SHELL is $(( )) integer
+# arithmetic, dividing toward zero; PYTHON divides as Python 3 does.
+import operator
+
+CONST, LOAD, BINARY = 0, 1, 2
+
+
+class ArithError(Exception):
+    # Division by zero or overflow, or with run(unset=None) a variable
+    # never assigned
+    pass
+
+
+def _shell_divide(a, b):
+    if b == 0:
+        raise ArithError('division by 0')
+    q = abs(a) // abs(b)
+    return -q if (a < 0) != (b < 0) else q
+
+
+def _python_divide(a, b):
+    if b == 0:
+        raise ArithError('division by zero')
+    try:
+        return a / b
+    except OverflowError as e:      # an int too large for a float
+        raise ArithError(str(e)) from None
+
+
+SHELL = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': _shell_divide}
+PYTHON = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': _python_divide}
+
+_NUMBERS = (int, float)
+
+
+def fold(op, left, right, operators=SHELL):
+    # left op right if both are numbers, else None. An operation that fails
+    # is not folded either: run() reports it if the expression is evaluated.
+    if type(left) in _NUMBERS and type(right) in _NUMBERS:
+        try:
+            return operators[op](left, right)
+        except ArithError:
+            return None
+    return None
+
+
+def compile(expr, operators=SHELL):
+    # Postfix code for expr. Walks it node, right, left with an explicit
+    # stack and reverses the result, which puts every operator after both
+    # of its operands.
+    code = []
+    emit = code.append
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        kind = type(node)
+        if kind is tuple:
+            op, left, right = node
+        elif kind is str:
+            emit((LOAD, node))
+            continue
+        elif kind in _NUMBERS:
+            emit((CONST, node))
+            continue
+        elif hasattr(node, 'op'):
+            op, left, right = node.op, node.left, node.right
+        elif hasattr(node, 'value'):
+            emit((CONST, node.value))
+            continue
+        else:
+            emit((LOAD, node.name))
+            continue
+        emit((BINARY, operators[op]))
+        stack.append(left)
+        stack.append(right)
+    code.reverse()
+    return tuple(code)
+
+
+def run(code, env, unset=0):
+    # The value of compiled code with variables read from env; a variable
+    # missing from it reads as unset, or is an error if unset is None
+    stack = []
+    push, pop, get = stack.append, stack.pop, env.get
+    for op, arg in code:
+        if op == BINARY:
+            right = pop()
+            stack[-1] = arg(stack[-1], right)
+        elif op == CONST:
+            push(arg)
+        else:
+            value = get(arg, unset)
+            if value is None:
+                raise ArithError(f"name '{arg}' is not defined")
+            push(value)
+    return stack[0]
+
+
+def evaluate(expr, env, operators=SHELL, unset=0):
+    if type(expr) in _NUMBERS:
+        return expr
+    return run(compile(expr, operators), env, unset)
@@ -0,0 +1,115 @@
+# diagnostics.py
+# Error collection and event hook shared by the lexer and the parser.
+#
+# Nothing in the parse path prints: t_error and p_error record a Diagnostic
+# and grammar actions report what they recognised through the optional
+# on_event(kind, value) callback. A run without a callback does no I/O.
+#
+# The parsers recover from syntax errors and keep going, so one run reports
+# every error; a Diagnostics that reaches max_errors stops the run instead,
+# since by then the rest is mostly one mistake cascading.
+
+MAX_ERRORS = 100
+
+
+class TooManyErrors(Exception):
+    # Raised through the lexer and parser; Parser.parse catches it and
+    # returns what was collected
+    pass
+
+
+class LimitExceeded(TooManyErrors):
+    # A parse went past one of its limits.Limits; stops it the same way
+    pass
+
+
+class Diagnostic:
+    __slots__ = ('kind', 'type', 'value', 'line', 'column')
+
+    def __init__(self, kind, type, value, line, column):
+        self.kind = kind        # 'lexical', 'syntax', 'arith' or 'limit'
+        self.type = type        # token type, 'ILLEGAL', '$end', 'ARITH' or 'LIMIT'
+        self.value = value
+        self.line = line
+        self.column = column
+
+    @property
+    def message(self):
+        if self.kind == 'lexical':
+            return f"Illegal character '{self.value}' at line {self.line}, column {self.column}"
+        if self.kind == 'arith':
+            return f"Arithmetic error: {self.value} at line {self.line}, column {self.column}"
+        if self.kind == 'limit':
+            if self.column is None:
+                return f"Parse stopped: {self.value} at line {self.line}"
+            return f"Parse stopped: {self.value} at line {self.line}, column {self.column}"
+        if self.type == '$end':
+            return "Syntax error at EOF"
+        return (f"Syntax error at token {self.type} ('{self.value}') "
+                f"line {self.line}, column {self.column}")
+
+    def as_dict(self):
+        return {'kind': self.kind, 'token': self.type, 'value': self.value,
+                'line': self.line, 'column': self.column}
+
+    def __repr__(self):
+        return f'Diagnostic({self.message!r})'
+
+
+def find_column(data, lexpos):
+    # Columns are 1-based and counted from the last newline before lexpos
+    return lexpos - data.rfind('\n', 0, lexpos)
+
+
+def _column(lexer, lexpos):
+    # lexpos is a file offset; a stream.StreamLexer only holds the chunk
+    # starting at lexoffset
+    return find_column(lexer.lexdata, lexpos - getattr(lexer, 'lexoffset', 0))
+
+
+class Diagnostics:
+    def __init__(self, on_event=None, max_errors=MAX_ERRORS):
+        self.errors = []
+        self.on_event = on_event
+        self.max_errors = max_errors   # None for no limit
+
+    def __len__(self):
+        return len(self.errors)
+
+    def __iter__(self):
+        return iter(self.errors)
+
+    def illegal(self, lexer, char):
+        self._add(Diagnostic('lexical', 'ILLEGAL', char, lexer.lineno,
+                             find_column(lexer.lexdata, lexer.lexpos)))
+
+    def syntax(self, tok, lexer):
+        if tok is None:
+            self._add(Diagnostic('syntax', '$end', None, lexer.lineno, None))
+        else:
+            self._add(Diagnostic('syntax', tok.type, tok.value, tok.lineno,
+                                 _column(lexer, tok.lexpos)))
+
+    def arith(self, message, lexer, lineno, lexpos):
+        # An expression that could not be evaluated (see arith.py), at the
+        # statement starting at lexpos
+        self._add(Diagnostic('arith', 'ARITH', message, lineno, _column(lexer, lexpos)))
+
+    def limit(self, message, lexer, tok):
+        # A limit was passed just after tok (None if no token was read yet);
+        # recorded whatever max_errors is, and the parse ends here
+        if tok is None:
+            line, column = lexer.lineno, None
+        else:
+            line, column = tok.lineno, _column(lexer, tok.lexpos)
+        self.errors.append(Diagnostic('limit', 'LIMIT', message, line, column))
+        raise LimitExceeded(message)
+
+    def _add(self, diagnostic):
+        self.errors.append(diagnostic)
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            raise TooManyErrors(self.max_errors)
+
+    def emit(self, kind, value):
+        if self.on_event is not None:
+            self.on_event(kind, value)
@@ -0,0 +1,100 @@
+# frozen.py
+# Startup path for the PLY lexer and parser.
+#
+# lextab.py and parsetab.py are generated ahead of time by
+# tools/build_tables.py and bound straight to the t_/p_ functions here, so
+# importing lexer.py/parser.py does no docstring reflection, no grammar
+# validation and never writes to disk. With LEXYACC_BUILD_TABLES=1 the
+# frozen files are ignored and the classic lex.lex()/yacc.yacc() path runs
+# (that is what the build script uses to regenerate them).
+#
+# The tables are found next to the module whose rules they hold, so every
+# grammar directory uses this one copy.
+#
+# Each table carries the signature of the rules it was built from: PLY's
+# _lr_signature (the start symbol, precedence, tokens and every p_ docstring)
+# in parsetab.py, and _lexsignature (see lexsignature) appended to lextab.py
+# by the build script. Both are recomputed from the module on load, which
+# reads only names and docstrings, and tables that don't match raise
+# StaleTables rather than run a grammar they were not built from.
+import importlib.util
+import os
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+BUILD = os.environ.get('LEXYACC_BUILD_TABLES') == '1'
+
+
+class StaleTables(Exception):
+    def __init__(self, path, module):
+        super().__init__(f'{path} was not built from the rules in {module.__file__};'
+                         ' rerun tools/build_tables.py')
+        self.path = path
+
+
+def lexsignature(module):
+    # What lex.lex() builds its regexes from: the tokens, states and
+    # literals, every string rule, and the function rules in the order they
+    # are defined (but not their lines, which unrelated edits move). Kept
+    # whole, like _lr_signature; hashing it would cost more to import than
+    # comparing it does.
+    rules = [(name, value) for name, value in vars(module).items() if name.startswith('t_')]
+    strings = sorted((name, value) for name, value in rules if isinstance(value, str))
+    functions = sorted((value.__code__.co_firstlineno, name, value.__doc__)
+                       for name, value in rules if callable(value))
+    parts = (sorted(module.tokens), getattr(module, 'states', ()),
+             getattr(module, 'literals', ''), strings,
+             [(name, doc) for _, name, doc in functions])
+    return repr(parts)
+
+
+def lrsignature(module):
+    # PLY's signature of the grammar in module, as yacc.yacc() computes it
+    pinfo = yacc.ParserReflect(vars(module), log=yacc.NullLogger())
+    pinfo.get_all()
+    return pinfo.signature()
+
+
+def load(directory, name):
+    # Import a generated table module by path so grammars in other
+    # directories (which have tables with the same name) never collide
+    path = os.path.join(directory, name + '.py')
+    if BUILD or not os.path.exists(path):
+        return None
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def directory(module):
+    # The grammar directory a lexer or parser module is in
+    return os.path.dirname(os.path.abspath(module.__file__))
+
+
+def lexer(module):
+    lextab = load(directory(module), 'lextab')
+    if lextab is None:
+        return lex.lex(module=module)
+    if getattr(lextab, '_lexsignature', None) != lexsignature(module):
+        raise StaleTables(lextab.__file__, module)
+    lexobj = lex.Lexer()
+    lexobj.readtab(lextab, vars(module))
+    lexobj.lexoptimize = True
+    return lexobj
+
+
+def parser(module):
+    parsetab = load(directory(module), 'parsetab')
+    if parsetab is not None:
+        if parsetab._lr_signature != lrsignature(module):
+            raise StaleTables(parsetab.__file__, module)
+        lrtable = yacc.LRTable()
+        lrtable.read_table(parsetab)
+        lrtable.bind_callables(vars(module))
+        return yacc.LRParser(lrtable, module.p_error)
+    if BUILD:
+        return yacc.yacc(module=module)
+    # No frozen tables: build them in memory but don't write anything
+    return yacc.yacc(module=module, debug=False, write_tables=False)
@@ -0,0 +1,550 @@
+"""Grammar-driven fuzzing and LALR table coverage for the registered grammars.
+
+    python -m lexyacc.fuzz [--grammars NAME ...] [--inputs N | --seconds S] [--seed N]
+                           [--max-tokens N] [--invalid P] [--check-every K]
+                           [--differential N] [--json OUT]
+
+Inputs are made from each grammar's own tables: the productions of
+_lr_productions in its parsetab.py (the rules of parser.out) are expanded
+at random from the start symbol into token types, up to about --max-tokens
+tokens, preferring productions no input has reduced yet. A fraction
+--invalid of them then gets one token deleted, inserted, replaced or
+swapped with the next. Each input runs through a recognizer that follows
+_lr_action and _lr_goto directly, with no semantic actions and no error
+recovery, and records the states entered, the action entries taken and the
+productions reduced; that is what makes millions of inputs a minute
+possible in one process. Every --check-every'th input is also parsed by the
+grammar's own Parser, from a token stream (see tokenstream.py) so without
+lexing, under an instrument.Profile: it must give the recognizer's verdict
+and not raise, and the productions it reduces while recovering from errors
+count towards the coverage.
+
+Per grammar the report gives the inputs per second and how many were
+valid, any disagreement or exception (with the input as token types), the
+productions, states and action entries covered, and the productions no
+input reduced. --differential N then makes N arithmetic expressions the
+same way from the mini-Python grammar's expression rule, adds the
+expression cases of `main.sh -t`, checks them all with
+`bash main.sh -b -g expression`, and compares parser.sh's accept or reject
+on each line with the shell grammar's on $(( line )) and the mini-Python
+grammar's on the line as a statement.
+
+Exit status 1 if a Parser disagreed with its tables or raised; differences
+from parser.sh are reported but are not failures.
+"""
+import argparse
+import inspect
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from collections import Counter
+
+import ply.yacc as yacc
+
+from . import frozen, registry
+from .diagnostics import Diagnostics
+from .instrument import Profile
+from .tokenstream import TokenStream
+
+MAIN_SH = os.path.join(registry.ROOT, 'main.sh')
+
+# Findings kept per grammar; the rest are only counted
+MAX_FINDINGS = 20
+
+# How often (in inputs) the preference for unreduced productions is renewed
+REFRESH_EVERY = 1024
+
+# parser.sh's arithmetic tokens under the mini-Python grammar's names, and
+# their text; a NUMBER is made up each time
+ARITHMETIC = {'NUMBER': None, 'PLUS': '+', 'MINUS': '-', 'TIMES': '*', 'DIVIDE': '/',
+              'LPAREN': '(', 'RPAREN': ')'}
+
+
+class Tables:
+    # A grammar's LALR tables from its frozen parsetab.py, numbered for
+    # speed: terminals are 0 .. width - 1, nonterminals follow, and each
+    # state's actions and gotos are lists indexed by symbol number
+    def __init__(self, directory):
+        lrtable = yacc.LRTable()
+        lrtable.read_table(frozen.load(directory, 'parsetab'))
+
+        self.productions = lrtable.lr_productions
+        rhs = []
+        for prod in self.productions:
+            symbols = prod.str.split('->', 1)[1].split()
+            rhs.append([] if symbols == ['<empty>'] else symbols)
+        nonterminals = list(dict.fromkeys(prod.name for prod in self.productions))
+        seen = {t for row in lrtable.lr_action.values() for t in row}
+        seen.update(s for symbols in rhs for s in symbols)
+        terminals = sorted(seen - set(nonterminals))
+        self.symbols = terminals + nonterminals
+        self.width = len(terminals)
+        number = {name: i for i, name in enumerate(self.symbols)}
+        self.number = number
+        self.end = number['$end']
+        self.start = number[rhs[0][0]]
+        self.rhs = [tuple(number[s] for s in symbols) for symbols in rhs]
+        self.lhs = [number[prod.name] for prod in self.productions]
+        self.lengths = [prod.len for prod in self.productions]
+
+        states = len(lrtable.lr_action)
+        self.action = [[None] * self.width for _ in range(states)]
+        self.goto = [[None] * len(self.symbols) for _ in range(states)]
+        for state, row in lrtable.lr_action.items():
+            for name, t in row.items():
+                self.action[state][number[name]] = t
+        for state, row in lrtable.lr_goto.items():
+            for name, target in row.items():
+                self.goto[state][number[name]] = target
+
+    def names(self, tokens):
+        return ' '.join(self.symbols[t] for t in tokens)
+
+
+def recognize(tables, tokens, coverage):
+    # True if tokens (terminal numbers, ending with $end) are a sentence of
+    # the grammar. Marks each action entry taken and counts each reduction.
+    action, goto, lengths, lhs = tables.action, tables.goto, tables.lengths, tables.lhs
+    width = tables.width
+    taken, reduced = coverage.taken, coverage.reduced
+    states = [0]
+    pos = 0
+    tok = tokens[0]
+    while True:
+        state = states[-1]
+        t = action[state][tok]
+        if t is None:
+            return False
+        taken[state * width + tok] = 1
+        if t > 0:
+            states.append(t)
+            pos += 1
+            tok = tokens[pos]
+        elif t < 0:
+            reduced[-t] += 1
+            size = lengths[-t]
+            if size:
+                del states[-size:]
+            states.append(goto[states[-1]][lhs[-t]])
+        else:
+            return True
+
+
+class Generator:
+    # Random sentences of a grammar as terminal numbers. Every nonterminal
+    # has a cost, the fewest tokens it can derive, and the production that
+    # derives them; a sentence is expanded with an explicit stack, choosing
+    # at random while what it has plus the least the rest can derive stays
+    # within the budget, and the cheapest production once it would not.
+    # Productions that can't derive a sentence of alphabet (such as those
+    # with the error token) are never chosen.
+    def __init__(self, tables, rng, start=None, alphabet=None):
+        self.tables = tables
+        self.rng = rng
+        self.start = tables.start if start is None else tables.number[start]
+        width = tables.width
+        if alphabet is None:
+            alphabet = [t for t in range(width)
+                        if tables.symbols[t] not in ('$end', 'error')]
+        else:
+            alphabet = [tables.number[name] for name in alphabet]
+        self.alphabet = alphabet
+
+        inf = float('inf')
+        cost = [inf] * len(tables.symbols)
+        for t in alphabet:
+            cost[t] = 1
+        cheapest = {}
+        changed = True
+        while changed:
+            changed = False
+            for p in range(1, len(tables.productions)):
+                c = sum(cost[s] for s in tables.rhs[p])
+                if c < cost[tables.lhs[p]]:
+                    cost[tables.lhs[p]] = c
+                    cheapest[tables.lhs[p]] = p
+                    changed = True
+        self.cost = cost
+        self.cheapest = cheapest
+        self.pcost = [sum(cost[s] for s in symbols) for symbols in tables.rhs]
+        self.choices = {}
+        for p in range(1, len(tables.productions)):
+            if self.pcost[p] < inf:
+                self.choices.setdefault(tables.lhs[p], []).append(p)
+        # Reversed right-hand sides, ready to push
+        self.pushed = [symbols[::-1] for symbols in tables.rhs]
+        self.fresh = {}
+
+    def prefer(self, reduced):
+        # Favour the productions reduced no times so far
+        self.fresh = {}
+        for nt, options in self.choices.items():
+            fresh = [p for p in options if not reduced[p]]
+            if fresh and len(fresh) < len(options):
+                self.fresh[nt] = fresh
+
+    def sentence(self, budget):
+        random = self.rng.random
+        width = self.tables.width
+        cost, pcost, choices, cheapest = self.cost, self.pcost, self.choices, self.cheapest
+        pushed, fresh = self.pushed, self.fresh
+        out = []
+        stack = [self.start]
+        need = cost[self.start]
+        while stack:
+            sym = stack.pop()
+            if sym < width:
+                out.append(sym)
+                need -= 1
+                continue
+            need -= cost[sym]
+            options = fresh.get(sym)
+            if options is None or random() < 0.5:
+                options = choices[sym]
+            p = options[int(random() * len(options))]
+            if len(out) + need + pcost[p] > budget:
+                p = cheapest[sym]
+            need += pcost[p]
+            stack.extend(pushed[p])
+        return out
+
+    def mutate(self, tokens):
+        # tokens with one random edit, which often leaves them no sentence
+        random, alphabet = self.rng.random, self.alphabet
+        i = int(random() * len(tokens))
+        edit = int(random() * 4)
+        if edit == 0 and tokens:
+            del tokens[i]
+        elif edit == 1 or not tokens:
+            tokens.insert(i, alphabet[int(random() * len(alphabet))])
+        elif edit == 2:
+            tokens[i] = alphabet[int(random() * len(alphabet))]
+        elif i + 1 < len(tokens):
+            tokens[i], tokens[i + 1] = tokens[i + 1], tokens[i]
+        return tokens
+
+
+class Coverage:
+    def __init__(self, tables):
+        self.tables = tables
+        self.taken = bytearray(len(tables.action) * tables.width)  # action entries
+        self.reduced = [0] * len(tables.productions)    # by the recognizer
+        self.parsed = Counter()                         # by the Parser, on checked inputs
+
+    def covered(self, p):
+        return bool(self.reduced[p] or self.parsed[p])
+
+    def as_dict(self):
+        tables = self.tables
+        width = tables.width
+        error = tables.number.get('error')
+        entries = [(s, t) for s, row in enumerate(tables.action)
+                   for t, action in enumerate(row) if action is not None]
+        counted = [(s, t) for s, t in entries if t != error]
+        productions = range(1, len(tables.productions))
+        uncovered = []
+        for p in productions:
+            if not self.covered(p):
+                prod = tables.productions[p]
+                uncovered.append({'number': p, 'production': prod.str, 'function': prod.func,
+                                  'file': prod.file, 'line': prod.line,
+                                  'recovery': error in tables.rhs[p]})
+        return {
+            'productions': len(productions),
+            'reduced': sum(self.covered(p) for p in productions),
+            'states': len(tables.action),
+            'entered': len({i // width for i, hit in enumerate(self.taken) if hit}),
+            'action_entries': len(counted),
+            'taken': sum(self.taken[s * width + t] for s, t in counted),
+            'error_entries': len(entries) - len(counted),
+            'uncovered': uncovered,
+        }
+
+
+class _Recorder:
+    # Stands in for a limits.Limits: notes the type of every token the
+    # parser reads, which for the mini-Python grammar is what its
+    # IndentLexer made of the stream rather than the stream itself
+    def __init__(self, number):
+        self.number = number
+        self.seen = []
+
+    def __bool__(self):
+        return True
+
+    def tokenfunc(self, lrparser, lexobj, token=None):
+        number, seen = self.number, self.seen
+
+        def recorded():
+            tok = (token or lexobj.token)()
+            seen.append(number[tok.type] if tok is not None else number['$end'])
+            return tok
+        return recorded
+
+
+class Checker:
+    # Parses inputs with the grammar's own Parser from their tokens. Each
+    # terminal gets one value (1 for a NUMBER, a line break for a NEWLINE,
+    # its lowercased name otherwise); the stream's text is the values with
+    # a blank between two on a line, so every line starts at column 0 and
+    # an INDENT or DEDENT reaches the parser only where the input has one.
+    # A production whose action reports a syntax error itself (such as the
+    # mini-Python grammar's unexpected_indent) makes a sentence the tables
+    # accept one the parser rejects, so its reduction counts as a reject.
+    def __init__(self, grammar, tables):
+        modules = grammar.load()
+        self.tables = tables
+        self.reporting = [p for p, prod in enumerate(tables.productions)
+                          if prod.func and '.syntax(' in
+                          inspect.getsource(getattr(modules['parser'], prod.func))]
+        self.profile = Profile()
+        self.recorder = _Recorder(tables.number)
+        self.parser = modules['parser'].Parser(profile=self.profile, limits=self.recorder)
+        self.names = tables.symbols[:tables.width]
+        self.values = [1 if name == 'NUMBER' else '\n' if name == 'NEWLINE' else name.lower()
+                       for name in self.names]
+
+    def stream(self, tokens):
+        stream = TokenStream(self.names, '')
+        texts, starts, lengths, lines = [], [], [], []
+        pos, line = 0, 1
+        for t in tokens:
+            text = str(self.values[t])
+            if texts and texts[-1] != '\n':
+                texts.append(' ')
+                pos += 1
+            starts.append(pos)
+            lengths.append(len(text))
+            lines.append(line)
+            texts.append(text)
+            pos += len(text)
+            line += text == '\n'
+        stream.data = ''.join(texts)
+        stream.types = array('B', tokens)
+        stream.starts = array('I', starts)
+        stream.lengths = array('I', lengths)
+        stream.lines = array('I', lines)
+        stream.value_ids = array('I', tokens)
+        stream.values = self.values
+        stream.lineno = line
+        return stream
+
+    def check(self, tokens, accepted):
+        # None if the Parser agrees with the tables, else a finding. tokens
+        # end with $end. The tables are asked again, about the tokens the
+        # parser read, when those differ or a reporting production may
+        # have been reduced.
+        diagnostics = Diagnostics(max_errors=None)
+        seen = self.recorder.seen
+        seen.clear()
+        try:
+            self.parser.parse_tokens(self.stream(tokens[:-1]), diagnostics)
+        except Exception as e:
+            verdict = f'raised {type(e).__name__}: {e}'
+        else:
+            if seen != tokens or self.reporting:
+                tokens = seen[:]
+                scratch = Coverage(self.tables)
+                accepted = recognize(self.tables, tokens, scratch)
+                accepted = accepted and not any(scratch.reduced[p] for p in self.reporting)
+            verdict = 'reject' if any(d.kind == 'syntax' for d in diagnostics) else 'accept'
+            if verdict == ('accept' if accepted else 'reject'):
+                return None
+        return {'input': self.tables.names(tokens[:-1]),
+                'tables': 'accept' if accepted else 'reject', 'parser': verdict}
+
+
+def fuzz(grammar, inputs, seconds, seed, max_tokens, invalid, check_every):
+    tables = Tables(grammar.directory)
+    coverage = Coverage(tables)
+    gen = Generator(tables, random.Random(seed))
+    checker = Checker(grammar, tables) if check_every else None
+    random_ = gen.rng.random
+    end = tables.end
+    findings = []
+    problems = valid = checked = count = 0
+    start = time.perf_counter()
+    deadline = start + seconds if seconds else None
+    while count < inputs:
+        if not count % REFRESH_EVERY:
+            gen.prefer(coverage.reduced)
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        tokens = gen.sentence(1 + int(random_() * max_tokens))
+        if random_() < invalid:
+            tokens = gen.mutate(tokens)
+        tokens.append(end)
+        accepted = recognize(tables, tokens, coverage)
+        valid += accepted
+        if checker is not None and not count % check_every:
+            checked += 1
+            finding = checker.check(tokens, accepted)
+            if finding is not None:
+                problems += 1
+                if len(findings) < MAX_FINDINGS:
+                    findings.append(finding)
+        count += 1
+    elapsed = time.perf_counter() - start
+    if checker is not None:
+        coverage.parsed.update(checker.profile.reductions)
+    return {'inputs': count, 'seconds': round(elapsed, 3), 'valid': valid,
+            'checked': checked, 'problems': problems, 'findings': findings,
+            'coverage': coverage.as_dict()}
+
+
+def main_sh_cases():
+    # The arithmetic cases of `main.sh -t`, valid and invalid
+    with open(MAIN_SH) as f:
+        text = f.read()
+    cases = []
+    for block in re.findall(r'declare -a (?:expression|error)_tests=\((.*?)\n\s*\)', text, re.S):
+        cases += re.findall(r'"([^"]*)"', block)
+    return cases
+
+
+def arithmetic(count, seed, max_tokens, invalid):
+    # count distinct expression lines over parser.sh's tokens, some spaced
+    # out and some not
+    mini = registry.get('minipython')
+    tables = Tables(mini.directory)
+    rng = random.Random(seed)
+    gen = Generator(tables, rng, start='expression', alphabet=ARITHMETIC)
+    lines = dict.fromkeys(main_sh_cases())
+    for _ in range(count * 10):
+        if len(lines) >= count:
+            break
+        tokens = gen.sentence(1 + int(rng.random() * max_tokens))
+        if rng.random() < invalid:
+            tokens = gen.mutate(tokens)
+        words = []
+        for t in tokens:
+            text = ARITHMETIC[tables.symbols[t]]
+            words.append(text if text is not None else str(rng.randrange(10 ** rng.randint(1, 4))))
+        line = (' ' if rng.random() < 0.5 else '').join(words)
+        if line.strip():
+            lines[line] = None
+    return list(lines)
+
+
+def main_sh_verdicts(lines):
+    # parser.sh's accept or reject of each line, through `main.sh -b`
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'expressions.txt')
+        with open(path, 'w') as f:
+            f.write(''.join(line + '\n' for line in lines))
+        proc = subprocess.run(['bash', MAIN_SH, '-b', '-f', path, '-g', 'expression'],
+                              cwd=registry.ROOT, capture_output=True, text=True)
+    verdicts = {}
+    for row in proc.stdout.splitlines():
+        fields = row.split('\t')
+        if fields[0].isdigit():
+            verdicts[lines[int(fields[0]) - 1]] = fields[2]
+    return verdicts
+
+
+def differential(count, seed, max_tokens, invalid):
+    lines = arithmetic(count, seed, max_tokens, invalid)
+    bash = main_sh_verdicts(lines)
+    wrappers = {'shell': '$(( {} ))', 'minipython': '{}\n'}
+    disagreements = []
+    accepted = 0
+    for line in lines:
+        verdicts = {'main.sh': bash.get(line, 'missing')}
+        for name, wrapper in wrappers.items():
+            _, diagnostics = registry.get(name).parse(wrapper.format(line))
+            rejected = any(d.kind in ('lexical', 'syntax') for d in diagnostics)
+            verdicts[name] = 'reject' if rejected else 'accept'
+        accepted += verdicts['main.sh'] == 'accept'
+        if len(set(verdicts.values())) > 1:
+            disagreements.append({'input': line, **verdicts})
+    return {'lines': len(lines), 'main_sh_cases': len(main_sh_cases()),
+            'main_sh_accepted': accepted, 'disagreements': disagreements}
+
+
+def report(name, r):
+    c = r['coverage']
+    rate = r['inputs'] / (r['seconds'] or 1e-9)
+    lines = [
+        f"{name}: {r['inputs']:,} inputs in {r['seconds']:.1f} s ({rate:,.0f}/s, "
+        f"{rate * 60 / 1e6:.1f}M/min), {r['valid'] / max(r['inputs'], 1):.0%} valid; "
+        f"{r['checked']:,} also parsed by the Parser, {r['problems']} disagreed or raised",
+        f"  productions {c['reduced']}/{c['productions']} reduced, "
+        f"states {c['entered']}/{c['states']} entered, action entries "
+        f"{c['taken']}/{c['action_entries']} taken ({c['error_entries']} more on the "
+        f"error token, used only in recovery)",
+    ]
+    for f in r['findings']:
+        lines.append(f"  tables {f['tables']}, parser {f['parser']}: {f['input']}")
+    if c['uncovered']:
+        lines.append('  never reduced:')
+    for u in c['uncovered']:
+        note = ', error recovery' if u['recovery'] else ''
+        lines.append(f"  {u['number']:>4} {u['production']}  "
+                     f"({u['function']}, {u['file']}:{u['line']}{note})")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog='python -m lexyacc.fuzz',
+                                 description=__doc__.splitlines()[0])
+    ap.add_argument('--grammars', nargs='+', metavar='NAME',
+                    help="grammars to fuzz (default: all registered)")
+    ap.add_argument('--inputs', type=int, default=200000,
+                    help="inputs per grammar (default: %(default)s)")
+    ap.add_argument('--seconds', type=float,
+                    help="stop each grammar after this long instead")
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--max-tokens', type=int, default=40,
+                    help="longest input, about (default: %(default)s)")
+    ap.add_argument('--invalid', type=float, default=0.3,
+                    help="fraction of inputs given a random edit (default: %(default)s)")
+    ap.add_argument('--check-every', type=int, default=100, metavar='K',
+                    help="parse every K'th input with the Parser too, 0 for none "
+                         "(default: %(default)s)")
+    ap.add_argument('--differential', type=int, default=1000, metavar='N',
+                    help="arithmetic lines to compare with parser.sh, 0 for none "
+                         "(default: %(default)s)")
+    ap.add_argument('--json', metavar='OUT', help="also write the results as JSON to OUT")
+    args = ap.parse_args(argv)
+    try:
+        grammars = [registry.get(name) for name in args.grammars or registry.names()]
+    except registry.UnknownGrammar as e:
+        ap.error(f'unknown grammar {e}')
+    inputs = sys.maxsize if args.seconds else args.inputs
+
+    results = {'grammars': {}}
+    status = 0
+    for grammar in grammars:
+        r = fuzz(grammar, inputs, args.seconds, args.seed, args.max_tokens, args.invalid,
+                 args.check_every)
+        results['grammars'][grammar.name] = r
+        status |= bool(r['problems'])
+        print(report(grammar.name, r))
+
+    if args.differential:
+        if shutil.which('bash') is None:
+            print('arithmetic: no bash here, parser.sh not compared')
+        else:
+            d = differential(args.differential, args.seed, args.max_tokens, args.invalid)
+            results['differential'] = d
+            print(f"arithmetic: {d['lines']} lines ({d['main_sh_cases']} from main.sh -t), "
+                  f"main.sh accepted {d['main_sh_accepted']}; "
+                  f"{len(d['disagreements'])} differ from parser.sh")
+            for x in d['disagreements']:
+                print(f"  {x['input']!r}: main.sh {x['main.sh']}, shell {x['shell']}, "
+                      f"minipython {x['minipython']}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# instrument.py
+# Opt-in profiling of the LALR parse loop.
+#
+# A Profile instruments a private copy of an LR parser instead of the parse
+# loop itself: the rows of its action table count every lookup (so every
+# shift, per state), each production's callable is wrapped to count and
+# time its reductions, and tokens are pulled through a timed tokenfunc.
+# Uninstrumented parsers keep the original tables and callables, so a run
+# without a Profile executes exactly the code it did before.
+#
+# Production numbers are indexes into parser.productions, which are the
+# entries of _lr_productions in parsetab.py.
+import copy
+import json
+from collections import Counter, defaultdict
+from time import perf_counter
+
+
+class _Row(dict):
+    # One state's row of the action table; lookups are tallied
+    __slots__ = ('state', 'profile')
+
+    def get(self, key, default=None):
+        t = dict.get(self, key, default)
+        profile = self.profile
+        if t is None:
+            profile.error_actions += 1
+        elif t > 0:
+            profile.shifts[self.state] += 1
+            if key == 'error':
+                profile.error_shifts += 1
+        return t
+
+
+class Profile:
+    def __init__(self):
+        self.productions = []
+        self.parses = 0
+        self.parse_time = 0.0
+        self.shifts = Counter()             # state -> shifts out of it
+        self.reductions = Counter()         # production number -> reductions
+        self.action_time = defaultdict(float)
+        self.tokens = Counter()             # token type -> tokens lexed
+        self.token_time = defaultdict(float)
+        self.errors_reported = 0            # calls of the error function
+        self.error_actions = 0              # table lookups with no action
+        self.error_shifts = 0               # 'error' tokens shifted by an error rule
+
+    def instrument(self, lrparser):
+        # Returns a copy of lrparser whose tables and callables report here
+        parser = copy.copy(lrparser)
+        self.productions = lrparser.productions
+        action = {}
+        for state, row in lrparser.action.items():
+            action[state] = row = _Row(row)
+            row.state, row.profile = state, self
+        parser.action = action
+        parser.productions = [self._production(n, prod)
+                              for n, prod in enumerate(lrparser.productions)]
+        return parser
+
+    def _production(self, number, prod):
+        prod = copy.copy(prod)
+        func = prod.callable
+        if func is None:
+            return prod
+        reductions, action_time = self.reductions, self.action_time
+
+        def reduce(p):
+            start = perf_counter()
+            try:
+                func(p)
+            finally:
+                action_time[number] += perf_counter() - start
+                reductions[number] += 1
+        prod.callable = reduce
+        return prod
+
+    def errorfunc(self, func):
+        def error(tok):
+            self.errors_reported += 1
+            return func(tok)
+        return error
+
+    def tokenfunc(self, lexobj):
+        tokens, token_time = self.tokens, self.token_time
+
+        def token():
+            start = perf_counter()
+            tok = lexobj.token()
+            kind = tok.type if tok is not None else '$end'
+            token_time[kind] += perf_counter() - start
+            tokens[kind] += 1
+            return tok
+        return token
+
+    def timed(self, func, *args, **kwargs):
+        # Runs one parse and adds it to the totals
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.parse_time += perf_counter() - start
+            self.parses += 1
+
+    def as_dict(self):
+        productions = []
+        for n, prod in enumerate(self.productions):
+            productions.append({
+                'number': n, 'production': prod.str, 'function': prod.func,
+                'file': prod.file, 'line': prod.line,
+                'reductions': self.reductions[n], 'seconds': self.action_time[n],
+            })
+        lexed = sum(n for kind, n in self.tokens.items() if kind != '$end')
+        shifted = sum(self.shifts.values()) - self.error_shifts
+        return {
+            'parses': self.parses,
+            'parse_seconds': self.parse_time,
+            'shifts': sum(self.shifts.values()),
+            'shifts_by_state': {str(s): n for s, n in sorted(self.shifts.items())},
+            'reductions': sum(self.reductions.values()),
+            'action_seconds': sum(self.action_time.values()),
+            'productions': productions,
+            'tokens': {kind: {'count': n, 'seconds': self.token_time[kind]}
+                       for kind, n in self.tokens.most_common()},
+            'lex_seconds': sum(self.token_time.values()),
+            'errors': {
+                'reported': self.errors_reported,
+                'error_actions': self.error_actions,
+                'error_shifts': self.error_shifts,
+                'discarded_tokens': max(lexed - shifted, 0),
+            },
+        }
+
+    def dump(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=1)
+
+    def report(self, top=20):
+        d = self.as_dict()
+        total = d['parse_seconds'] or 1e-12
+        lines = [
+            f"parses {d['parses']}, {d['parse_seconds'] * 1000:.1f} ms: "
+            f"lexing {d['lex_seconds'] * 1000:.1f} ms ({d['lex_seconds'] / total:.0%}), "
+            f"actions {d['action_seconds'] * 1000:.1f} ms ({d['action_seconds'] / total:.0%})",
+            f"shifts {d['shifts']:,}, reductions {d['reductions']:,}",
+            '',
+            f"{'#':>3} {'reductions':>10} {'ms':>9} {'us/red':>7}  production (function)",
+        ]
+        ranked = sorted(d['productions'], key=lambda p: (-p['seconds'], p['number']))
+        for p in ranked[:top]:
+            if not p['reductions']:
+                break
+            per = p['seconds'] / p['reductions'] * 1e6
+            lines.append(f"{p['number']:>3} {p['reductions']:>10,} {p['seconds'] * 1000:>9.2f} "
+                         f"{per:>7.2f}  {p['production']} ({p['function']})")
+        lines += ['', f"{'token':<14} {'count':>10} {'ms':>9}"]
+        for kind, t in d['tokens'].items():
+            lines.append(f"{kind:<14} {t['count']:>10,} {t['seconds'] * 1000:>9.2f}")
+        busiest = sorted(self.shifts.items(), key=lambda s: -s[1])[:5]
+        lines += ['', 'busiest states (shifts): ' +
+                  ', '.join(f'{s}: {n:,}' for s, n in busiest)]
+        e = d['errors']
+        lines.append(f"error recovery: {e['reported']} reported, {e['error_actions']} error actions, "
+                     f"{e['error_shifts']} error tokens shifted, {e['discarded_tokens']} tokens discarded")
+        return '\n'.join(lines)
@@ -0,0 +1,62 @@
+# limits.py
+# Bounds on one parse, for inputs nobody has looked at.
+#
+# Nothing in a parse recurses, but a generated or hostile input can still
+# make one arbitrarily large or slow: the parser stack grows with every
+# level of nesting, and the tokens of a huge input all pass through the
+# parse loop. A Parser given Limits (Parser(limits=Limits(...))) stops a
+# parse that goes past one: the parse reports a 'limit' diagnostic where it
+# stopped and returns what it had collected, like one that reaches the most
+# errors allowed.
+#
+# The checks run once per token the parser reads, in the function it reads
+# tokens through: a count, the length of the parser's symbol stack, and
+# every 1024 tokens the clock. The stack only grows by shifting a token (a
+# reduction never leaves it longer by more than one symbol), so checking it
+# per token bounds it. Its length is the nesting depth as the parser sees
+# it: a few entries per open parenthesis or block, plus the statement being
+# read. A parse without Limits does none of this.
+from time import perf_counter
+
+# Tokens between two looks at the clock, minus one (a mask)
+_CLOCK_EVERY = 1023
+
+
+class Limits:
+    def __init__(self, max_depth=None, max_tokens=None, max_time=None):
+        self.max_depth = max_depth      # parser stack entries
+        self.max_tokens = max_tokens    # tokens read, per parse
+        self.max_time = max_time        # seconds, per parse
+
+    def __bool__(self):
+        return any(v is not None for v in (self.max_depth, self.max_tokens, self.max_time))
+
+    def __repr__(self):
+        return (f'Limits(max_depth={self.max_depth}, max_tokens={self.max_tokens}, '
+                f'max_time={self.max_time})')
+
+    def tokenfunc(self, lrparser, lexobj, token=None):
+        # The function for lrparser to read the tokens of one parse with:
+        # token (by default lexobj.token, looked up on every call since
+        # input() may replace it) with the checks in front. A limit passed
+        # is reported to lexobj's diagnostics, whose limit() ends the parse.
+        max_depth = self.max_depth
+        max_tokens = self.max_tokens
+        deadline = None
+        if self.max_time is not None:
+            deadline = perf_counter() + self.max_time
+        count = 0
+        last = None
+
+        def limited():
+            nonlocal count, last
+            count += 1
+            if max_tokens is not None and count > max_tokens:
+                lexobj.diagnostics.limit(f'more than {max_tokens} tokens', lexobj, last)
+            if max_depth is not None and len(lrparser.symstack) > max_depth:
+                lexobj.diagnostics.limit(f'nesting deeper than {max_depth}', lexobj, last)
+            if deadline is not None and not count & _CLOCK_EVERY and perf_counter() > deadline:
+                lexobj.diagnostics.limit(f'longer than {self.max_time} s', lexobj, last)
+            last = (token or lexobj.token)()
+            return last
+        return limited
@@ -0,0 +1,155 @@
+# registry.py
+# Grammars by name, loaded on first use.
+#
+# Each grammar lives in a directory of flat modules that import each
+# other by bare name (lexer, parser, ...), and the directories use the
+# same names. What they have in common (diagnostics, frozen tables, ...)
+# is one copy in this package, imported as lexyacc.<module> and shared by
+# every grammar. load() imports a grammar with its directory first on
+# sys.path and none of those names in sys.modules, keeps the modules it
+# got in Grammar.modules and takes them out of sys.modules again, putting
+# back whatever was there. The modules hold on to each other through
+# their own globals, so any number of grammars work side by side in one
+# process, and a grammar nobody asks for is never imported: registering
+# one costs nothing, loading it costs its import and frozen tables (see
+# frozen.py).
+#
+# A grammar's parser() returns an object with parse(data) -> (tree,
+# diagnostics), whatever the grammar's own Parser returns; the tree is None
+# for grammars that don't build one. Parser objects are not thread-safe:
+# use one per thread, as with the grammars' own Parser.
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_grammars = {}
+_aliases = {}
+_load_lock = threading.Lock()
+
+
+class UnknownGrammar(KeyError):
+    pass
+
+
+class Grammar:
+    def __init__(self, name, directory, make_parser, entries=('parser',), extensions=(),
+                 aliases=(), description=''):
+        self.name = name
+        self.directory = directory          # absolute path of its modules
+        self.make_parser = make_parser      # (modules, **options) -> parser
+        self.entries = tuple(entries)       # the modules load() imports
+        self.extensions = tuple(extensions)
+        self.aliases = tuple(aliases)
+        self.description = description
+        self.modules = None                 # name -> module, once loaded
+        self.load_time = None               # seconds load() took
+        self._default = None
+
+    @property
+    def loaded(self):
+        return self.modules is not None
+
+    def load(self):
+        # The grammar's modules by name, imported the first time
+        if self.modules is None:
+            with _load_lock:
+                if self.modules is None:
+                    start = time.perf_counter()
+                    self.modules = _import_isolated(self.directory, self.entries)
+                    self.load_time = time.perf_counter() - start
+        return self.modules
+
+    def parser(self, **options):
+        # A new parser; options go to the grammar's Parser
+        return self.make_parser(self.load(), **options)
+
+    def parse(self, data, diagnostics=None):
+        # (tree, diagnostics) from a parser kept for these one-off calls
+        if self._default is None:
+            self._default = self.parser()
+        return self._default.parse(data, diagnostics)
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f'<Grammar {self.name} ({state})>'
+
+
+def _import_isolated(directory, entries):
+    # Imports the entries modules from directory and returns every module
+    # of that directory they pulled in, leaving sys.modules as it found it
+    names = {f[:-3] for f in os.listdir(directory) if f.endswith('.py')}
+    saved = {n: sys.modules.pop(n) for n in names if n in sys.modules}
+    sys.path.insert(0, directory)
+    try:
+        for entry in entries:
+            __import__(entry)
+        return {n: sys.modules[n] for n in names if n in sys.modules}
+    finally:
+        sys.path.remove(directory)
+        for n in names:
+            sys.modules.pop(n, None)
+        sys.modules.update(saved)
+
+
+class _DiagnosticsOnly:
+    # Adapts a Parser whose parse() returns only the diagnostics
+    def __init__(self, parser):
+        self.parser = parser
+
+    def parse(self, data, diagnostics=None):
+        return None, self.parser.parse(data, diagnostics)
+
+
+def register(name, directory, make_parser, entries=('parser',), extensions=(), aliases=(),
+             description=''):
+    # Adds a grammar; directory is relative to the repository root unless
+    # absolute. Nothing is imported until the grammar is used, and then
+    # only the entries modules and what they import.
+    if name in _grammars or name in _aliases:
+        raise ValueError(f'grammar {name!r} is already registered')
+    grammar = Grammar(name, os.path.join(ROOT, directory), make_parser, entries,
+                      extensions, aliases, description)
+    _grammars[name] = grammar
+    for alias in grammar.aliases:
+        _aliases[alias] = name
+    return grammar
+
+
+def get(name):
+    try:
+        return _grammars[_aliases.get(name, name)]
+    except KeyError:
+        raise UnknownGrammar(name) from None
+
+
+def names():
+    return list(_grammars)
+
+
+def for_path(path):
+    # The grammar whose extensions the file name ends with, or None
+    for grammar in _grammars.values():
+        if path.endswith(grammar.extensions):
+            return grammar
+    return None
+
+
+def parse(name, data, diagnostics=None):
+    return get(name).parse(data, diagnostics)
+
+
+register('shell', 'Python',
+         lambda m, **options: m['parser'].Parser(m['fastlex'].lexer, **options),
+         entries=('parser', 'fastlex'), extensions=('.sh',), aliases=('Python',),
+         description='shell commands, if/for blocks and $(( )) arithmetic; builds a tree')
+register('minipython', 'Arnav',
+         lambda m, **options: _DiagnosticsOnly(m['parser'].Parser(**options)),
+         extensions=('.py',), aliases=('Arnav', 'mini-python'),
+         description='mini-Python: assignments, expressions, if, while, def')
+register('java', 'Khush',
+         lambda m, **options: _DiagnosticsOnly(m['parser'].Parser(**options)),
+         extensions=('.java',), aliases=('Khush',),
+         description='Java compilation units: declarations indexed, statements skipped')
@@ -0,0 +1,358 @@
+"""A long-running parse server for every registered grammar.
+
+    python -m lexyacc.server [--socket PATH | --host HOST --port N] [--jobs N]
+                             [--batch-size N] [--max-bytes N] [--time-limit S]
+                             [--max-depth N] [--max-tokens N]
+                             [--queue N] [--grammars NAME ...]
+
+Clients send JSON lines and get one JSON line back per request, tagged with
+the request's id (replies on one connection may come back out of order):
+
+    {"id": 1, "grammar": "shell", "text": "echo hi | wc -l"}
+    -> {"id": 1, "ok": true, "errors": [], "parse_ms": 0.05, "latency_ms": 0.9}
+    {"id": 2, "op": "stats"}
+    -> {"id": 2, "stats": {"requests": ..., "latency_ms": {"p50": ...}, ...}}
+
+Parsing happens in a pool of worker processes whose grammars are loaded when
+they start, so no request pays for imports or tables. Requests wait in one
+bounded queue; whenever a worker is free the requests queued by then (up to
+--batch-size of them, and about 64 KB of text) go to it as one batch, so
+under load a task carries many small parses and at low load nothing waits
+for a batch to fill. A full queue stops the server reading from the
+connections that feed it, and each connection has a bounded number of
+requests in flight, so a fast client slows down instead of growing memory.
+A request larger than --max-bytes is refused; one that runs longer than
+--time-limit in its worker is stopped there and answered with an error.
+One that nests deeper than --max-depth or has more than --max-tokens tokens
+is stopped by the parser (see limits.py) and
+answered with a 'limit' diagnostic.
+
+Stats are also written to stderr when the server stops (SIGINT/SIGTERM).
+"""
+import argparse
+import asyncio
+import collections
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from . import registry
+from .limits import Limits
+
+BATCH_BYTES = 64 << 10
+CONNECTION_IN_FLIGHT = 256
+
+
+# ---- worker side --------------------------------------------------------
+
+class TimeLimit(Exception):
+    pass
+
+
+_time_limit = None
+_parsers = {}
+
+
+def _expired(signum, frame):
+    raise TimeLimit()
+
+
+def init_worker(grammars, time_limit, max_depth=None, max_tokens=None):
+    # Loads the grammars up front: the tables are warm before any request
+    global _time_limit
+    _time_limit = time_limit
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # the server shuts down the pool
+    signal.signal(signal.SIGALRM, _expired)
+    for name in grammars:
+        grammar = registry.get(name)
+        limits = Limits(max_depth, max_tokens)
+        _parsers[name] = grammar.parser(limits=limits) if limits else grammar
+
+
+def parse_batch(requests):
+    # [(grammar, text)] -> one reply dict per request, in order
+    replies = []
+    for name, text in requests:
+        start = time.perf_counter()
+        if _time_limit:
+            signal.setitimer(signal.ITIMER_REAL, _time_limit)
+        try:
+            _, diagnostics = _parsers[name].parse(text)
+        except TimeLimit:
+            replies.append({'ok': False, 'error': 'time limit exceeded'})
+            continue
+        finally:
+            if _time_limit:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        errors = [d.as_dict() for d in diagnostics]
+        replies.append({'ok': not errors, 'errors': errors,
+                        'parse_ms': round((time.perf_counter() - start) * 1000, 3)})
+    return replies
+
+
+# ---- server side --------------------------------------------------------
+
+class Stats:
+    # Counters since start, and the latencies of the last window requests
+    def __init__(self, window=10000):
+        self.started = time.monotonic()
+        self.counts = collections.Counter()
+        self.latencies = collections.deque(maxlen=window)
+        self.bytes = 0
+        self.batches = 0
+        self.batched = 0
+
+    def record(self, outcome, latency):
+        self.counts['requests'] += 1
+        self.counts[outcome] += 1
+        self.latencies.append(latency)
+
+    def as_dict(self, queued=0):
+        uptime = time.monotonic() - self.started
+        latencies = sorted(self.latencies)
+        percentiles = {}
+        if latencies:
+            for q in (50, 90, 99):
+                percentiles[f'p{q}'] = round(latencies[(len(latencies) - 1) * q // 100] * 1000, 3)
+            percentiles['max'] = round(latencies[-1] * 1000, 3)
+        return {
+            'uptime_s': round(uptime, 3),
+            'requests': self.counts['requests'],
+            'ok': self.counts['ok'],
+            'failed': self.counts['failed'],
+            'refused': self.counts['refused'],
+            'timeouts': self.counts['timeout'],
+            'bytes': self.bytes,
+            'requests_per_s': round(self.counts['requests'] / uptime, 1) if uptime else 0.0,
+            'batches': self.batches,
+            'mean_batch': round(self.batched / self.batches, 2) if self.batches else 0.0,
+            'queued': queued,
+            'latency_ms': percentiles,
+        }
+
+
+class ParseServer:
+    def __init__(self, jobs=None, batch_size=32, max_bytes=1 << 20, time_limit=5.0,
+                 queue_size=1024, grammars=None, max_depth=None, max_tokens=None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.max_tokens = max_tokens
+        self.grammars = list(grammars or registry.names())
+        self.stats = Stats()
+        self._queue = asyncio.Queue(queue_size)
+        # Two batches per worker in flight: one running, one ready to go
+        self._slots = asyncio.Semaphore(2 * self.jobs)
+        self._tasks = set()
+        self._pool = self._start_pool()
+
+    def _start_pool(self):
+        return ProcessPoolExecutor(self.jobs, initializer=init_worker,
+                                   initargs=(self.grammars, self.time_limit,
+                                             self.max_depth, self.max_tokens))
+
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def parse(self, grammar, text):
+        # The reply for one request; waits while the queue is full
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((grammar, text, future))
+        return await future
+
+    async def batcher(self):
+        # Hands whatever is queued to the next free slot, one batch at a time
+        while True:
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            size = len(batch[0][1])
+            while len(batch) < self.batch_size and size < BATCH_BYTES:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                batch.append(item)
+                size += len(item[1])
+            self.stats.batches += 1
+            self.stats.batched += len(batch)
+            self._spawn(self._run(batch))
+
+    async def _run(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            replies = await loop.run_in_executor(
+                self._pool, parse_batch, [(grammar, text) for grammar, text, _ in batch])
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # A worker died (killed, out of memory); start a fresh pool
+                self._pool = self._start_pool()
+            replies = [{'ok': False, 'error': 'worker failed'} for _ in batch]
+        finally:
+            self._slots.release()
+        for (_, _, future), reply in zip(batch, replies):
+            if not future.done():
+                future.set_result(reply)
+
+    async def handle(self, reader, writer):
+        # One connection: reads requests while fewer than
+        # CONNECTION_IN_FLIGHT of its own are unanswered
+        in_flight = asyncio.Semaphore(CONNECTION_IN_FLIGHT)
+        pending = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the stream limit: the rest of the line
+                    # cannot be found, so the connection is closed
+                    self._reply(writer, {'ok': False, 'error': 'request too large'}, None)
+                    self.stats.record('refused', 0.0)
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                received = time.monotonic()
+                await in_flight.acquire()
+                task = self._spawn(self._answer(line, writer, received))
+                task.add_done_callback(lambda _: in_flight.release())
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _answer(self, line, writer, received):
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+        except (ValueError, AttributeError):
+            self._reply(writer, {'ok': False, 'error': 'bad request'}, None)
+            self.stats.record('refused', time.monotonic() - received)
+            return
+        if request.get('op') == 'stats':
+            self._reply(writer, {'stats': self.stats.as_dict(self._queue.qsize())}, request_id)
+            await writer.drain()
+            return
+
+        text = request.get('text')
+        try:
+            grammar = registry.get(request.get('grammar'))
+        except (registry.UnknownGrammar, TypeError):
+            reply, outcome = {'ok': False, 'error': 'unknown grammar'}, 'refused'
+        else:
+            if not isinstance(text, str):
+                reply, outcome = {'ok': False, 'error': 'text missing'}, 'refused'
+            elif len(text.encode()) > self.max_bytes:
+                reply, outcome = {'ok': False, 'error': 'request too large'}, 'refused'
+            elif grammar.name not in self.grammars:
+                reply, outcome = {'ok': False, 'error': 'grammar not served'}, 'refused'
+            else:
+                self.stats.bytes += len(text)
+                reply = await self.parse(grammar.name, text)
+                if 'errors' in reply:
+                    outcome = 'ok' if reply['ok'] else 'failed'
+                elif reply.get('error') == 'time limit exceeded':
+                    outcome = 'timeout'
+                else:
+                    outcome = 'failed'
+        latency = time.monotonic() - received
+        reply['latency_ms'] = round(latency * 1000, 3)
+        self.stats.record(outcome, latency)
+        self._reply(writer, reply, request_id)
+        # A client that does not read its replies stops being read from
+        await writer.drain()
+
+    def _reply(self, writer, reply, request_id):
+        if writer.is_closing():
+            return
+        writer.write(json.dumps(dict(reply, id=request_id)).encode() + b'\n')
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def serve(args):
+    server = ParseServer(args.jobs, args.batch_size, args.max_bytes, args.time_limit,
+                         args.queue, args.grammars, args.max_depth, args.max_tokens)
+    # Room for the largest request after JSON escaping
+    limit = 2 * args.max_bytes + 4096
+    if args.socket:
+        listener = await asyncio.start_unix_server(server.handle, args.socket, limit=limit)
+        where = args.socket
+    else:
+        listener = await asyncio.start_server(server.handle, args.host, args.port, limit=limit)
+        where = '{}:{}'.format(*listener.sockets[0].getsockname()[:2])
+    # Start the workers (and so load the tables) before saying we are ready
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(server._pool, parse_batch, [])
+                           for _ in range(server.jobs)))
+    batcher = asyncio.ensure_future(server.batcher())
+
+    stop = loop.create_future()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set_result, None)
+    print(f'listening on {where} ({server.jobs} workers, grammars: '
+          f"{', '.join(server.grammars)})", file=sys.stderr, flush=True)
+    try:
+        await stop
+    finally:
+        listener.close()
+        batcher.cancel()
+        server.close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+        print(json.dumps({'stats': server.stats.as_dict()}), file=sys.stderr)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog='python -m lexyacc.server',
+                                 description=__doc__.splitlines()[0])
+    ap.add_argument('--socket', metavar='PATH', help="listen on this Unix socket")
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=7878,
+                    help="TCP port, without --socket (default: %(default)s; 0 picks one)")
+    ap.add_argument('--jobs', type=int, default=None,
+                    help="worker processes (default: one per CPU)")
+    ap.add_argument('--batch-size', type=int, default=32,
+                    help="most requests sent to a worker at once (default: %(default)s)")
+    ap.add_argument('--max-bytes', type=int, default=1 << 20,
+                    help="largest text accepted (default: %(default)s)")
+    ap.add_argument('--time-limit', type=float, default=5.0,
+                    help="seconds a parse may run in its worker, 0 for none (default: %(default)s)")
+    ap.add_argument('--max-depth', type=int, metavar='N',
+                    help="stop a parse whose parser stack gets deeper than N (default: none)")
+    ap.add_argument('--max-tokens', type=int, metavar='N',
+                    help="stop a parse after N tokens (default: none)")
+    ap.add_argument('--queue', type=int, default=1024,
+                    help="requests waiting for a worker before reading pauses "
+                         "(default: %(default)s)")
+    ap.add_argument('--grammars', nargs='+', metavar='NAME',
+                    help="grammars to serve (default: all registered)")
+    args = ap.parse_args(argv)
+    if args.grammars:
+        try:
+            args.grammars = [registry.get(name).name for name in args.grammars]
+        except registry.UnknownGrammar as e:
+            ap.error(f'unknown grammar {e}')
+    asyncio.run(serve(args))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# stream.py
+# Lexing a file in chunks, for inputs too large to hold as one string.
+#
+# StreamLexer reads a text file a chunk at a time and runs an ordinary lexer
+# (PLY's or fastlex's) over each chunk in turn, so the parser gets the same
+# tokens as from lexer.input(whole file) while only one chunk of text is in
+# memory. Chunks are cut just after a run of newlines that is outside any
+# quotes: in the shell and mini-Python grammars no token spans such a point
+# (only a shell string or newline run can contain a newline), so every
+# chunk lexes exactly as that stretch of the whole file does, and each one
+# starts a line. A grammar with other tokens that can hold a newline passes
+# a cut function of its own (see Khush/lexer.py).
+#
+# lexpos of the tokens is moved to file offsets; lineno carries over from
+# chunk to chunk in the wrapped lexer. lexdata is the current chunk and
+# lexoffset its offset in the file, which is what diagnostics.find_column
+# needs: the parser reports a syntax error on the token just read, which is
+# always in the current chunk.
+import re
+from functools import partial
+
+CHUNK_SIZE = 1 << 20
+
+_QUOTE = re.compile(r'''["']''')
+
+
+def safe_cut(data):
+    # The offset of the last safe cut in data, 0 if there is none. Steps
+    # from string to string with find, so it costs a loop iteration per
+    # string rather than per line and allocates nothing; a quote that does
+    # not close within data ends the search, since no cut after it is safe
+    # yet. A newline run that reaches the end of data may go on in the next
+    # read, so only the text before it is looked at.
+    end = len(data)
+    while end and data[end - 1] == '\n':
+        end -= 1
+    cut = pos = 0
+    while True:
+        m = _QUOTE.search(data, pos, end)
+        limit = end if m is None else m.start()
+        newline = data.rfind('\n', pos, limit)
+        if newline >= 0:
+            cut = newline + 1
+        if m is None:
+            return cut
+        close = data.find(m.group(), limit + 1, end)
+        if close < 0:
+            return cut
+        pos = close + 1
+
+
+class StreamLexer:
+    def __init__(self, lexobj, f, chunk_size=CHUNK_SIZE, cut=safe_cut):
+        self.lexer = lexobj             # lexes each chunk
+        self.lexoffset = 0
+        self._cut = cut                 # like safe_cut: where data may end a chunk
+        self._tokens = self._scan(f, chunk_size)
+        self.token = partial(next, self._tokens, None)
+
+    @property
+    def diagnostics(self):
+        return self.lexer.diagnostics
+
+    @property
+    def lexdata(self):
+        return self.lexer.lexdata
+
+    @property
+    def lexpos(self):
+        return self.lexer.lexpos
+
+    @property
+    def lineno(self):
+        return self.lexer.lineno
+
+    def __iter__(self):
+        return self._tokens
+
+    def _scan(self, f, chunk_size):
+        lexobj = self.lexer
+        safe_cut = self._cut
+        pending = ''
+        while True:
+            data = f.read(chunk_size)
+            pieces = [pending, data]
+            # No safe cut yet: keep reading, in ever larger pieces so a very
+            # long string or line costs linear time
+            size = chunk_size
+            while data:
+                cut = safe_cut(''.join(pieces))
+                if cut:
+                    break
+                size *= 2
+                data = f.read(size)
+                pieces.append(data)
+            text = ''.join(pieces)
+            if not data:
+                cut = len(text)
+            chunk, pending = text[:cut], text[cut:]
+            del text, pieces
+
+            offset = self.lexoffset
+            lexobj.input(chunk)
+            for tok in iter(lexobj.token, None):
+                tok.lexpos += offset
+                yield tok
+            if not data:
+                return
+            self.lexoffset = offset + cut
@@ -0,0 +1,247 @@
+# tokenstream.py
+# A lexed token stream kept as flat arrays, for feeding the parser again
+# without lexing again.
+#
+# scan() runs a lexer over the text once and records each token as numbers:
+# its type as a small int (its index in the grammar's tokens list), its
+# lexpos and length in the text, its line, and its value as an index into a
+# table of the distinct values. Equal values are stored once, and replaying
+# hands the parser that one object every time. Each array has the smallest
+# item size (one, two or four bytes) its largest number fits in, so a token
+# costs ten to fourteen bytes plus its share of the text and the value
+# table, however often the same names and numbers recur (texts up to 4 GiB).
+# to_bytes() writes the arrays as their raw bytes, so from_bytes() is a few
+# memory copies rather than a parse, and the file can be made by one stage
+# (or process) and read by the next.
+#
+# TokenLexer replays a stream to the parser in place of a lexer: it builds
+# only the token objects the parser holds on its stack, with no regex or
+# rule function run, and has lexdata, lexpos and lineno for diagnostics. A
+# character the lexer rejected is recorded in the stream at its position,
+# so the replay reports it in the same order relative to syntax errors as
+# the original run did.
+#
+# The format is for caching between stages of one tool, not for exchange:
+# the value table is marshalled, so only load files this code wrote.
+import marshal
+import re
+from array import array
+from functools import partial
+
+MAGIC = b'LYTS'
+# Bump when the layout changes
+VERSION = 1
+
+ILLEGAL = '<illegal>'           # the type recorded for a rejected character
+
+_DIGITS = re.compile(r'\d+')
+
+# Item sizes the stored arrays are written with
+_ITEMSIZE = {'B': 1, 'H': 2, 'I': 4}
+
+
+class Token:
+    # What the parser needs of a LexToken, in less memory and quicker to
+    # make; lexer is set by PLY on the token passed to the error function
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __repr__(self):
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+
+class TokenStream:
+    def __init__(self, names, data):
+        self.names = list(names)        # type number -> token type
+        self.data = data                # the text the offsets point into
+        self.types = array('B')
+        self.starts = array('I')
+        self.lengths = array('I')
+        self.lines = array('I')
+        self.value_ids = array('I')
+        self.values = []                # distinct token values
+        self.lineno = 1                 # the lexer's lineno at the end
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        # (type, value, lineno, lexpos) of each token, rejected characters
+        # included as ILLEGAL
+        names, values = self.names, self.values
+        for kind, start, line, value in zip(self.types, self.starts, self.lines,
+                                            self.value_ids):
+            yield names[kind], values[value], line, start
+
+    def text(self, i):
+        # The source text of token i
+        start = self.starts[i]
+        return self.data[start:start + self.lengths[i]]
+
+    def _arrays(self):
+        return (self.types, self.starts, self.lengths, self.lines, self.value_ids)
+
+    def to_bytes(self):
+        return MAGIC + marshal.dumps((
+            VERSION, self.names, self.data, self.lineno,
+            tuple((a.typecode, a.tobytes()) for a in self._arrays()), self.values))
+
+    @classmethod
+    def from_bytes(cls, blob):
+        if blob[:len(MAGIC)] != MAGIC:
+            raise ValueError('not a token stream')
+        try:
+            fields = marshal.loads(memoryview(blob)[len(MAGIC):])
+        except (EOFError, TypeError, ValueError):
+            raise ValueError('truncated or corrupt token stream') from None
+        if fields[0] != VERSION:
+            raise ValueError(f'token stream version {fields[0]}, expected {VERSION}')
+        _, names, data, lineno, arrays, values = fields
+        self = cls(names, data)
+        (self.types, self.starts, self.lengths, self.lines,
+         self.value_ids) = (_array(typecode, raw) for typecode, raw in arrays)
+        self.values = values
+        self.lineno = lineno
+        return self
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def _array(typecode, raw):
+    a = array(typecode)
+    if a.itemsize != _ITEMSIZE[typecode]:
+        raise ValueError('token stream written on a different platform')
+    a.frombytes(raw)
+    return a
+
+
+def _packed(items):
+    # items in an array of the smallest typecode that holds the largest
+    top = max(items, default=0)
+    for typecode in 'BH':
+        if top < 1 << 8 * _ITEMSIZE[typecode]:
+            return array(typecode, items)
+    return array('I', items)
+
+
+class _Recorder:
+    # Stands in for the lexer's Diagnostics during a scan: a rejected
+    # character becomes an entry of the stream
+    def __init__(self, add):
+        self._add = add
+
+    def illegal(self, lexer, char):
+        self._add(ILLEGAL, char, lexer.lineno, lexer.lexpos, 1)
+
+
+def scan(lexobj, data, names):
+    # Lexes data once on a clone of lexobj (a PLY lexer or anything with
+    # the same interface) into a TokenStream whose type numbers follow
+    # names, the grammar's tokens list
+    stream = TokenStream(names, data)
+    numbers = {name: i for i, name in enumerate(stream.names)}
+    interned = {}
+    values = stream.values
+    # Lists while scanning (appending to them is quicker), arrays at the end
+    types, starts, lengths, lines, value_ids = [], [], [], [], []
+
+    def intern(value):
+        # Keyed by type as well, so 1 and '1' (or True) stay apart
+        key = (type(value), value)
+        vid = interned.get(key)
+        if vid is None:
+            vid = interned[key] = len(values)
+            values.append(value)
+        return vid
+
+    def number(kind):
+        n = numbers.get(kind)
+        if n is None:
+            n = numbers[kind] = len(stream.names)
+            stream.names.append(kind)
+        return n
+
+    def add(kind, value, lineno, lexpos, length):
+        types.append(number(kind))
+        starts.append(lexpos)
+        lengths.append(length)
+        lines.append(lineno)
+        value_ids.append(intern(value))
+
+    lexobj = lexobj.clone()
+    lexobj.diagnostics = _Recorder(add)
+    lexobj.lineno = 1
+    lexobj.input(data)
+    # The loop is add() written out, with the lookups cached per value
+    seen = {}               # (type, value) -> (type number, value id)
+    for tok in iter(lexobj.token, None):
+        start, value = tok.lexpos, tok.value
+        ids = seen.get((tok.type, value))
+        if ids is None:
+            ids = seen[tok.type, value] = number(tok.type), intern(value)
+        # PLY leaves lexpos just after the token. fastlex only moves it at
+        # line breaks and strings; for its other tokens the value is the
+        # text, or a number read from a run of digits.
+        end = lexobj.lexpos
+        if end <= start:
+            if isinstance(value, str):
+                end = start + len(value)
+            else:
+                end = _DIGITS.match(data, start).end()
+        types.append(ids[0])
+        starts.append(start)
+        lengths.append(end - start)
+        lines.append(tok.lineno)
+        value_ids.append(ids[1])
+    stream.lineno = lexobj.lineno
+    (stream.types, stream.starts, stream.lengths, stream.lines,
+     stream.value_ids) = map(_packed, (types, starts, lengths, lines, value_ids))
+    return stream
+
+
+class TokenLexer:
+    # Replays a TokenStream to the parser; diagnostics go to those of
+    # lexobj, the parser's own lexer
+    def __init__(self, lexobj, stream):
+        self.lexer = lexobj
+        self.stream = stream
+        self.lexdata = stream.data
+        self.lexoffset = 0
+        self.lexpos = 0
+        self.lineno = 1
+        self._tokens = self._replay()
+        self.token = partial(next, self._tokens, None)
+
+    @property
+    def diagnostics(self):
+        return self.lexer.diagnostics
+
+    def __iter__(self):
+        return self._tokens
+
+    def _replay(self):
+        stream = self.stream
+        names = stream.names
+        values = stream.values
+        illegal = names.index(ILLEGAL) if ILLEGAL in names else -1
+        for kind, start, line, value in zip(stream.types, stream.starts, stream.lines,
+                                            stream.value_ids):
+            if kind == illegal:
+                self.lexpos = start
+                self.lineno = line
+                self.lexer.diagnostics.illegal(self, values[value])
+                continue
+            tok = Token()
+            tok.type = names[kind]
+            tok.value = values[value]
+            tok.lineno = line
+            tok.lexpos = start
+            yield tok
+        self.lexpos = len(self.lexdata)
+        self.lineno = stream.lineno
@@ -36,6 +36,9 @@ show_help() {
     echo "  -g, --grammar TYPE      Specify grammar type (expression|sequence|declaration)"
     echo "  -t, --test              Run built-in test cases"
     echo "  -q, --quiet             Suppress debug output"
+    echo "  -b, --batch             With -f, print one compact result per line and a total"
+    echo "  -j, --jobs N            With --batch, split the file across N background workers"
+    echo "      --trace             With --batch, write the lexer and parser traces to stderr"
     echo
     echo -e "${YELLOW}Grammar Types:${NC}"
     echo "  expression, arithmetic  - Parse arithmetic expressions (3 + 4 * 2)"
@@ -47,6 +50,7 @@ show_help() {
     echo "  $0 -g expression        # Interactive with expression grammar"
     echo "  $0 -f input.txt -g sequence  # Parse file with sequence grammar"
     echo "  $0 -t                   # Run test cases"
+    echo "  $0 -b -f input.txt -g expression -j 4  # Validate a large file"
 }
 
 show_version() {
@@ -96,7 +100,7 @@ process_input() {
     fi
     
     if [[ "$quiet_mode" == "true" ]]; then
-        if parse_input "$input" "$grammar_type" 2>/dev/null; then
+        if QUIET=true parse_input "$input" "$grammar_type" 2>/dev/null; then
             echo -e "${GREEN}✓ ACCEPTED${NC}"
             return 0
         else
@@ -327,12 +331,109 @@ process_file() {
     return 0
 }
 
+# Batch mode: the whole file is checked in this one process (or in --jobs
+# background workers, each taking a contiguous share of the lines) with no
+# trace output, and each line gets one tab-separated result:
+#   <line number> <grammar> accept|reject <index of the token in error, or ->
+# followed by a total. Blank and comment lines are skipped, as in
+# process_file. A line seen before in the run reuses its result.
+declare -a BATCH_LINES=()
+declare -A BATCH_RESULTS=()
+BATCH_TOTAL=0
+BATCH_ACCEPTED=0
+
+batch_range() {
+    local grammar_type="$1"
+    local first="$2"
+    local last="$3"
+    local i line result
+    BATCH_TOTAL=0
+    BATCH_ACCEPTED=0
+    for ((i = first; i < last; i++)); do
+        line="${BATCH_LINES[i]}"
+        if [[ -z "$line" || "$line" =~ ^[[:space:]]*# ]]; then
+            continue
+        fi
+        BATCH_TOTAL=$((BATCH_TOTAL + 1))
+        result="${BATCH_RESULTS[$line]}"
+        if [[ -z "$result" ]]; then
+            # Traces (and the token list) go to stderr, out of the results
+            if parse_input "$line" "$grammar_type" >&2; then
+                result=$'accept\t-'
+            else
+                result=$'reject\t'"${PARSE_ERROR_INDEX:--}"
+            fi
+            BATCH_RESULTS[$line]="$result"
+        fi
+        if [[ "$result" == accept* ]]; then
+            BATCH_ACCEPTED=$((BATCH_ACCEPTED + 1))
+        fi
+        printf '%d\t%s\t%s\n' $((i + 1)) "$grammar_type" "$result"
+    done
+}
+
+run_batch() {
+    local filename="$1"
+    local grammar_type="$2"
+    local jobs="$3"
+    local trace="$4"
+
+    if [[ ! -f "$filename" ]]; then
+        echo -e "${RED}Error: File '$filename' not found.${NC}" >&2
+        return 2
+    fi
+    QUIET=true
+    if [[ "$trace" == true ]]; then
+        QUIET=false
+    fi
+
+    mapfile -t BATCH_LINES < "$filename"
+    local count=${#BATCH_LINES[@]}
+    local total=0
+    local accepted=0
+    if (( jobs <= 1 || count < jobs )); then
+        batch_range "$grammar_type" 0 "$count"
+        total=$BATCH_TOTAL
+        accepted=$BATCH_ACCEPTED
+    else
+        local tmp
+        tmp=$(mktemp -d) || return 2
+        local share=$(( (count + jobs - 1) / jobs ))
+        local k first last
+        for ((k = 0; k < jobs; k++)); do
+            first=$((k * share))
+            last=$(( first + share < count ? first + share : count ))
+            (
+                batch_range "$grammar_type" "$first" "$last" > "$tmp/$k"
+                echo "$BATCH_TOTAL $BATCH_ACCEPTED" > "$tmp/$k.totals"
+            ) &
+        done
+        wait
+        # Shares are contiguous, so their results in order are in line order
+        local worker_total worker_accepted
+        for ((k = 0; k < jobs; k++)); do
+            cat "$tmp/$k"
+            read -r worker_total worker_accepted < "$tmp/$k.totals"
+            total=$((total + worker_total))
+            accepted=$((accepted + worker_accepted))
+        done
+        rm -rf "$tmp"
+    fi
+
+    printf 'total\t%d lines\t%d accepted\t%d rejected\n' \
+        "$total" "$accepted" $((total - accepted))
+    (( accepted == total ))
+}
+
 main() {
     local interactive_mode=true
     local grammar_type=""
     local filename=""
     local run_tests=false
     local quiet_mode=false
+    local batch_mode=false
+    local jobs=1
+    local trace=false
     
     while [[ $# -gt 0 ]]; do
         case $1 in
@@ -366,6 +467,23 @@ main() {
                 quiet_mode=true
                 shift
                 ;;
+            -b|--batch)
+                batch_mode=true
+                interactive_mode=false
+                shift
+                ;;
+            -j|--jobs)
+                if [[ ! "$2" =~ ^[1-9][0-9]*$ ]]; then
+                    echo -e "${RED}Invalid number of jobs: $2${NC}"
+                    exit 1
+                fi
+                jobs="$2"
+                shift 2
+                ;;
+            --trace)
+                trace=true
+                shift
+                ;;
             *)
                 echo -e "${RED}Unknown option: $1${NC}"
                 echo "Use -h or --help for usage information."
@@ -394,13 +512,20 @@ main() {
             echo "Use -g option to specify grammar type."
             exit 1
         fi
+        if [[ "$batch_mode" == true ]]; then
+            run_batch "$filename" "$grammar_type" "$jobs" "$trace"
+            exit $?
+        fi
         process_file "$filename" "$grammar_type" "$quiet_mode"
+    elif [[ "$batch_mode" == true ]]; then
+        echo -e "${RED}Error: Batch mode needs a file (-f FILE).${NC}"
+        exit 1
     elif [[ "$interactive_mode" == true ]]; then
         run_interactive "$grammar_type" "$quiet_mode"
     fi
 }
 
-## Check if script is run directly
-#if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
-#    main "$@"
-#fi
\ No newline at end of file
+# Check if script is run directly
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    main "$@"
+fi
\ No newline at end of file
@@ -11,105 +11,109 @@ source "$SCRIPT_DIR/lexer.sh"
 CURRENT_TOKEN_INDEX=0
 PARSE_SUCCESS=true
 PARSE_TREE=()
+PARSE_ERROR_INDEX=""    # index of the token the first error is at, if any
+
+# With QUIET=true nothing is written to stderr, errors included: the result
+# is the return status and PARSE_ERROR_INDEX
 
 # Grammar rule functions (similar to PLY p_ functions)
 parse_expression() {
-    echo "Parsing expression..." >&2
+    [[ $QUIET == true ]] || echo "Parsing expression..." >&2
     if ! parse_term; then
         return 1
     fi
     while true; do
         local current_token
-        current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+        current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
         case "$current_token" in
             "PLUS")
-                echo "Found PLUS operator" >&2
+                [[ $QUIET == true ]] || echo "Found PLUS operator" >&2
                 CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
                 if ! parse_term; then
                     parser_error "Expected term after PLUS"
                     return 1
                 fi
-                echo "Expression: PLUS operation completed" >&2
+                [[ $QUIET == true ]] || echo "Expression: PLUS operation completed" >&2
                 ;;
             "MINUS")
-                echo "Found MINUS operator" >&2
+                [[ $QUIET == true ]] || echo "Found MINUS operator" >&2
                 CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
                 if ! parse_term; then
                     parser_error "Expected term after MINUS"
                     return 1
                 fi
-                echo "Expression: MINUS operation completed" >&2
+                [[ $QUIET == true ]] || echo "Expression: MINUS operation completed" >&2
                 ;;
             *)
                 break
                 ;;
         esac
     done
-    echo "Expression parsing successful" >&2
+    [[ $QUIET == true ]] || echo "Expression parsing successful" >&2
     return 0
 }
 
 parse_term() {
-    echo "Parsing term..." >&2
+    [[ $QUIET == true ]] || echo "Parsing term..." >&2
     if ! parse_factor; then
         return 1
     fi
     while true; do
         local current_token
-        current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+        current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
         case "$current_token" in
             "TIMES")
-                echo "Found TIMES operator" >&2
+                [[ $QUIET == true ]] || echo "Found TIMES operator" >&2
                 CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
                 if ! parse_factor; then
                     parser_error "Expected factor after TIMES"
                     return 1
                 fi
-                echo "Term: TIMES operation completed" >&2
+                [[ $QUIET == true ]] || echo "Term: TIMES operation completed" >&2
                 ;;
             "DIVIDE")
-                echo "Found DIVIDE operator" >&2
+                [[ $QUIET == true ]] || echo "Found DIVIDE operator" >&2
                 CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
                 if ! parse_factor; then
                     parser_error "Expected factor after DIVIDE"
                     return 1
                 fi
-                echo "Term: DIVIDE operation completed" >&2
+                [[ $QUIET == true ]] || echo "Term: DIVIDE operation completed" >&2
                 ;;
             *)
                 break
                 ;;
         esac
     done
-    echo "Term parsing successful" >&2
+    [[ $QUIET == true ]] || echo "Term parsing successful" >&2
     return 0
 }
 
 parse_factor() {
-    echo "Parsing factor..." >&2
+    [[ $QUIET == true ]] || echo "Parsing factor..." >&2
     local current_token
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     case "$current_token" in
         "NUMBER")
             local value
-            value=$(get_token_value_at_index $CURRENT_TOKEN_INDEX)
-            echo "Found NUMBER: $value" >&2
+            value="${TOKEN_VALUES[CURRENT_TOKEN_INDEX]}"
+            [[ $QUIET == true ]] || echo "Found NUMBER: $value" >&2
             CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
             return 0
             ;;
         "LPAREN")
-            echo "Found LPAREN - parsing parenthesized expression" >&2
+            [[ $QUIET == true ]] || echo "Found LPAREN - parsing parenthesized expression" >&2
             CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
             if ! parse_expression; then
                 parser_error "Expected expression after LPAREN"
                 return 1
             fi
-            current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+            current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
             if [[ "$current_token" != "RPAREN" ]]; then
                 parser_error "Expected RPAREN, found $current_token"
                 return 1
             fi
-            echo "Found RPAREN - parenthesized expression complete" >&2
+            [[ $QUIET == true ]] || echo "Found RPAREN - parenthesized expression complete" >&2
             CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
             return 0
             ;;
@@ -121,82 +125,82 @@ parse_factor() {
 }
 
 parse_sequence() {
-    echo "Parsing a^n b^n sequence..." >&2
+    [[ $QUIET == true ]] || echo "Parsing a^n b^n sequence..." >&2
     local current_token
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     if [[ "$current_token" != "A" ]]; then
         parser_error "Expected A token, found $current_token"
         return 1
     fi
-    echo "Found A token" >&2
+    [[ $QUIET == true ]] || echo "Found A token" >&2
     CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     if [[ "$current_token" == "A" ]]; then
-        echo "Recursive case: A sequence B" >&2
+        [[ $QUIET == true ]] || echo "Recursive case: A sequence B" >&2
         if ! parse_sequence; then
             return 1
         fi
     fi
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     if [[ "$current_token" != "B" ]]; then
         parser_error "Expected B token, found $current_token"
         return 1
     fi
-    echo "Found B token" >&2
+    [[ $QUIET == true ]] || echo "Found B token" >&2
     CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
-    echo "Sequence parsing successful" >&2
+    [[ $QUIET == true ]] || echo "Sequence parsing successful" >&2
     return 0
 }
 
 parse_declaration() {
-    echo "Parsing variable declaration..." >&2
+    [[ $QUIET == true ]] || echo "Parsing variable declaration..." >&2
     local current_token
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     if [[ "$current_token" != "TYPE" ]]; then
         parser_error "Expected TYPE, found $current_token"
         return 1
     fi
     local type_value
-    type_value=$(get_token_value_at_index $CURRENT_TOKEN_INDEX)
-    echo "Found TYPE: $type_value" >&2
+    type_value="${TOKEN_VALUES[CURRENT_TOKEN_INDEX]}"
+    [[ $QUIET == true ]] || echo "Found TYPE: $type_value" >&2
     CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
     if ! parse_varlist; then
         parser_error "Expected variable list after TYPE"
         return 1
     fi
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     if [[ "$current_token" != "SEMICOLON" ]]; then
         parser_error "Expected SEMICOLON, found $current_token"
         return 1
     fi
-    echo "Found SEMICOLON" >&2
+    [[ $QUIET == true ]] || echo "Found SEMICOLON" >&2
     CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
-    echo "Declaration parsing successful" >&2
+    [[ $QUIET == true ]] || echo "Declaration parsing successful" >&2
     return 0
 }
 
 parse_varlist() {
-    echo "Parsing variable list..." >&2
+    [[ $QUIET == true ]] || echo "Parsing variable list..." >&2
     local current_token
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     if [[ "$current_token" != "ID" ]]; then
         parser_error "Expected ID, found $current_token"
         return 1
     fi
     local id_value
-    id_value=$(get_token_value_at_index $CURRENT_TOKEN_INDEX)
-    echo "Found ID: $id_value" >&2
+    id_value="${TOKEN_VALUES[CURRENT_TOKEN_INDEX]}"
+    [[ $QUIET == true ]] || echo "Found ID: $id_value" >&2
     CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     if [[ "$current_token" == "COMMA" ]]; then
-        echo "Found COMMA - parsing more variables" >&2
+        [[ $QUIET == true ]] || echo "Found COMMA - parsing more variables" >&2
         CURRENT_TOKEN_INDEX=$((CURRENT_TOKEN_INDEX + 1))
         if ! parse_varlist; then
             parser_error "Expected variable list after COMMA"
             return 1
         fi
     fi
-    echo "Variable list parsing successful" >&2
+    [[ $QUIET == true ]] || echo "Variable list parsing successful" >&2
     return 0
 }
 
@@ -204,43 +208,46 @@ parse_varlist() {
 parse_input() {
     local input="$1"
     local grammar_type="$2"
-    echo "=== PARSING PROCESS ===" >&2
-    echo "Input: '$input'" >&2
-    echo "Grammar: $grammar_type" >&2
-    if ! tokenize_input "$input"; then
-        echo "Tokenization failed" >&2
+    [[ $QUIET == true ]] || echo "=== PARSING PROCESS ===" >&2
+    [[ $QUIET == true ]] || echo "Input: '$input'" >&2
+    [[ $QUIET == true ]] || echo "Grammar: $grammar_type" >&2
+    PARSE_ERROR_INDEX=""
+    if ! tokenize_input "$input" "$grammar_type"; then
+        [[ $QUIET == true ]] || echo "Tokenization failed" >&2
+        PARSE_ERROR_INDEX=${#TOKENS[@]}
+        PARSE_SUCCESS=false
         return 1
     fi
     CURRENT_TOKEN_INDEX=0
     PARSE_SUCCESS=true
     case "$grammar_type" in
         "expression" | "arithmetic")
-            echo "Using arithmetic expression grammar" >&2
-            if parse_expression; then
-                echo "=== PARSING SUCCESSFUL ===" >&2
+            [[ $QUIET == true ]] || echo "Using arithmetic expression grammar" >&2
+            if parse_expression && parsing_complete; then
+                [[ $QUIET == true ]] || echo "=== PARSING SUCCESSFUL ===" >&2
                 return 0
             else
-                echo "=== PARSING FAILED ===" >&2
+                [[ $QUIET == true ]] || echo "=== PARSING FAILED ===" >&2
                 return 1
             fi
             ;;
         "sequence" | "anbn")
-            echo "Using a^n b^n sequence grammar" >&2
-            if parse_sequence; then
-                echo "=== PARSING SUCCESSFUL ===" >&2
+            [[ $QUIET == true ]] || echo "Using a^n b^n sequence grammar" >&2
+            if parse_sequence && parsing_complete; then
+                [[ $QUIET == true ]] || echo "=== PARSING SUCCESSFUL ===" >&2
                 return 0
             else
-                echo "=== PARSING FAILED ===" >&2
+                [[ $QUIET == true ]] || echo "=== PARSING FAILED ===" >&2
                 return 1
             fi
             ;;
         "declaration" | "variable")
-            echo "Using variable declaration grammar" >&2
-            if parse_declaration; then
-                echo "=== PARSING SUCCESSFUL ===" >&2
+            [[ $QUIET == true ]] || echo "Using variable declaration grammar" >&2
+            if parse_declaration && parsing_complete; then
+                [[ $QUIET == true ]] || echo "=== PARSING SUCCESSFUL ===" >&2
                 return 0
             else
-                echo "=== PARSING FAILED ===" >&2
+                [[ $QUIET == true ]] || echo "=== PARSING FAILED ===" >&2
                 return 1
             fi
             ;;
@@ -255,23 +262,26 @@ parse_input() {
 # Error handling function
 parser_error() {
     local message="$1"
+    # The rules report an error again on the way out; the first is the one
+    PARSE_ERROR_INDEX="${PARSE_ERROR_INDEX:-$CURRENT_TOKEN_INDEX}"
+    PARSE_SUCCESS=false
+    [[ $QUIET == true ]] && return 1
     echo "Parse error at token index $CURRENT_TOKEN_INDEX: $message" >&2
     local current_token
-    current_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+    current_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
     local current_value
-    current_value=$(get_token_value_at_index $CURRENT_TOKEN_INDEX)
+    current_value="${TOKEN_VALUES[CURRENT_TOKEN_INDEX]}"
     echo "Current token: $current_token = '$current_value'" >&2
-    PARSE_SUCCESS=false
     return 1
 }
 
 # Function to check if parsing completed successfully
 parsing_complete() {
     local total_tokens
-    total_tokens=$(get_token_count)
+    total_tokens=${#TOKENS[@]}
     if [[ $CURRENT_TOKEN_INDEX -lt $total_tokens ]]; then
         local remaining_token
-        remaining_token=$(get_token_at_index $CURRENT_TOKEN_INDEX)
+        remaining_token="${TOKENS[CURRENT_TOKEN_INDEX]:-EOF}"
         parser_error "Unexpected token: $remaining_token"
         return 1
     fi
@@ -0,0 +1,33 @@
+# conftest.py
+# The grammar directories hold flat modules of the same names (lexer,
+# parser, ...), imported by bare name as the grammars' own scripts do. The
+# grammar fixture imports one grammar's afresh, with the modules of any
+# other dropped first, so tests of different grammars can share a run.
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAMMARS = tuple(os.path.join(ROOT, name) for name in ('Python', 'Arnav', 'Khush'))
+sys.path.insert(0, ROOT)
+
+
+def _load(name, module='parser'):
+    directory = os.path.join(ROOT, name)
+    if sys.path[0] != directory:
+        for key, value in list(sys.modules.items()):
+            path = getattr(value, '__file__', None) or ''
+            if os.path.dirname(path) in GRAMMARS:
+                del sys.modules[key]
+        sys.path[:] = [directory] + [p for p in sys.path if p not in GRAMMARS]
+    return importlib.import_module(module)
+
+
+@pytest.fixture
+def grammar():
+    # grammar('Khush') is Khush/parser.py; grammar('Khush', 'symbols') another module
+    saved = sys.path[:]
+    yield _load
+    sys.path[:] = saved
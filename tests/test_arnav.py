@@ -0,0 +1,13 @@
+import io
+
+import pytest
+
+
+@pytest.mark.parametrize('source', ['', '\n', '# only a comment\n', '# a\n\n    # b\n', '\n\n# no newline'])
+def test_empty_program(grammar, source):
+    parser = grammar('Arnav')
+    found = []
+    diagnostics = parser.Diagnostics(on_event=lambda kind, name: found.append(kind))
+    assert list(parser.Parser().parse(source, diagnostics)) == []
+    assert found == ['program']
+    assert list(parser.Parser().parse_file(io.StringIO(source))) == []
@@ -0,0 +1,70 @@
+import io
+
+import pytest
+
+# Generics spanning lines: one TYPEARGS token holds the newlines, so a
+# chunk cut inside one would split it
+SOURCE = '''package a.b;
+import java.util.Map;
+class A {
+    Map<String,
+        Integer> m;
+    java.util.List<Map<String,
+        java.util.List<Integer>>> n = null;
+    void f(Map<String,
+           Integer> p) { int x = 1; }
+}
+'''
+
+
+def collect(parser, run):
+    found = []
+    diagnostics = parser.Diagnostics(on_event=lambda kind, name: found.append((kind, name)))
+    result = run(parser.Parser(), diagnostics)
+    return found, [(d.kind, d.line, d.column) for d in result]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 8, 16, 30, 64])
+def test_parse_file_matches_parse(grammar, chunk_size):
+    parser = grammar('Khush')
+    whole = collect(parser, lambda p, d: p.parse(SOURCE, d))
+    streamed = collect(parser, lambda p, d: p.parse_file(io.StringIO(SOURCE), d, chunk_size))
+    assert whole[1] == []
+    assert streamed == whole
+
+
+def index(grammar, source):
+    parser = grammar('Khush')
+    symbols = grammar('Khush', 'symbols').SymbolIndex()
+    diagnostics = parser.Parser(symbols=symbols).parse(source)
+    assert list(diagnostics) == []
+    assert symbols.complete
+    return [(s.name, s.kind, s.type, s.scope) for s in symbols]
+
+
+def test_enum(grammar):
+    assert index(grammar, 'class A { enum Color { RED, GREEN(1) { void f() {} }; int v; } void k() {} }') == [
+        ('A', 'class', 'A', ''),
+        ('Color', 'class', 'Color', 'A'),
+        ('RED', 'constant', 'Color', 'A.Color'),
+        ('GREEN', 'constant', 'Color', 'A.Color'),
+        ('f', 'function', 'void', 'A.Color.GREEN'),
+        ('v', 'variable', 'int', 'A.Color'),
+        ('k', 'function', 'void', 'A'),
+    ]
+
+
+def test_for_variables(grammar):
+    assert index(grammar, 'class A { void f() { for (String s : list) {} for (int i = 0; i < n; i++) g(i); } }')[2:] == [
+        ('s', 'variable', 'String', 'A.f'),
+        ('i', 'variable', 'int', 'A.f'),
+    ]
+
+
+def test_record(grammar):
+    assert index(grammar, 'record R(int a) { R { check(a); } int record() { return record; } }') == [
+        ('R', 'class', 'R', ''),
+        ('a', 'variable', 'int', 'R'),
+        ('R', 'function', 'R', 'R'),
+        ('record', 'function', 'int', 'R'),
+    ]
@@ -0,0 +1,114 @@
+"""Regenerate (or check) the frozen PLY tables of every grammar directory.
+
+    python tools/build_tables.py           # rewrite lextab.py, parsetab.py, parser.out
+    python tools/build_tables.py --check   # exit 1 if a table is stale or the grammar has conflicts
+
+Each grammar is built in its own interpreter so the flat `lexer`/`parser`
+module names of the different directories never meet.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAMMARS = ('Python', 'Arnav', 'Khush')
+
+# Rebuilds the LALR table in memory and reports its size and conflicts
+STATS = '''
+import ply.yacc as yacc
+
+def grammar_stats(module):
+    pinfo = yacc.ParserReflect(vars(module), log=yacc.NullLogger())
+    pinfo.get_all()
+    pinfo.validate_all()
+    grammar = yacc.Grammar(pinfo.tokens)
+    for term, assoc, level in pinfo.preclist:
+        grammar.set_precedence(term, assoc, level)
+    for funcname, (filename, line, prodname, syms) in pinfo.grammar:
+        grammar.add_production(prodname, syms, funcname, filename, line)
+    grammar.set_start(pinfo.start)
+    lr = yacc.LRGeneratedTable(grammar, 'LALR')
+    conflicts = len(lr.sr_conflicts) + len(lr.rr_conflicts)
+    return pinfo, len(lr.lr_action), conflicts
+'''
+
+BUILD = STATS + '''
+import os
+import lexer, parser
+from lexyacc import frozen
+lexer.lexer.writetab('lextab', os.getcwd())
+with open('lextab.py', 'a') as f:
+    f.write(f'_lexsignature = {frozen.lexsignature(lexer)!r}\\n')
+_, states, conflicts = grammar_stats(parser)
+print(f'tables rebuilt ({states} states, {conflicts} conflicts)')
+'''
+
+CHECK = STATS + '''
+import os
+import sys
+import ply.lex as lex
+from lexyacc import frozen
+
+try:
+    import lexer, parser
+except frozen.StaleTables as e:
+    # Refused on load; the other table may be stale too
+    print(os.path.basename(e.path) + ' stale')
+    sys.exit(1)
+
+problems = []
+parsetab = frozen.load(os.getcwd(), 'parsetab')
+pinfo, states, conflicts = grammar_stats(parser)
+if parsetab is None or parsetab._lr_signature != pinfo.signature():
+    problems.append('parsetab.py')
+
+lextab = frozen.load(os.getcwd(), 'lextab')
+fresh = lex.lex(module=lexer)
+if lextab is None or {s: [r for r, _ in v] for s, v in lextab._lexstatere.items()} != fresh.lexstateretext:
+    problems.append('lextab.py')
+
+if problems:
+    print(', '.join(problems) + ' stale')
+if conflicts:
+    print(f'grammar has {conflicts} conflicts')
+if not problems and not conflicts:
+    print(f'tables up to date ({states} states, 0 conflicts)')
+sys.exit(1 if problems or conflicts else 0)
+'''
+
+
+def run(grammar, code, build):
+    # The grammar's directory is the working directory, the shared modules
+    # come from the lexyacc package at the root
+    env = dict(os.environ, PYTHONHASHSEED='0', PYTHONPATH=ROOT)
+    if build:
+        env['LEXYACC_BUILD_TABLES'] = '1'
+        # Start from scratch so yacc always regenerates parsetab.py and parser.out
+        for name in ('lextab.py', 'parsetab.py'):
+            path = os.path.join(ROOT, grammar, name)
+            if os.path.exists(path):
+                os.remove(path)
+    return subprocess.run([sys.executable, '-c', code], cwd=os.path.join(ROOT, grammar),
+                          env=env, capture_output=True, text=True)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--check', action='store_true',
+                    help="only verify the frozen tables match the grammar")
+    args = ap.parse_args()
+
+    status = 0
+    for grammar in GRAMMARS:
+        proc = run(grammar, CHECK if args.check else BUILD, build=not args.check)
+        if proc.returncode:
+            status = 1
+        print(f"{grammar}: {'; '.join(proc.stdout.split(chr(10))).strip('; ')}")
+        if proc.returncode and proc.stderr:
+            print(proc.stderr.rstrip(), file=sys.stderr)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
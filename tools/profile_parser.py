@@ -0,0 +1,51 @@
+"""Profile one grammar's parser on some input files.
+
+    python tools/profile_parser.py GRAMMAR FILE... [--lines] [--top N] [--json OUT]
+
+GRAMMAR is one of the grammar directories (Python, Arnav, Khush). Prints
+shifts, reductions and time per production (numbered as in the
+_lr_productions table of its parsetab.py), lexing time per token type and
+error-recovery counts; --json also writes them machine-readable. --lines
+parses every line as its own input, as the REPLs do.
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAMMARS = ('Python', 'Arnav', 'Khush')
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('grammar', choices=GRAMMARS)
+    ap.add_argument('files', nargs='+', help="input files ('-' for stdin)")
+    ap.add_argument('--lines', action='store_true', help="parse each line separately")
+    ap.add_argument('--top', type=int, default=20, help="productions to list (default: 20)")
+    ap.add_argument('--json', metavar='OUT', help="also write the profile as JSON to OUT")
+    args = ap.parse_args()
+
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, os.path.join(ROOT, args.grammar))
+    import parser
+    from lexyacc.instrument import Profile
+
+    profile = Profile()
+    instance = parser.Parser(profile=profile)
+    for path in args.files:
+        if path == '-':
+            data = sys.stdin.read()
+        else:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                data = f.read()
+        for unit in data.splitlines() if args.lines else [data]:
+            instance.parse(unit)
+
+    print(profile.report(args.top))
+    if args.json:
+        profile.dump(args.json)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())